@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Atomic replacement of files.
+
+Content is written to a temporary file in the destination directory,
+which is then renamed over the destination, so that readers see
+either the old or the new file, never a partial one.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import stat
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Flags of a new temporary file; O_BINARY only exists on Windows
+_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+
+
+def _create_temporary(path: Path) -> tuple[int, Path]:
+    # Created like open() creates files, with mode 0o666 under the
+    # umask, rather than owner-only like tempfile.mkstemp()
+    while True:
+        tmp = path.with_name(f'.{path.name}.{os.urandom(4).hex()}')
+        try:
+            return os.open(tmp, _FLAGS, 0o666), tmp
+        except FileExistsError:
+            continue
+
+
+@contextlib.contextmanager
+def atomic_open(path: str | os.PathLike, mode: str = 'wb', **kwargs) -> Iterator[IO]:
+    """Open a temporary file that replaces ``path`` when closed.
+
+    Parent directories are created. The file gets the permissions of
+    the file it replaces, or of a new file, rather than the owner-only
+    ones of ``tempfile.mkstemp()``. If the block raises, the temporary
+    file is removed and ``path`` is left unchanged.
+
+    Args:
+        path: Destination file.
+        mode: Writing mode, ``'wb'`` or ``'w'``.
+        **kwargs: Further arguments for ``open()``, e.g. ``encoding``.
+
+    Yields:
+        IO: The open temporary file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = _create_temporary(path)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_atomic(path: str | os.PathLike, data: bytes | str) -> None:
+    """Replace a file with new content; see ``atomic_open()``.
+
+    Args:
+        path: Destination file.
+        data: Bytes, or text written as UTF-8.
+    """
+    if isinstance(data, str):
+        with atomic_open(path, 'w', encoding='utf-8') as f:
+            f.write(data)
+    else:
+        with atomic_open(path) as f:
+            f.write(data)
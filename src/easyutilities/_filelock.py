@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Advisory file locks shared between processes.
+
+Uses ``fcntl.flock`` on POSIX and ``msvcrt.locking`` on Windows. Locks
+are held on a separate lock file next to the protected resource and are
+released automatically if the holding process dies. The holder may
+delete the lock file; processes waiting for it then lock a new one.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+# Interval between attempts while waiting for a lock, in seconds
+_POLL_INTERVAL = 0.01
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:  # pragma: no cover - Windows
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """Exclusive lock on a lock file, usable as a context manager.
+
+    The lock is not reentrant: acquiring it twice, even from the same
+    thread, blocks until the timeout.
+
+    Args:
+        path: Lock file; created with its parent directories if needed.
+        timeout: Seconds to wait for the lock, or None to wait forever.
+    """
+
+    def __init__(self, path: str | os.PathLike, timeout: float | None = None) -> None:
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._fd: int | None = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether this object currently holds the lock."""
+        return self._fd is not None
+
+    def acquire(self) -> None:
+        """Wait for and take the lock.
+
+        Raises:
+            TimeoutError: If the lock was not obtained within the
+                timeout.
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            while not _try_lock(fd):
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f'Could not lock {self.path} within {self.timeout} s')
+                time.sleep(_POLL_INTERVAL)
+            if self._is_current(fd):
+                self._fd = fd
+                return
+            # The holder removed the lock file while we waited
+            _unlock(fd)
+            os.close(fd)
+
+    def remove(self) -> None:
+        """Delete the lock file while holding the lock.
+
+        Waiting processes then lock a new lock file. Does nothing
+        where open files cannot be deleted, as on Windows.
+
+        Raises:
+            RuntimeError: If this object does not hold the lock.
+        """
+        if self._fd is None:
+            raise RuntimeError(f'{self.path} is not locked by this object')
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def _is_current(self, fd: int) -> bool:
+        # Whether the locked file is still the one at the path
+        try:
+            return os.path.samestat(os.fstat(fd), os.stat(self.path))
+        except FileNotFoundError:
+            return False
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+
+    def __enter__(self) -> FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
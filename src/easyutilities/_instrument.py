@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Switch, no-op context and display shared by instrumentation.
+
+``profiling`` and ``memory`` instrument blocks and functions that stay
+in library code. Each keeps a ``Recorder``: while it is disabled,
+blocks get the shared ``NULL_CONTEXT`` and wrapped functions call
+straight through; while it is enabled, results are appended to its
+records. ``show()`` renders results as HTML in Jupyter and as text
+elsewhere.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING
+from typing import TextIO
+
+from easyutilities.display import DisplayUpdater
+from easyutilities.environment import can_update_ipython_display
+from easyutilities.environment import in_jupyter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+# Returned for blocks while instrumentation is disabled
+NULL_CONTEXT = _NullContext()
+
+
+class Recorder:
+    """On/off state and records of one kind of instrumentation.
+
+    Args:
+        env_var: Environment variable enabling the recorder at
+            creation unless empty or ``'0'``.
+
+    Attributes:
+        enabled: Whether blocks are instrumented.
+        records: Results, in order of completion.
+    """
+
+    __slots__ = ('enabled', 'records')
+
+    def __init__(self, env_var: str) -> None:
+        self.enabled = os.environ.get(env_var, '') not in ('', '0')
+        self.records: list = []
+
+    @contextlib.contextmanager
+    def scope(self, *, clear: bool) -> Iterator[None]:
+        """Enable the recorder within a block.
+
+        Args:
+            clear: Discard previous records first.
+
+        Yields:
+            None: The recorder is enabled until the block exits;
+            afterwards, it is restored to its previous state.
+        """
+        if clear:
+            self.records.clear()
+        previous, self.enabled = self.enabled, True
+        try:
+            yield
+        finally:
+            self.enabled = previous
+
+    def wrap(
+        self,
+        func: Callable,
+        name: str | None,
+        context: Callable[[str], contextlib.AbstractContextManager],
+    ) -> Callable:
+        """Run each call of a function in an instrumented block.
+
+        Args:
+            func: Function to wrap.
+            name: Name passed to ``context``; default the qualified
+                name of the function.
+            context: Factory of the block, called with the name on
+                each call while the recorder is enabled.
+
+        Returns:
+            Callable: The wrapped function, which costs one extra
+            branch per call while the recorder is disabled.
+        """
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            with context(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def show(
+    to_html: Callable[[], str],
+    to_text: Callable[[], str],
+    file: TextIO | None = None,
+) -> None:
+    """Display results once, as HTML in Jupyter and as text elsewhere.
+
+    Only the rendering that is displayed is computed.
+
+    Args:
+        to_html: Renders the HTML shown in Jupyter.
+        to_text: Renders the text printed elsewhere, including CI.
+        file: Stream for the text; default ``sys.stdout``.
+    """
+    if in_jupyter() and can_update_ipython_display():
+        DisplayUpdater.create(max_fps=0).update(to_html())
+        return
+    print(to_text(), file=file or sys.stdout)
@@ -0,0 +1,476 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Benchmark harness for EasyScience packages.
+
+Times a callable with warmup and repeated rounds, reports min, median
+and interquartile range, captures the peak traced memory of one extra
+call, and stores results as JSON. Saved results can be compared
+against a baseline to flag regressions.
+
+Usage:
+  python -m easyutilities.bench show results.json
+  python -m easyutilities.bench compare baseline.json results.json
+  python -m easyutilities.bench compare a.json b.json --threshold 0.2
+
+``compare`` exits with status 1 if any benchmark regressed.
+
+In pytest, enable the ``benchmark`` fixture with
+``pytest_plugins = ['easyutilities.bench_plugin']`` in a top-level
+``conftest.py`` (see ``easyutilities.bench_plugin``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+# Version of the JSON result file layout
+FORMAT_VERSION = 1
+
+# ----------------------------------------------------------------------
+# Results
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark.
+
+    Attributes:
+        name: Benchmark name.
+        times: Seconds per call, one entry per round.
+        number: Calls per round.
+        warmup: Warmup rounds run before timing.
+        peak_memory: Peak traced memory of one call in bytes, or None
+            if not measured.
+        extra: Free-form metadata, e.g. problem sizes.
+    """
+
+    name: str
+    times: list[float]
+    number: int = 1
+    warmup: int = 0
+    peak_memory: int | None = None
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def min(self) -> float:
+        """Fastest time per call in seconds."""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """Median time per call in seconds."""
+        return statistics.median(self.times)
+
+    @property
+    def iqr(self) -> float:
+        """Interquartile range of the time per call in seconds."""
+        if len(self.times) < 2:
+            return 0.0
+        q1, _, q3 = statistics.quantiles(self.times, n=4, method='inclusive')
+        return q3 - q1
+
+    def to_dict(self) -> dict:
+        """Return the result with its statistics as a dictionary."""
+        data = asdict(self)
+        data.update(min=self.min, median=self.median, iqr=self.iqr)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BenchmarkResult:
+        """Create a result from ``to_dict()`` output.
+
+        Args:
+            data: Dictionary as written to a result file.
+
+        Returns:
+            BenchmarkResult: The restored result.
+        """
+        return cls(
+            name=data['name'],
+            times=list(data['times']),
+            number=data.get('number', 1),
+            warmup=data.get('warmup', 0),
+            peak_memory=data.get('peak_memory'),
+            extra=dict(data.get('extra', {})),
+        )
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a unit suited to its magnitude.
+
+    Args:
+        seconds: Duration in seconds.
+
+    Returns:
+        str: E.g. ``'12.3 us'`` or ``'1.50 s'``.
+    """
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if abs(seconds) >= scale:
+            return f'{seconds / scale:.3g} {unit}'
+    return f'{seconds / 1e-9:.3g} ns'
+
+
+def format_bytes(size: int | None) -> str:
+    """Format a byte count with a binary unit.
+
+    Args:
+        size: Number of bytes, or None.
+
+    Returns:
+        str: E.g. ``'1.5 MiB'``, or ``'-'`` for None.
+    """
+    if size is None:
+        return '-'
+    if size < 1024:
+        return f'{size} B'
+    value = size / 1024
+    for unit in ('KiB', 'MiB'):
+        if value < 1024:
+            return f'{value:.1f} {unit}'
+        value /= 1024
+    return f'{value:.1f} GiB'
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    """Format results as a text table.
+
+    Args:
+        results: Results to format.
+
+    Returns:
+        str: One line per benchmark with min, median, IQR and memory.
+    """
+    results = list(results)
+    width = max([len(r.name) for r in results] + [9])
+    lines = [f'{"benchmark":<{width}} {"min":>10} {"median":>10} {"iqr":>10} {"peak mem":>10}']
+    for r in results:
+        lines.append(
+            f'{r.name:<{width}} {format_time(r.min):>10} {format_time(r.median):>10} '
+            f'{format_time(r.iqr):>10} {format_bytes(r.peak_memory):>10}'
+        )
+    return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------
+# Running benchmarks
+# ----------------------------------------------------------------------
+
+
+def _calibrate(func: Callable[[], object], min_round_time: float) -> int:
+    # Smallest power-of-ten number of calls that takes min_round_time,
+    # like timeit.Timer.autorange()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_round_time or number >= 10**9:
+            return number
+        number *= 10
+
+
+def run_benchmark(
+    func: Callable[..., object],
+    args: Sequence[object] = (),
+    kwargs: Mapping[str, object] | None = None,
+    *,
+    name: str | None = None,
+    rounds: int = 7,
+    warmup: int = 1,
+    number: int | None = None,
+    min_round_time: float = 0.01,
+    memory: bool = True,
+) -> BenchmarkResult:
+    """Time ``func(*args, **kwargs)``.
+
+    The arguments of ``func`` are passed as a sequence and a mapping,
+    so that they never clash with the options of the benchmark.
+
+    Args:
+        func: Callable to benchmark.
+        args: Positional arguments for ``func``.
+        kwargs: Keyword arguments for ``func``.
+        name: Benchmark name; defaults to the qualified name of
+            ``func``.
+        rounds: Number of timed rounds.
+        warmup: Number of untimed rounds run first.
+        number: Calls per round. Chosen so that a round takes at least
+            ``min_round_time`` if not given.
+        min_round_time: Minimum duration of a round in seconds when
+            calibrating ``number``.
+        memory: Measure the peak traced memory of one extra call.
+
+    Returns:
+        BenchmarkResult: Timings per call, one entry per round.
+    """
+    kwargs = kwargs or {}
+
+    def call() -> object:
+        return func(*args, **kwargs)
+
+    if name is None:
+        name = getattr(func, '__qualname__', repr(func))
+    if number is None:
+        number = _calibrate(call, min_round_time)
+    for _ in range(warmup * number):
+        call()
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        times.append((time.perf_counter() - start) / number)
+    peak_memory = measure_peak_memory(call) if memory else None
+    return BenchmarkResult(name, times, number, warmup, peak_memory)
+
+
+def measure_peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak memory traced by ``tracemalloc`` during a call.
+
+    Args:
+        func: Callable without arguments.
+
+    Returns:
+        int: Peak traced memory in bytes.
+    """
+    # Imported here, as easyutilities.memory imports this module; its
+    # watches keep the peaks of open memory trackers across the reset
+    from easyutilities.memory import _PeakWatch
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    watch = _PeakWatch()
+    try:
+        watch.open()
+        try:
+            func()
+        finally:
+            peak, _ = watch.close()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return max(peak, 0)
+
+
+# ----------------------------------------------------------------------
+# Result files
+# ----------------------------------------------------------------------
+
+
+def machine_info() -> dict:
+    """Return a description of the machine running the benchmarks."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(results: Iterable[BenchmarkResult], path: str | Path) -> Path:
+    """Write results and machine information to a JSON file.
+
+    Args:
+        results: Results to save.
+        path: Destination file; parent directories are created.
+
+    Returns:
+        Path: The written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'machine': machine_info(),
+        'results': [result.to_dict() for result in results],
+    }
+    path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+    return path
+
+
+def load_results(path: str | Path) -> dict[str, BenchmarkResult]:
+    """Read results written by ``save_results()``.
+
+    Args:
+        path: JSON result file.
+
+    Returns:
+        dict[str, BenchmarkResult]: Results by benchmark name.
+
+    Raises:
+        ValueError: If the file has an unsupported format version.
+    """
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError(f'Unsupported benchmark file version in {path}: {data.get("version")}')
+    results = (BenchmarkResult.from_dict(item) for item in data['results'])
+    return {result.name: result for result in results}
+
+
+# ----------------------------------------------------------------------
+# Comparison
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Comparison of one benchmark against its baseline.
+
+    Attributes:
+        name: Benchmark name.
+        baseline: Baseline median in seconds, or None if new.
+        current: Current median in seconds, or None if removed.
+        threshold: Relative slowdown counted as a regression.
+    """
+
+    name: str
+    baseline: float | None
+    current: float | None
+    threshold: float
+
+    @property
+    def ratio(self) -> float | None:
+        """Current over baseline median, or None if one is missing."""
+        if self.baseline is None or self.current is None or self.baseline <= 0:
+            return None
+        return self.current / self.baseline
+
+    @property
+    def status(self) -> str:
+        """One of ``'regressed'``, ``'improved'``, ``'unchanged'``,
+        ``'new'`` or ``'removed'``.
+        """
+        if self.baseline is None:
+            return 'new'
+        if self.current is None:
+            return 'removed'
+        ratio = self.ratio
+        if ratio is None:
+            return 'unchanged'
+        if ratio > 1 + self.threshold:
+            return 'regressed'
+        if ratio < 1 / (1 + self.threshold):
+            return 'improved'
+        return 'unchanged'
+
+
+def compare_results(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+    threshold: float = 0.1,
+) -> list[Comparison]:
+    """Compare benchmark medians against a baseline.
+
+    The median is used rather than the minimum because it reflects
+    typical behaviour while staying robust against single rounds
+    disturbed by other processes.
+
+    Args:
+        baseline: Baseline results by name.
+        current: Current results by name.
+        threshold: Relative slowdown counted as a regression, e.g. 0.1
+            for 10 %.
+
+    Returns:
+        list[Comparison]: One comparison per benchmark name, sorted.
+    """
+    comparisons = []
+    for name in sorted(baseline.keys() | current.keys()):
+        base = baseline.get(name)
+        cur = current.get(name)
+        comparisons.append(
+            Comparison(
+                name,
+                base.median if base is not None else None,
+                cur.median if cur is not None else None,
+                threshold,
+            )
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: Iterable[Comparison]) -> str:
+    """Format comparisons as a text table.
+
+    Args:
+        comparisons: Comparisons to format.
+
+    Returns:
+        str: One line per benchmark with both medians and the ratio.
+    """
+    comparisons = list(comparisons)
+    width = max([len(c.name) for c in comparisons] + [9])
+    lines = [f'{"benchmark":<{width}} {"baseline":>10} {"current":>10} {"ratio":>7}  status']
+    for c in comparisons:
+        base = format_time(c.baseline) if c.baseline is not None else '-'
+        cur = format_time(c.current) if c.current is not None else '-'
+        ratio = f'{c.ratio:.2f}x' if c.ratio is not None else '-'
+        lines.append(f'{c.name:<{width}} {base:>10} {cur:>10} {ratio:>7}  {c.status}')
+    return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: show or compare benchmark result files."""
+    parser = argparse.ArgumentParser(
+        prog='python -m easyutilities.bench',
+        description='Show or compare benchmark result files',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    show = commands.add_parser('show', help='Print the results in a file')
+    show.add_argument('results', help='JSON result file')
+    compare = commands.add_parser('compare', help='Compare results against a baseline')
+    compare.add_argument('baseline', help='Baseline JSON result file')
+    compare.add_argument('results', help='Current JSON result file')
+    compare.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Relative slowdown counted as a regression (default: 0.1)',
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == 'show':
+        print(format_results(load_results(args.results).values()))
+        return 0
+
+    comparisons = compare_results(
+        load_results(args.baseline),
+        load_results(args.results),
+        threshold=args.threshold,
+    )
+    print(format_comparisons(comparisons))
+    regressed = [c.name for c in comparisons if c.status == 'regressed']
+    if regressed:
+        print(f'\n{len(regressed)} benchmark(s) regressed by more than {args.threshold:.0%}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
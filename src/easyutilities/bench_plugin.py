@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Pytest plugin providing the ``benchmark`` fixture.
+
+Enable it in a top-level ``conftest.py``:
+
+```python
+pytest_plugins = ['easyutilities.bench_plugin']
+```
+
+Tests then time a callable with the fixture, which returns the
+callable's result so the test can still check it:
+
+```python
+def test_fit(benchmark):
+    result = benchmark(fit, (data,), {'method': 'lm'}, rounds=5)
+    assert result.success
+```
+
+Tests using the fixture get the ``benchmark`` marker, so they can be
+selected with ``-m benchmark`` or skipped with ``-m "not benchmark"``.
+
+Options:
+  --bench-json PATH   Save the results of the session to a JSON file.
+  --bench-disable     Call each benchmarked function once, untimed.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from easyutilities.bench import BenchmarkResult
+from easyutilities.bench import format_results
+from easyutilities.bench import run_benchmark
+from easyutilities.bench import save_results
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+_RESULTS_KEY = pytest.StashKey[list[BenchmarkResult]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the benchmark command line options."""
+    group = parser.getgroup('benchmark', 'easyutilities benchmarks')
+    group.addoption(
+        '--bench-json',
+        metavar='PATH',
+        default=None,
+        help='Save benchmark results to a JSON file',
+    )
+    group.addoption(
+        '--bench-disable',
+        action='store_true',
+        default=False,
+        help='Call benchmarked functions once without timing them',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the marker and prepare result collection."""
+    config.addinivalue_line('markers', 'benchmark: test records a benchmark')
+    config.stash[_RESULTS_KEY] = []
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark tests that use the ``benchmark`` fixture."""
+    for item in items:
+        if 'benchmark' in getattr(item, 'fixturenames', ()):
+            item.add_marker(pytest.mark.benchmark)
+
+
+class BenchmarkFixture:
+    """Callable returned by the ``benchmark`` fixture.
+
+    Args:
+        name: Name recorded for the benchmark, the test node ID.
+        results: Session-wide list the result is appended to.
+        disabled: Call the function once without timing it.
+    """
+
+    def __init__(self, name: str, results: list[BenchmarkResult], disabled: bool) -> None:
+        self.name = name
+        self.disabled = disabled
+        self.result: BenchmarkResult | None = None
+        self._results = results
+
+    def __call__(
+        self,
+        func: Callable[..., object],
+        args: Sequence[object] = (),
+        kwargs: Mapping[str, object] | None = None,
+        *,
+        rounds: int = 7,
+        warmup: int = 1,
+    ) -> object:
+        """Benchmark ``func(*args, **kwargs)`` and return its result.
+
+        Args:
+            func: Callable to benchmark.
+            args: Positional arguments for ``func``.
+            kwargs: Keyword arguments for ``func``.
+            rounds: Number of timed rounds.
+            warmup: Number of untimed rounds run first.
+
+        Returns:
+            The return value of one extra call of ``func``.
+
+        Raises:
+            RuntimeError: If called more than once in a test.
+        """
+        if self.result is not None:
+            raise RuntimeError(f'benchmark fixture called more than once in {self.name}')
+        if not self.disabled:
+            self.result = run_benchmark(
+                func, args, kwargs, name=self.name, rounds=rounds, warmup=warmup
+            )
+            self._results.append(self.result)
+        return func(*args, **(kwargs or {}))
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> BenchmarkFixture:
+    """Time a callable and record the result for the session."""
+    config = request.config
+    return BenchmarkFixture(
+        request.node.nodeid,
+        config.stash[_RESULTS_KEY],
+        config.getoption('bench_disable'),
+    )
+
+
+def _output_path(config: pytest.Config) -> Path | None:
+    path = config.getoption('bench_json')
+    if path is None:
+        return None
+    path = Path(path)
+    # Each pytest-xdist worker writes its own file
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker is not None:
+        path = path.with_name(f'{path.stem}.{worker}{path.suffix}')
+    return path
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Save the results of the session if requested."""
+    results = session.config.stash[_RESULTS_KEY]
+    path = _output_path(session.config)
+    if results and path is not None:
+        save_results(results, path)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """Print a table of the benchmarks run in this session."""
+    results = config.stash[_RESULTS_KEY]
+    if not results:
+        return
+    terminalreporter.write_sep('-', 'benchmarks')
+    terminalreporter.write_line(format_results(results))
+    path = _output_path(config)
+    if path is not None:
+        terminalreporter.write_line(f'Saved to {path}')
@@ -0,0 +1,422 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Namespaced in-memory caches bounded by size.
+
+Module-level dictionaries caching calculators or computed patterns by
+model name leak state from one run into the next, grow without bound
+and are not safe to share between threads. ``Cache`` replaces them:
+
+- entries are evicted least recently used first once the cache holds
+  more than ``max_bytes`` (measured with ``sizeof()``, which counts
+  NumPy ``nbytes``) or ``max_items``;
+- entries may expire ``ttl`` seconds after they were stored;
+- hits, misses, evictions and expirations are counted in ``stats``;
+- all operations are thread-safe.
+
+Caches shared across a package are registered under a dotted
+namespace with ``get_cache()`` or ``@memoize``, so that they can be
+inspected with ``cache_stats()`` and reset together with
+``clear_caches()`` or a ``scope()`` block, e.g. between tutorial
+scripts run in one process.
+
+```python
+from easyutilities.cache import memoize
+from easyutilities.cache import scope
+
+
+@memoize('easydiffraction.calculators', max_bytes=64 << 20)
+def reflections(cell, wavelength): ...
+
+
+with scope('easydiffraction'):
+    run_tutorial()  # Caches start empty and are emptied afterwards
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+    from collections.abc import Iterator
+
+# Default size limit of a cache, in bytes
+DEFAULT_MAX_BYTES = 256 << 20
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+_registry: dict[str, Cache] = {}
+_registry_lock = threading.Lock()
+
+# ----------------------------------------------------------------------
+# Sizes
+# ----------------------------------------------------------------------
+
+
+def sizeof(obj: object) -> int:
+    """Estimate the memory held by an object.
+
+    Uses ``nbytes`` for NumPy arrays and other objects providing it,
+    ``memory_usage(deep=True)`` for pandas tables, the sum over the
+    items of lists, tuples, sets and dicts, and ``sys.getsizeof()``
+    otherwise. Objects reachable twice are counted once.
+
+    Args:
+        obj: Object to measure.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    seen: set[int] = set()
+
+    def measure(obj: object) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        nbytes = getattr(obj, 'nbytes', None)
+        if isinstance(nbytes, int):
+            return nbytes
+        memory_usage = getattr(obj, 'memory_usage', None)
+        if callable(memory_usage) and hasattr(obj, 'columns'):
+            return int(memory_usage(deep=True).sum())
+        size = sys.getsizeof(obj, 0)
+        if isinstance(obj, dict):
+            size += sum(measure(key) + measure(value) for key, value in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum(measure(item) for item in obj)
+        return size
+
+    return measure(obj)
+
+
+# ----------------------------------------------------------------------
+# Caches
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class CacheStats:
+    """Counters and contents of a cache.
+
+    Attributes:
+        hits: Lookups that found an entry.
+        misses: Lookups that found no entry, or an expired one.
+        evictions: Entries removed to respect the size limits.
+        expirations: Entries removed because they expired.
+        items: Entries held.
+        nbytes: Estimated size of the entries held, in bytes.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    items: int = 0
+    nbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits; zero without lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Cache:
+    """Thread-safe LRU cache bounded by size, with optional expiry.
+
+    Values larger than ``max_bytes`` on their own are not stored.
+
+    Args:
+        namespace: Name shown in statistics; see ``get_cache()``.
+        max_bytes: Maximum total size of the values, measured with
+            ``sizeof``; None for no limit.
+        max_items: Maximum number of entries; None for no limit.
+        ttl: Seconds after which entries expire; None for never.
+        sizeof: Function measuring the size of a value in bytes.
+        clock: Monotonic clock returning seconds; mainly for tests.
+    """
+
+    def __init__(
+        self,
+        namespace: str = '',
+        *,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        max_items: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[object], int] = sizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        # Values with their size and expiry time, least recent first
+        self._entries: OrderedDict[Hashable, tuple[object, int, float]] = OrderedDict()
+        self._nbytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f'<Cache {self.namespace!r}: {len(self)} items, {self._nbytes:,} bytes>'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def __getitem__(self, key: Hashable) -> object:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: object) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of the cached values, in bytes."""
+        return self._nbytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """Copy of the counters, with the current contents."""
+        with self._lock:
+            stats = CacheStats(**vars(self._stats))
+            stats.items, stats.nbytes = len(self._entries), self._nbytes
+        return stats
+
+    def get(self, key: Hashable, default: object = None, *, count: bool = True) -> object:
+        """Return a cached value and mark it as recently used.
+
+        Args:
+            key: Key of the value.
+            default: Returned if there is no value, or it expired.
+            count: Count the lookup in ``stats``.
+
+        Returns:
+            object: The cached value, or ``default``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self._clock():
+                self._remove(key)
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += count
+                return default
+            self._entries.move_to_end(key)
+            self._stats.hits += count
+            return entry[0]
+
+    def set(self, key: Hashable, value: object) -> bool:
+        """Store a value, evicting least recently used ones as needed.
+
+        Args:
+            key: Key of the value.
+            value: Value to cache.
+
+        Returns:
+            bool: False if the value alone exceeds ``max_bytes`` and
+            was not stored.
+        """
+        nbytes = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return False
+            expires = self._clock() + self.ttl if self.ttl is not None else float('inf')
+            self._entries[key] = (value, nbytes, expires)
+            self._nbytes += nbytes
+            self._shrink()
+        return True
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], object]) -> object:
+        """Return a cached value, computing and storing it if missing.
+
+        ``factory`` runs without holding the lock, so threads missing
+        the same key at once may each compute the value.
+
+        Args:
+            key: Key of the value.
+            factory: Callable without arguments computing the value.
+
+        Returns:
+            object: The cached or computed value.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self, *, stats: bool = False) -> None:
+        """Remove all entries.
+
+        Args:
+            stats: Also reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            if stats:
+                self._stats = CacheStats()
+
+    def _remove(self, key: Hashable) -> None:
+        _, nbytes, _ = self._entries.pop(key)
+        self._nbytes -= nbytes
+
+    def _shrink(self) -> None:
+        if not self._over_limit():
+            return
+        now = self._clock()
+        for key in [key for key, entry in self._entries.items() if entry[2] <= now]:
+            self._remove(key)
+            self._stats.expirations += 1
+        while self._over_limit():
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _over_limit(self) -> bool:
+        return (self.max_bytes is not None and self._nbytes > self.max_bytes) or (
+            self.max_items is not None and len(self._entries) > self.max_items
+        )
+
+
+# ----------------------------------------------------------------------
+# Namespaces
+# ----------------------------------------------------------------------
+
+
+def get_cache(namespace: str, **limits: object) -> Cache:
+    """Return the cache registered under a namespace, creating it.
+
+    Args:
+        namespace: Dotted name, e.g. ``'easydiffraction.calculators'``.
+        **limits: Keyword arguments of ``Cache``, used only when the
+            cache is created.
+
+    Returns:
+        Cache: The registered cache.
+    """
+    with _registry_lock:
+        cache = _registry.get(namespace)
+        if cache is None:
+            cache = _registry[namespace] = Cache(namespace, **limits)
+        return cache
+
+
+def _matching(namespaces: tuple[str, ...]) -> list[Cache]:
+    # Caches in any of the namespaces or their children; all if none
+    with _registry_lock:
+        caches = list(_registry.values())
+    if not namespaces:
+        return caches
+    return [
+        cache
+        for cache in caches
+        if any(cache.namespace == ns or cache.namespace.startswith(ns + '.') for ns in namespaces)
+    ]
+
+
+def clear_caches(*namespaces: str, stats: bool = False) -> None:
+    """Empty registered caches.
+
+    Args:
+        *namespaces: Namespaces to clear, including their children,
+            e.g. ``'easydiffraction'`` clears
+            ``'easydiffraction.calculators'``; all if none given.
+        stats: Also reset the counters.
+    """
+    for cache in _matching(namespaces):
+        cache.clear(stats=stats)
+
+
+def cache_stats(*namespaces: str) -> dict[str, CacheStats]:
+    """Return the statistics of registered caches.
+
+    Args:
+        *namespaces: Namespaces to include, with their children; all
+            if none given.
+
+    Returns:
+        dict[str, CacheStats]: Statistics by namespace.
+    """
+    return {cache.namespace: cache.stats for cache in _matching(namespaces)}
+
+
+@contextlib.contextmanager
+def scope(*namespaces: str) -> Iterator[None]:
+    """Run a block with empty caches, emptied again on exit.
+
+    Args:
+        *namespaces: Namespaces to reset, with their children; all if
+            none given.
+
+    Yields:
+        None: Caches are cleared before the block and after it, even
+        if it raises.
+    """
+    clear_caches(*namespaces, stats=True)
+    try:
+        yield
+    finally:
+        clear_caches(*namespaces)
+
+
+def memoize(
+    namespace: str,
+    *,
+    key: Callable[..., Hashable] | None = None,
+    **limits: object,
+) -> Callable[[Callable], Callable]:
+    """Cache the results of a function in a registered cache.
+
+    Functions may share a namespace: keys include the function. The
+    decorated function has the cache as its ``cache`` attribute.
+
+    Args:
+        namespace: Namespace of the cache; see ``get_cache()``.
+        key: Function of the call arguments returning the cache key;
+            default the arguments themselves, which must be hashable.
+        **limits: Keyword arguments of ``Cache``.
+
+    Returns:
+        Callable[[Callable], Callable]: Decorator.
+    """
+    cache = get_cache(namespace, **limits)
+
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = (func, key(*args, **kwargs))
+            elif kwargs:
+                cache_key = (func, *args, _KWARGS_MARK, *sorted(kwargs.items()))
+            else:
+                cache_key = (func, *args)
+            return cache.get_or_set(cache_key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorate
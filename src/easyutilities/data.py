@@ -0,0 +1,553 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Registry of remote data files with a shared, content-addressed cache.
+
+Data files are registered with a URL and a known hash, in the format
+used by ``pooch`` (``'sha256:<hex>'``, or a bare SHA-256 hex digest),
+and can be loaded from pooch-style registry files. ``DataRegistry``
+then:
+
+- fetches many files concurrently with a bounded thread pool,
+- verifies each hash while streaming, without reading the file again,
+- resumes interrupted downloads with HTTP ``Range`` requests,
+- stores files under their hash, so identical files registered under
+  different names or by different packages are downloaded once,
+- locks each entry with a file lock, so that processes sharing the
+  cache never download the same file twice or see partial files,
+- optionally prunes the least recently used files beyond a size limit.
+
+The cache layout is ``<cache_dir>/objects/<alg>/<xx>/<digest>/<file>``,
+keeping the original file name so readers that look at the suffix
+still work. The default cache directory is
+``pooch.os_cache('easyscience')``, overridable with the
+``EASYSCIENCE_DATA_DIR`` environment variable.
+
+```python
+from easyutilities.data import DataRegistry
+
+registry = DataRegistry()
+registry.load_registry('registry.txt')
+paths = registry.fetch_many()
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import http.client
+import os
+import threading
+import urllib.error
+import urllib.request
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from easyutilities._filelock import FileLock
+from easyutilities.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pooch
+else:
+    pooch = lazy_import('pooch')
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = 'EASYSCIENCE_DATA_DIR'
+
+# Size of the chunks read from the network and hashed, in bytes
+_CHUNK_SIZE = 1 << 20
+
+# ----------------------------------------------------------------------
+# Errors
+# ----------------------------------------------------------------------
+
+
+class HashMismatchError(ValueError):
+    """Raised when a downloaded file does not match its known hash."""
+
+
+class DownloadError(RuntimeError):
+    """Raised by ``fetch_many()`` when one or more downloads failed.
+
+    Attributes:
+        errors: Exception of each failed file, by name.
+    """
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        self.errors = errors
+        details = '\n'.join(f'  {name}: {error}' for name, error in errors.items())
+        super().__init__(f'{len(errors)} download(s) failed:\n{details}')
+
+
+# ----------------------------------------------------------------------
+# Registry entries
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DataFile:
+    """A registered remote file.
+
+    Attributes:
+        name: Name the file is fetched by, e.g. ``'hrpt/si.xye'``.
+        url: Download URL.
+        algorithm: Hash algorithm, e.g. ``'sha256'``.
+        digest: Expected hex digest.
+    """
+
+    name: str
+    url: str
+    algorithm: str
+    digest: str
+
+    @property
+    def known_hash(self) -> str:
+        """Hash in pooch format, ``'<alg>:<digest>'``."""
+        return f'{self.algorithm}:{self.digest}'
+
+    @property
+    def filename(self) -> str:
+        """Base name the file is stored under."""
+        return self.name.rsplit('/', 1)[-1]
+
+
+def parse_hash(known_hash: str) -> tuple[str, str]:
+    """Split a pooch-style hash into algorithm and lower-case digest.
+
+    Args:
+        known_hash: ``'<alg>:<hex>'``, or a bare hex digest for SHA-256.
+
+    Returns:
+        tuple[str, str]: Algorithm name and hex digest.
+
+    Raises:
+        ValueError: If the algorithm is not supported by ``hashlib``.
+    """
+    algorithm, _, digest = known_hash.rpartition(':')
+    algorithm = algorithm.lower() or 'sha256'
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f'Unsupported hash algorithm {algorithm!r} in {known_hash!r}')
+    return algorithm, digest.strip().lower()
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory.
+
+    ``EASYSCIENCE_DATA_DIR`` if set, else the per-user cache directory
+    from ``pooch.os_cache('easyscience')``.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    return Path(pooch.os_cache('easyscience'))
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+
+class DataRegistry:
+    """Remote data files with a shared, content-addressed local cache.
+
+    Args:
+        cache_dir: Cache directory; see ``default_cache_dir()``.
+        base_url: Prefix for URLs given relative to it, or for entries
+            registered without a URL.
+        max_workers: Maximum number of concurrent downloads.
+        max_cache_bytes: Prune least recently used files after each
+            fetch so that the cache stays below this size, keeping the
+            files just fetched; None disables pruning.
+        timeout: Network timeout per request in seconds.
+        retries: Additional attempts after a failed download, each
+            resuming where the previous one stopped.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | os.PathLike | None = None,
+        *,
+        base_url: str = '',
+        max_workers: int = 8,
+        max_cache_bytes: int | None = None,
+        timeout: float = 60.0,
+        retries: int = 2,
+    ) -> None:
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.max_cache_bytes = max_cache_bytes
+        self.timeout = timeout
+        self.retries = retries
+        self._files: dict[str, DataFile] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        """Cache directory, resolved on first use."""
+        if self._cache_dir is None:
+            self._cache_dir = default_cache_dir()
+        return self._cache_dir
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the registered files."""
+        return list(self._files)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __getitem__(self, name: str) -> DataFile:
+        try:
+            return self._files[name]
+        except KeyError:
+            raise KeyError(f'No data file registered as {name!r}') from None
+
+    def register(self, name: str, known_hash: str, url: str | None = None) -> DataFile:
+        """Register a remote file.
+
+        Args:
+            name: Name to fetch the file by.
+            known_hash: Hash in pooch format.
+            url: Download URL; defaults to ``base_url + name``. A URL
+                without a scheme is taken relative to ``base_url``.
+
+        Returns:
+            DataFile: The registry entry.
+        """
+        if url is None:
+            url = name
+        if '://' not in url:
+            url = self.base_url + url
+        algorithm, digest = parse_hash(known_hash)
+        entry = DataFile(name, url, algorithm, digest)
+        self._files[name] = entry
+        return entry
+
+    def load_registry(self, source: str | os.PathLike | Iterable[str]) -> None:
+        """Register the files listed in a pooch-style registry.
+
+        Each non-empty line not starting with ``#`` holds a name, a
+        hash and optionally a URL, separated by whitespace.
+
+        Args:
+            source: Path of a registry file, or its lines.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            lines = Path(source).read_text(encoding='utf-8').splitlines()
+        else:
+            lines = source
+        for number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split()
+            if len(fields) not in (2, 3):
+                raise ValueError(f'Invalid registry line {number}: {line!r}')
+            self.register(*fields)
+
+    # ------------------------------------------------------------------
+    # Cache paths
+    # ------------------------------------------------------------------
+
+    def _entry_dir(self, entry: DataFile) -> Path:
+        return self.cache_dir / 'objects' / entry.algorithm / entry.digest[:2] / entry.digest
+
+    def path(self, name: str) -> Path:
+        """Return the cache path of a file, whether or not it exists."""
+        entry = self[name]
+        return self._entry_dir(entry) / entry.filename
+
+    def is_cached(self, name: str) -> bool:
+        """Check whether a file is in the cache."""
+        return self.path(name).is_file()
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    def fetch(self, name: str) -> Path:
+        """Return the local path of a file, downloading it if needed.
+
+        Args:
+            name: Registered name.
+
+        Returns:
+            Path: Path of the verified file in the cache.
+
+        Raises:
+            HashMismatchError: If the downloaded file has another hash.
+            urllib.error.URLError: If the download failed.
+        """
+        path = self._fetch(self[name])
+        self._prune_after_fetch([path])
+        return path
+
+    def fetch_many(self, names: Iterable[str] | None = None) -> dict[str, Path]:
+        """Fetch several files concurrently.
+
+        Files sharing a hash are downloaded once. All downloads are
+        attempted even if some fail.
+
+        Args:
+            names: Registered names; all files if None.
+
+        Returns:
+            dict[str, Path]: Cache path by name.
+
+        Raises:
+            DownloadError: If any download failed.
+        """
+        entries = [self[name] for name in (self._files if names is None else names)]
+        paths: dict[str, Path] = {}
+        errors: dict[str, Exception] = {}
+        # One download per content hash; threads only ever lock
+        # different entries, so they cannot block each other
+        unique = {entry.known_hash: entry for entry in entries}
+
+        def fetch(entry: DataFile) -> None:
+            try:
+                self._fetch(entry)
+            except Exception as e:
+                errors[entry.known_hash] = e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(fetch, unique.values()))
+
+        failed = {}
+        for entry in entries:
+            if entry.known_hash in errors:
+                failed[entry.name] = errors[entry.known_hash]
+            else:
+                paths[entry.name] = self._link(entry, unique[entry.known_hash])
+        self._prune_after_fetch(paths.values())
+        if failed:
+            raise DownloadError(failed)
+        return paths
+
+    def _link(self, entry: DataFile, fetched: DataFile) -> Path:
+        # Entries sharing a hash but not a file name get their own name
+        # next to the downloaded file
+        if entry.filename == fetched.filename:
+            return self._entry_dir(entry) / entry.filename
+        return self._fetch(entry)
+
+    def _fetch(self, entry: DataFile) -> Path:
+        entry_dir = self._entry_dir(entry)
+        target = entry_dir / entry.filename
+        if target.is_file():
+            _touch(target)
+            return target
+        with FileLock(entry_dir.with_name(entry.digest + '.lock')):
+            if target.is_file():
+                _touch(target)
+                return target
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            existing = next((p for p in entry_dir.iterdir() if p.suffix != '.part'), None)
+            if existing is not None:
+                # Same content registered under another file name
+                _link_or_copy(existing, target)
+                return target
+            part = target.with_name(target.name + '.part')
+            for attempt in range(self.retries + 1):
+                try:
+                    self._download(entry, part)
+                    break
+                except (OSError, http.client.HTTPException) as e:
+                    # Retry broken connections, not HTTP error statuses
+                    if attempt == self.retries or isinstance(e, urllib.error.HTTPError):
+                        raise
+            os.replace(part, target)
+        return target
+
+    def _download(self, entry: DataFile, part: Path) -> None:
+        # Stream into part, resuming after (and re-hashing) its content
+        hasher = hashlib.new(entry.algorithm)
+        offset = _hash_file(part, hasher) if part.exists() else 0
+        request = urllib.request.Request(entry.url)  # noqa: S310
+        if offset:
+            request.add_header('Range', f'bytes={offset}-')
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)  # noqa: S310
+        except urllib.error.HTTPError as e:
+            if e.code != 416 or not offset:
+                raise
+            # Range not satisfiable: the partial file is complete
+            response = None
+        if response is not None:
+            with response, open(part, 'ab' if offset else 'wb') as f:
+                if offset and response.status != 206:
+                    # The server ignored the range and sends everything
+                    hasher = hashlib.new(entry.algorithm)
+                    f.truncate(0)
+                length = response.headers.get('Content-Length')
+                received = 0
+                while chunk := response.read(_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    received += len(chunk)
+            # http.client ends a truncated body silently; raise so that
+            # the retry resumes after the bytes received so far
+            if length is not None and received < int(length):
+                raise http.client.IncompleteRead(b'', int(length) - received)
+        if hasher.hexdigest() != entry.digest:
+            part.unlink(missing_ok=True)
+            raise HashMismatchError(
+                f'{entry.name}: expected {entry.known_hash}, '
+                f'downloaded {entry.algorithm}:{hasher.hexdigest()} from {entry.url}'
+            )
+
+    def load_columns(self, name: str, parser=None, **kwargs) -> dict:
+        """Fetch a file and load its columns through a binary sidecar.
+
+        Sidecars are kept in the ``sidecars`` subdirectory of the cache
+        and keyed on the registered hash, so the file is not hashed
+        again. See ``easyutilities.sidecar.load_columns()``.
+
+        Args:
+            name: Registered name.
+            parser: Parser of the file.
+            **kwargs: Passed on to ``load_columns()``.
+
+        Returns:
+            dict: Read-only memory-mapped columns by name.
+        """
+        from easyutilities.sidecar import load_columns
+
+        path = self.fetch(name)
+        entry = self[name]
+        if entry.algorithm == 'sha256':
+            kwargs.setdefault('source_hash', entry.digest)
+        kwargs.setdefault('cache_dir', self.cache_dir / 'sidecars')
+        return load_columns(path, parser, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Cache maintenance
+    # ------------------------------------------------------------------
+
+    def cache_size(self) -> int:
+        """Total size of the complete files in the cache, in bytes.
+
+        Files stored under several names as hard links are counted
+        once.
+        """
+        return sum(size for _, size, _ in _cached_files(self.cache_dir))
+
+    def prune(self, max_bytes: int, keep: Iterable[str | os.PathLike] = ()) -> list[Path]:
+        """Remove least recently used files until the cache fits.
+
+        Files are ordered by their last use, which ``fetch()`` records
+        as the modification time. Files being downloaded, or locked by
+        another process, are skipped. A file stored under several names
+        as hard links is only freed with all of them, so all are
+        removed together.
+
+        Args:
+            max_bytes: Maximum total size of the cache.
+            keep: Cache paths never removed, nor any hard links to
+                them.
+
+        Returns:
+            list[Path]: Removed files.
+        """
+        keep = {Path(path) for path in keep}
+        files = sorted(_cached_files(self.cache_dir), key=lambda item: item[2])
+        total = sum(size for _, size, _ in files)
+        removed = []
+        with _prune_lock:
+            for paths, size, _ in files:
+                if total <= max_bytes:
+                    break
+                if keep.intersection(paths):
+                    continue
+                locks = sorted({
+                    path.parent.with_name(path.parent.name + '.lock') for path in paths
+                })
+                try:
+                    with contextlib.ExitStack() as stack:
+                        for lock in locks:
+                            stack.enter_context(FileLock(lock, timeout=0))
+                        for path in paths:
+                            path.unlink(missing_ok=True)
+                except TimeoutError:
+                    continue
+                total -= size
+                removed.extend(paths)
+        return removed
+
+    def _prune_after_fetch(self, fetched: Iterable[Path]) -> None:
+        # Fetched paths are returned to the caller, so they must survive
+        # pruning even if they alone exceed the limit
+        if self.max_cache_bytes is None:
+            return
+        fetched = set(fetched)
+        self.prune(self.max_cache_bytes, keep=fetched)
+        size = sum(
+            size
+            for paths, size, _ in _cached_files(self.cache_dir)
+            if not fetched.isdisjoint(paths)
+        )
+        if size > self.max_cache_bytes:
+            warnings.warn(
+                f'Fetched files take {size} bytes, more than the cache limit of '
+                f'{self.max_cache_bytes} bytes; they are kept until the next prune',
+                stacklevel=3,
+            )
+
+
+# Serialises pruning within a process; other processes are kept out of
+# individual entries by their file locks
+_prune_lock = threading.Lock()
+
+
+def _cached_files(cache_dir: Path) -> list[tuple[list[Path], int, float]]:
+    # (paths, size, last use) of complete files in the cache; hard
+    # links to one file share its storage and are listed together
+    files: dict[tuple[int, int], tuple[list[Path], int, float]] = {}
+    for path in (cache_dir / 'objects').glob('*/*/*/*'):
+        if path.suffix == '.part':
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        key = (stat.st_dev, stat.st_ino)
+        if key in files:
+            files[key][0].append(path)
+        else:
+            files[key] = ([path], stat.st_size, stat.st_mtime)
+    return list(files.values())
+
+
+def _touch(path: Path) -> None:
+    # Record the last use for LRU pruning; atime is unreliable
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _hash_file(path: Path, hasher) -> int:
+    size = 0
+    with open(path, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            hasher.update(chunk)
+            size += len(chunk)
+    return size
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        # No hard links on this file system
+        tmp = target.with_name(target.name + '.part')
+        tmp.write_bytes(source.read_bytes())
+        os.replace(tmp, target)
@@ -0,0 +1,507 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Persistent on-disk cache of function results.
+
+Re-running a notebook or a batch job recomputes resolution kernels,
+reflection lists or background fits whose inputs have not changed.
+``@disk_memoize`` stores the results of a function on disk, keyed on
+the SHA-256 of its arguments, so that later calls with the same
+arguments, in any process, load them instead:
+
+- NumPy arrays among the arguments are hashed from their memory
+  buffers in C order, so that equal arrays give equal keys whatever
+  their layout, without copying C-contiguous arrays; other values are
+  hashed by type and value, or through their pickle;
+- NumPy array results are stored as ``.npy`` files and returned as
+  read-only memory maps, so that a hit on a large array costs about
+  an ``mmap()``; other results are pickled;
+- entries are written to a temporary file renamed into place, so
+  that readers never see a partial entry, and computed under a lock
+  file, so that concurrent processes compute each entry once; the
+  lock file is removed with its entry;
+- the least recently used entries are removed once the cache holds
+  more than ``max_bytes``.
+
+Change the namespace of a function when its results change for the
+same arguments, e.g. ``'easydiffraction.kernels-v2'``.
+
+The cache layout is::
+
+    <cache_dir>/<namespace>/<xx>/<sha256>.npy or .pkl
+    <cache_dir>/<namespace>/<xx>/<sha256>.lock
+
+```python
+from easyutilities.disk_cache import disk_memoize
+
+
+@disk_memoize
+def resolution_kernel(x, fwhm): ...
+
+
+kernel = resolution_kernel(x, 0.1)  # Memory-mapped once stored
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle  # noqa: S403
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from easyutilities._atomic import atomic_open
+from easyutilities._filelock import FileLock
+from easyutilities.sidecar import parser_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+# Version of the key and entry formats; bumping it invalidates entries
+FORMAT_VERSION = 2
+
+# Default size limit of a cache directory, in bytes
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Bytes of other than C-contiguous arrays copied at once for hashing
+_HASH_BLOCK = 1 << 18
+
+_MISSING = object()
+
+# Scalars hashed by their type and repr(), which is exact for floats
+_SCALARS = (type(None), bool, int, float, complex, str)
+
+# ----------------------------------------------------------------------
+# Hashing
+# ----------------------------------------------------------------------
+
+
+def _c_order_buffers(array: np.ndarray) -> Iterator[memoryview]:
+    # Bytes of an array in C order: the buffer of C-contiguous arrays,
+    # else copies of blocks of rows, split further if rows are large
+    if array.flags.c_contiguous:
+        yield memoryview(array.reshape(-1).view(np.uint8))
+    elif array.ndim > 1 and array[0].nbytes > _HASH_BLOCK:
+        for row in array:
+            yield from _c_order_buffers(row)
+    else:
+        rows = max(1, _HASH_BLOCK // array[:1].nbytes)
+        for start in range(0, len(array), rows):
+            block = np.ascontiguousarray(array[start : start + rows])
+            yield memoryview(block.reshape(-1).view(np.uint8))
+
+
+def _update(hasher, value: object) -> None:
+    # Feeds a value to the hasher, prefixed by a tag and a length so
+    # that different nestings never give the same byte stream
+    def write(tag: str, data: bytes | memoryview = b'') -> None:
+        data = memoryview(data)
+        hasher.update(f'{tag}:{data.nbytes}:'.encode())
+        hasher.update(data)
+
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        write(f'ndarray:{value.dtype.str}:{value.shape}')
+        hasher.update(f'data:{value.nbytes}:'.encode())
+        for buffer in _c_order_buffers(value):
+            hasher.update(buffer)
+    elif isinstance(value, np.generic):
+        write(f'scalar:{value.dtype.str}', value.tobytes())
+    elif type(value) in _SCALARS:
+        write(type(value).__name__, repr(value).encode())
+    elif isinstance(value, (bytes, bytearray)):
+        write('bytes', bytes(value))
+    elif isinstance(value, (tuple, list)):
+        write(f'{type(value).__name__}:{len(value)}')
+        for item in value:
+            _update(hasher, item)
+    elif isinstance(value, dict):
+        # Independent of the insertion order
+        items = sorted((argument_hash(key), argument_hash(item)) for key, item in value.items())
+        write('dict', ''.join(key + item for key, item in items).encode())
+    elif isinstance(value, (set, frozenset)):
+        write('set', ''.join(sorted(argument_hash(item) for item in value)).encode())
+    elif isinstance(value, os.PathLike):
+        write('path', os.fsencode(value))
+    else:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            raise TypeError(f'Cannot hash {type(value).__name__} argument: {error}') from error
+        write(f'pickle:{type(value).__module__}.{type(value).__qualname__}', data)
+
+
+def argument_hash(*args: object, **kwargs: object) -> str:
+    """Return the SHA-256 hex digest of arguments.
+
+    NumPy arrays are hashed from their elements in C order together
+    with their dtype and shape, so that C- and Fortran-ordered copies
+    or views of an array give the same digest. C-contiguous arrays are
+    not copied, others are copied in blocks of 256 KiB.
+    Scalars, strings, bytes and paths are hashed by type and value,
+    tuples, lists, dicts and sets by their items, independently of the
+    order of dicts and sets. Other values are hashed through their
+    pickle, which must not depend on the process.
+
+    Args:
+        *args: Positional arguments.
+        **kwargs: Keyword arguments, in any order.
+
+    Returns:
+        str: Hex digest.
+
+    Raises:
+        TypeError: If an argument cannot be pickled.
+    """
+    hasher = hashlib.sha256(f'easyutilities-{FORMAT_VERSION}'.encode())
+    _update(hasher, args)
+    if kwargs:
+        _update(hasher, kwargs)
+    return hasher.hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Entries
+# ----------------------------------------------------------------------
+
+
+def _touch(path: Path) -> None:
+    # Record the last use for LRU pruning; atime is unreliable
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _load_array(path: Path) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode='r', allow_pickle=False)
+    except ValueError:
+        # Arrays without elements cannot be memory-mapped
+        return np.load(path, allow_pickle=False)
+
+
+def _load(base: Path) -> object:
+    # Cached value, or _MISSING if there is no readable entry
+    path = base.with_suffix('.npy')
+    try:
+        value = _load_array(path)
+    except FileNotFoundError:
+        path = base.with_suffix('.pkl')
+        try:
+            with path.open('rb') as f:
+                value = pickle.load(f)  # noqa: S301
+        except Exception:
+            # Missing, truncated, or of a class that no longer exists
+            return _MISSING
+    except (ValueError, EOFError, OSError):
+        # Truncated
+        return _MISSING
+    _touch(path)
+    return value
+
+
+def _store(base: Path, value: object) -> Path:
+    # Written to a temporary file renamed into place, so that readers
+    # never see a partial entry
+    array = type(value) in (np.ndarray, np.memmap) and not value.dtype.hasobject
+    path = base.with_suffix('.npy' if array else '.pkl')
+    with atomic_open(path) as f:
+        if array:
+            np.save(f, value, allow_pickle=False)
+        else:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _entries(cache_dir: Path):
+    # (path, size, last use) of complete entries in the cache
+    for path in cache_dir.glob('*/*/*'):
+        if path.name.startswith('.') or path.suffix not in ('.npy', '.pkl'):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        yield path, stat.st_size, stat.st_mtime
+
+
+def default_cache_dir() -> Path:
+    """Return the default result cache directory.
+
+    The ``results`` subdirectory of the data download cache, see
+    ``easyutilities.data.default_cache_dir()``.
+    """
+    from easyutilities.data import default_cache_dir as data_cache_dir
+
+    return data_cache_dir() / 'results'
+
+
+# ----------------------------------------------------------------------
+# Caches
+# ----------------------------------------------------------------------
+
+
+class DiskCache:
+    """Cache of values on disk, shared between processes.
+
+    Keys are any values accepted by ``argument_hash()``. NumPy arrays
+    are returned as read-only memory maps, other values unpickled.
+    The size limit applies to the whole cache directory, across
+    namespaces; values larger than it on their own are not stored.
+
+    Args:
+        namespace: Subdirectory of the entries, e.g. a function key.
+        cache_dir: Cache directory; see ``default_cache_dir()``.
+        max_bytes: Maximum total size of the cache directory, checked
+            after each store; None for no limit.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        cache_dir: str | os.PathLike | None = None,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.namespace = namespace
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def __repr__(self) -> str:
+        return f'<DiskCache {self.namespace!r} in {str(self.cache_dir)!r}>'
+
+    def __contains__(self, key: object) -> bool:
+        return _has_entry(self._base(key))
+
+    @property
+    def directory(self) -> Path:
+        """Directory of the entries of this namespace."""
+        return self.cache_dir / self.namespace
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the entries of this namespace, in bytes."""
+        return sum(size for path, size, _ in _entries(self.cache_dir) if self._owns(path))
+
+    def get(self, key: object, default: object = None) -> object:
+        """Return a cached value and mark it as recently used.
+
+        Args:
+            key: Key of the value.
+            default: Returned if there is no readable value.
+
+        Returns:
+            object: The cached value, or ``default``.
+        """
+        value = _load(self._base(key))
+        return default if value is _MISSING else value
+
+    def set(self, key: object, value: object) -> bool:
+        """Store a value, then prune the cache to its size limit.
+
+        Args:
+            key: Key of the value.
+            value: NumPy array or picklable value.
+
+        Returns:
+            bool: False if the value alone exceeds ``max_bytes`` and
+            was not stored.
+        """
+        base = self._base(key)
+        with FileLock(base.with_suffix('.lock')) as lock:
+            path = self._store(base, value)
+            if path is None:
+                lock.remove()
+        self.prune()
+        return path is not None
+
+    def get_or_set(self, key: object, factory: Callable[[], object]) -> object:
+        """Return a cached value, computing and storing it if missing.
+
+        ``factory`` runs under the lock file of the entry, so that
+        processes and threads missing the same key at once compute the
+        value only once.
+
+        Args:
+            key: Key of the value.
+            factory: Callable without arguments computing the value.
+
+        Returns:
+            object: The cached value; the computed one if it could not
+            be stored.
+        """
+        base = self._base(key)
+        value = _load(base)
+        if value is not _MISSING:
+            return value
+        with FileLock(base.with_suffix('.lock')) as lock:
+            # Another process may have stored it while we waited
+            value = _load(base)
+            if value is not _MISSING:
+                return value
+            value = factory()
+            path = self._store(base, value)
+            if path is None:
+                lock.remove()
+        if path is None:
+            return value
+        self.prune()
+        if path.suffix != '.npy':
+            return value
+        # Arrays are returned as memory maps on misses too
+        cached = _load(base)
+        return value if cached is _MISSING else cached
+
+    def clear(self) -> None:
+        """Remove all entries of this namespace.
+
+        Entries locked by another process are skipped.
+        """
+        for path, _, _ in list(_entries(self.cache_dir)):
+            if self._owns(path):
+                _remove(path)
+        _remove_orphan_locks(self.directory.glob('*/*.lock'))
+
+    def prune(self, max_bytes: int | None = None) -> list[Path]:
+        """Remove least recently used entries until the cache fits.
+
+        Entries of all namespaces in the cache directory are ordered
+        by their last use, which loads record as the modification time.
+        Entries locked by another process are skipped, and so is the
+        whole pruning while another process prunes. Lock files left
+        without an entry, e.g. by an interrupted computation, are
+        removed as well.
+
+        Args:
+            max_bytes: Maximum total size; default ``max_bytes``.
+
+        Returns:
+            list[Path]: Removed entry files.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        if max_bytes is None:
+            return []
+        removed = []
+        try:
+            with FileLock(self.cache_dir / 'prune.lock', timeout=0):
+                _remove_orphan_locks(self.cache_dir.glob('*/*/*.lock'))
+                files = sorted(_entries(self.cache_dir), key=lambda item: item[2])
+                total = sum(size for _, size, _ in files)
+                for path, size, _ in files:
+                    if total <= max_bytes:
+                        break
+                    if _remove(path):
+                        total -= size
+                        removed.append(path)
+        except TimeoutError:
+            pass
+        return removed
+
+    def _base(self, key: object) -> Path:
+        digest = argument_hash(key)
+        return self.directory / digest[:2] / digest
+
+    def _owns(self, path: Path) -> bool:
+        return path.parent.parent == self.directory
+
+    def _store(self, base: Path, value: object) -> Path | None:
+        # Stored entry file, or None if the value is too large
+        if self.max_bytes is not None and getattr(value, 'nbytes', 0) > self.max_bytes:
+            return None
+        path = _store(base, value)
+        if self.max_bytes is not None and path.stat().st_size > self.max_bytes:
+            path.unlink()
+            return None
+        # A value of another kind stored before under the same key
+        other = base.with_suffix('.pkl' if path.suffix == '.npy' else '.npy')
+        other.unlink(missing_ok=True)
+        return path
+
+
+def _has_entry(base: Path) -> bool:
+    return base.with_suffix('.npy').exists() or base.with_suffix('.pkl').exists()
+
+
+def _remove(path: Path) -> bool:
+    # Removes an entry and its lock file, unless another process holds
+    # the lock
+    try:
+        with FileLock(path.with_suffix('.lock'), timeout=0) as lock:
+            path.unlink(missing_ok=True)
+            if not _has_entry(path):
+                lock.remove()
+    except (TimeoutError, OSError):
+        # Locked, or memory-mapped on Windows
+        return False
+    return True
+
+
+def _remove_orphan_locks(locks: Iterable[Path]) -> None:
+    # Removes lock files without an entry, unless held by a process
+    # computing the entry
+    for path in list(locks):
+        if _has_entry(path):
+            continue
+        try:
+            with FileLock(path, timeout=0) as lock:
+                if not _has_entry(path):
+                    lock.remove()
+        except (TimeoutError, OSError):
+            pass
+
+
+# ----------------------------------------------------------------------
+# Decorator
+# ----------------------------------------------------------------------
+
+
+def disk_memoize(
+    func: Callable | None = None,
+    *,
+    namespace: str | None = None,
+    cache_dir: str | os.PathLike | None = None,
+    max_bytes: int | None = DEFAULT_MAX_BYTES,
+) -> Callable:
+    """Cache the results of a function on disk.
+
+    Use as ``@disk_memoize`` or ``@disk_memoize(namespace=...)``.
+    Calls are keyed on ``argument_hash()`` of the bound arguments,
+    with defaults applied, so that ``f(1)``, ``f(x=1)`` and, if ``x``
+    defaults to 1, ``f()`` share an entry. The decorated function has
+    its ``DiskCache`` as its ``cache`` attribute.
+
+    Args:
+        func: Function to decorate; it must return a NumPy array or a
+            picklable value.
+        namespace: Namespace of the entries; default the module and
+            qualified name of the function. Change it when the results
+            of the function change.
+        cache_dir: Cache directory; see ``default_cache_dir()``.
+        max_bytes: Maximum total size of the cache directory; None for
+            no limit.
+
+    Returns:
+        Callable: The decorated function, or a decorator if ``func``
+        is None.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        cache = DiskCache(namespace or parser_key(func), cache_dir=cache_dir, max_bytes=max_bytes)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return cache.get_or_set(bound.arguments, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorate if func is None else decorate(func)
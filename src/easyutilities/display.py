@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Rate-limited updates of IPython display handles.
+
+Pushing ``handle.update(HTML(...))`` from every iteration of a fit
+loop floods the Jupyter kernel's IOPub channel and stalls the
+frontend. ``DisplayUpdater`` wraps a display handle, coalesces
+updates to a maximum frame rate, and skips frames whose HTML is
+identical to the last one sent.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from easyutilities.environment import can_use_ipython_display
+from easyutilities.environment import in_jupyter
+from easyutilities.environment import ipython_display_classes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    # Content of a frame: either the HTML itself or a callable
+    # rendering it. A callable defers rendering until a frame is sent.
+    Content = str | Callable[[], str]
+
+
+class DisplayUpdater:
+    """Rate-limited, diffing updater for an IPython display handle.
+
+    Calls to ``update()`` within ``1 / max_fps`` seconds of the last
+    sent frame only remember the content; the latest remembered content
+    is sent by a later ``update()`` or by ``flush()``. Frames whose
+    rendered HTML equals the last sent frame are not sent at all.
+
+    Outside Jupyter (as decided by ``in_jupyter()``), or if ``handle``
+    is not an updatable IPython display handle, the updater does
+    nothing.
+
+    Example:
+        ```python
+        with DisplayUpdater.create(max_fps=5) as updater:
+            for i in range(100_000):
+                step()
+                updater.update(lambda: f'<b>{i}</b>')
+        ```
+
+    Args:
+        handle: IPython ``DisplayHandle`` to update.
+        max_fps: Maximum number of frames sent per second. Zero or
+            negative disables rate limiting.
+        clock: Monotonic clock returning seconds; mainly for tests.
+    """
+
+    def __init__(
+        self,
+        handle: object,
+        *,
+        max_fps: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._handle = handle
+        self._interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._clock = clock
+        self._enabled = in_jupyter() and can_use_ipython_display(handle)
+        self._next_time = float('-inf')
+        self._pending: Content | None = None
+        self._last_html: str | None = None
+        self.frames_sent = 0
+        self.frames_skipped = 0
+
+    @classmethod
+    def create(cls, *, max_fps: float = 10.0, **kwargs) -> DisplayUpdater:
+        """Create a new output area and return an updater for it.
+
+        Outside Jupyter no output is created and the returned updater
+        does nothing.
+
+        Args:
+            max_fps: Maximum number of frames sent per second.
+            **kwargs: Further keyword arguments for the constructor.
+
+        Returns:
+            DisplayUpdater: Updater bound to the new display handle.
+        """
+        handle = None
+        classes = ipython_display_classes()
+        if classes is not None and in_jupyter():
+            from IPython.display import display  # type: ignore[import-not-found]
+
+            handle = display(classes[1](''), display_id=True)
+        return cls(handle, max_fps=max_fps, **kwargs)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether updates are sent to the display handle."""
+        return self._enabled
+
+    @property
+    def handle(self) -> object:
+        """The wrapped display handle."""
+        return self._handle
+
+    def update(self, content: Content) -> bool:
+        """Request a new frame.
+
+        Between frames this only checks a timestamp and stores
+        ``content``; rendering and sending happen at most ``max_fps``
+        times per second.
+
+        Args:
+            content: HTML string, or a callable returning one.
+
+        Returns:
+            bool: True if a frame was sent to the display handle.
+        """
+        if not self._enabled:
+            return False
+        now = self._clock()
+        if now < self._next_time:
+            self._pending = content
+            return False
+        return self._send(content, now)
+
+    def flush(self) -> bool:
+        """Send the most recent content that has not been sent yet.
+
+        Returns:
+            bool: True if a frame was sent to the display handle.
+        """
+        content = self._pending
+        if not self._enabled or content is None:
+            return False
+        return self._send(content, self._clock())
+
+    def close(self) -> None:
+        """Flush the final state; same as ``flush()``."""
+        self.flush()
+
+    def __enter__(self) -> DisplayUpdater:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _send(self, content: Content, now: float) -> bool:
+        self._pending = None
+        self._next_time = now + self._interval
+        html = content() if callable(content) else content
+        if html == self._last_html:
+            self.frames_skipped += 1
+            return False
+        html_class = ipython_display_classes()[1]  # type: ignore[index]
+        self._handle.update(html_class(html))  # type: ignore[attr-defined]
+        self._last_html = html
+        self.frames_sent += 1
+        return True
@@ -6,6 +6,12 @@ This module provides functions to detect the current execution
 environment, including testing frameworks, terminals, IDEs, notebook
 environments, and CI systems. It also includes helpers for
 IPython/Jupyter display handling.
+
+Detection runs once per process: the results are stored in a frozen
+``EnvironmentInfo`` snapshot, and the ``in_*`` functions are
+constant-time lookups on it. Call ``refresh()`` after changing
+``os.environ``, ``sys.modules`` or the IPython shell (for example in
+tests that use ``monkeypatch``) to detect the environment again.
 """
 
 from __future__ import annotations
@@ -14,6 +20,116 @@ import os
 import sys
 from importlib.util import find_spec
 
+# ----------------------------------------------------------------------
+# Environment snapshot
+# ----------------------------------------------------------------------
+
+
+class EnvironmentInfo:
+    """Frozen snapshot of the detected runtime environment.
+
+    Attributes:
+        pytest: True if running under pytest.
+        warp: True if running inside Warp terminal.
+        pycharm: True if running inside PyCharm.
+        colab: True if running in Google Colab.
+        jupyter: True if running in a Jupyter Notebook.
+        github_ci: True if running in GitHub Actions CI.
+    """
+
+    __slots__ = ('pytest', 'warp', 'pycharm', 'colab', 'jupyter', 'github_ci')
+
+    def __init__(
+        self,
+        *,
+        pytest: bool,
+        warp: bool,
+        pycharm: bool,
+        colab: bool,
+        jupyter: bool,
+        github_ci: bool,
+    ) -> None:
+        for name, value in zip(
+            self.__slots__, (pytest, warp, pycharm, colab, jupyter, github_ci), strict=True
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'{type(self).__name__} is frozen')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is frozen')
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EnvironmentInfo):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.as_dict().values()))
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())
+        return f'{type(self).__name__}({fields})'
+
+    def as_dict(self) -> dict[str, bool]:
+        """Return the snapshot as a plain dictionary.
+
+        Returns:
+            dict[str, bool]: Mapping of field names to detected values.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def detect(cls) -> EnvironmentInfo:
+        """Run all environment detectors and build a new snapshot.
+
+        This is the slow path; prefer ``environment_info()``, which
+        returns the cached snapshot.
+
+        Returns:
+            EnvironmentInfo: Freshly detected environment.
+        """
+        return cls(
+            pytest=_detect_pytest(),
+            warp=_detect_warp(),
+            pycharm=_detect_pycharm(),
+            colab=_detect_colab(),
+            jupyter=_detect_jupyter(),
+            github_ci=_detect_github_ci(),
+        )
+
+
+_snapshot: EnvironmentInfo | None = None
+
+
+def environment_info() -> EnvironmentInfo:
+    """Return the cached environment snapshot, detecting it if needed.
+
+    Returns:
+        EnvironmentInfo: The process-wide environment snapshot.
+    """
+    info = _snapshot
+    if info is None:
+        info = refresh()
+    return info
+
+
+def refresh() -> EnvironmentInfo:
+    """Discard the cached snapshot and detect the environment again.
+
+    Also forgets the resolved IPython display classes, so that they are
+    imported again on next use.
+
+    Returns:
+        EnvironmentInfo: The newly detected environment snapshot.
+    """
+    global _snapshot, _display_classes
+    _display_classes = None
+    _snapshot = EnvironmentInfo.detect()
+    return _snapshot
+
+
 # ----------------------------------------------------------------------
 # Testing
 # ----------------------------------------------------------------------
@@ -25,6 +141,10 @@ def in_pytest() -> bool:
     Returns:
         bool: True if pytest is loaded in sys.modules, False otherwise.
     """
+    return (_snapshot or environment_info()).pytest
+
+
+def _detect_pytest() -> bool:
     return 'pytest' in sys.modules
 
 
@@ -39,6 +159,10 @@ def in_warp() -> bool:
     Returns:
         bool: True if running inside Warp terminal, False otherwise.
     """
+    return (_snapshot or environment_info()).warp
+
+
+def _detect_warp() -> bool:
     return os.getenv('TERM_PROGRAM') == 'WarpTerminal'
 
 
@@ -48,6 +172,10 @@ def in_pycharm() -> bool:
     Returns:
         bool: True if running inside PyCharm, False otherwise.
     """
+    return (_snapshot or environment_info()).pycharm
+
+
+def _detect_pycharm() -> bool:
     return os.environ.get('PYCHARM_HOSTED') == '1'
 
 
@@ -62,6 +190,10 @@ def in_colab() -> bool:
     Returns:
         bool: True if running in Google Colab, False otherwise.
     """
+    return (_snapshot or environment_info()).colab
+
+
+def _detect_colab() -> bool:
     try:
         return find_spec('google.colab') is not None
     except ModuleNotFoundError:  # pragma: no cover - importlib edge case
@@ -71,23 +203,24 @@ def in_colab() -> bool:
 def in_jupyter() -> bool:
     """Determine if the current environment is a Jupyter Notebook.
 
-    Uses multiple detection strategies including IPython availability,
-    config-based detection, and shell class name inspection.
+    Uses multiple detection strategies including whether IPython is
+    loaded, config-based detection, and shell class name inspection.
 
     Returns:
         bool: True if in Jupyter Notebook, False otherwise.
     """
-    try:
-        import IPython  # type: ignore[import-not-found]
-    except ImportError:  # pragma: no cover - optional dependency
-        ipython_mod = None
-    else:
-        ipython_mod = IPython
+    return (_snapshot or environment_info()).jupyter
+
+
+def _detect_jupyter() -> bool:
+    # A running notebook kernel has always imported IPython already, so
+    # there is no need to pay for importing it here.
+    ipython_mod = sys.modules.get('IPython')
     if ipython_mod is None:
         return False
-    if in_pycharm():
+    if _detect_pycharm():
         return False
-    if in_colab():
+    if _detect_colab():
         return True
 
     try:
@@ -120,6 +253,10 @@ def in_github_ci() -> bool:
     Returns:
         bool: True if ``GITHUB_ACTIONS`` is set, False otherwise.
     """
+    return (_snapshot or environment_info()).github_ci
+
+
+def _detect_github_ci() -> bool:
     return os.environ.get('GITHUB_ACTIONS') is not None
 
 
@@ -127,13 +264,46 @@ def in_github_ci() -> bool:
 # IPython / Jupyter helpers
 # ----------------------------------------------------------------------
 
+# IPython display classes as ``(DisplayHandle, HTML)``. ``None`` means
+# not resolved yet; an empty tuple means IPython is unavailable.
+_display_classes: tuple[type, ...] | None = None
+
+
+def _resolve_display_classes() -> tuple[type, ...]:
+    global _display_classes
+    try:
+        from IPython.display import HTML  # type: ignore[import-not-found]
+        from IPython.display import DisplayHandle  # type: ignore[import-not-found]
+    except ImportError:
+        _display_classes = ()
+    else:
+        _display_classes = (DisplayHandle, HTML)
+    return _display_classes
+
+
+def ipython_display_classes() -> tuple[type, type] | None:
+    """Return the IPython ``DisplayHandle`` and ``HTML`` classes.
+
+    ``IPython.display`` is imported at most once per process. A failed
+    import is cached as well, so callers without IPython do not retry
+    it on every call. Use ``refresh()`` to resolve again.
+
+    Returns:
+        tuple[type, type] | None: ``(DisplayHandle, HTML)``, or None if
+        IPython is unavailable.
+    """
+    classes = _display_classes
+    if classes is None:
+        classes = _resolve_display_classes()
+    return classes or None  # type: ignore[return-value]
+
 
 def is_ipython_display_handle(obj: object) -> bool:
     """Check if an object is an IPython DisplayHandle instance.
 
-    Tries to import ``IPython.display.DisplayHandle`` and uses
-    ``isinstance`` when available. Falls back to a conservative
-    module name heuristic if IPython is missing.
+    Uses ``isinstance`` against ``IPython.display.DisplayHandle`` when
+    IPython is available. Falls back to a conservative module name
+    heuristic if IPython is missing.
 
     Args:
         obj: The object to check.
@@ -141,20 +311,20 @@ def is_ipython_display_handle(obj: object) -> bool:
     Returns:
         bool: True if ``obj`` is a DisplayHandle, False otherwise.
     """
-    try:  # Fast path when IPython is available
-        from IPython.display import DisplayHandle  # type: ignore[import-not-found]
-
+    classes = _display_classes
+    if classes is None:
+        classes = _resolve_display_classes()
+    if classes:
         try:
-            return isinstance(obj, DisplayHandle)
+            return isinstance(obj, classes[0])
         except TypeError:
             return False
-    except ImportError:
-        # Fallback heuristic when IPython is unavailable
-        try:
-            mod = getattr(getattr(obj, '__class__', None), '__module__', '')
-            return isinstance(mod, str) and mod.startswith('IPython')
-        except (AttributeError, TypeError):
-            return False
+    # Fallback heuristic when IPython is unavailable
+    try:
+        mod = getattr(getattr(obj, '__class__', None), '__module__', '')
+        return isinstance(mod, str) and mod.startswith('IPython')
+    except (AttributeError, TypeError):
+        return False
 
 
 def can_update_ipython_display() -> bool:
@@ -166,19 +336,18 @@ def can_update_ipython_display() -> bool:
     Returns:
         bool: True if IPython HTML display is available.
     """
-    try:
-        from IPython.display import HTML  # type: ignore[import-not-found]  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
+    classes = _display_classes
+    if classes is None:
+        classes = _resolve_display_classes()
+    return bool(classes)
 
 
 def can_use_ipython_display(handle: object) -> bool:
     """Check if a given IPython DisplayHandle can be updated.
 
     Combines type checking of the handle with availability of IPython
-    HTML utilities.
+    HTML utilities. After the first call this costs about as much as a
+    plain ``isinstance`` check.
 
     Args:
         handle: The display handle object to check.
@@ -186,7 +355,12 @@ def can_use_ipython_display(handle: object) -> bool:
     Returns:
         bool: True if the handle can be updated, False otherwise.
     """
+    classes = _display_classes
+    if classes is None:
+        classes = _resolve_display_classes()
+    if not classes:
+        return False
     try:
-        return is_ipython_display_handle(handle) and can_update_ipython_display()
-    except (AttributeError, TypeError):
+        return isinstance(handle, classes[0])
+    except TypeError:
         return False
@@ -0,0 +1,431 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Batched evaluation of models over parameter grids and samples.
+
+Grid searches and starting-point searches of fits call the model once
+per candidate from Python, which is dominated by interpreter overhead
+for the small patterns of a typical fit. ``evaluate_grid()`` instead
+passes a whole batch of candidates to a vectorized model at once:
+each parameter arrives as a column of shape ``(batch, 1)``, which
+NumPy broadcasts against the data points, and the model returns all
+predicted patterns as one ``(batch, points)`` array.
+
+Candidates are given as:
+
+- ``Grid``: the full Cartesian product of parameter axes, indexed
+  lazily so that it is never held in memory;
+- ``Sample``: explicit points, e.g. from ``latin_hypercube()`` or
+  ``sobol()``.
+
+Batches are sized so that the temporaries of all batches in flight
+fit in ``memory_budget`` bytes. They run serially, or fanned out to
+worker threads with ``easyutilities.parallel.parallel_map()``, as
+NumPy releases the GIL. The result holds the chi-squared of every
+candidate, as a surface over the axes of a grid, and the best ones.
+
+```python
+import numpy as np
+
+from easyutilities.grid import Grid
+from easyutilities.grid import evaluate_grid
+
+
+def gaussian(x, amplitude, center, width):
+    return amplitude * np.exp(-0.5 * ((x - center) / width) ** 2)
+
+
+grid = Grid({
+    'center': np.linspace(-1, 1, 201),
+    'width': np.linspace(0.1, 2, 96),
+})
+result = evaluate_grid(
+    gaussian, x, y, grid, sigma=e, fixed={'amplitude': 10}
+)
+result.surface  # Shape (201, 96)
+result.best(3)  # Three lowest chi-squared candidates
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+import numpy as np
+
+from easyutilities.lazy import lazy_import
+from easyutilities.parallel import cpu_count
+from easyutilities.parallel import parallel_map
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+
+    import scipy.stats.qmc as qmc
+    from numpy.typing import ArrayLike
+else:
+    qmc = lazy_import('scipy.stats.qmc')
+
+# Default bound of the memory used by batches in flight, in bytes
+DEFAULT_MEMORY_BUDGET = 256 << 20
+
+# Arrays of one pattern per candidate alive while evaluating a batch:
+# the prediction, the residuals and model intermediates
+_TEMPORARIES = 4
+
+# ----------------------------------------------------------------------
+# Candidates
+# ----------------------------------------------------------------------
+
+
+class Grid:
+    """Full Cartesian grid of parameter values.
+
+    Points are ordered as by ``itertools.product()`` over the axes,
+    the last axis varying fastest, and generated batch by batch.
+
+    Args:
+        axes: Values of each parameter, by name.
+
+    Raises:
+        ValueError: If there are no axes, or one of them is empty.
+    """
+
+    def __init__(self, axes: Mapping[str, ArrayLike]) -> None:
+        self.axes = {
+            name: np.asarray(values, dtype=float).ravel() for name, values in axes.items()
+        }
+        if not self.axes or not all(len(values) for values in self.axes.values()):
+            raise ValueError('A grid needs at least one axis, and no empty axes')
+
+    def __repr__(self) -> str:
+        shape = ' x '.join(f'{name}[{len(values)}]' for name, values in self.axes.items())
+        return f'<Grid {shape}>'
+
+    def __len__(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Parameter names, in axis order."""
+        return tuple(self.axes)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Number of values of each axis."""
+        return tuple(len(values) for values in self.axes.values())
+
+    def take(self, start: int, stop: int) -> dict[str, np.ndarray]:
+        """Return the parameter values of a range of points.
+
+        Args:
+            start: Index of the first point.
+            stop: Index after the last point.
+
+        Returns:
+            dict[str, np.ndarray]: One-dimensional values by name.
+        """
+        indices = np.unravel_index(np.arange(start, stop), self.shape)
+        return {name: values[index] for (name, values), index in zip(self.axes.items(), indices)}
+
+
+class Sample:
+    """Explicit parameter points, e.g. a random or quasi-random sample.
+
+    Args:
+        values: Values of each parameter at every point, by name.
+
+    Raises:
+        ValueError: If there are no parameters or no points, or the
+            values of the parameters differ in length.
+    """
+
+    def __init__(self, values: Mapping[str, ArrayLike]) -> None:
+        self.values = {name: np.asarray(v, dtype=float).ravel() for name, v in values.items()}
+        lengths = {len(v) for v in self.values.values()}
+        if len(lengths) != 1:
+            raise ValueError('A sample needs parameters with values at the same points')
+        if not lengths.pop():
+            raise ValueError('A sample needs at least one point')
+
+    def __repr__(self) -> str:
+        return f'<Sample of {len(self)} points over {", ".join(self.names)}>'
+
+    def __len__(self) -> int:
+        return len(next(iter(self.values.values())))
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Parameter names."""
+        return tuple(self.values)
+
+    def take(self, start: int, stop: int) -> dict[str, np.ndarray]:
+        """Return the parameter values of a range of points.
+
+        Args:
+            start: Index of the first point.
+            stop: Index after the last point.
+
+        Returns:
+            dict[str, np.ndarray]: One-dimensional values by name.
+        """
+        return {name: values[start:stop] for name, values in self.values.items()}
+
+
+def _scale(unit: np.ndarray, bounds: Mapping[str, tuple[float, float]]) -> Sample:
+    # Maps points of the unit hypercube to the parameter bounds
+    low, high = np.array(list(bounds.values()), dtype=float).reshape(-1, 2).T
+    if not (np.all(np.isfinite(low)) and np.all(np.isfinite(high)) and np.all(low < high)):
+        raise ValueError('Bounds must be finite (low, high) pairs with low < high')
+    scaled = low + unit * (high - low)
+    return Sample(dict(zip(bounds, scaled.T)))
+
+
+def latin_hypercube(
+    bounds: Mapping[str, tuple[float, float]],
+    size: int,
+    *,
+    seed: int | np.random.Generator | None = None,
+) -> Sample:
+    """Draw a Latin-hypercube sample within bounds.
+
+    Each parameter range is split into ``size`` equal strata, and
+    every stratum of every parameter holds exactly one point.
+
+    Args:
+        bounds: ``(low, high)`` of each parameter, by name.
+        size: Number of points.
+        seed: Seed or generator of the random numbers.
+
+    Returns:
+        Sample: The sampled points.
+
+    Raises:
+        ValueError: If a bound is not a finite increasing pair, or
+            ``size`` is zero.
+    """
+    rng = np.random.default_rng(seed)
+    strata = rng.permuted(np.tile(np.arange(size), (len(bounds), 1)), axis=1).T
+    return _scale((strata + rng.random(strata.shape)) / size, bounds)
+
+
+def sobol(
+    bounds: Mapping[str, tuple[float, float]],
+    size: int,
+    *,
+    seed: int | np.random.Generator | None = None,
+    scramble: bool = True,
+) -> Sample:
+    """Draw a Sobol low-discrepancy sample within bounds.
+
+    Requires SciPy. Sobol points are balanced for sizes that are
+    powers of two; SciPy warns about other sizes.
+
+    Args:
+        bounds: ``(low, high)`` of each parameter, by name.
+        size: Number of points.
+        seed: Seed or generator of the scrambling.
+        scramble: Randomize the sequence, which improves its
+            uniformity; without it, the first point is the lower
+            corner.
+
+    Returns:
+        Sample: The sampled points.
+
+    Raises:
+        ImportError: If SciPy is not installed.
+        ValueError: If a bound is not a finite increasing pair, or
+            ``size`` is zero.
+    """
+    sampler = qmc.Sobol(len(bounds), scramble=scramble, seed=seed)
+    return _scale(sampler.random(size), bounds)
+
+
+# ----------------------------------------------------------------------
+# Evaluation
+# ----------------------------------------------------------------------
+
+
+class Candidate(NamedTuple):
+    """Parameter point with its chi-squared.
+
+    Attributes:
+        chi2: Chi-squared of the model at the point.
+        params: Parameter values by name, without fixed ones.
+        index: Index of the point in the grid or sample.
+    """
+
+    chi2: float
+    params: dict[str, float]
+    index: int
+
+
+@dataclass
+class GridResult:
+    """Chi-squared values of an evaluation.
+
+    Attributes:
+        points: The evaluated grid or sample.
+        chi2: Chi-squared of every point, in point order, or None if
+            not kept. Points where the model returned NaN have
+            infinite chi-squared.
+        best_index: Indices of the best points, by increasing
+            chi-squared.
+        best_chi2: Chi-squared of the best points.
+        batch_size: Points per batch.
+        batches: Number of batches evaluated.
+    """
+
+    points: Grid | Sample
+    chi2: np.ndarray | None
+    best_index: np.ndarray
+    best_chi2: np.ndarray
+    batch_size: int
+    batches: int
+
+    @property
+    def surface(self) -> np.ndarray:
+        """Chi-squared over the axes of a grid, in axis order.
+
+        Raises:
+            ValueError: If the points are not a grid, or the values
+                were not kept.
+        """
+        if not isinstance(self.points, Grid) or self.chi2 is None:
+            raise ValueError('Surfaces need a grid evaluated with keep_chi2=True')
+        return self.chi2.reshape(self.points.shape)
+
+    def best(self, count: int | None = None) -> list[Candidate]:
+        """Return the best candidates.
+
+        Args:
+            count: Number of candidates; default all kept.
+
+        Returns:
+            list[Candidate]: Candidates by increasing chi-squared.
+        """
+        candidates = []
+        for index, chi2 in zip(self.best_index[:count], self.best_chi2[:count]):
+            values = self.points.take(int(index), int(index) + 1)
+            params = {name: float(value[0]) for name, value in values.items()}
+            candidates.append(Candidate(float(chi2), params, int(index)))
+        return candidates
+
+
+class _Task(NamedTuple):
+    # Everything a worker needs; picklable if the model is importable
+    model: Callable
+    x: object
+    y: np.ndarray
+    weights: np.ndarray
+    points: Grid | Sample
+    fixed: dict
+
+
+def _chi2_batch(task: _Task, bounds: tuple[int, int]) -> tuple[int, np.ndarray]:
+    start, stop = bounds
+    columns = {name: values[:, None] for name, values in task.points.take(start, stop).items()}
+    predicted = task.model(task.x, **task.fixed, **columns)
+    residuals = np.broadcast_to((task.y - predicted) * task.weights, (stop - start, task.y.size))
+    chi2 = np.einsum('ij,ij->i', residuals, residuals)
+    chi2[np.isnan(chi2)] = np.inf
+    return start, chi2
+
+
+def _keep_best(
+    index: np.ndarray, chi2: np.ndarray, start: int, batch: np.ndarray, top: int
+) -> tuple[np.ndarray, np.ndarray]:
+    # Best points among those kept so far and a new batch
+    index = np.concatenate([index, np.arange(start, start + len(batch))])
+    chi2 = np.concatenate([chi2, batch])
+    if len(chi2) > top:
+        keep = np.argpartition(chi2, top - 1)[:top]
+        index, chi2 = index[keep], chi2[keep]
+    return index, chi2
+
+
+def evaluate_grid(
+    model: Callable,
+    x: ArrayLike,
+    y: ArrayLike,
+    points: Grid | Sample,
+    *,
+    sigma: ArrayLike | None = None,
+    fixed: Mapping[str, object] | None = None,
+    top: int = 10,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    keep_chi2: bool = True,
+    max_workers: int | None = 1,
+    executor: str | None = None,
+) -> GridResult:
+    """Evaluate the chi-squared of a model at every point.
+
+    ``model(x, **fixed, **params)`` is called once per batch, with
+    each varied parameter as an array of shape ``(batch, 1)``, and
+    must return the predicted ``y`` of every candidate, broadcastable
+    to shape ``(batch, len(y))``.
+
+    Args:
+        model: Vectorized model function.
+        x: Independent variable, passed to the model as is.
+        y: Measured values, one-dimensional.
+        points: Grid or sample of the varied parameters.
+        sigma: Uncertainties of ``y``; default 1.
+        fixed: Parameters passed unchanged to every call.
+        top: Number of best candidates kept.
+        memory_budget: Bound of the memory used by the temporaries of
+            all batches in flight, in bytes; sets the batch size.
+        keep_chi2: Keep the chi-squared of every point, needed for
+            surfaces; without it, memory does not grow with the
+            number of points.
+        max_workers: Batches evaluated at once; 1 evaluates serially
+            in the calling thread, None uses all usable CPUs.
+        executor: Executor override passed to ``parallel_map()``,
+            which otherwise uses threads, or runs serially under
+            pytest.
+
+    Returns:
+        GridResult: Chi-squared values and best candidates.
+
+    Raises:
+        ValueError: If ``top``, ``memory_budget`` or ``max_workers``
+            is not positive.
+    """
+    if top < 1 or memory_budget < 1:
+        raise ValueError('top and memory_budget must be positive')
+    if max_workers is not None and max_workers < 1:
+        raise ValueError('max_workers must be positive')
+    y = np.asarray(y, dtype=float).ravel()
+    weights = np.ones_like(y) if sigma is None else 1.0 / np.asarray(sigma, dtype=float).ravel()
+    task = _Task(model, x, y, weights, points, dict(fixed or {}))
+
+    size = len(points)
+    workers = cpu_count() if max_workers is None else max_workers
+    bytes_per_point = max(1, y.size) * y.itemsize * _TEMPORARIES
+    batch_size = int(min(size, max(1, memory_budget // (bytes_per_point * workers))))
+    ranges = [(start, min(start + batch_size, size)) for start in range(0, size, batch_size)]
+
+    if workers == 1 and executor is None:
+        batches = map(functools.partial(_chi2_batch, task), ranges)
+    else:
+        batches = parallel_map(
+            functools.partial(_chi2_batch, task),
+            ranges,
+            workload='nogil',
+            executor=executor,
+            max_workers=workers,
+            chunksize=1,
+        )
+
+    chi2 = np.empty(size) if keep_chi2 else None
+    best_index = np.empty(0, dtype=np.intp)
+    best_chi2 = np.empty(0)
+    for start, batch in batches:
+        if chi2 is not None:
+            chi2[start : start + len(batch)] = batch
+        best_index, best_chi2 = _keep_best(best_index, best_chi2, start, batch, top)
+    order = np.lexsort((best_index, best_chi2))
+    return GridResult(points, chi2, best_index[order], best_chi2[order], batch_size, len(ranges))
@@ -0,0 +1,236 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Deferred imports of optional and heavy dependencies.
+
+``lazy_import()`` returns a module proxy that imports the real module on
+first attribute access. The outcome is cached, including a failed
+import, so processes that never touch e.g. plotly never pay for
+importing it, and code without an optional dependency does not retry
+the import on every call.
+
+For static type checkers, import the real module under
+``TYPE_CHECKING`` and bind the proxy otherwise:
+
+```python
+from typing import TYPE_CHECKING
+
+from easyutilities.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+else:
+    go = lazy_import('plotly.graph_objects')
+```
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+import types
+from typing import NamedTuple
+
+# Proxies by module name, so that all callers share one import
+_registry: dict[str, LazyModule] = {}
+_records: list[ImportRecord] = []
+_lock = threading.RLock()
+
+# ----------------------------------------------------------------------
+# Import records
+# ----------------------------------------------------------------------
+
+
+class ImportRecord(NamedTuple):
+    """Outcome of one deferred import.
+
+    Attributes:
+        name: Fully qualified module name.
+        started_at: Wall-clock time of the import, as from
+            ``time.time()``.
+        duration: Time the import took, in seconds.
+        error: Error message if the import failed, else None.
+    """
+
+    name: str
+    started_at: float
+    duration: float
+    error: str | None
+
+
+def import_records() -> list[ImportRecord]:
+    """Return the deferred imports performed so far.
+
+    Returns:
+        list[ImportRecord]: One record per deferred import, in the
+        order they happened.
+    """
+    with _lock:
+        return list(_records)
+
+
+# ----------------------------------------------------------------------
+# Lazy module proxy
+# ----------------------------------------------------------------------
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first use.
+
+    Create instances with ``lazy_import()``. Attributes that are found
+    are cached on the proxy, so repeated access is a plain attribute
+    lookup.
+
+    Args:
+        name: Fully qualified module name.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        # Stored in __dict__ directly: plain attributes would be looked
+        # up through __getattr__ while the proxy is unresolved
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_error'] = None
+
+    def _lazy_load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is not None:
+            return module
+        if self.__dict__['_lazy_error'] is None:
+            # Imported without holding the lock: the import system has
+            # its own per-module locks, and a thread importing a module
+            # whose import needs another proxy would otherwise deadlock
+            # with a thread holding the lock while waiting for it
+            record, module = _import(self.__name__)
+            with _lock:
+                # The first outcome published wins
+                if self.__dict__['_lazy_module'] is None and self.__dict__['_lazy_error'] is None:
+                    self.__dict__['_lazy_module'] = module
+                    self.__dict__['_lazy_error'] = record.error
+                    _records.append(record)
+        module = self.__dict__['_lazy_module']
+        error = self.__dict__['_lazy_error']
+        if module is None:
+            raise ImportError(
+                f'Optional dependency {self.__name__!r} is not available: {error}',
+                name=self.__name__,
+            )
+        return module
+
+    def __getattr__(self, attr: str) -> object:
+        if attr.startswith('__') and attr.endswith('__'):
+            raise AttributeError(attr)
+        module = self._lazy_load()
+        try:
+            value = getattr(module, attr)
+        except AttributeError:
+            # Submodules are only attributes once they are imported
+            submodule = lazy_import(f'{self.__name__}.{attr}')
+            if not is_available(submodule):
+                raise AttributeError(
+                    f'module {self.__name__!r} has no attribute {attr!r}'
+                ) from None
+            value = submodule._lazy_load()
+        setattr(self, attr, value)
+        return value
+
+    def __dir__(self) -> list[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        if self.__dict__['_lazy_module'] is not None:
+            state = 'imported'
+        elif self.__dict__['_lazy_error'] is not None:
+            state = 'unavailable'
+        else:
+            state = 'not imported'
+        return f'<lazy module {self.__name__!r} ({state})>'
+
+
+def _import(name: str) -> tuple[ImportRecord, types.ModuleType | None]:
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(name)
+    except ImportError as exc:
+        module, error = None, str(exc) or type(exc).__name__
+    else:
+        error = None
+    return ImportRecord(name, started_at, time.perf_counter() - start, error), module
+
+
+# ----------------------------------------------------------------------
+# Public API
+# ----------------------------------------------------------------------
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy that imports ``name`` on first attribute access.
+
+    Repeated calls with the same name return the same proxy.
+
+    Args:
+        name: Fully qualified module name, e.g.
+            ``'plotly.graph_objects'``.
+
+    Returns:
+        LazyModule: Module proxy.
+    """
+    proxy = _registry.get(name)
+    if proxy is None:
+        with _lock:
+            proxy = _registry.setdefault(name, LazyModule(name))
+    return proxy
+
+
+def is_available(module: str | LazyModule) -> bool:
+    """Check whether a module can be imported, importing it if needed.
+
+    The outcome is cached like any other deferred import.
+
+    Args:
+        module: Module name or proxy returned by ``lazy_import()``.
+
+    Returns:
+        bool: True if the module was imported successfully.
+    """
+    proxy = lazy_import(module) if isinstance(module, str) else module
+    try:
+        proxy._lazy_load()
+    except ImportError:
+        return False
+    return True
+
+
+def is_imported(module: str | LazyModule) -> bool:
+    """Check whether a deferred import has already happened.
+
+    Never triggers an import.
+
+    Args:
+        module: Module name or proxy returned by ``lazy_import()``.
+
+    Returns:
+        bool: True if the module was imported successfully.
+    """
+    proxy = _registry.get(module) if isinstance(module, str) else module
+    return proxy is not None and proxy.__dict__['_lazy_module'] is not None
+
+
+def optional_import(name: str) -> types.ModuleType | None:
+    """Import ``name`` now, returning None if it is not available.
+
+    Replaces ``try: import x except ImportError: x = None`` blocks,
+    with the outcome cached process-wide.
+
+    Args:
+        name: Fully qualified module name.
+
+    Returns:
+        types.ModuleType | None: The imported module, or None.
+    """
+    proxy = lazy_import(name)
+    try:
+        return proxy._lazy_load()
+    except ImportError:
+        return None
@@ -0,0 +1,475 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Peak memory and allocation sites of functions and blocks.
+
+Fitting and reduction steps run out of memory when they briefly hold
+several copies of large arrays, which the memory in use before and
+after the step does not show. ``track()`` and ``@tracked`` measure,
+for a block or each call of a function:
+
+- the peak memory traced by ``tracemalloc``, which includes NumPy
+  array data, above the memory in use at the start;
+- the resident set size (RSS) of the process at the start, at the end
+  and at its peak, sampled in a background thread;
+- the allocation sites whose memory grew most, from a diff of
+  ``tracemalloc`` snapshots taken at the start and the end.
+
+``tracemalloc`` and the RSS cover all threads, so blocks that run work
+in a thread pool include the memory of its workers. Overlapping blocks,
+nested or in other threads, each get their own peak.
+
+Tracking starts and stops ``tracemalloc``, which slows down every
+allocation of the process, so it is off by default: ``track()`` and
+``@tracked`` then cost a branch. Turn it on for a block with
+``tracking()``, with ``enable()``, or for a whole run with the
+``EASYSCIENCE_MEMORY=1`` environment variable. ``show_reports()``
+renders the reports with a table of allocation sites.
+
+```python
+from easyutilities import memory
+
+with memory.tracking():
+    with memory.track('reduce') as report:
+        reduce(run)
+print(report.peak)
+memory.show_reports()
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import html
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+from typing import TextIO
+
+from easyutilities._instrument import NULL_CONTEXT
+from easyutilities._instrument import Recorder
+from easyutilities._instrument import show
+from easyutilities.bench import format_bytes
+from easyutilities.lazy import optional_import
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Environment variable enabling tracking at import
+MEMORY_ENV = 'EASYSCIENCE_MEMORY'
+
+# Seconds between RSS samples
+RSS_INTERVAL = 0.005
+
+# Allocation sites listed per report
+TOP_SITES = 10
+
+# Whether blocks are tracked, and the completed MemoryReport list
+_recorder = Recorder(MEMORY_ENV)
+
+# Open peak watches, trackers using tracemalloc, and whether
+# tracemalloc was started by them
+_active: list[_PeakWatch] = []
+_tracing_users = 0
+_started_tracing = False
+_lock = threading.RLock()
+
+# Frames of these files are left out of allocation sites
+_IGNORED = (tracemalloc.__file__, __file__, '<frozen importlib._bootstrap>')
+
+# ----------------------------------------------------------------------
+# Resident set size
+# ----------------------------------------------------------------------
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_process = None
+
+
+def current_rss() -> int | None:
+    """Return the resident set size of this process.
+
+    Read from ``/proc/self/statm`` on Linux, else from ``psutil`` if
+    installed.
+
+    Returns:
+        int | None: RSS in bytes, or None if unavailable.
+    """
+    global _process
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    if _process is None:
+        psutil = optional_import('psutil')
+        if psutil is None:
+            return None
+        _process = psutil.Process()
+    return _process.memory_info().rss
+
+
+class _RssSampler(threading.Thread):
+    # Highest RSS seen until stop()
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name='easyutilities-rss', daemon=True)
+        self.interval = interval
+        self.start_rss = self.peak = current_rss()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            self._sample()
+
+    def stop(self) -> int | None:
+        self._done.set()
+        if self.is_alive():
+            self.join()
+        return self._sample()
+
+    def _sample(self) -> int | None:
+        rss = current_rss()
+        if rss is not None and rss > (self.peak or 0):
+            self.peak = rss
+        return rss
+
+
+# ----------------------------------------------------------------------
+# Snapshots
+# ----------------------------------------------------------------------
+
+
+class AllocationSite(NamedTuple):
+    """Change of the memory allocated at one source line.
+
+    Attributes:
+        location: ``'file:line'`` of the allocation.
+        size_diff: Change of the allocated bytes.
+        count_diff: Change of the number of allocated blocks.
+        size: Bytes allocated at the end.
+    """
+
+    location: str
+    size_diff: int
+    count_diff: int
+    size: int
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Take a ``tracemalloc`` snapshot without its own allocations.
+
+    Returns:
+        tracemalloc.Snapshot: Snapshot of the traced allocations.
+
+    Raises:
+        RuntimeError: If ``tracemalloc`` is not tracing.
+    """
+    filters = [tracemalloc.Filter(False, name) for name in _IGNORED]
+    return tracemalloc.take_snapshot().filter_traces(filters)
+
+
+def snapshot_diff(
+    before: tracemalloc.Snapshot,
+    after: tracemalloc.Snapshot,
+    top: int = TOP_SITES,
+) -> list[AllocationSite]:
+    """Return the source lines whose allocated memory grew most.
+
+    Args:
+        before: Earlier snapshot.
+        after: Later snapshot.
+        top: Maximum number of sites returned.
+
+    Returns:
+        list[AllocationSite]: Sites with more memory allocated at the
+        end, by decreasing growth.
+    """
+    sites = []
+    for stat in after.compare_to(before, 'lineno')[:top]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        location = f'{frame.filename}:{frame.lineno}'
+        sites.append(AllocationSite(location, stat.size_diff, stat.count_diff, stat.size))
+    return sites
+
+
+# ----------------------------------------------------------------------
+# Tracking
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class MemoryReport:
+    """Memory used by one tracked block or call.
+
+    Filled in when the block exits.
+
+    Attributes:
+        name: Name given to ``track()`` or the tracked function.
+        peak: Peak traced memory above the start, in bytes.
+        net: Change of the traced memory, in bytes.
+        rss_start: RSS at the start, in bytes, or None.
+        rss_end: RSS at the end, in bytes, or None.
+        rss_peak: Highest sampled RSS, in bytes, or None.
+        duration: Wall time in seconds.
+        sites: Allocation sites that grew most.
+    """
+
+    name: str
+    peak: int = 0
+    net: int = 0
+    rss_start: int | None = None
+    rss_end: int | None = None
+    rss_peak: int | None = None
+    duration: float = 0.0
+    sites: list[AllocationSite] = field(default_factory=list)
+
+
+def _reset_peak() -> None:
+    # Resets the tracemalloc peak after handing it to the open peak
+    # watches, which would lose it otherwise; every reset of the peak,
+    # also in other modules, must go through here
+    with _lock:
+        _, peak = tracemalloc.get_traced_memory()
+        for watch in _active:
+            watch.peak = max(watch.peak, peak)
+        tracemalloc.reset_peak()
+
+
+class _PeakWatch:
+    # Peak traced memory from open() to close(), kept across resets of
+    # the peak by overlapping watches; tracemalloc must be tracing
+    __slots__ = ('start', 'peak')
+
+    def open(self) -> None:
+        with _lock:
+            _reset_peak()
+            self.start, _ = tracemalloc.get_traced_memory()
+            self.peak = self.start
+            _active.append(self)
+
+    def close(self) -> tuple[int, int]:
+        # Peak and net change of the traced memory since open()
+        with _lock:
+            current, peak = tracemalloc.get_traced_memory()
+            _active.remove(self)
+        return max(self.peak, peak) - self.start, current - self.start
+
+
+class _Tracker:
+    __slots__ = ('report', 'top', '_watch', '_before', '_sampler', '_time')
+
+    def __init__(self, name: str, top: int) -> None:
+        self.report = MemoryReport(name)
+        self.top = top
+        self._watch = _PeakWatch()
+
+    def __enter__(self) -> MemoryReport:
+        global _started_tracing, _tracing_users
+        with _lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracing = True
+            _tracing_users += 1
+        # Started first, so that the sampler is not in the diff
+        self._sampler = _RssSampler(RSS_INTERVAL)
+        if self._sampler.start_rss is not None:
+            self._sampler.start()
+        self._before = take_snapshot() if self.top else None
+        self._watch.open()
+        self._time = time.perf_counter()
+        return self.report
+
+    def __exit__(self, *exc_info: object) -> None:
+        global _started_tracing, _tracing_users
+        report = self.report
+        report.duration = time.perf_counter() - self._time
+        report.rss_end = self._sampler.stop()
+        report.rss_start = self._sampler.start_rss
+        report.rss_peak = self._sampler.peak
+        report.peak, report.net = self._watch.close()
+        if self._before is not None:
+            report.sites = snapshot_diff(self._before, take_snapshot(), self.top)
+        with _lock:
+            _tracing_users -= 1
+            if not _tracing_users and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+        _recorder.records.append(report)
+
+
+def track(name: str, *, top: int = TOP_SITES) -> contextlib.AbstractContextManager:
+    """Measure the memory used by a block.
+
+    Args:
+        name: Name of the report.
+        top: Allocation sites to report; zero skips the snapshots,
+            which take time proportional to the live allocations.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager yielding
+        the ``MemoryReport``, filled in on exit and added to
+        ``reports()``; or a shared no-op one yielding None if tracking
+        is disabled.
+    """
+    if not _recorder.enabled:
+        return NULL_CONTEXT
+    return _Tracker(name, top)
+
+
+def tracked(
+    func: Callable | None = None,
+    *,
+    name: str | None = None,
+    top: int = TOP_SITES,
+) -> Callable:
+    """Measure the memory used by each call of a function.
+
+    Use as ``@tracked`` or ``@tracked(name='reduce', top=5)``. Each
+    call adds a report named after the function to ``reports()``.
+
+    Args:
+        func: Function to decorate.
+        name: Report name; default the qualified name of the function.
+        top: Allocation sites to report; see ``track()``.
+
+    Returns:
+        Callable: The decorated function, or a decorator if ``func``
+        is None.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        return _recorder.wrap(func, name, lambda label: _Tracker(label, top))
+
+    return decorate if func is None else decorate(func)
+
+
+def enable() -> None:
+    """Start tracking memory."""
+    _recorder.enabled = True
+
+
+def disable() -> None:
+    """Stop tracking memory; reports are kept."""
+    _recorder.enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if memory is being tracked."""
+    return _recorder.enabled
+
+
+def tracking(*, clear: bool = True) -> contextlib.AbstractContextManager:
+    """Track memory within a block.
+
+    ``tracemalloc`` itself only runs while a ``track()`` block or
+    ``@tracked`` call is open, not for the whole block.
+
+    Args:
+        clear: Discard previous reports first.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager enabling
+        tracking until the block exits; afterwards, tracking is
+        restored to its previous state.
+    """
+    return _recorder.scope(clear=clear)
+
+
+def reports() -> list[MemoryReport]:
+    """Return the reports, in order of completion."""
+    return list(_recorder.records)
+
+
+def clear() -> None:
+    """Discard all reports."""
+    _recorder.records.clear()
+
+
+# ----------------------------------------------------------------------
+# Rendering
+# ----------------------------------------------------------------------
+
+
+def _signed(size: int) -> str:
+    return ('+' if size >= 0 else '-') + format_bytes(abs(size))
+
+
+def _headline(report: MemoryReport) -> str:
+    line = f'peak {format_bytes(report.peak)}, net {_signed(report.net)}'
+    if report.rss_start is not None:
+        line += (
+            f', RSS {format_bytes(report.rss_start)} to {format_bytes(report.rss_end)}'
+            f' (peak {format_bytes(report.rss_peak)})'
+        )
+    return f'{line}, {report.duration:.3g} s'
+
+
+def format_report(report: MemoryReport) -> str:
+    """Render a report as text.
+
+    Args:
+        report: Report to render.
+
+    Returns:
+        str: Headline with the peak, net and RSS, followed by a table
+        of the allocation sites.
+    """
+    lines = [f'{report.name}: {_headline(report)}']
+    if report.sites:
+        lines.append(f'  {"size diff":>12} {"blocks":>8}  location')
+        lines.extend(
+            f'  {_signed(site.size_diff):>12} {site.count_diff:>+8}  {site.location}'
+            for site in report.sites
+        )
+    return '\n'.join(lines)
+
+
+def report_html(report: MemoryReport) -> str:
+    """Render a report as HTML.
+
+    Args:
+        report: Report to render.
+
+    Returns:
+        str: Headline paragraph followed by a table of the allocation
+        sites.
+    """
+    headline = f'<p><b>{html.escape(report.name)}</b>: {_headline(report)}</p>'
+    if not report.sites:
+        return headline
+    rows = ''.join(
+        f'<tr><td style="text-align: right">{_signed(site.size_diff)}</td>'
+        f'<td style="text-align: right">{site.count_diff:+}</td>'
+        f'<td style="text-align: left">{html.escape(site.location)}</td></tr>'
+        for site in report.sites
+    )
+    header = '<tr><th>size diff</th><th>blocks</th><th>location</th></tr>'
+    return f'{headline}<table><thead>{header}</thead><tbody>{rows}</tbody></table>'
+
+
+def show_reports(
+    reports: list[MemoryReport] | None = None,
+    file: TextIO | None = None,
+) -> None:
+    """Display memory reports, one after the other.
+
+    In Jupyter, displays ``report_html()`` of each report; elsewhere,
+    including CI, prints ``format_report()`` of each report, separated
+    by blank lines.
+
+    Args:
+        reports: Reports to show; default ``reports()``.
+        file: Stream for the text rendering; default ``sys.stdout``.
+    """
+    reports = list(_recorder.records) if reports is None else reports
+    show(
+        lambda: ''.join(map(report_html, reports)),
+        lambda: '\n\n'.join(map(format_report, reports)),
+        file,
+    )
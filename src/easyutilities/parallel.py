@@ -0,0 +1,293 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Environment-aware parallel map with chunking and streaming.
+
+``parallel_map()`` applies a function to the items of an iterable in
+worker threads or processes and yields the results in input order, as
+soon as they are ready. The executor is chosen by
+``choose_executor()`` from a workload hint and the environment:
+
+- an explicit ``executor`` argument always wins, then the
+  ``EASYSCIENCE_PARALLEL`` environment variable (``serial``,
+  ``thread`` or ``process``);
+- under pytest, work runs serially, so that tests stay deterministic
+  and tracebacks stay simple;
+- ``workload='io'`` (downloads, file reads) and ``workload='nogil'``
+  (NumPy or compiled code releasing the GIL) use threads;
+- ``workload='cpu'`` (pure Python) uses processes, or threads on
+  free-threaded Python builds and for functions that worker processes
+  cannot import: lambdas, local functions, and functions defined in a
+  Jupyter or Colab notebook. Notebook kernels start workers with
+  ``spawn``, since forking a kernel with running threads is unsafe;
+- with a single CPU, or a single chunk of work, work runs serially.
+
+Items are sent to the workers in chunks, to amortise the cost of
+inter-process communication, and only a few chunks per worker are
+read ahead of the consumer, so that long or infinite iterables are
+streamed. A worker exception is raised in the caller with its
+traceback and a note naming the failing item.
+
+```python
+from easyutilities.parallel import parallel_map
+
+for result in parallel_map(fit_dataset, paths, workload='cpu'):
+    print(result.chi2)
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import length_hint
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from easyutilities.environment import in_colab
+from easyutilities.environment import in_jupyter
+from easyutilities.environment import in_pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+
+# Environment variable forcing the executor of automatic choices
+PARALLEL_ENV = 'EASYSCIENCE_PARALLEL'
+
+EXECUTORS = ('serial', 'thread', 'process')
+WORKLOADS = ('cpu', 'io', 'nogil')
+
+# Chunks per worker when the chunk size is derived from the length
+CHUNKS_PER_WORKER = 4
+
+# Chunks per worker submitted ahead of the consumer
+_READ_AHEAD = 2
+
+# ----------------------------------------------------------------------
+# Executor choice
+# ----------------------------------------------------------------------
+
+
+def _cgroup_cpu_limit() -> int | None:
+    # CPU quota of the container, from cgroup v2 or v1
+    try:
+        quota, period = Path('/sys/fs/cgroup/cpu.max').read_text().split()[:2]
+    except (OSError, ValueError):
+        try:
+            quota = Path('/sys/fs/cgroup/cpu/cpu.cfs_quota_us').read_text().strip()
+            period = Path('/sys/fs/cgroup/cpu/cpu.cfs_period_us').read_text().strip()
+        except OSError:
+            return None
+    if quota in ('max', '-1'):
+        return None
+    try:
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def cpu_count() -> int:
+    """Return the number of CPUs this process may use.
+
+    Respects the CPU affinity of the process and the CPU quota of a
+    container, unlike ``os.cpu_count()``.
+
+    Returns:
+        int: Usable CPUs, at least 1.
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS and Windows
+        count = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        count = min(count, limit)
+    return max(1, count)
+
+
+def _in_notebook() -> bool:
+    return in_jupyter() or in_colab()
+
+
+def _importable(func: Callable) -> bool:
+    # Whether worker processes can import the function by its module
+    # and qualified name, as pickle does. Checked by looking the name
+    # up rather than by pickling, which would copy the arguments of a
+    # partial; those are pickled, and errors reported, on submission.
+    while isinstance(func, functools.partial):
+        func = func.func
+    func = getattr(func, '__func__', func)  # bound methods
+    if not hasattr(func, '__qualname__'):
+        func = type(func)  # callable instances
+    # Methods of builtin types only know their class
+    owner = getattr(func, '__objclass__', func)
+    module = getattr(owner, '__module__', None)
+    if module is None or (module == '__main__' and _in_notebook()):
+        return False
+    target = sys.modules.get(module)
+    for name in func.__qualname__.split('.'):
+        target = getattr(target, name, None)
+    return target is func
+
+
+def _gil_enabled() -> bool:
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def choose_executor(
+    func: Callable,
+    *,
+    workload: str = 'cpu',
+    executor: str | None = None,
+) -> str:
+    """Choose how ``parallel_map()`` runs a function.
+
+    Args:
+        func: Function to run.
+        workload: ``'cpu'`` for pure Python computations, ``'io'``
+            for waiting on files or the network, ``'nogil'`` for
+            NumPy or compiled code releasing the GIL.
+        executor: ``'serial'``, ``'thread'`` or ``'process'`` to
+            override the choice, e.g. under pytest.
+
+    Returns:
+        str: ``'serial'``, ``'thread'`` or ``'process'``.
+
+    Raises:
+        ValueError: If an argument or ``EASYSCIENCE_PARALLEL`` is not
+            one of the allowed values, or processes are requested for
+            a function they cannot import.
+    """
+    if workload not in WORKLOADS:
+        raise ValueError(f'workload must be one of {WORKLOADS}, not {workload!r}')
+    if executor is None:
+        executor = os.environ.get(PARALLEL_ENV) or None
+    if executor is not None:
+        if executor not in EXECUTORS:
+            raise ValueError(f'executor must be one of {EXECUTORS}, not {executor!r}')
+        if executor == 'process' and not _importable(func):
+            raise ValueError(
+                f'Worker processes cannot import {func!r}; define it in a module '
+                'instead of a notebook, a lambda or another function'
+            )
+        return executor
+    if in_pytest():
+        return 'serial'
+    if workload != 'cpu' or not _gil_enabled() or not _importable(func):
+        return 'thread'
+    return 'process'
+
+
+# ----------------------------------------------------------------------
+# Map
+# ----------------------------------------------------------------------
+
+
+def _run_chunk(func: Callable, start: int, items: list) -> list:
+    # Runs in the workers; notes survive pickling to the caller
+    results = []
+    for index, item in enumerate(items, start):
+        try:
+            results.append(func(item))
+        except Exception as error:
+            error.add_note(f'Raised by parallel_map() for item {index}')
+            raise
+    return results
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[tuple[int, list]]:
+    # (index of the first item, items) of consecutive chunks
+    iterator = iter(iterable)
+    start = 0
+    while chunk := list(islice(iterator, size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _create_executor(kind: str, workers: int) -> Executor:
+    if kind == 'thread':
+        return ThreadPoolExecutor(workers, thread_name_prefix='parallel_map')
+    context = multiprocessing.get_context('spawn') if _in_notebook() else None
+    return ProcessPoolExecutor(workers, mp_context=context)
+
+
+def _stream(
+    func: Callable, chunks: Iterator[tuple[int, list]], kind: str, workers: int
+) -> Iterator:
+    pool = _create_executor(kind, workers)
+    pending = deque()
+    try:
+        for start, items in islice(chunks, workers * _READ_AHEAD):
+            pending.append(pool.submit(_run_chunk, func, start, items))
+        while pending:
+            results = pending.popleft().result()
+            # Keep the workers busy while the consumer handles results
+            for start, items in islice(chunks, 1):
+                pending.append(pool.submit(_run_chunk, func, start, items))
+            yield from results
+    finally:
+        # Also on errors and when the consumer stops early
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_map(
+    func: Callable,
+    iterable: Iterable,
+    *,
+    workload: str = 'cpu',
+    executor: str | None = None,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+) -> Iterator:
+    """Apply a function to each item, in parallel where worthwhile.
+
+    Results are yielded in the order of the items, each as soon as it
+    and all earlier ones are ready. Items are read lazily, a few
+    chunks per worker ahead of the consumer. Stopping the iteration
+    early cancels the chunks not yet started.
+
+    Args:
+        func: Function of one item; for processes, it and the items
+            must be picklable.
+        iterable: Items, possibly a generator or infinite.
+        workload: Kind of work, see ``choose_executor()``.
+        executor: ``'serial'``, ``'thread'`` or ``'process'`` to
+            override the automatic choice.
+        max_workers: Number of workers; default ``cpu_count()``, or
+            ``cpu_count() + 4`` up to 32 for I/O in threads.
+        chunksize: Items sent to a worker at once; by default, the
+            number of items split into ``CHUNKS_PER_WORKER`` chunks
+            per worker if it is known, else 1.
+
+    Returns:
+        Iterator: Results in input order.
+
+    Raises:
+        ValueError: If an argument is invalid, see
+            ``choose_executor()``.
+    """
+    kind = choose_executor(func, workload=workload, executor=executor)
+    if max_workers is None:
+        max_workers = min(32, cpu_count() + 4) if workload == 'io' else cpu_count()
+    if max_workers < 1 or (chunksize is not None and chunksize < 1):
+        raise ValueError('max_workers and chunksize must be at least 1')
+    length = length_hint(iterable)
+    if chunksize is None:
+        chunksize = max(1, math.ceil(length / (max_workers * CHUNKS_PER_WORKER)))
+    if length:
+        max_workers = min(max_workers, math.ceil(length / chunksize))
+    if kind == 'serial' or max_workers == 1:
+        return map(func, iterable)
+    return _stream(func, _chunks(iterable, chunksize), kind, max_workers)
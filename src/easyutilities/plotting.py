@@ -0,0 +1,360 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Plotly figures of large datasets.
+
+Plotting a measured pattern of 10^6 points or a long MCMC trace as
+plain SVG ``Scatter`` traces produces multi-MB notebook outputs and
+sluggish interaction. ``FigureResampler`` keeps the full-resolution
+data of its traces and sends plotly only a shape-preserving sample:
+
+- Traces longer than a threshold are downsampled, by default to the
+  minimum and maximum of each of about one bucket per pixel, so that
+  peaks and spikes survive. Largest-Triangle-Three-Buckets (LTTB) is
+  also available.
+- Traces of many points at full resolution are drawn with WebGL
+  (``Scattergl``), which keeps panning and zooming responsive; smaller
+  ones stay SVG, as browsers allow only a few WebGL contexts per page.
+  The trace type is chosen once, as plotly cannot change it in place.
+- Zooming a ``FigureWidget`` resamples the visible range from the
+  full-resolution data.
+
+``default_renderer()`` picks a plotly renderer suited to the current
+environment and ``configure_renderer()`` makes it the default. New
+figures use the template of the current light or dark theme.
+
+```python
+from easyutilities.plotting import FigureResampler
+
+fig = FigureResampler()
+fig.add_trace(tof, counts, name='measured')
+fig.show()
+```
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from easyutilities.environment import in_colab
+from easyutilities.environment import in_github_ci
+from easyutilities.environment import in_jupyter
+from easyutilities.lazy import lazy_import
+from easyutilities.theme import current_theme
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    from numpy.typing import ArrayLike
+else:
+    go = lazy_import('plotly.graph_objects')
+    pio = lazy_import('plotly.io')
+
+# Points per trace above which traces are downsampled
+DOWNSAMPLE_THRESHOLD = 5_000
+
+# Points a downsampled trace is reduced to: a minimum and a maximum
+# for each pixel of a figure 1000 pixels wide
+DEFAULT_POINTS = 2_000
+
+# Full-resolution points per trace above which Scattergl is used
+# instead of Scatter
+WEBGL_THRESHOLD = 10_000
+
+METHODS = ('minmax', 'lttb')
+
+# Plotly templates by theme
+TEMPLATES = {'light': 'plotly', 'dark': 'plotly_dark'}
+
+# ----------------------------------------------------------------------
+# Downsampling
+# ----------------------------------------------------------------------
+
+
+def minmax_indices(y: ArrayLike, n_out: int) -> np.ndarray:
+    """Select the minimum and maximum of equally sized buckets.
+
+    Args:
+        y: Values, in plotting order.
+        n_out: Maximum number of selected points; two per bucket.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points, including
+        the first and last point. All indices if ``y`` has at most
+        ``n_out`` points. NaNs are never selected as extremes.
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max(n_out, 2):
+        return np.arange(n)
+    buckets = (n_out - 2) // 2
+    if buckets < 1:
+        return np.array([0, n - 1])
+    size = -(-n // buckets)
+    # Pad with the last value to fill the buckets; argmin/argmax return
+    # the first occurrence, so padding is only selected in buckets made
+    # of padding alone, which are clipped to the last point
+    padded = np.pad(y.astype(np.float64, copy=False), (0, buckets * size - n), mode='edge')
+    table = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = np.where(np.isnan(table), np.inf, table).argmin(axis=1) + offsets
+    highs = np.where(np.isnan(table), -np.inf, table).argmax(axis=1) + offsets
+    indices = np.minimum(np.concatenate((lows, highs)), n - 1)
+    return np.unique(np.concatenate(([0, n - 1], indices)))
+
+
+def lttb_indices(x: ArrayLike, y: ArrayLike, n_out: int) -> np.ndarray:
+    """Select points with Largest-Triangle-Three-Buckets.
+
+    The points between the first and last are split into ``n_out - 2``
+    buckets, and from each the point forming the largest triangle with
+    the point selected before and the mean of the next bucket is
+    selected. Only the loop over buckets runs in Python.
+
+    Args:
+        x: Positions, in plotting order.
+        y: Values.
+        n_out: Number of selected points, at least 3.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points. All indices
+        if there are at most ``n_out`` points.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[: n - 1], edges[:-1]) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[: n - 1], edges[:-1]) / counts, y[-1])
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        bx, by = mean_x[i + 1], mean_y[i + 1]
+        area = np.abs((ax - bx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (by - ay))
+        a = lo + int(np.nan_to_num(area, nan=-1.0).argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def downsample(
+    x: ArrayLike,
+    y: ArrayLike,
+    n_out: int = DEFAULT_POINTS,
+    method: str = 'minmax',
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a line to at most ``n_out`` points, preserving its shape.
+
+    Args:
+        x: Positions, in plotting order.
+        y: Values.
+        n_out: Maximum number of points returned.
+        method: ``'minmax'``, see ``minmax_indices()``, or ``'lttb'``,
+            see ``lttb_indices()``.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Selected positions and values.
+
+    Raises:
+        ValueError: If ``method`` is unknown.
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if method == 'minmax':
+        indices = minmax_indices(y, n_out)
+    elif method == 'lttb':
+        indices = lttb_indices(x, y, n_out)
+    else:
+        raise ValueError(f'Unknown method {method!r}; expected one of {METHODS}')
+    return x[indices], y[indices]
+
+
+# ----------------------------------------------------------------------
+# Renderers
+# ----------------------------------------------------------------------
+
+
+def default_renderer() -> str:
+    """Return the plotly renderer suited to the current environment.
+
+    - Google Colab: ``'colab'``.
+    - Jupyter: ``'plotly_mimetype+notebook_connected'``, which renders
+      in JupyterLab and classic notebooks, and in exported HTML loads
+      plotly.js from a CDN instead of embedding 3.5 MB per notebook.
+    - Headless CI: ``'json'``, which never opens a browser.
+    - Elsewhere, including PyCharm, whose run console cannot show
+      HTML: ``'browser'``.
+
+    Returns:
+        str: Name of a plotly renderer.
+    """
+    if in_colab():
+        return 'colab'
+    if in_jupyter():
+        return 'plotly_mimetype+notebook_connected'
+    if in_github_ci():
+        return 'json'
+    return 'browser'
+
+
+def default_template() -> str:
+    """Return the plotly template of ``current_theme()``.
+
+    Returns:
+        str: Name of a plotly template, from ``TEMPLATES``.
+    """
+    return TEMPLATES[current_theme()]
+
+
+def configure_renderer() -> str:
+    """Make ``default_renderer()`` the default plotly renderer.
+
+    A renderer set through the ``PLOTLY_RENDERER`` environment variable
+    is left in place.
+
+    Returns:
+        str: The default plotly renderer now in use.
+    """
+    if not os.environ.get('PLOTLY_RENDERER'):
+        pio.renderers.default = default_renderer()
+    return pio.renderers.default
+
+
+# ----------------------------------------------------------------------
+# Figures
+# ----------------------------------------------------------------------
+
+
+class _Series:
+    # Full-resolution data of a trace
+    __slots__ = ('x', 'y', 'monotonic')
+
+    def __init__(self, x: np.ndarray, y: np.ndarray) -> None:
+        self.x = x
+        self.y = y
+        self.monotonic = bool(np.all(x[1:] >= x[:-1]))
+
+    def visible(self, x_range: Sequence[float] | None) -> tuple[np.ndarray, np.ndarray]:
+        if x_range is None:
+            return self.x, self.y
+        lo, hi = sorted(x_range)
+        if self.monotonic:
+            # One point beyond each side, so lines reach the edges
+            start = max(int(np.searchsorted(self.x, lo)) - 1, 0)
+            stop = int(np.searchsorted(self.x, hi, side='right')) + 1
+            return self.x[start:stop], self.y[start:stop]
+        mask = (self.x >= lo) & (self.x <= hi)
+        return self.x[mask], self.y[mask]
+
+
+class FigureResampler:
+    """Plotly figure that plots downsampled views of its traces.
+
+    Args:
+        figure: Figure to add traces to; default a new empty one
+            with ``default_template()``.
+        n_out: Points per downsampled trace.
+        method: Downsampling method; see ``downsample()``.
+        threshold: Points above which traces are downsampled.
+        webgl_threshold: Full-resolution points per trace above
+            which ``Scattergl`` is used.
+
+    Raises:
+        ValueError: If ``method`` is unknown.
+    """
+
+    def __init__(
+        self,
+        figure: go.Figure | None = None,
+        *,
+        n_out: int = DEFAULT_POINTS,
+        method: str = 'minmax',
+        threshold: int = DOWNSAMPLE_THRESHOLD,
+        webgl_threshold: int = WEBGL_THRESHOLD,
+    ) -> None:
+        if method not in METHODS:
+            raise ValueError(f'Unknown method {method!r}; expected one of {METHODS}')
+        if figure is None:
+            figure = go.Figure(layout={'template': default_template()})
+        self.figure = figure
+        self.n_out = n_out
+        self.method = method
+        self.threshold = threshold
+        self.webgl_threshold = webgl_threshold
+        # Full-resolution data by index of the trace in the figure
+        self._series: dict[int, _Series] = {}
+
+    def add_trace(self, x: ArrayLike, y: ArrayLike, **kwargs) -> go.Figure:
+        """Add a line of any length to the figure.
+
+        Args:
+            x: Positions, in plotting order.
+            y: Values.
+            **kwargs: Further ``Scatter`` properties, e.g. ``name`` or
+                ``mode``.
+
+        Returns:
+            go.Figure: The figure.
+        """
+        series = _Series(np.asarray(x), np.asarray(y))
+        x_view, y_view = self._sample(series.x, series.y)
+        trace_class = go.Scattergl if len(series.x) > self.webgl_threshold else go.Scatter
+        self.figure.add_trace(trace_class(x=x_view, y=y_view, **kwargs))
+        self._series[len(self.figure.data) - 1] = series
+        return self.figure
+
+    def resample(self, x_range: Sequence[float] | None = None) -> None:
+        """Resample all traces for a visible range of x.
+
+        Args:
+            x_range: Lower and upper x of the visible range, or None
+                for the whole data.
+        """
+        with self.figure.batch_update():
+            for index, series in self._series.items():
+                x_view, y_view = self._sample(*series.visible(x_range))
+                trace = self.figure.data[index]
+                trace.x, trace.y = x_view, y_view
+
+    def widget(self) -> go.FigureWidget:
+        """Return a ``FigureWidget`` that resamples when zoomed.
+
+        The traces are moved into the widget, which this resampler then
+        manages instead of the original figure.
+
+        Returns:
+            go.FigureWidget: Widget for display in Jupyter.
+
+        Raises:
+            ImportError: If the widget dependencies of plotly, such as
+                ``anywidget`` or ``ipywidgets``, are missing.
+        """
+        self.figure = go.FigureWidget(self.figure)
+
+        def on_zoom(layout, x_range, autorange):
+            self.resample(None if autorange else x_range)
+
+        self.figure.layout.on_change(on_zoom, 'xaxis.range', 'xaxis.autorange')
+        return self.figure
+
+    def show(self, renderer: str | None = None, **kwargs) -> None:
+        """Show the figure with ``default_renderer()`` or ``renderer``.
+
+        Args:
+            renderer: Plotly renderer name.
+            **kwargs: Further arguments for ``Figure.show()``.
+        """
+        self.figure.show(renderer=renderer or default_renderer(), **kwargs)
+
+    def _sample(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if len(x) <= self.threshold:
+            return x, y
+        return downsample(x, y, self.n_out, self.method)
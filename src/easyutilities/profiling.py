@@ -0,0 +1,405 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Hierarchical timing spans with Chrome trace export.
+
+Where does the time of a fit go: the minimizer, the model, the
+calculator? ``span()`` and ``@profiled`` mark regions of code in any
+EasyScience layer; while profiling is enabled, each region records
+its wall and CPU time, nested under the regions enclosing it in the
+same thread.
+
+Profiling is disabled by default, when ``span()`` returns a shared
+no-op context manager and ``@profiled`` functions call straight
+through, so that spans can stay in library code at the cost of one
+branch. Enable it with ``profile()``, ``enable()`` or the
+``EASYSCIENCE_PROFILE=1`` environment variable.
+
+Recorded spans can be:
+
+- saved as Chrome Trace Event JSON with ``save_chrome_trace()``, for
+  https://ui.perfetto.dev or ``chrome://tracing``;
+- summarized as a tree of total, CPU and self time per span with
+  ``show_summary()``: an HTML table in Jupyter and a text tree
+  elsewhere.
+
+```python
+from easyutilities import profiling
+
+
+@profiling.profiled
+def residuals(params): ...
+
+
+with profiling.profile():
+    with profiling.span('fit', minimizer='lmfit'):
+        fit()
+profiling.show_summary()
+profiling.save_chrome_trace('fit.json')
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import html
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+from typing import TextIO
+
+from easyutilities._instrument import NULL_CONTEXT
+from easyutilities._instrument import Recorder
+from easyutilities._instrument import show
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Environment variable enabling profiling at import
+PROFILE_ENV = 'EASYSCIENCE_PROFILE'
+
+# Whether spans are recorded, and the completed SpanRecord list
+_recorder = Recorder(PROFILE_ENV)
+_thread_names: dict[int, str] = {}
+# Zero of the timestamps in Chrome traces
+_origin_ns = time.perf_counter_ns()
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+
+class SpanRecord(NamedTuple):
+    """One completed span.
+
+    Attributes:
+        path: Names of the enclosing spans and this span, outermost
+            first.
+        thread_id: ``threading.get_ident()`` of the recording thread.
+        start_ns: Start time, from ``time.perf_counter_ns()``.
+        wall_ns: Wall time in nanoseconds.
+        cpu_ns: CPU time of the recording thread in nanoseconds.
+        args: Keyword arguments given to ``span()``, or None.
+    """
+
+    path: tuple[str, ...]
+    thread_id: int
+    start_ns: int
+    wall_ns: int
+    cpu_ns: int
+    args: dict | None
+
+    @property
+    def name(self) -> str:
+        """Name of the span."""
+        return self.path[-1]
+
+
+class _Stack(threading.local):
+    # Paths of the open spans of each thread
+    def __init__(self) -> None:
+        self.paths: list[tuple[str, ...]] = []
+        thread = threading.current_thread()
+        _thread_names[thread.ident] = thread.name
+
+
+_stack = _Stack()
+
+
+class _Span:
+    __slots__ = ('name', 'args', '_path', '_start', '_cpu')
+
+    def __init__(self, name: str, args: dict | None) -> None:
+        self.name = name
+        self.args = args
+
+    def __enter__(self) -> _Span:
+        paths = _stack.paths
+        self._path = (*paths[-1], self.name) if paths else (self.name,)
+        paths.append(self._path)
+        self._cpu = time.thread_time_ns()
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        end = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self._cpu
+        _stack.paths.pop()
+        _recorder.records.append(
+            SpanRecord(
+                self._path, threading.get_ident(), self._start, end - self._start, cpu, self.args
+            )
+        )
+
+
+def span(name: str, **args: object) -> contextlib.AbstractContextManager:
+    """Time a block of code as a span nested in the enclosing ones.
+
+    Args:
+        name: Span name; spans of the same name and parents are
+            summarized together.
+        **args: JSON-serializable details shown in Chrome traces.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager recording
+        the span, or a shared no-op one if profiling is disabled.
+    """
+    if not _recorder.enabled:
+        return NULL_CONTEXT
+    return _Span(name, args or None)
+
+
+def profiled(
+    func: Callable | None = None,
+    *,
+    name: str | None = None,
+) -> Callable:
+    """Record each call of a function as a span.
+
+    Use as ``@profiled`` or ``@profiled(name='chi2')``. While
+    profiling is disabled, calls cost one extra branch.
+
+    Args:
+        func: Function to decorate.
+        name: Span name; default the qualified name of the function.
+
+    Returns:
+        Callable: The decorated function, or a decorator if ``func``
+        is None.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        return _recorder.wrap(func, name, lambda label: _Span(label, None))
+
+    return decorate if func is None else decorate(func)
+
+
+def enable() -> None:
+    """Start recording spans."""
+    _recorder.enabled = True
+
+
+def disable() -> None:
+    """Stop recording spans; recorded spans are kept."""
+    _recorder.enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if spans are being recorded."""
+    return _recorder.enabled
+
+
+def profile(*, clear: bool = True) -> contextlib.AbstractContextManager:
+    """Record spans within a block.
+
+    Args:
+        clear: Discard previously recorded spans first.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager recording
+        spans until the block exits; afterwards, profiling is restored
+        to its previous state.
+    """
+    return _recorder.scope(clear=clear)
+
+
+def records() -> list[SpanRecord]:
+    """Return the recorded spans, in order of completion."""
+    return list(_recorder.records)
+
+
+def clear() -> None:
+    """Discard all recorded spans."""
+    _recorder.records.clear()
+
+
+# ----------------------------------------------------------------------
+# Chrome trace
+# ----------------------------------------------------------------------
+
+
+def chrome_trace(spans: list[SpanRecord] | None = None) -> dict:
+    """Convert spans to the Chrome Trace Event format.
+
+    Each span is a complete (``"X"``) event with timestamps in
+    microseconds and its CPU time in ``args``; threads are named by
+    metadata events.
+
+    Args:
+        spans: Spans to convert; default ``records()``.
+
+    Returns:
+        dict: JSON-serializable trace object.
+    """
+    spans = records() if spans is None else spans
+    pid = os.getpid()
+    events = [
+        {
+            'name': 'thread_name',
+            'ph': 'M',
+            'pid': pid,
+            'tid': thread_id,
+            'args': {'name': _thread_names.get(thread_id, str(thread_id))},
+        }
+        for thread_id in sorted({record.thread_id for record in spans})
+    ]
+    for record in sorted(spans, key=lambda record: record.start_ns):
+        events.append({
+            'name': record.name,
+            'cat': 'easyutilities',
+            'ph': 'X',
+            'ts': (record.start_ns - _origin_ns) / 1e3,
+            'dur': record.wall_ns / 1e3,
+            'pid': pid,
+            'tid': record.thread_id,
+            'args': {'cpu_ms': record.cpu_ns / 1e6, **(record.args or {})},
+        })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def save_chrome_trace(path: str | Path, spans: list[SpanRecord] | None = None) -> Path:
+    """Write spans as a Chrome trace JSON file.
+
+    Args:
+        path: Output file, e.g. ``'fit.json'``.
+        spans: Spans to write; default ``records()``.
+
+    Returns:
+        Path: The written file.
+    """
+    path = Path(path)
+    with path.open('w', encoding='utf-8') as f:
+        json.dump(chrome_trace(spans), f, default=str)
+    return path
+
+
+# ----------------------------------------------------------------------
+# Summary
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class SpanStats:
+    """Totals of all spans with the same path.
+
+    Attributes:
+        path: Names of the enclosing spans and this span.
+        calls: Number of spans.
+        wall: Total wall time in seconds.
+        cpu: Total CPU time in seconds.
+        self_wall: Wall time not spent in child spans, in seconds.
+    """
+
+    path: tuple[str, ...]
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    self_wall: float = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Nesting level; zero for outermost spans."""
+        return len(self.path) - 1
+
+
+def summary(spans: list[SpanRecord] | None = None) -> list[SpanStats]:
+    """Total the spans of each path, across threads.
+
+    Args:
+        spans: Spans to summarize; default ``records()``.
+
+    Returns:
+        list[SpanStats]: Totals in tree order: each path is followed
+        by its children, siblings by decreasing wall time.
+    """
+    spans = records() if spans is None else spans
+    stats: dict[tuple[str, ...], SpanStats] = {}
+    for record in spans:
+        entry = stats.get(record.path)
+        if entry is None:
+            entry = stats[record.path] = SpanStats(record.path)
+        entry.calls += 1
+        entry.wall += record.wall_ns / 1e9
+        entry.cpu += record.cpu_ns / 1e9
+    children: dict[tuple[str, ...], list[SpanStats]] = {}
+    for entry in stats.values():
+        entry.self_wall = entry.wall
+        children.setdefault(entry.path[:-1], []).append(entry)
+    for entry in stats.values():
+        parent = stats.get(entry.path[:-1])
+        if parent is not None:
+            parent.self_wall -= entry.wall
+
+    ordered: list[SpanStats] = []
+
+    def visit(path: tuple[str, ...]) -> None:
+        for entry in sorted(children.get(path, []), key=lambda entry: -entry.wall):
+            ordered.append(entry)
+            visit(entry.path)
+
+    visit(())
+    return ordered
+
+
+_COLUMNS = ('calls', 'wall (s)', 'cpu (s)', 'self (s)')
+
+
+def _row(entry: SpanStats) -> tuple[str, ...]:
+    return (f'{entry.calls:,}', f'{entry.wall:.4f}', f'{entry.cpu:.4f}', f'{entry.self_wall:.4f}')
+
+
+def format_summary(stats: list[SpanStats] | None = None) -> str:
+    """Render a summary as an indented text tree.
+
+    Args:
+        stats: Output of ``summary()``; default the summary of
+            ``records()``.
+
+    Returns:
+        str: Text table with one line per span path.
+    """
+    stats = summary() if stats is None else stats
+    labels = ['  ' * entry.depth + entry.path[-1] for entry in stats]
+    width = max([len('span'), *map(len, labels)])
+    lines = ['span'.ljust(width) + ''.join(f'{column:>12}' for column in _COLUMNS)]
+    for label, entry in zip(labels, stats):
+        lines.append(label.ljust(width) + ''.join(f'{cell:>12}' for cell in _row(entry)))
+    return '\n'.join(lines)
+
+
+def summary_html(stats: list[SpanStats] | None = None) -> str:
+    """Render a summary as an HTML table, indented by nesting.
+
+    Args:
+        stats: Output of ``summary()``; default the summary of
+            ``records()``.
+
+    Returns:
+        str: HTML table.
+    """
+    stats = summary() if stats is None else stats
+    header = ''.join(f'<th>{column}</th>' for column in ('span', *_COLUMNS))
+    rows = []
+    for entry in stats:
+        name = html.escape(entry.path[-1])
+        cells = ''.join(f'<td style="text-align: right">{cell}</td>' for cell in _row(entry))
+        indent = f'padding-left: {1.5 * entry.depth + 0.5}em; text-align: left'
+        rows.append(f'<tr><td style="{indent}">{name}</td>{cells}</tr>')
+    return f'<table><thead><tr>{header}</tr></thead><tbody>{"".join(rows)}</tbody></table>'
+
+
+def show_summary(file: TextIO | None = None) -> None:
+    """Display the summary of the recorded spans.
+
+    In Jupyter, displays ``summary_html()``; elsewhere, including CI,
+    prints ``format_summary()``.
+
+    Args:
+        file: Stream for the text rendering; default ``sys.stdout``.
+    """
+    stats = summary()
+    show(lambda: summary_html(stats), lambda: format_summary(stats), file)
@@ -0,0 +1,483 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Environment-aware, low-overhead progress reporting.
+
+``Progress`` picks its output backend from
+``easyutilities.environment``:
+
+- Jupyter and Colab: HTML progress bar in a display handle.
+- Real terminal: in-place ANSI redraw (conservative variant in Warp and
+  PyCharm).
+- GitHub Actions CI, or output redirected to a file: periodic plain
+  lines.
+- pytest: silent.
+
+Ticks are amortised: between redraws, wrapping a sized iterable costs
+a C-level ``islice`` step per item, wrapping a generator costs one
+extra generator step per item, and ``advance()`` costs an integer
+increment under an uncontended lock. The clock is only read every few
+ticks, and the display is only redrawn after ``min_interval`` seconds.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from itertools import chain
+from itertools import islice
+from operator import length_hint
+from typing import TYPE_CHECKING
+
+from easyutilities.display import DisplayUpdater
+from easyutilities.environment import in_github_ci
+from easyutilities.environment import in_jupyter
+from easyutilities.environment import in_pycharm
+from easyutilities.environment import in_pytest
+from easyutilities.environment import in_warp
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from typing import TextIO
+
+# Upper bound for the number of ticks between two clock readings
+_MAX_STRIDE = 100_000
+
+# ----------------------------------------------------------------------
+# State and formatting
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressState:
+    """Snapshot of a progress reporter passed to backends."""
+
+    description: str
+    count: int
+    total: int | None
+    elapsed: float
+
+    @property
+    def fraction(self) -> float | None:
+        """Completed fraction in [0, 1], or None if total is unknown."""
+        if not self.total:
+            return None
+        return min(self.count / self.total, 1.0)
+
+    @property
+    def rate(self) -> float:
+        """Average number of ticks per second."""
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f'{hours:d}:{minutes:02d}:{seconds:02d}'
+    return f'{minutes:02d}:{seconds:02d}'
+
+
+def format_progress(state: ProgressState, width: int = 20) -> str:
+    """Format a progress state as a single plain-text line.
+
+    Args:
+        state: Progress state to format.
+        width: Width of the text progress bar in characters; zero
+            omits the bar.
+
+    Returns:
+        str: Line such as ``fit:  45% |#########           | 45/100
+        [00:03<00:04, 12.3 it/s]``.
+    """
+    prefix = f'{state.description}: ' if state.description else ''
+    elapsed = _format_seconds(state.elapsed)
+    rate = state.rate
+    fraction = state.fraction
+    if fraction is None:
+        return f'{prefix}{state.count} [{elapsed}, {rate:.1f} it/s]'
+    filled = int(fraction * width)
+    bar = f' |{"#" * filled}{" " * (width - filled)}|' if width else ''
+    remaining = (state.total - state.count) / rate if rate > 0 else 0.0
+    return (
+        f'{prefix}{fraction:4.0%}{bar} {state.count}/{state.total} '
+        f'[{elapsed}<{_format_seconds(max(remaining, 0.0))}, {rate:.1f} it/s]'
+    )
+
+
+# ----------------------------------------------------------------------
+# Backends
+# ----------------------------------------------------------------------
+
+
+class NullBackend:
+    """Backend that never renders anything (used under pytest)."""
+
+    min_interval = float('inf')
+
+    def render(self, state: ProgressState) -> None:
+        """Ignore the state."""
+
+    def close(self, state: ProgressState) -> None:
+        """Ignore the final state."""
+
+
+class HtmlBackend:
+    """Backend rendering an HTML progress bar in a display handle.
+
+    Args:
+        updater: Display updater to render into. A new output area is
+            created if not given.
+    """
+
+    min_interval = 0.1
+
+    def __init__(self, updater: DisplayUpdater | None = None) -> None:
+        # Redraws are already throttled by Progress, so only use the
+        # updater's diffing, not its rate limit.
+        self._updater = updater or DisplayUpdater.create(max_fps=0)
+
+    @staticmethod
+    def to_html(state: ProgressState) -> str:
+        """Render a progress state as HTML.
+
+        Args:
+            state: Progress state to render.
+
+        Returns:
+            str: HTML snippet with a ``<progress>`` element.
+        """
+        text = format_progress(state, width=0)
+        if state.total:
+            bar = f'<progress value="{state.count}" max="{state.total}"></progress> '
+        else:
+            bar = ''
+        return f'<div style="font-family: monospace">{bar}{text}</div>'
+
+    def render(self, state: ProgressState) -> None:
+        """Send the state to the display handle."""
+        self._updater.update(self.to_html(state))
+
+    def close(self, state: ProgressState) -> None:
+        """Send the final state to the display handle."""
+        self._updater.update(self.to_html(state))
+        self._updater.flush()
+
+
+def _terminal_columns(stream: TextIO) -> int:
+    # Width of the terminal the stream writes to, which is not stdout
+    # for the default stream, stderr; shutil looks at stdout only
+    try:
+        return os.get_terminal_size(stream.fileno()).columns
+    except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+        return shutil.get_terminal_size().columns
+
+
+class AnsiBackend:
+    """Backend redrawing a single terminal line in place.
+
+    In Warp and PyCharm, whose output views do not reliably honour
+    erase-line and cursor-visibility escapes, the line is redrawn with
+    a carriage return and space padding only.
+
+    Args:
+        stream: Text stream connected to a terminal.
+        plain: Use carriage return and padding only. Detected from the
+            environment if not given.
+    """
+
+    min_interval = 0.1
+
+    def __init__(self, stream: TextIO, *, plain: bool | None = None) -> None:
+        self._stream = stream
+        self._plain = (in_warp() or in_pycharm()) if plain is None else plain
+        self._width = _terminal_columns(stream) - 1
+        self._last_length = 0
+        self._started = False
+
+    def _write(self, line: str) -> None:
+        # Lines wider than the terminal wrap and break the redraw
+        line = line[: self._width]
+        if self._plain:
+            text = '\r' + line.ljust(self._last_length)
+        else:
+            text = '\r' + line + '\x1b[K'
+            if not self._started:
+                text = '\x1b[?25l' + text  # hide cursor
+        self._started = True
+        self._last_length = len(line)
+        self._stream.write(text)
+        self._stream.flush()
+
+    def render(self, state: ProgressState) -> None:
+        """Redraw the progress line."""
+        self._write(format_progress(state))
+
+    def close(self, state: ProgressState) -> None:
+        """Draw the final line and move to the next line."""
+        self._write(format_progress(state))
+        self._stream.write('\n' if self._plain else '\x1b[?25h\n')
+        self._stream.flush()
+
+
+class LineBackend:
+    """Backend writing periodic plain lines, e.g. for CI logs.
+
+    Args:
+        stream: Text stream to write to.
+        min_interval: Minimum number of seconds between lines.
+    """
+
+    def __init__(self, stream: TextIO, *, min_interval: float = 10.0) -> None:
+        self._stream = stream
+        self.min_interval = min_interval
+
+    def render(self, state: ProgressState) -> None:
+        """Write the state as one line."""
+        self._stream.write(format_progress(state) + '\n')
+        self._stream.flush()
+
+    def close(self, state: ProgressState) -> None:
+        """Write the final state as one line."""
+        self.render(state)
+
+
+def select_backend(stream: TextIO | None = None) -> object:
+    """Select the progress backend for the current environment.
+
+    Args:
+        stream: Text stream for terminal and plain-line output.
+            Defaults to ``sys.stderr``.
+
+    Returns:
+        object: A ``NullBackend``, ``HtmlBackend``, ``LineBackend`` or
+        ``AnsiBackend`` instance.
+    """
+    if in_pytest():
+        return NullBackend()
+    if in_jupyter():  # includes Colab
+        return HtmlBackend()
+    stream = stream or sys.stderr
+    if in_github_ci():
+        return LineBackend(stream)
+    try:
+        is_tty = stream.isatty()
+    except (AttributeError, ValueError):
+        is_tty = False
+    if is_tty:
+        return AnsiBackend(stream)
+    return LineBackend(stream)
+
+
+# ----------------------------------------------------------------------
+# Progress reporter
+# ----------------------------------------------------------------------
+
+
+class Progress:
+    """Thread-safe, amortised progress reporter.
+
+    Example:
+        ```python
+        with Progress(total=len(points), description='fit') as progress:
+            for point in progress.iter(points):
+                evaluate(point)
+        ```
+
+    Args:
+        total: Expected number of ticks, if known.
+        description: Short label shown before the progress bar.
+        backend: Output backend. Selected with ``select_backend()`` if
+            not given.
+        min_interval: Minimum number of seconds between redraws.
+            Defaults to the backend's ``min_interval``.
+        clock: Monotonic clock returning seconds; mainly for tests.
+    """
+
+    def __init__(
+        self,
+        total: int | None = None,
+        *,
+        description: str = '',
+        backend: object | None = None,
+        min_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total = total
+        self.description = description
+        self.backend = backend if backend is not None else select_backend()
+        if min_interval is None:
+            min_interval = self.backend.min_interval  # type: ignore[attr-defined]
+        self.min_interval = min_interval
+        # Aim for several clock readings per redraw interval
+        self._check_interval = min(min_interval / 4, 0.05)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Ticks, added under the lock
+        self._count = 0
+        self._next_check = 1
+        self._stride = 1
+        self._start = clock()
+        self._last_check = self._start
+        self._last_check_count = 0
+        self._next_redraw = self._start
+        self._closed = False
+
+    @property
+    def count(self) -> int:
+        """Number of ticks so far."""
+        return self._count
+
+    def state(self) -> ProgressState:
+        """Return a snapshot of the current progress.
+
+        Returns:
+            ProgressState: Current description, count, total and
+            elapsed time.
+        """
+        return ProgressState(self.description, self.count, self.total, self._clock() - self._start)
+
+    def advance(self, n: int = 1) -> None:
+        """Add ``n`` ticks; redraw if ``min_interval`` has passed.
+
+        Safe to call from several threads. The clock is only read
+        about every ``_stride`` ticks.
+
+        Args:
+            n: Number of ticks to add.
+        """
+        with self._lock:
+            self._count += n
+            if self._count >= self._next_check:
+                self._check()
+
+    def _check(self) -> None:
+        # Called with the lock held, about every ``_stride`` ticks
+        now = self._clock()
+        count = self._count
+        elapsed = now - self._last_check
+        if elapsed > 0:
+            ticks_per_second = (count - self._last_check_count) / elapsed
+            stride = int(ticks_per_second * self._check_interval)
+            self._stride = max(1, min(stride, _MAX_STRIDE))
+        self._next_check = count + self._stride
+        self._last_check = now
+        self._last_check_count = count
+        if now >= self._next_redraw and not self._closed:
+            self._next_redraw = now + self.min_interval
+            self.backend.render(self.state())  # type: ignore[attr-defined]
+
+    def iter(self, iterable: Iterable, *, close: bool = False) -> Iterator:
+        """Iterate over ``iterable``, adding one tick per item.
+
+        Sets ``total`` from ``len(iterable)`` if it is not set yet.
+
+        Args:
+            iterable: Items to iterate over.
+            close: Close the reporter when the iteration ends.
+
+        Returns:
+            Iterator: Iterator over the items of ``iterable``.
+        """
+        try:
+            size = len(iterable)  # type: ignore[arg-type]
+        except TypeError:
+            return self._iter_unsized(iterable, close)
+        if self.total is None:
+            self.total = size
+        return self._iter_sized(iterable, size, close)
+
+    def _iter_sized(self, iterable: Iterable, size: int, close: bool) -> Iterator:
+        # ``chain`` pulls the items through C-level ``islice`` strides,
+        # so the Python generator below only runs once per stride.
+        return chain.from_iterable(self._strides(iter(iterable), size, close))
+
+    def _strides(self, it: Iterator, size: int, close: bool) -> Iterator:
+        done = 0
+        try:
+            while done < size:
+                stride = min(self._stride, size - done)
+                yield islice(it, stride)
+                done += stride
+                self._advance_stride(stride)
+        finally:
+            # On early exit, the remaining length of the iterator tells
+            # how far the consumer got into the current stride
+            if done < size:
+                remaining = length_hint(it, -1)
+                if remaining >= 0:
+                    self._advance_stride(max(size - remaining - done, 0))
+            if close:
+                self.close()
+
+    def _iter_unsized(self, iterable: Iterable, close: bool) -> Iterator:
+        countdown = pending = self._stride
+        try:
+            for item in iterable:
+                countdown -= 1
+                yield item
+                if not countdown:
+                    self._advance_stride(pending)
+                    countdown = pending = self._stride
+        finally:
+            self._advance_stride(pending - countdown)
+            if close:
+                self.close()
+
+    def _advance_stride(self, n: int) -> None:
+        with self._lock:
+            self._count += n
+            self._check()
+
+    def close(self) -> None:
+        """Render the final state and release the backend.
+
+        Calling it more than once has no further effect.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.backend.close(self.state())  # type: ignore[attr-defined]
+
+    def __enter__(self) -> Progress:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def track(
+    iterable: Iterable,
+    description: str = '',
+    *,
+    total: int | None = None,
+    **kwargs,
+) -> Iterator:
+    """Iterate over ``iterable`` while reporting progress.
+
+    The reporter is closed when the iteration ends.
+
+    Example:
+        ```python
+        for point in track(points, 'fit'):
+            evaluate(point)
+        ```
+
+    Args:
+        iterable: Items to iterate over.
+        description: Short label shown before the progress bar.
+        total: Expected number of items, if ``iterable`` has no length.
+        **kwargs: Further keyword arguments for ``Progress``.
+
+    Returns:
+        Iterator: Iterator over the items of ``iterable``.
+    """
+    progress = Progress(total, description=description, **kwargs)
+    return progress.iter(iterable, close=True)
@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""NumPy arrays in shared memory for process pools.
+
+Fanning a large measured dataset out to a process pool, e.g. for
+bootstrap or ensemble fits, pickles and copies the full arrays for
+every task. ``share()`` copies an array once into a
+``multiprocessing.shared_memory`` segment and returns a
+``SharedArray`` handle: a picklable tuple of a few dozen bytes that
+tasks receive instead of the array. In a worker, ``handle.open()``
+maps the segment and returns a zero-copy ``ndarray`` view, read-only
+unless requested otherwise.
+
+Segments are reference-counted in the process that created them:
+``share()`` holds one reference, ``acquire()`` adds one and
+``release()``, or leaving a ``with handle:`` block, drops one. The
+segment is unlinked with the last reference. Cleanup is guaranteed:
+
+- segments still held at interpreter exit are unlinked then;
+- if the owning process crashes, the ``multiprocessing`` resource
+  tracker unlinks its segments;
+- workers never own segments, so a crashing worker leaks nothing:
+  the operating system unmaps its views.
+
+Worker views outlive the unlinking of their segment; the memory is
+freed once the last view is garbage collected.
+
+```python
+from functools import partial
+
+from easyutilities.parallel import parallel_map
+from easyutilities.shared_memory import share
+
+
+def bootstrap_fit(handle, seed):
+    data = handle.open()  # Zero-copy view
+    ...
+
+
+with share(data) as handle:
+    results = list(
+        parallel_map(partial(bootstrap_fit, handle), range(100))
+    )
+```
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import mmap
+import os
+import sys
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+import numpy as np
+
+
+class _Segment:
+    __slots__ = ('memory', 'refs')
+
+    def __init__(self, memory: SharedMemory) -> None:
+        self.memory = memory
+        self.refs = 1
+
+
+# Segments created by this process, by name
+_owned: dict[str, _Segment] = {}
+_lock = threading.Lock()
+
+# ----------------------------------------------------------------------
+# Handles
+# ----------------------------------------------------------------------
+
+
+class SharedArray(NamedTuple):
+    """Picklable handle of an array in shared memory.
+
+    Use as a context manager in the owning process to release the
+    reference taken by ``share()`` on exit.
+
+    Attributes:
+        name: Name of the shared memory segment.
+        shape: Shape of the array.
+        dtype: Data type string of the array, e.g. ``'<f8'``.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def __enter__(self) -> SharedArray:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        release(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the array in bytes."""
+        return math.prod(self.shape) * np.dtype(self.dtype).itemsize
+
+    def open(self, *, writeable: bool = False) -> np.ndarray:
+        """Return a zero-copy view of the shared array.
+
+        Works in any process while the segment exists, including the
+        owning one. Writes through a writeable view are seen by all
+        processes.
+
+        Args:
+            writeable: Return a writeable view; by default the view is
+                read-only.
+
+        Returns:
+            np.ndarray: View of the shared memory.
+
+        Raises:
+            FileNotFoundError: If the segment was already unlinked.
+        """
+        # Mapped at least one byte, as empty mappings are invalid
+        buffer = _map(self.name, max(1, self.nbytes), writeable)
+        count = math.prod(self.shape)
+        view = np.frombuffer(buffer, dtype=self.dtype, count=count).reshape(self.shape)
+        view.flags.writeable = writeable
+        return view
+
+
+if sys.version_info >= (3, 13):
+
+    class _Mapping(SharedMemory):
+        # Segment opened for views, which keep it open through the
+        # buffer protocol; closed when the last view is collected
+        def __buffer__(self, flags: int) -> memoryview:
+            return self.buf.__buffer__(flags)
+
+
+def _map(name: str, size: int, writeable: bool) -> object:
+    # Maps a segment without registering it with the resource tracker,
+    # which would unlink it when a worker exits. The array view keeps
+    # the mapping alive and unmaps it when garbage collected.
+    if sys.version_info >= (3, 13):
+        return _Mapping(name, track=False)
+    if os.name == 'nt':
+        # Opened by name first, which raises if the segment is gone,
+        # where a tagged mmap would create a new zero-filled one; the
+        # mapping then keeps the segment alive. Windows does not track
+        # segments.
+        memory = SharedMemory(name)
+        try:
+            access = mmap.ACCESS_WRITE if writeable else mmap.ACCESS_READ
+            return mmap.mmap(-1, size, tagname=name, access=access)
+        finally:
+            memory.close()
+    # Python 3.11 and 3.12 on POSIX: SharedMemory registers every
+    # segment it opens, so the segment is opened with the private
+    # function it uses itself
+    import _posixshmem
+
+    flags = os.O_RDWR if writeable else os.O_RDONLY
+    fd = _posixshmem.shm_open('/' + name.lstrip('/'), flags, mode=0o600)
+    try:
+        if writeable:
+            return mmap.mmap(fd, size)
+        return mmap.mmap(fd, size, prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+
+
+# ----------------------------------------------------------------------
+# Ownership
+# ----------------------------------------------------------------------
+
+
+def share(array: np.ndarray) -> SharedArray:
+    """Copy an array into a new shared memory segment.
+
+    The calling process owns the segment and holds one reference to
+    it; release it with ``release()`` or a ``with`` block.
+
+    Args:
+        array: Array to publish; object arrays are not supported.
+
+    Returns:
+        SharedArray: Handle to pass to workers.
+
+    Raises:
+        TypeError: If the array has object dtype.
+    """
+    array = np.asarray(array)
+    if array.dtype.hasobject:
+        raise TypeError('Arrays of Python objects cannot be shared')
+    memory = SharedMemory(create=True, size=max(1, array.nbytes))
+    try:
+        target = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+        target[...] = array
+        # Drop the export of the buffer, which would prevent closing
+        del target
+    except BaseException:
+        memory.close()
+        memory.unlink()
+        raise
+    with _lock:
+        _owned[memory.name] = _Segment(memory)
+    return SharedArray(memory.name, array.shape, array.dtype.str)
+
+
+def acquire(handle: SharedArray) -> SharedArray:
+    """Add a reference to a segment owned by this process.
+
+    Args:
+        handle: Handle returned by ``share()``.
+
+    Returns:
+        SharedArray: The same handle, to use in a ``with`` block.
+
+    Raises:
+        KeyError: If this process does not own the segment, or it was
+            already released.
+    """
+    with _lock:
+        _owned[handle.name].refs += 1
+    return handle
+
+
+def release(handle: SharedArray) -> None:
+    """Drop a reference, unlinking the segment with the last one.
+
+    Views opened before stay valid until garbage collected.
+
+    Args:
+        handle: Handle returned by ``share()``.
+
+    Raises:
+        KeyError: If this process does not own the segment, or it was
+            already released.
+    """
+    with _lock:
+        segment = _owned[handle.name]
+        segment.refs -= 1
+        if segment.refs > 0:
+            return
+        del _owned[handle.name]
+    _unlink(segment.memory)
+
+
+def references(handle: SharedArray) -> int:
+    """Return the references to a segment held by this process.
+
+    Returns:
+        int: Number of references; zero once the segment is released,
+        or if another process owns it.
+    """
+    with _lock:
+        segment = _owned.get(handle.name)
+        return 0 if segment is None else segment.refs
+
+
+def _unlink(memory: SharedMemory) -> None:
+    memory.close()
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+
+
+@atexit.register
+def _release_all() -> None:
+    # Unlinks segments still held when the interpreter exits
+    with _lock:
+        segments = list(_owned.values())
+        _owned.clear()
+    for segment in segments:
+        _unlink(segment.memory)
+
+
+def _forget_owned() -> None:
+    # Forked children inherit the registry but not the ownership, and
+    # possibly a lock held by another thread of the parent
+    global _lock
+    _lock = threading.Lock()
+    _owned.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_owned)
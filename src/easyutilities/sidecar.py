@@ -0,0 +1,290 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Binary sidecars of parsed text datasets, loaded as memory maps.
+
+``load_columns()`` parses a text data file once and stores the columns
+as ``.npy`` files plus a small JSON header in a sidecar directory keyed
+on the SHA-256 of the source file and on the parser. Later loads return
+read-only ``np.memmap`` views of the ``.npy`` files: nothing is parsed
+or copied, and all processes loading the same sidecar share the same
+physical pages through the operating system's page cache.
+
+Sidecars are invalidated automatically: a changed source file has
+another hash and gets a new sidecar. To avoid re-hashing unchanged
+files, the hash of each source is remembered together with its size
+and modification time.
+
+The cache layout is::
+
+    <cache_dir>/<key>/<xx>/<sha256>/header.json
+    <cache_dir>/<key>/<xx>/<sha256>/0.npy, 1.npy, ...
+    <cache_dir>/index/<hash of the source path>.json
+
+```python
+from easyutilities.sidecar import load_columns
+
+columns = load_columns('si.xye', names=['x', 'y', 'e'])
+columns['y'].max()
+```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from easyutilities._atomic import write_atomic
+from easyutilities._filelock import FileLock
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+
+    Parser = Callable[[Path], 'Mapping[str, ArrayLike] | ArrayLike']
+
+# Version of the sidecar layout; bumping it invalidates all sidecars
+FORMAT_VERSION = 1
+
+# Size of the chunks read when hashing a source file, in bytes
+_CHUNK_SIZE = 1 << 20
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+
+def parse_whitespace(path: Path) -> np.ndarray:
+    """Parse whitespace-separated numeric columns.
+
+    Lines starting with ``#`` are comments.
+
+    Args:
+        path: Text file.
+
+    Returns:
+        np.ndarray: Two-dimensional array with one column per field.
+    """
+    return np.loadtxt(path, comments='#', ndmin=2)
+
+
+def _as_columns(parsed: object, names: Sequence[str] | None) -> dict[str, np.ndarray]:
+    # Normalise parser output to contiguous arrays by column name
+    if hasattr(parsed, 'keys'):
+        columns = {str(name): np.ascontiguousarray(parsed[name]) for name in parsed.keys()}
+        if names is not None:
+            columns = dict(zip(names, columns.values(), strict=True))
+    else:
+        table = np.asarray(parsed)
+        if table.ndim == 1:
+            table = table[:, np.newaxis]
+        if names is None:
+            names = [f'col{i}' for i in range(table.shape[1])]
+        if len(names) != table.shape[1]:
+            raise ValueError(f'{len(names)} names given for {table.shape[1]} columns')
+        columns = {name: np.ascontiguousarray(table[:, i]) for i, name in enumerate(names)}
+    for name, values in columns.items():
+        if values.dtype.hasobject:
+            raise TypeError(f'Column {name!r} has object dtype and cannot be memory-mapped')
+    return columns
+
+
+def parser_key(parser: Callable) -> str:
+    """Return a directory-safe key identifying a parser.
+
+    Args:
+        parser: Parser function.
+
+    Returns:
+        str: Module and qualified name, e.g.
+        ``'easyutilities.sidecar.parse_whitespace'``.
+    """
+    name = f'{getattr(parser, "__module__", "")}.{getattr(parser, "__qualname__", repr(parser))}'
+    return re.sub(r'[^\w.-]+', '_', name).strip('._')
+
+
+# ----------------------------------------------------------------------
+# Source hashes
+# ----------------------------------------------------------------------
+
+
+def file_hash(path: str | os.PathLike) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _source_hash(path: Path, cache_dir: Path) -> str:
+    # Hash of the source, reusing the remembered one while the size and
+    # modification time of the file are unchanged
+    path = path.resolve()
+    stat = path.stat()
+    key = hashlib.sha256(os.fsencode(path)).hexdigest()
+    index_file = cache_dir / 'index' / f'{key}.json'
+    try:
+        entry = json.loads(index_file.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        entry = {}
+    if entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return entry['sha256']
+    digest = file_hash(path)
+    entry = {'path': str(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    entry['sha256'] = digest
+    write_atomic(index_file, json.dumps(entry))
+    return digest
+
+
+# ----------------------------------------------------------------------
+# Sidecars
+# ----------------------------------------------------------------------
+
+
+def default_cache_dir() -> Path:
+    """Return the default sidecar directory.
+
+    The ``sidecars`` subdirectory of the data download cache, see
+    ``easyutilities.data.default_cache_dir()``.
+    """
+    from easyutilities.data import default_cache_dir as data_cache_dir
+
+    return data_cache_dir() / 'sidecars'
+
+
+def sidecar_dir(source_hash: str, key: str, cache_dir: str | os.PathLike) -> Path:
+    """Return the directory of the sidecar for a source and parser.
+
+    Args:
+        source_hash: SHA-256 hex digest of the source file.
+        key: Parser key, see ``parser_key()``.
+        cache_dir: Sidecar cache directory.
+
+    Returns:
+        Path: Sidecar directory, whether or not it exists.
+    """
+    return Path(cache_dir) / key / source_hash[:2] / source_hash
+
+
+def load_columns(
+    source: str | os.PathLike,
+    parser: Parser | None = None,
+    *,
+    names: Sequence[str] | None = None,
+    key: str | None = None,
+    cache_dir: str | os.PathLike | None = None,
+    source_hash: str | None = None,
+) -> dict[str, np.ndarray]:
+    """Load the columns of a text data file through a binary sidecar.
+
+    The first call parses ``source`` and writes the sidecar; later
+    calls, in any process, memory-map it.
+
+    Args:
+        source: Text data file.
+        parser: Function parsing the file into a mapping of column
+            arrays, or into a two-dimensional array whose columns are
+            named by ``names``. Defaults to ``parse_whitespace()``.
+        names: Column names; default ``col0``, ``col1``, ...
+        key: Identifies the parser and its options in the cache;
+            defaults to ``parser_key(parser)``. Change it when the
+            parser changes its output.
+        cache_dir: Sidecar cache directory; see ``default_cache_dir()``.
+        source_hash: Known SHA-256 hex digest of ``source``, e.g. from
+            a data registry, to skip hashing the file.
+
+    Returns:
+        dict[str, np.ndarray]: Read-only memory-mapped columns by name.
+
+    Raises:
+        TypeError: If a parsed column has object dtype.
+    """
+    source = Path(source)
+    parser = parser or parse_whitespace
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    if key is None:
+        key = parser_key(parser)
+    if names is not None:
+        key = f'{key}-' + hashlib.sha256('\0'.join(names).encode()).hexdigest()[:12]
+    if source_hash is None:
+        source_hash = _source_hash(source, cache_dir)
+    directory = sidecar_dir(source_hash, key, cache_dir)
+
+    columns = _read_sidecar(directory, source_hash)
+    if columns is not None:
+        return columns
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    with FileLock(directory.with_name(source_hash + '.lock')):
+        # Another process may have written it while we waited
+        columns = _read_sidecar(directory, source_hash)
+        if columns is None:
+            parsed = _as_columns(parser(source), names)
+            _write_sidecar(directory, parsed, source_hash, key)
+            columns = _read_sidecar(directory, source_hash)
+    return columns
+
+
+def _read_sidecar(directory: Path, source_hash: str) -> dict[str, np.ndarray] | None:
+    try:
+        header = json.loads((directory / 'header.json').read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if header.get('version') != FORMAT_VERSION or header.get('source_sha256') != source_hash:
+        return None
+    columns = {}
+    for column in header['columns']:
+        path = directory / column['file']
+        try:
+            if column['size'] == 0:
+                # Empty files cannot be memory-mapped
+                columns[column['name']] = np.load(path, allow_pickle=False)
+            else:
+                columns[column['name']] = np.load(path, mmap_mode='r', allow_pickle=False)
+        except (FileNotFoundError, ValueError):
+            # Missing or truncated column file: rebuilt like a stale one
+            return None
+    return columns
+
+
+def _write_sidecar(
+    directory: Path, columns: dict[str, np.ndarray], source_hash: str, key: str
+) -> None:
+    # Written into a temporary directory renamed into place, so that
+    # readers never see a partial sidecar
+    tmp = Path(tempfile.mkdtemp(dir=directory.parent, prefix='.tmp-'))
+    try:
+        header = {
+            'version': FORMAT_VERSION,
+            'source_sha256': source_hash,
+            'key': key,
+            'columns': [],
+        }
+        for i, (name, values) in enumerate(columns.items()):
+            file = f'{i}.npy'
+            np.save(tmp / file, values, allow_pickle=False)
+            header['columns'].append({
+                'name': name,
+                'file': file,
+                'dtype': values.dtype.str,
+                'shape': list(values.shape),
+                'size': int(values.size),
+            })
+        (tmp / 'header.json').write_text(json.dumps(header, indent=2), encoding='utf-8')
+        if directory.exists():
+            # Outdated or broken sidecar
+            shutil.rmtree(directory)
+        os.rename(tmp, directory)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
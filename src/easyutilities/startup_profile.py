@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Import-time profile of a module in a fresh interpreter.
+
+Runs ``python -X importtime -c "import <module>"`` in a subprocess and
+parses the report into a tree, leaving out the modules imported during
+interpreter startup.
+
+Usage:
+  python -m easyutilities.startup_profile
+  python -m easyutilities.startup_profile easyutilities.environment
+  python -m easyutilities.startup_profile --min-us 500 --top 10
+  python -m easyutilities.startup_profile --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess  # noqa: S404
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+
+# Written to stderr right before the profiled import, to separate it
+# from the imports done during interpreter startup.
+_MARKER = '--- easyutilities.startup_profile ---'
+
+_LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$')
+
+# ----------------------------------------------------------------------
+# Data structures
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class ImportNode:
+    """One module in the import-time tree.
+
+    Attributes:
+        name: Fully qualified module name.
+        self_us: Time spent in the module itself, in microseconds.
+        cumulative_us: Time including nested imports, in microseconds.
+        children: Modules imported while importing this one.
+    """
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list[ImportNode] = field(default_factory=list)
+
+    def walk(self):
+        """Yield this node and all nested nodes, parents first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict:
+        """Return the subtree as JSON-serialisable dictionaries."""
+        return {
+            'name': self.name,
+            'self_us': self.self_us,
+            'cumulative_us': self.cumulative_us,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class ImportProfile:
+    """Import-time tree of a module imported in a fresh interpreter.
+
+    Attributes:
+        module: Name of the profiled module.
+        roots: Top-level imports triggered by importing ``module``.
+    """
+
+    module: str
+    roots: list[ImportNode]
+
+    @property
+    def total_us(self) -> int:
+        """Total import time in microseconds."""
+        return sum(root.cumulative_us for root in self.roots)
+
+    @property
+    def modules(self) -> set[str]:
+        """Names of all modules imported by ``module``."""
+        return {node.name for root in self.roots for node in root.walk()}
+
+    def top(self, n: int = 10) -> list[ImportNode]:
+        """Return the ``n`` modules with the largest self time."""
+        nodes = [node for root in self.roots for node in root.walk()]
+        return sorted(nodes, key=lambda node: node.self_us, reverse=True)[:n]
+
+    def to_dict(self) -> dict:
+        """Return the profile as JSON-serialisable dictionaries."""
+        return {
+            'module': self.module,
+            'total_us': self.total_us,
+            'modules': sorted(self.modules),
+            'roots': [root.to_dict() for root in self.roots],
+        }
+
+
+# ----------------------------------------------------------------------
+# Profiling
+# ----------------------------------------------------------------------
+
+
+def parse_importtime(text: str) -> list[ImportNode]:
+    """Parse ``-X importtime`` output into a forest of import nodes.
+
+    Nested imports are reported before their parent, indented by two
+    more spaces.
+
+    Args:
+        text: The stderr output of ``python -X importtime``.
+
+    Returns:
+        list[ImportNode]: Top-level imports in report order.
+    """
+    # Children waiting for their parent, by indentation depth
+    pending: dict[int, list[ImportNode]] = {}
+    for line in text.splitlines():
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = ImportNode(name, int(self_us), int(cumulative_us))
+        node.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def profile_import(module: str = 'easyutilities') -> ImportProfile:
+    """Import ``module`` in a fresh interpreter and profile it.
+
+    The subprocess inherits the environment of the current process,
+    with this package's source directory prepended to ``PYTHONPATH``.
+
+    Args:
+        module: Name of the module to import.
+
+    Returns:
+        ImportProfile: Import-time tree of ``module``.
+
+    Raises:
+        RuntimeError: If the import fails in the subprocess.
+    """
+    code = f'import sys; sys.stderr.write({_MARKER!r} + "\\n"); import {module}'
+    env = os.environ.copy()
+    src_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    existing = env.get('PYTHONPATH', '')
+    env['PYTHONPATH'] = src_root if not existing else src_root + os.pathsep + existing
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', code],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Importing {module!r} failed:\n{result.stderr.strip()}')
+    _, _, report = result.stderr.partition(_MARKER)
+    return ImportProfile(module, parse_importtime(report))
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+
+
+def format_tree(profile: ImportProfile, min_us: int = 0) -> str:
+    """Format the import tree with cumulative and self times.
+
+    Args:
+        profile: Profile to format.
+        min_us: Hide subtrees whose cumulative time is below this many
+            microseconds.
+
+    Returns:
+        str: One line per module, indented by nesting depth.
+    """
+    lines = [f'{"cumulative":>12} {"self":>10}  module']
+
+    def add(node: ImportNode, depth: int) -> None:
+        if node.cumulative_us < min_us:
+            return
+        lines.append(
+            f'{node.cumulative_us / 1000:>10.2f}ms {node.self_us / 1000:>8.2f}ms  '
+            f'{"  " * depth}{node.name}'
+        )
+        for child in node.children:
+            add(child, depth + 1)
+
+    for root in profile.roots:
+        add(root, 0)
+    lines.append(
+        f'Total: {profile.total_us / 1000:.2f} ms, {len(profile.modules)} modules '
+        f'imported by {profile.module!r}'
+    )
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: profile a module import and print the report."""
+    parser = argparse.ArgumentParser(
+        prog='python -m easyutilities.startup_profile',
+        description='Show the import-time tree of a module in a fresh interpreter',
+    )
+    parser.add_argument(
+        'module',
+        nargs='?',
+        default='easyutilities',
+        help='Module to import (default: easyutilities)',
+    )
+    parser.add_argument(
+        '--min-us',
+        type=int,
+        default=0,
+        help='Hide subtrees faster than this many microseconds',
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=0,
+        help='Also list the N modules with the largest self time',
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the profile as JSON',
+    )
+    args = parser.parse_args(argv)
+
+    profile = profile_import(args.module)
+    if args.json:
+        print(json.dumps(profile.to_dict(), indent=2))
+        return 0
+    print(format_tree(profile, min_us=args.min_us))
+    if args.top:
+        print(f'\nTop {args.top} by self time:')
+        for node in profile.top(args.top):
+            print(f'{node.self_us / 1000:>10.2f}ms  {node.name}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,277 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Display of large pandas tables in notebooks and terminals.
+
+Displaying a ``DataFrame`` of 10^5 to 10^6 rows as HTML renders every
+row into the notebook, which freezes the browser and bloats the saved
+``.ipynb``. ``show_table()`` instead renders only what is visible:
+
+- In Jupyter, a ``TableView`` shows one page of rows in an output area
+  and replaces it through the display handle on ``next()``,
+  ``prev()`` or ``goto()``.
+- In Google Colab, the view is a fixed-height scrollable window of
+  rows, moved with ``scroll_to()``, so that the output frame keeps its
+  size while moving through the table.
+- Elsewhere, the first and last rows are printed as text.
+
+Windows use the scrollbars of the current light or dark theme. All
+renderings slice the rows first, so their cost does not depend on
+the number of rows in the table.
+
+```python
+from easyutilities.table import show_table
+
+view = show_table(reflections)  # page 1
+view.next()  # page 2, in the same output area
+view.goto(-1)  # last page
+```
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from typing import TYPE_CHECKING
+from typing import TextIO
+
+from easyutilities.display import DisplayUpdater
+from easyutilities.environment import can_update_ipython_display
+from easyutilities.environment import in_colab
+from easyutilities.environment import in_jupyter
+from easyutilities.theme import current_theme
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Rows per page in paginated views
+PAGE_ROWS = 20
+
+# Rows per window in windowed views
+WINDOW_ROWS = 100
+
+# Height of windowed views, in CSS pixels
+WINDOW_HEIGHT = 400
+
+# Rows printed by format_table(): this many from the start and the end
+TEXT_ROWS = 10
+
+MODES = ('pages', 'window')
+
+
+def _as_frame(frame: pd.DataFrame | pd.Series) -> pd.DataFrame:
+    return frame.to_frame() if hasattr(frame, 'to_frame') else frame
+
+
+def default_mode() -> str:
+    """Return the view mode suited to the current environment.
+
+    Returns:
+        str: ``'window'`` in Google Colab, else ``'pages'``.
+    """
+    return 'window' if in_colab() else 'pages'
+
+
+# ----------------------------------------------------------------------
+# Notebook view
+# ----------------------------------------------------------------------
+
+
+class TableView:
+    """Paginated or windowed HTML view of a table.
+
+    Only the rows of the current page or window are rendered. Once
+    shown, navigating re-renders the view into the same output area
+    through its display handle. Navigation methods return None, so
+    that calling them as the last line of a cell does not display the
+    view a second time.
+
+    Args:
+        frame: Table to view; a ``Series`` is viewed as one column.
+        rows: Rows per page or window; default ``PAGE_ROWS`` or
+            ``WINDOW_ROWS``.
+        mode: ``'pages'`` or ``'window'``; default ``default_mode()``.
+        handle: IPython display handle to render into; by default
+            ``show()`` creates a new output area.
+
+    Raises:
+        ValueError: If ``mode`` is unknown or ``rows`` not positive.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame | pd.Series,
+        *,
+        rows: int | None = None,
+        mode: str | None = None,
+        handle: object = None,
+    ) -> None:
+        mode = mode or default_mode()
+        if mode not in MODES:
+            raise ValueError(f'Unknown mode {mode!r}; expected one of {MODES}')
+        if rows is None:
+            rows = PAGE_ROWS if mode == 'pages' else WINDOW_ROWS
+        if rows < 1:
+            raise ValueError(f'rows must be positive, got {rows}')
+        self.frame = _as_frame(frame)
+        self.mode = mode
+        self.rows = rows
+        self._start = 0
+        self._updater = None if handle is None else DisplayUpdater(handle, max_fps=0)
+
+    def __repr__(self) -> str:
+        return (
+            f'<TableView of {self.total} rows, {self.mode} of {self.rows} rows, '
+            f'page {self.page + 1} of {self.pages}>'
+        )
+
+    @property
+    def total(self) -> int:
+        """Number of rows in the table."""
+        return len(self.frame)
+
+    @property
+    def start(self) -> int:
+        """Position of the first row in view."""
+        return self._start
+
+    @property
+    def stop(self) -> int:
+        """Position after the last row in view."""
+        return min(self._start + self.rows, self.total)
+
+    @property
+    def page(self) -> int:
+        """Zero-based page of the first row in view."""
+        return self._start // self.rows
+
+    @property
+    def pages(self) -> int:
+        """Number of pages, at least one."""
+        return max(1, -(-self.total // self.rows))
+
+    def goto(self, page: int) -> None:
+        """Show a page; negative pages count from the end.
+
+        Args:
+            page: Zero-based page number; clipped to the valid range.
+        """
+        if page < 0:
+            page += self.pages
+        self.scroll_to(min(max(page, 0), self.pages - 1) * self.rows)
+
+    def next(self) -> None:
+        """Show the next page, if any."""
+        self.goto(self.page + 1)
+
+    def prev(self) -> None:
+        """Show the previous page, if any."""
+        self.goto(max(self.page - 1, 0))
+
+    def scroll_to(self, row: int) -> None:
+        """Show the rows starting at a position.
+
+        In paginated views, shows the page containing the row.
+
+        Args:
+            row: Position of the first row to show; clipped so that a
+                full window is shown where possible.
+        """
+        if self.mode == 'pages':
+            row = min(row, self.total - 1) // self.rows * self.rows
+        else:
+            row = min(row, self.total - self.rows)
+        self._start = max(row, 0)
+        if self._updater is not None:
+            self._updater.update(self.to_html)
+
+    def show(self) -> None:
+        """Display the view in a new output area, or in ``handle``.
+
+        Does nothing outside Jupyter.
+        """
+        if self._updater is None:
+            self._updater = DisplayUpdater.create(max_fps=0)
+        self._updater.update(self.to_html)
+
+    def to_html(self) -> str:
+        """Render the rows in view as HTML.
+
+        Returns:
+            str: HTML table with a line locating the rows in the table.
+        """
+        html = self.frame.iloc[self.start : self.stop].to_html(border=0)
+        if self.mode == 'window':
+            # color-scheme gives the scrollbars the colours of the theme
+            style = f'max-height: {WINDOW_HEIGHT}px; overflow: auto'
+            style += f'; color-scheme: {current_theme()}'
+            html = f'<div style="{style}">{html}</div>'
+        first = self.start + 1 if self.total else 0
+        footer = f'Rows {first:,}–{self.stop:,} of {self.total:,}'
+        if self.mode == 'pages':
+            footer += f', page {self.page + 1:,} of {self.pages:,}'
+        return f'{html}\n<p style="font-size: smaller">{footer}</p>'
+
+
+# ----------------------------------------------------------------------
+# Text rendering
+# ----------------------------------------------------------------------
+
+
+def format_table(
+    frame: pd.DataFrame | pd.Series,
+    *,
+    rows: int = TEXT_ROWS,
+    width: int | None = None,
+) -> str:
+    """Render the first and last rows of a table as text.
+
+    Args:
+        frame: Table to render.
+        rows: Rows shown from each end; tables of up to twice as many
+            rows are shown in full.
+        width: Line width; default the terminal width.
+
+    Returns:
+        str: Text table followed by the table dimensions.
+    """
+    if width is None:
+        width = shutil.get_terminal_size().columns
+    return _as_frame(frame).to_string(
+        max_rows=2 * rows,
+        min_rows=2 * rows,
+        line_width=width,
+        show_dimensions=True,
+    )
+
+
+def show_table(
+    frame: pd.DataFrame | pd.Series,
+    *,
+    rows: int | None = None,
+    mode: str | None = None,
+    file: TextIO | None = None,
+) -> TableView | None:
+    """Display a table of any size in the current environment.
+
+    In Jupyter (``in_jupyter()``), displays a ``TableView`` of the
+    table; in Google Colab (``in_colab()``) a windowed one. Elsewhere
+    prints ``format_table()``.
+
+    Args:
+        frame: Table to display.
+        rows: Rows per page or window in notebooks, or rows from each
+            end in text.
+        mode: View mode in notebooks; default ``default_mode()``.
+        file: Stream for the text rendering; default ``sys.stdout``.
+
+    Returns:
+        TableView | None: The displayed view, for navigation, or None
+        if the table was printed.
+    """
+    if in_jupyter() and can_update_ipython_display():
+        view = TableView(frame, rows=rows, mode=mode)
+        view.show()
+        return view
+    text = format_table(frame) if rows is None else format_table(frame, rows=rows)
+    print(text, file=file or sys.stdout)
+    return None
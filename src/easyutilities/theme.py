@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""Cached detection of the light or dark theme.
+
+Plots, tables and structure views adapt their colours to the theme of
+the user. Detecting it is slow: on Linux, ``darkdetect`` runs
+``gsettings`` in a subprocess, and in Jupyter the theme is read from
+the JupyterLab settings files. ``current_theme()`` therefore resolves
+the theme once and caches it for ``THEME_TTL`` seconds, after which
+renderers keep getting the cached theme while it is detected again in
+a background thread. Rendering never waits for a subprocess.
+
+The theme is taken from, in order:
+
+1. ``set_theme()``, for the current process.
+2. The ``EASYSCIENCE_THEME`` environment variable, ``light`` or
+   ``dark``.
+3. In Jupyter, the JupyterLab theme setting, unless the theme follows
+   the system.
+4. The system theme, from ``darkdetect``.
+5. ``DEFAULT_THEME``.
+
+Sources 1 to 3 are cheap; only the system theme is detected in the
+background.
+
+```python
+from easyutilities.theme import current_theme
+
+dark = current_theme() == 'dark'
+```
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from easyutilities.environment import in_jupyter
+from easyutilities.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import darkdetect
+else:
+    darkdetect = lazy_import('darkdetect')
+
+THEMES = ('light', 'dark')
+
+# Theme used until, or unless, another one is detected
+DEFAULT_THEME = 'light'
+
+# Seconds a detected theme is used before it is detected again
+THEME_TTL = 60.0
+
+# Environment variable overriding the detected theme
+THEME_ENV = 'EASYSCIENCE_THEME'
+
+# JupyterLab settings file of the theme, relative to the user settings
+# directory
+_JUPYTERLAB_THEME_SETTINGS = Path(
+    '@jupyterlab', 'apputils-extension', 'themes.jupyterlab-settings'
+)
+
+_COMMENT_RE = re.compile(r'^\s*//.*$', re.MULTILINE)
+
+# Detected theme and the time.monotonic() it was detected at
+_cached: tuple[str, float] | None = None
+_override: str | None = None
+_worker: threading.Thread | None = None
+_lock = threading.Lock()
+
+# ----------------------------------------------------------------------
+# Sources
+# ----------------------------------------------------------------------
+
+
+def _check(theme: str) -> str:
+    theme = theme.lower()
+    if theme not in THEMES:
+        raise ValueError(f'Unknown theme {theme!r}; expected one of {THEMES}')
+    return theme
+
+
+def _env_theme() -> str | None:
+    value = os.environ.get(THEME_ENV, '').strip().lower()
+    return value if value in THEMES else None
+
+
+def jupyterlab_settings_dir() -> Path:
+    """Return the JupyterLab user settings directory.
+
+    Returns:
+        Path: ``JUPYTERLAB_SETTINGS_DIR`` if set, else
+        ``lab/user-settings`` in ``JUPYTER_CONFIG_DIR`` or
+        ``~/.jupyter``.
+    """
+    override = os.environ.get('JUPYTERLAB_SETTINGS_DIR')
+    if override:
+        return Path(override).expanduser()
+    config = os.environ.get('JUPYTER_CONFIG_DIR') or '~/.jupyter'
+    return Path(config).expanduser() / 'lab' / 'user-settings'
+
+
+def _jupyter_theme() -> str | None:
+    path = jupyterlab_settings_dir() / _JUPYTERLAB_THEME_SETTINGS
+    try:
+        # Settings files are JSON with // comments
+        settings = json.loads(_COMMENT_RE.sub('', path.read_text(encoding='utf-8')))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(settings, dict) or settings.get('adaptive-theme'):
+        return None
+    name = settings.get('theme')
+    if not isinstance(name, str):
+        return None
+    return 'dark' if 'dark' in name.lower() else 'light'
+
+
+def _system_theme() -> str | None:
+    try:
+        theme = darkdetect.theme()
+    except Exception:  # Platform backends may fail in any way
+        return None
+    return theme.lower() if isinstance(theme, str) and theme.lower() in THEMES else None
+
+
+def _cheap_theme() -> str | None:
+    # Sources that need no subprocess
+    theme = _env_theme()
+    if theme is None and in_jupyter():
+        theme = _jupyter_theme()
+    return theme
+
+
+# ----------------------------------------------------------------------
+# Detection and cache
+# ----------------------------------------------------------------------
+
+
+def detect_theme() -> str:
+    """Detect the theme from all sources, ignoring the cache.
+
+    This is the slow path, which may run a subprocess; prefer
+    ``current_theme()``.
+
+    Returns:
+        str: ``'light'`` or ``'dark'``.
+    """
+    return _cheap_theme() or _system_theme() or DEFAULT_THEME
+
+
+def refresh() -> str:
+    """Detect the theme now and cache it.
+
+    Returns:
+        str: The detected theme.
+    """
+    global _cached
+    theme = detect_theme()
+    with _lock:
+        _cached = (theme, time.monotonic())
+    return theme
+
+
+def refresh_in_background() -> threading.Thread:
+    """Detect the theme in a daemon thread and cache it.
+
+    At most one detection runs at a time.
+
+    Returns:
+        threading.Thread: The running detection thread.
+    """
+    global _worker
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=refresh, name='easyutilities-theme', daemon=True)
+            _worker.start()
+        return _worker
+
+
+def current_theme(*, wait: bool = False) -> str:
+    """Return the current theme, from the cache where possible.
+
+    A cached theme is returned as is, even once older than
+    ``THEME_TTL``; it is then detected again in the background. On the
+    first call, cheap sources are checked directly, and if none sets
+    the theme, ``DEFAULT_THEME`` is returned while the system theme is
+    detected in the background.
+
+    Args:
+        wait: Detect an expired or missing theme before returning,
+            instead of in the background.
+
+    Returns:
+        str: ``'light'`` or ``'dark'``.
+    """
+    global _cached
+    if _override is not None:
+        return _override
+    cached = _cached
+    if cached is not None and time.monotonic() - cached[1] < THEME_TTL:
+        return cached[0]
+    if wait:
+        return refresh()
+    if cached is None:
+        theme = _cheap_theme()
+        if theme is not None:
+            _cached = (theme, time.monotonic())
+            return theme
+        # Expired right away, so that the system theme replaces it
+        _cached = cached = (DEFAULT_THEME, -float('inf'))
+    refresh_in_background()
+    return cached[0]
+
+
+def is_dark() -> bool:
+    """Return True if ``current_theme()`` is dark."""
+    return current_theme() == 'dark'
+
+
+def set_theme(theme: str | None) -> None:
+    """Use a theme for the rest of the process, skipping detection.
+
+    Args:
+        theme: ``'light'`` or ``'dark'``, or None to detect it again.
+
+    Raises:
+        ValueError: If ``theme`` is unknown.
+    """
+    global _override
+    _override = None if theme is None else _check(theme)
+
+
+def reset() -> None:
+    """Forget the cached and the set theme."""
+    global _cached, _override
+    with _lock:
+        _cached = None
+        _override = None
@@ -0,0 +1,474 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+"""py3Dmol viewer for crystal structures of any size.
+
+Supercells with tens of thousands of atoms are unusable when bonds are
+found by checking all pairs of atoms and the model is regenerated on
+every redraw. Here:
+
+- ``find_bonds()`` finds bonds with a vectorized cell-list search:
+  atoms are binned into a grid of cells at least one bond length wide,
+  and only atoms in neighbouring cells are compared, across periodic
+  boundaries if a unit cell is given. Cost grows linearly with the
+  number of atoms.
+- ``model_payload()`` serializes a structure and its bonds into the
+  model string sent to 3Dmol.js, cached by the contents of the
+  structure.
+- ``StructureViewer`` sends the model once; style changes of a shown
+  viewer send only the style commands.
+
+```python
+from easyutilities.viewer import StructureViewer
+
+viewer = StructureViewer(symbols, positions, cell=lattice)
+viewer.show()
+viewer.set_style({'sphere': {'scale': 0.3}})  # No model resent
+```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from easyutilities.lazy import lazy_import
+from easyutilities.theme import current_theme
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import py3Dmol
+    from numpy.typing import ArrayLike
+else:
+    py3Dmol = lazy_import('py3Dmol')
+
+# Covalent radii in angstrom, from B. Cordero et al., Dalton Trans.
+# (2008) 2832; low-spin values for Mn, Fe and Co
+COVALENT_RADII = {
+    'H': 0.31, 'He': 0.28, 'Li': 1.28, 'Be': 0.96, 'B': 0.84, 'C': 0.76,
+    'N': 0.71, 'O': 0.66, 'F': 0.57, 'Ne': 0.58, 'Na': 1.66, 'Mg': 1.41,
+    'Al': 1.21, 'Si': 1.11, 'P': 1.07, 'S': 1.05, 'Cl': 1.02, 'Ar': 1.06,
+    'K': 2.03, 'Ca': 1.76, 'Sc': 1.70, 'Ti': 1.60, 'V': 1.53, 'Cr': 1.39,
+    'Mn': 1.39, 'Fe': 1.32, 'Co': 1.26, 'Ni': 1.24, 'Cu': 1.32, 'Zn': 1.22,
+    'Ga': 1.22, 'Ge': 1.20, 'As': 1.19, 'Se': 1.20, 'Br': 1.20, 'Kr': 1.16,
+    'Rb': 2.20, 'Sr': 1.95, 'Y': 1.90, 'Zr': 1.75, 'Nb': 1.64, 'Mo': 1.54,
+    'Ag': 1.45, 'Cd': 1.44, 'In': 1.42, 'Sn': 1.39, 'Sb': 1.39, 'Te': 1.38,
+    'I': 1.39, 'Cs': 2.44, 'Ba': 2.15, 'La': 2.07, 'Ce': 2.04, 'Nd': 2.01,
+    'Gd': 1.96, 'Hf': 1.75, 'Ta': 1.70, 'W': 1.62, 'Pt': 1.36, 'Au': 1.36,
+    'Hg': 1.32, 'Pb': 1.46, 'Bi': 1.48, 'U': 1.96,
+}  # fmt: skip
+
+# Radius of elements missing from COVALENT_RADII, in angstrom
+DEFAULT_RADIUS = 1.5
+
+# Atoms are bonded if closer than this times the sum of their radii
+BOND_TOLERANCE = 1.2
+
+# Number of serialized models kept by model_payload()
+MODEL_CACHE_SIZE = 8
+
+DEFAULT_STYLE = {'stick': {'radius': 0.15}, 'sphere': {'scale': 0.25}}
+
+# Viewer background colours by theme
+BACKGROUNDS = {'light': 'white', 'dark': 'black'}
+
+_model_cache: OrderedDict[str, str] = OrderedDict()
+
+# ----------------------------------------------------------------------
+# Bonds
+# ----------------------------------------------------------------------
+
+
+def covalent_radii(symbols: Sequence[str]) -> np.ndarray:
+    """Return the covalent radii of elements.
+
+    Args:
+        symbols: Element symbols; case and charges such as ``'Fe3+'``
+            are ignored.
+
+    Returns:
+        np.ndarray: Radii in angstrom; ``DEFAULT_RADIUS`` for unknown
+        symbols.
+    """
+    radii = {}
+    for symbol in set(symbols):
+        element = symbol.strip().rstrip('+-0123456789').capitalize()
+        radii[symbol] = COVALENT_RADII.get(element, DEFAULT_RADIUS)
+    return np.array([radii[symbol] for symbol in symbols], dtype=np.float64)
+
+
+def find_bonds(
+    positions: ArrayLike,
+    *,
+    cutoff: float | None = None,
+    radii: ArrayLike | None = None,
+    tolerance: float = BOND_TOLERANCE,
+    cell: ArrayLike | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find pairs of atoms closer than a bond length.
+
+    Atoms are binned into a grid of cells at least as wide as the
+    longest possible bond, so that each atom is only compared with the
+    atoms in its own and the neighbouring cells. Each neighbour offset
+    is processed for all atoms at once with NumPy.
+
+    Args:
+        positions: Cartesian coordinates, shape ``(n, 3)``.
+        cutoff: Bond length shared by all pairs.
+        radii: Radii per atom, e.g. ``covalent_radii(symbols)``; atoms
+            are bonded if closer than ``tolerance`` times the sum of
+            their radii. Used if ``cutoff`` is None.
+        tolerance: Factor applied to the sum of radii.
+        cell: Lattice vectors as rows, shape ``(3, 3)``; bonds are then
+            found across periodic boundaries.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Bonded atom indices ``(i, j)``
+        with ``i <= j``, shape ``(m, 2)``, and the lattice translation
+        of atom ``j`` for each bond, shape ``(m, 3)``; zero for bonds
+        within the given positions and always zero without ``cell``.
+        Bonds to periodic images of the same atom have ``i == j``.
+
+    Raises:
+        ValueError: If neither ``cutoff`` nor ``radii`` is given.
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    n = len(positions)
+    if cutoff is None:
+        if radii is None:
+            raise ValueError('Either cutoff or radii must be given')
+        radii = np.asarray(radii, dtype=np.float64)
+        reach = 2 * tolerance * float(radii.max(initial=0.0))
+    else:
+        reach = float(cutoff)
+    empty = np.empty((0, 2), dtype=np.intp), np.empty((0, 3), dtype=np.intp)
+    if n == 0 or reach <= 0:
+        return empty
+
+    periodic = cell is not None
+    if periodic:
+        lattice = np.asarray(cell, dtype=np.float64).reshape(3, 3)
+        fractional = positions @ np.linalg.inv(lattice)
+        wraps = np.floor(fractional)
+        fractional -= wraps
+        inside = fractional @ lattice
+        # Widths of the cell perpendicular to each pair of vectors
+        areas = np.linalg.norm(np.cross(lattice[[1, 2, 0]], lattice[[2, 0, 1]]), axis=1)
+        widths = abs(np.linalg.det(lattice)) / areas
+    else:
+        lattice = None
+        origin = positions.min(axis=0)
+        widths = np.maximum(positions.max(axis=0) - origin, reach)
+        fractional = (positions - origin) / widths
+        inside = positions
+    grid = np.maximum((widths // reach).astype(np.intp), 1)
+    # Cells to search in each direction; more than one if the unit
+    # cell is narrower than a bond
+    reach_cells = np.ceil(reach * grid / widths - 1e-12).astype(np.intp)
+    bins = np.minimum((fractional * grid).astype(np.intp), grid - 1)
+
+    flat = np.ravel_multi_index(bins.T, grid)
+    order = np.argsort(flat, kind='stable')
+    counts = np.bincount(flat, minlength=int(grid.prod()))
+    starts = np.cumsum(counts) - counts
+
+    pairs, images = [], []
+    ranges = [range(-r, r + 1) for r in reach_cells]
+    for offset in itertools.product(*ranges):
+        neighbour = bins + offset
+        if periodic:
+            image = np.floor_divide(neighbour, grid)
+            neighbour -= image * grid
+            atoms = np.arange(n)
+        else:
+            valid = np.all((neighbour >= 0) & (neighbour < grid), axis=1)
+            atoms = np.flatnonzero(valid)
+            neighbour = neighbour[valid]
+            image = np.zeros_like(neighbour)
+        cells = np.ravel_multi_index(neighbour.T, grid)
+        per_atom = counts[cells]
+        total = int(per_atom.sum())
+        if total == 0:
+            continue
+        # Expand to one candidate pair per atom in the neighbour cell
+        i = np.repeat(atoms, per_atom)
+        rank = np.arange(total) - np.repeat(np.cumsum(per_atom) - per_atom, per_atom)
+        j = order[np.repeat(starts[cells], per_atom) + rank]
+        image = np.repeat(image, per_atom, axis=0)
+        delta = inside[j] - inside[i]
+        if periodic:
+            delta += image @ lattice
+        distance2 = np.einsum('ij,ij->i', delta, delta)
+        if cutoff is None:
+            limit = tolerance * (radii[i] + radii[j])
+        else:
+            limit = reach
+        # Each bond is found from both ends; keep i < j, and for bonds
+        # between images of one atom the positive translation
+        keep = (distance2 <= limit * limit) & (
+            (i < j) | ((i == j) & _lexicographically_positive(image))
+        )
+        pairs.append(np.column_stack((i[keep], j[keep])))
+        images.append(image[keep])
+
+    if not pairs:
+        return empty
+    pairs = np.concatenate(pairs)
+    images = np.concatenate(images)
+    if periodic:
+        # Translations between the original, unwrapped positions
+        images = images + (wraps[pairs[:, 0]] - wraps[pairs[:, 1]]).astype(np.intp)
+    sort = np.lexsort((*images.T[::-1], pairs[:, 1], pairs[:, 0]))
+    return pairs[sort], images[sort]
+
+
+def _lexicographically_positive(image: np.ndarray) -> np.ndarray:
+    # True where the first nonzero component is positive
+    first = np.argmax(image != 0, axis=1)
+    return image[np.arange(len(image)), first] > 0
+
+
+# ----------------------------------------------------------------------
+# Model payloads
+# ----------------------------------------------------------------------
+
+
+def structure_key(
+    symbols: Sequence[str],
+    positions: np.ndarray,
+    cell: np.ndarray | None,
+    *extra: object,
+) -> str:
+    """Return a hash identifying the contents of a structure.
+
+    Args:
+        symbols: Element symbols.
+        positions: Cartesian coordinates as a float64 array.
+        cell: Lattice vectors as a float64 array, or None.
+        *extra: Further values affecting the model, e.g. the bond
+            cutoff.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    hasher.update('\0'.join(symbols).encode())
+    hasher.update(np.ascontiguousarray(positions, dtype=np.float64).tobytes())
+    if cell is not None:
+        hasher.update(np.ascontiguousarray(cell, dtype=np.float64).tobytes())
+    hasher.update(repr(extra).encode())
+    return hasher.hexdigest()
+
+
+def to_sdf(symbols: Sequence[str], positions: np.ndarray, pairs: np.ndarray) -> str:
+    """Serialize atoms and bonds as an SDF V3000 molecule.
+
+    V3000 has no limit of 999 atoms, unlike V2000. All bonds are
+    written as single bonds.
+
+    Args:
+        symbols: Element symbols.
+        positions: Cartesian coordinates, shape ``(n, 3)``.
+        pairs: Zero-based indices of bonded atoms, shape ``(m, 2)``.
+
+    Returns:
+        str: SDF text readable by 3Dmol.js.
+    """
+    lines = [
+        'structure',
+        '  easyutilities',
+        '',
+        '  0  0  0     0  0            999 V3000',
+        'M  V30 BEGIN CTAB',
+        f'M  V30 COUNTS {len(symbols)} {len(pairs)} 0 0 0',
+        'M  V30 BEGIN ATOM',
+    ]
+    lines.extend(
+        f'M  V30 {n} {symbol} {x:.4f} {y:.4f} {z:.4f} 0'
+        for n, (symbol, (x, y, z)) in enumerate(zip(symbols, positions.tolist()), 1)
+    )
+    lines.append('M  V30 END ATOM')
+    if len(pairs):
+        lines.append('M  V30 BEGIN BOND')
+        lines.extend(f'M  V30 {n} 1 {i + 1} {j + 1}' for n, (i, j) in enumerate(pairs.tolist(), 1))
+        lines.append('M  V30 END BOND')
+    lines += ['M  V30 END CTAB', 'M  END', '$$$$', '']
+    return '\n'.join(lines)
+
+
+def model_payload(
+    symbols: Sequence[str],
+    positions: ArrayLike,
+    *,
+    cell: ArrayLike | None = None,
+    cutoff: float | None = None,
+    tolerance: float = BOND_TOLERANCE,
+) -> str:
+    """Return the model string of a structure, with its bonds.
+
+    Bonds come from ``find_bonds()``, using covalent radii unless
+    ``cutoff`` is given. Bonds crossing the periodic boundary connect
+    atoms on opposite faces of the cell and are not drawn. The last
+    ``MODEL_CACHE_SIZE`` payloads are cached by the contents of the
+    structure, so redrawing an unchanged structure costs one hash.
+
+    Args:
+        symbols: Element symbols.
+        positions: Cartesian coordinates, shape ``(n, 3)``.
+        cell: Lattice vectors as rows, for periodic bonds.
+        cutoff: Bond length shared by all pairs.
+        tolerance: See ``find_bonds()``.
+
+    Returns:
+        str: SDF V3000 text for ``view.addModel(payload, 'sdf')``.
+    """
+    symbols = list(symbols)
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    cell = None if cell is None else np.asarray(cell, dtype=np.float64).reshape(3, 3)
+    key = structure_key(symbols, positions, cell, cutoff, tolerance)
+    payload = _model_cache.get(key)
+    if payload is not None:
+        _model_cache.move_to_end(key)
+        return payload
+    radii = None if cutoff is not None else covalent_radii(symbols)
+    pairs, images = find_bonds(
+        positions, cutoff=cutoff, radii=radii, tolerance=tolerance, cell=cell
+    )
+    pairs = pairs[~images.any(axis=1)]
+    payload = to_sdf(symbols, positions, pairs)
+    _model_cache[key] = payload
+    while len(_model_cache) > MODEL_CACHE_SIZE:
+        _model_cache.popitem(last=False)
+    return payload
+
+
+def clear_model_cache() -> None:
+    """Forget all cached model payloads."""
+    _model_cache.clear()
+
+
+# ----------------------------------------------------------------------
+# Viewer
+# ----------------------------------------------------------------------
+
+
+class StructureViewer:
+    """py3Dmol view of a structure with incremental updates.
+
+    The model is added to the view once. After ``show()``, style
+    changes are sent with py3Dmol's ``update()``, which transmits only
+    the commands issued since, not the model. Replacing the structure
+    sends the new model once, reusing cached payloads. The background
+    follows the current light or dark theme.
+
+    Args:
+        symbols: Element symbols.
+        positions: Cartesian coordinates, shape ``(n, 3)``.
+        cell: Lattice vectors as rows, for periodic bonds.
+        cutoff: Bond length shared by all pairs; default covalent
+            radii.
+        style: 3Dmol.js style; default ``DEFAULT_STYLE``.
+        width: Viewer width in pixels.
+        height: Viewer height in pixels.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        positions: ArrayLike,
+        *,
+        cell: ArrayLike | None = None,
+        cutoff: float | None = None,
+        style: dict | None = None,
+        width: int = 640,
+        height: int = 480,
+    ) -> None:
+        self.cutoff = cutoff
+        self.style = dict(style or DEFAULT_STYLE)
+        self.width = width
+        self.height = height
+        self._view = None
+        self._shown = False
+        self._payload = ''
+        # Script of the view before its first model
+        self._start_js = ''
+        self.set_structure(symbols, positions, cell=cell)
+
+    @property
+    def view(self) -> py3Dmol.view:
+        """The py3Dmol view, created with the model on first access."""
+        if self._view is None:
+            self._view = py3Dmol.view(width=self.width, height=self.height)
+            self._view.setBackgroundColor(BACKGROUNDS[current_theme()])
+            self._start_js = self._view.startjs
+            self._add_model()
+        return self._view
+
+    def _add_model(self) -> None:
+        self._view.addModel(self._payload, 'sdf')
+        self._view.setStyle({}, self.style)
+        self._view.zoomTo()
+
+    def show(self) -> None:
+        """Display the viewer in the notebook."""
+        self.view.show()
+        self._shown = True
+
+    def set_style(self, style: dict, selection: dict | None = None) -> None:
+        """Change the style of all or selected atoms.
+
+        Args:
+            style: 3Dmol.js style, e.g. ``{'line': {}}``.
+            selection: 3Dmol.js atom selection, e.g. ``{'elem': 'O'}``;
+                default all atoms.
+        """
+        if selection is None:
+            self.style = dict(style)
+            if self._view is None:
+                # Applied when the view is created
+                return
+        self.view.setStyle(selection or {}, style)
+        self._send()
+
+    def set_structure(
+        self,
+        symbols: Sequence[str],
+        positions: ArrayLike,
+        *,
+        cell: ArrayLike | None = None,
+    ) -> bool:
+        """Replace the structure; a no-op if its contents are unchanged.
+
+        Args:
+            symbols: Element symbols.
+            positions: Cartesian coordinates, shape ``(n, 3)``.
+            cell: Lattice vectors as rows, for periodic bonds.
+
+        Returns:
+            bool: True if the model changed.
+        """
+        payload = model_payload(symbols, positions, cell=cell, cutoff=self.cutoff)
+        if payload is self._payload or payload == self._payload:
+            return False
+        self._payload = payload
+        if self._view is not None:
+            self._view.removeAllModels()
+            self._view.addModel(payload, 'sdf')
+            self._view.setStyle({}, self.style)
+            self._send()
+            # py3Dmol also appends each call to the script replayed by
+            # show(), which would then hold every model set so far
+            pending = self._view.updatejs
+            self._view.startjs = self._start_js
+            self._add_model()
+            self._view.updatejs = pending
+        return True
+
+    def _send(self) -> None:
+        self._view.render()
+        if self._shown:
+            self._view.update()
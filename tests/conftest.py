@@ -0,0 +1,4 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+pytest_plugins = ['easyutilities.bench_plugin', 'pytester']
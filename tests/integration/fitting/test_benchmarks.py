@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from easyutilities.grid import Grid
+from easyutilities.grid import evaluate_grid
+from easyutilities.grid import latin_hypercube
+from easyutilities.parallel import cpu_count
+from easyutilities.progress import NullBackend
+from easyutilities.progress import Progress
+
+# ----------------------------------------------------------------------
+# Synthetic data
+# ----------------------------------------------------------------------
+
+
+def gaussian(x, amplitude, center, width):
+    return amplitude * math.exp(-0.5 * ((x - center) / width) ** 2)
+
+
+@pytest.fixture(scope='module')
+def peak():
+    """Noisy Gaussian peak with known parameters."""
+    rng = random.Random(1234)  # noqa: S311
+    x = [i * 0.02 for i in range(-250, 251)]
+    y = [gaussian(xi, 10.0, 0.3, 0.8) + rng.gauss(0.0, 0.1) for xi in x]
+    sigma = [0.1] * len(x)
+    return x, y, sigma
+
+
+def chi2(x, y, sigma, amplitude, center, width):
+    return sum(
+        ((yi - gaussian(xi, amplitude, center, width)) / si) ** 2
+        for xi, yi, si in zip(x, y, sigma, strict=True)
+    )
+
+
+def grid_search(x, y, sigma, centers, widths, progress=None):
+    """Best (chi2, center, width) over a grid at fixed amplitude."""
+    candidates = [(c, w) for c in centers for w in widths]
+    if progress is not None:
+        candidates = progress.iter(candidates)
+    return min((chi2(x, y, sigma, 10.0, c, w), c, w) for c, w in candidates)
+
+
+def vectorized_gaussian(x, amplitude, center, width):
+    return amplitude * np.exp(-0.5 * ((x - center) / width) ** 2)
+
+
+@pytest.fixture(scope='module')
+def peak_arrays(peak):
+    """The noisy peak as NumPy arrays."""
+    return tuple(np.asarray(values) for values in peak)
+
+
+CENTERS = [i * 0.1 for i in range(-5, 6)]
+WIDTHS = [0.5 + i * 0.1 for i in range(7)]
+
+# Fine grid of 201 x 121 candidates, 0.01 apart
+FINE_GRID = Grid({
+    'center': np.linspace(-1.0, 1.0, 201),
+    'width': np.linspace(0.4, 1.6, 121),
+})
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+
+
+def test_bench_chi2_evaluation(benchmark, peak):
+    """Benchmark one chi-square evaluation of a 501-point pattern."""
+    value = benchmark(chi2, (*peak, 10.0, 0.3, 0.8))
+    assert value == pytest.approx(len(peak[0]), rel=0.2)
+
+
+def test_bench_grid_search(benchmark, peak):
+    """Benchmark a coarse grid search for the peak position."""
+    best = benchmark(grid_search, (*peak, CENTERS, WIDTHS), rounds=3)
+    assert best[1:] == pytest.approx((0.3, 0.8))
+
+
+def test_bench_grid_search_with_progress(benchmark, peak):
+    """Benchmark the grid search with progress reporting enabled."""
+
+    def search():
+        with Progress(backend=NullBackend()) as progress:
+            return grid_search(*peak, CENTERS, WIDTHS, progress=progress)
+
+    best = benchmark(search, rounds=3)
+    assert best[1:] == pytest.approx((0.3, 0.8))
+
+
+def test_bench_batched_grid_search(benchmark, peak, peak_arrays):
+    """Benchmark the coarse grid search as one batched evaluation."""
+    x, y, sigma = peak_arrays
+    grid = Grid({'center': CENTERS, 'width': WIDTHS})
+    result = benchmark(
+        evaluate_grid,
+        (vectorized_gaussian, x, y, grid),
+        {'sigma': sigma, 'fixed': {'amplitude': 10.0}},
+    )
+    best = result.best(1)[0]
+    assert (best.params['center'], best.params['width']) == pytest.approx((0.3, 0.8))
+    assert best.chi2 == pytest.approx(grid_search(*peak, CENTERS, WIDTHS)[0])
+
+
+def test_bench_fine_grid_surface(benchmark, peak_arrays):
+    """Benchmark a chi-square surface of 24k candidates."""
+    x, y, sigma = peak_arrays
+    result = benchmark(
+        evaluate_grid,
+        (vectorized_gaussian, x, y, FINE_GRID),
+        {'sigma': sigma, 'fixed': {'amplitude': 10.0}, 'memory_budget': 16 << 20},
+        rounds=3,
+    )
+    assert result.surface.shape == (201, 121)
+    best = result.best(1)[0]
+    assert best.params['center'] == pytest.approx(0.3, abs=0.02)
+    assert best.params['width'] == pytest.approx(0.8, abs=0.02)
+
+
+def test_bench_fine_grid_surface_in_threads(benchmark, peak_arrays):
+    """Benchmark the fine surface with batches fanned out to threads."""
+    x, y, sigma = peak_arrays
+    options = {
+        'sigma': sigma,
+        'fixed': {'amplitude': 10.0},
+        'memory_budget': 16 << 20,
+        'max_workers': cpu_count(),
+        'executor': 'thread',
+    }
+    result = benchmark(evaluate_grid, (vectorized_gaussian, x, y, FINE_GRID), options, rounds=3)
+    assert result.best(1)[0].params['center'] == pytest.approx(0.3, abs=0.02)
+
+
+def test_bench_latin_hypercube_search(benchmark, peak_arrays):
+    """Benchmark a starting-point search over all three parameters."""
+    bounds = {'amplitude': (5.0, 15.0), 'center': (-1.0, 1.0), 'width': (0.4, 1.6)}
+    sample = latin_hypercube(bounds, 16384, seed=1234)
+    x, y, sigma = peak_arrays
+    result = benchmark(
+        evaluate_grid,
+        (vectorized_gaussian, x, y, sample),
+        {'sigma': sigma, 'keep_chi2': False, 'memory_budget': 16 << 20},
+        rounds=3,
+    )
+    best = result.best(1)[0]
+    assert best.params['amplitude'] == pytest.approx(10.0, rel=0.1)
+    assert best.params['center'] == pytest.approx(0.3, abs=0.1)
+    assert best.params['width'] == pytest.approx(0.8, rel=0.1)
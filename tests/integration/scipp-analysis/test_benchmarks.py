@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from easyutilities.io import iter_chunks
+from easyutilities.io import read_columns
+from easyutilities.sidecar import load_columns
+
+# ----------------------------------------------------------------------
+# Synthetic events
+# ----------------------------------------------------------------------
+
+N_EVENTS = 100_000
+N_BINS = 200
+
+EDGES = np.linspace(0.0, 100.0, N_BINS + 1)
+
+
+@pytest.fixture(scope='module')
+def event_file(tmp_path_factory):
+    """Text file of time-of-flight events with pixels and weights."""
+    rng = np.random.default_rng(42)
+    path = tmp_path_factory.mktemp('events') / 'events.txt'
+    with path.open('w') as f:
+        f.write('# tof pixel weight\n')
+        np.savetxt(
+            f,
+            np.column_stack([
+                rng.uniform(0.0, 100.0, N_EVENTS),
+                rng.integers(0, 1024, N_EVENTS),
+                rng.uniform(0.5, 1.5, N_EVENTS),
+            ]),
+            fmt=['%.6f', '%d', '%.4f'],
+        )
+    return path
+
+
+def histogram_chunks(path, rows):
+    """Weighted time-of-flight histogram, reduced chunk by chunk."""
+    counts = np.zeros(N_BINS)
+    for chunk in iter_chunks(path, rows):
+        counts += np.histogram(chunk['tof'], EDGES, weights=chunk['weight'])[0]
+    return counts
+
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+
+
+def test_bench_read_event_columns(benchmark, event_file):
+    """Benchmark reading 100k events into typed columns."""
+    columns = benchmark(read_columns, (event_file,), rounds=3)
+    assert columns['pixel'].dtype.kind == 'i'
+    assert len(columns['tof']) == N_EVENTS
+
+
+def test_bench_histogram_event_chunks(benchmark, event_file):
+    """Benchmark a weighted histogram of 100k events in chunks."""
+    counts = benchmark(histogram_chunks, (event_file, 10_000), rounds=3)
+    total = read_columns(event_file)['weight'].sum()
+    assert counts.sum() == pytest.approx(total)
+
+
+def test_bench_load_event_sidecar(benchmark, event_file, tmp_path):
+    """Benchmark memory-mapping the columns of a parsed event file."""
+    options = {'names': ['tof', 'pixel', 'weight'], 'cache_dir': tmp_path}
+    load_columns(event_file, **options)
+    columns = benchmark(load_columns, (event_file,), options)
+    assert isinstance(columns['tof'], np.memmap)
+    assert len(columns['weight']) == N_EVENTS
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import NamedTuple
+
+import pytest
+
+import easyutilities.environment as env
+import easyutilities.memory as memory
+import easyutilities.profiling as profiling
+
+
+@pytest.fixture
+def instrumentation_off():
+    """Start and end a test with profiling and memory tracking off."""
+    recorders = (profiling._recorder, memory._recorder)
+    for recorder in recorders:
+        recorder.enabled = False
+        recorder.records.clear()
+    yield
+    for recorder in recorders:
+        recorder.enabled = False
+        recorder.records.clear()
+
+
+@pytest.fixture
+def set_environment(monkeypatch):
+    """Return a function pretending to run in the given environment.
+
+    Its keyword arguments are ``EnvironmentInfo`` flags; flags not
+    given, including ``pytest``, are False.
+    """
+
+    def set_environment(**flags):
+        fields = dict.fromkeys(env.EnvironmentInfo.__slots__, False)
+        fields.update(flags)
+        monkeypatch.setattr(env, '_snapshot', env.EnvironmentInfo(**fields))
+
+    return set_environment
+
+
+# ----------------------------------------------------------------------
+# Local file server
+# ----------------------------------------------------------------------
+
+
+class Request(NamedTuple):
+    """A request answered by ``FileServer``."""
+
+    path: str
+    range: str | None
+    status: int
+
+
+class FileServer:
+    """HTTP server serving bytes from a dict, with Range and ETags.
+
+    Responses carry an ETag, and ``If-None-Match`` is answered with
+    ``304 Not Modified``. ``ranges`` turns Range support off, and
+    ``cut_after`` maps paths to a byte count after which the next
+    response for that path is cut off, once.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.cut_after = {}
+        self.ranges = True
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.lstrip('/')
+                range_header = self.headers.get('Range')
+                status = self._respond(path, range_header)
+                server.requests.append(Request(path, range_header, status))
+
+            def _respond(self, path, range_header):
+                content = server.files.get(path)
+                if content is None:
+                    return self._empty(404)
+                etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+                if self.headers.get('If-None-Match') == etag:
+                    return self._empty(304)
+                start = 0
+                if range_header and server.ranges:
+                    start = int(range_header.removeprefix('bytes=').rstrip('-'))
+                    if start >= len(content):
+                        return self._empty(416)
+                    status = 206
+                    self.send_response(status)
+                    self.send_header('Content-Range', f'bytes {start}-{len(content) - 1}/*')
+                else:
+                    status = 200
+                    self.send_response(status)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(content) - start))
+                self.end_headers()
+                body = content[start:]
+                cut = server.cut_after.pop(path, None)
+                self.wfile.write(body if cut is None else body[:cut])
+                return status
+
+            def _empty(self, status):
+                self.send_response(status)
+                self.end_headers()
+                return status
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._httpd.server_address[1]}'
+        thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+
+    def add(self, path, content):
+        """Serve content at a path and return its pooch-style hash."""
+        self.files[path] = content
+        return 'sha256:' + hashlib.sha256(content).hexdigest()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def file_server():
+    """Local HTTP server; see ``FileServer``."""
+    server = FileServer()
+    yield server
+    server.close()
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import stat
+
+import pytest
+
+from easyutilities._atomic import atomic_open
+from easyutilities._atomic import write_atomic
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX permissions')
+def test_new_file_gets_default_permissions(tmp_path):
+    """Test a new file gets the mode of open() under the umask."""
+    reference = tmp_path / 'reference'
+    reference.write_bytes(b'')
+    write_atomic(tmp_path / 'sub' / 'new', b'data')
+    mode = stat.S_IMODE((tmp_path / 'sub' / 'new').stat().st_mode)
+    assert mode == stat.S_IMODE(reference.stat().st_mode)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX permissions')
+def test_replaced_file_keeps_permissions(tmp_path):
+    """Test replacing a file keeps its mode."""
+    path = tmp_path / 'file'
+    path.write_bytes(b'old')
+    path.chmod(0o640)
+    write_atomic(path, 'new')
+    assert path.read_text(encoding='utf-8') == 'new'
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_failed_write_leaves_file_unchanged(tmp_path):
+    """Test a block that raises neither replaces nor leaves files."""
+    path = tmp_path / 'file'
+    path.write_bytes(b'old')
+    with pytest.raises(RuntimeError), atomic_open(path) as f:
+        f.write(b'partial')
+        raise RuntimeError
+    assert path.read_bytes() == b'old'
+    assert os.listdir(tmp_path) == ['file']
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+
+import pytest
+
+import easyutilities.bench as bench
+
+# ----------------------------------------------------------------------
+# BenchmarkResult
+# ----------------------------------------------------------------------
+
+
+def test_result_statistics():
+    """Test min, median and interquartile range of the timings."""
+    result = bench.BenchmarkResult('b', [5.0, 1.0, 3.0, 2.0, 4.0])
+    assert result.min == 1.0
+    assert result.median == 3.0
+    assert result.iqr == 2.0
+
+
+def test_result_iqr_of_single_round_is_zero():
+    """Test a single round has no spread."""
+    assert bench.BenchmarkResult('b', [1.0]).iqr == 0.0
+
+
+def test_result_round_trip():
+    """Test from_dict() restores to_dict() output."""
+    result = bench.BenchmarkResult('b', [1.0, 2.0], number=10, warmup=2, peak_memory=64)
+    result.extra['size'] = 100
+    data = result.to_dict()
+    assert data['median'] == 1.5
+    assert bench.BenchmarkResult.from_dict(data) == result
+
+
+@pytest.mark.parametrize(
+    ('seconds', 'expected'),
+    [(2.5, '2.5 s'), (0.0123, '12.3 ms'), (4.56e-6, '4.56 us'), (7e-8, '70 ns')],
+)
+def test_format_time(seconds, expected):
+    """Test durations get a unit suited to their magnitude."""
+    assert bench.format_time(seconds) == expected
+
+
+@pytest.mark.parametrize(
+    ('size', 'expected'),
+    [(None, '-'), (512, '512 B'), (1536, '1.5 KiB'), (3 * 1024**2, '3.0 MiB')],
+)
+def test_format_bytes(size, expected):
+    """Test byte counts get a binary unit."""
+    assert bench.format_bytes(size) == expected
+
+
+# ----------------------------------------------------------------------
+# run_benchmark()
+# ----------------------------------------------------------------------
+
+
+def test_run_benchmark_counts_calls():
+    """Test warmup, rounds and number of calls per round."""
+    calls = []
+    result = bench.run_benchmark(calls.append, ['x'], rounds=3, warmup=2, number=5, memory=False)
+    # Warmup, timed rounds; no extra call for the memory peak
+    assert len(calls) == 2 * 5 + 3 * 5
+    assert len(result.times) == 3
+    assert result.number == 5
+    assert result.peak_memory is None
+
+
+def test_run_benchmark_passes_keyword_arguments():
+    """Test arguments named like benchmark options reach func."""
+    calls = []
+
+    def fit(rounds, *, name):
+        calls.append((rounds, name))
+
+    result = bench.run_benchmark(fit, [2], {'name': 'lm'}, name='fit', rounds=1, number=1)
+    assert set(calls) == {(2, 'lm')}
+    assert (result.name, len(result.times)) == ('fit', 1)
+
+
+def test_run_benchmark_calibrates_number():
+    """Test the number of calls is calibrated for fast functions."""
+    result = bench.run_benchmark(lambda: None, rounds=1, min_round_time=0.001)
+    assert result.number >= 10
+    assert result.name == 'test_run_benchmark_calibrates_number.<locals>.<lambda>'
+
+
+def test_measure_peak_memory():
+    """Test the peak includes temporary allocations."""
+    peak = bench.measure_peak_memory(lambda: bytearray(1_000_000))
+    assert 1_000_000 <= peak < 1_100_000
+
+
+# ----------------------------------------------------------------------
+# Files and comparison
+# ----------------------------------------------------------------------
+
+
+def test_save_and_load_results(tmp_path):
+    """Test results survive a round trip through a JSON file."""
+    results = [bench.BenchmarkResult('a', [1.0]), bench.BenchmarkResult('b', [2.0, 3.0])]
+    path = bench.save_results(results, tmp_path / 'out' / 'results.json')
+    data = json.loads(path.read_text())
+    assert data['machine']['python']
+    assert bench.load_results(path) == {'a': results[0], 'b': results[1]}
+
+
+def test_load_results_rejects_unknown_version(tmp_path):
+    """Test files with another format version are rejected."""
+    path = tmp_path / 'results.json'
+    path.write_text(json.dumps({'version': 99, 'results': []}))
+    with pytest.raises(ValueError, match='version'):
+        bench.load_results(path)
+
+
+def test_compare_results_statuses():
+    """Test regressions, improvements, new and removed benchmarks."""
+    baseline = {
+        name: bench.BenchmarkResult(name, [1.0])
+        for name in ('slower', 'faster', 'same', 'removed')
+    }
+    current = {
+        'slower': bench.BenchmarkResult('slower', [1.2]),
+        'faster': bench.BenchmarkResult('faster', [0.8]),
+        'same': bench.BenchmarkResult('same', [1.05]),
+        'new': bench.BenchmarkResult('new', [1.0]),
+    }
+    comparisons = bench.compare_results(baseline, current, threshold=0.1)
+    assert {c.name: c.status for c in comparisons} == {
+        'faster': 'improved',
+        'new': 'new',
+        'removed': 'removed',
+        'same': 'unchanged',
+        'slower': 'regressed',
+    }
+
+
+def test_main_compare_exit_status(tmp_path, capsys):
+    """Test compare exits with 1 if a benchmark regressed."""
+    baseline = bench.save_results([bench.BenchmarkResult('a', [1.0])], tmp_path / 'base.json')
+    current = bench.save_results([bench.BenchmarkResult('a', [1.5])], tmp_path / 'cur.json')
+    assert bench.main(['compare', str(baseline), str(current)]) == 1
+    assert 'regressed' in capsys.readouterr().out
+    assert bench.main(['compare', str(baseline), str(current), '--threshold', '1']) == 0
+
+
+# ----------------------------------------------------------------------
+# Pytest plugin
+# ----------------------------------------------------------------------
+
+PLUGIN_TEST = """
+def test_sum(benchmark):
+    assert benchmark(sum, [range(100)], {'start': 1}, rounds=2) == 4951
+
+def test_plain():
+    pass
+"""
+
+
+def test_plugin_records_results(pytester):
+    """Test the fixture records results and saves them as JSON."""
+    pytester.makepyfile(PLUGIN_TEST)
+    result = pytester.runpytest('-p', 'easyutilities.bench_plugin', '--bench-json=out.json')
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(['*benchmarks*', '*test_plugin_records_results.py::test_sum*'])
+    results = bench.load_results(pytester.path / 'out.json')
+    assert len(results['test_plugin_records_results.py::test_sum'].times) == 2
+
+
+def test_plugin_marks_benchmarks(pytester):
+    """Test tests using the fixture can be selected by marker."""
+    pytester.makepyfile(PLUGIN_TEST)
+    result = pytester.runpytest('-p', 'easyutilities.bench_plugin', '-m', 'not benchmark')
+    result.assert_outcomes(passed=1, deselected=1)
+
+
+def test_plugin_disable_skips_timing(pytester):
+    """Test --bench-disable calls benchmarked functions untimed."""
+    pytester.makepyfile(PLUGIN_TEST)
+    result = pytester.runpytest('-p', 'easyutilities.bench_plugin', '--bench-disable')
+    result.assert_outcomes(passed=2)
+    result.stdout.no_fnmatch_line('*benchmarks*')
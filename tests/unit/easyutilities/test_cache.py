@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import threading
+
+import numpy as np
+import pytest
+
+import easyutilities.cache as cache_module
+from easyutilities.cache import Cache
+from easyutilities.cache import sizeof
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    """Use an empty registry of namespaced caches."""
+    monkeypatch.setattr(cache_module, '_registry', {})
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def array(kib):
+    """Return an array of kib KiB."""
+    return np.zeros(kib * 128)
+
+
+# ----------------------------------------------------------------------
+# Sizes
+# ----------------------------------------------------------------------
+
+
+def test_sizeof_counts_array_data_once():
+    """Test arrays count their data and shared objects count once."""
+    data = array(8)
+    assert sizeof(data) == 8192
+    assert 2 * 8192 <= sizeof({'a': data, 'b': array(8), 'c': data}) < 3 * 8192
+    assert sizeof('text') == len(b'text') + sizeof('')
+
+
+def test_sizeof_pandas_frame():
+    """Test pandas tables are measured by their memory usage."""
+    pd = pytest.importorskip('pandas')
+    frame = pd.DataFrame({'x': np.zeros(1000)})
+    assert sizeof(frame) >= 8000
+
+
+# ----------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------
+
+
+def test_lru_eviction_by_size():
+    """Test least recently used entries are evicted by size."""
+    cache = Cache(max_bytes=3 * 8192)
+    for key in 'abc':
+        cache[key] = array(8)
+    assert cache['a'] is not None  # Now most recently used
+    cache['d'] = array(8)
+    assert 'b' not in cache
+    assert set(cache._entries) == {'a', 'c', 'd'}
+    assert cache.nbytes == 3 * 8192
+    assert cache.stats.evictions == 1
+
+
+def test_eviction_by_count_and_oversized_values():
+    """Test the item limit and values larger than the cache."""
+    cache = Cache(max_bytes=8192, max_items=2)
+    cache['a'], cache['b'], cache['c'] = 1, 2, 3
+    assert list(cache._entries) == ['b', 'c']
+    assert not cache.set('big', array(16))
+    assert 'big' not in cache
+
+
+def test_ttl_expiry():
+    """Test entries expire and count as misses."""
+    clock = Clock()
+    cache = Cache(ttl=10.0, clock=clock)
+    cache['a'] = 1
+    clock.now = 9.0
+    assert cache.get('a') == 1
+    clock.now = 10.0
+    assert cache.get('a') is None
+    with pytest.raises(KeyError):
+        cache['a']
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.expirations, stats.items) == (1, 2, 1, 0)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_replacing_and_deleting_update_size():
+    """Test sizes follow replaced and deleted entries."""
+    cache = Cache()
+    cache['a'] = array(8)
+    cache['a'] = array(4)
+    assert cache.nbytes == 4096
+    del cache['a']
+    assert (len(cache), cache.nbytes) == (0, 0)
+
+
+def test_get_or_set_is_thread_safe():
+    """Test concurrent use keeps the size accounting consistent."""
+    cache = Cache(max_bytes=50 * 1024)
+
+    def work(offset):
+        for i in range(500):
+            cache.get_or_set((offset + i) % 97, lambda: array(1))
+
+    threads = [threading.Thread(target=work, args=(n * 13,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.nbytes == len(cache) * 1024 <= 50 * 1024
+    stats = cache.stats
+    assert stats.hits + stats.misses == 8 * 500
+
+
+# ----------------------------------------------------------------------
+# Namespaces
+# ----------------------------------------------------------------------
+
+
+def test_memoize_caches_per_function():
+    """Test memoized functions share a namespace, not results."""
+    calls = []
+
+    @cache_module.memoize('pkg.calculators')
+    def square(x, power=2):
+        calls.append(x)
+        return x**power
+
+    @cache_module.memoize('pkg.calculators')
+    def negate(x):
+        return -x
+
+    assert square(3) == square(3) == 9
+    assert square(3, power=3) == 27
+    assert negate(3) == -3
+    assert calls == [3, 3]
+    assert square.cache is negate.cache is cache_module.get_cache('pkg.calculators')
+
+
+def test_memoize_with_key_function():
+    """Test a key function allows unhashable arguments."""
+
+    @cache_module.memoize('pkg.sums', key=lambda values: tuple(values))
+    def total(values):
+        return sum(values)
+
+    assert total([1, 2]) == 3
+    assert total.cache.stats.misses == 1
+    assert total([1, 2]) == 3
+    assert total.cache.stats.hits == 1
+
+
+def test_scope_resets_namespaces():
+    """Test scopes empty their namespaces on entry and exit only."""
+    calculators = cache_module.get_cache('pkg.calculators')
+    other = cache_module.get_cache('other')
+    calculators['model'] = 1
+    other['x'] = 1
+    with cache_module.scope('pkg'):
+        assert 'model' not in calculators
+        calculators['model'] = 2
+    assert len(calculators) == 0
+    assert calculators.stats.hits == 0
+    assert 'x' in other
+    stats = cache_module.cache_stats()
+    assert set(stats) == {'pkg.calculators', 'other'}
+    cache_module.clear_caches()
+    assert len(other) == 0
+
+
+def test_get_cache_returns_registered_cache():
+    """Test limits only apply when a cache is created."""
+    first = cache_module.get_cache('pkg', max_items=3)
+    assert cache_module.get_cache('pkg', max_items=5) is first
+    assert first.max_items == 3
+    assert repr(first) == "<Cache 'pkg': 0 items, 0 bytes>"
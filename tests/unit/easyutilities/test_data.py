@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import subprocess  # noqa: S404
+import sys
+import threading
+import time
+import urllib.error
+
+import pytest
+
+import easyutilities.data as data
+from easyutilities._filelock import FileLock
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def registry(file_server, tmp_path):
+    """Registry on the local file server with a temporary cache."""
+    return data.DataRegistry(tmp_path / 'cache', base_url=file_server.url + '/', retries=1)
+
+
+# ----------------------------------------------------------------------
+# Registration
+# ----------------------------------------------------------------------
+
+
+def test_parse_hash():
+    """Test pooch-style hashes are split into algorithm and digest."""
+    assert data.parse_hash('MD5:ABC') == ('md5', 'abc')
+    assert data.parse_hash('abc') == ('sha256', 'abc')
+    with pytest.raises(ValueError, match='no_such_alg'):
+        data.parse_hash('no_such_alg:abc')
+
+
+def test_load_registry(tmp_path):
+    """Test a pooch-style registry file is loaded."""
+    path = tmp_path / 'registry.txt'
+    path.write_text('# comment\n\na/x.dat sha256:aa\nb.dat md5:bb https://h/b.dat\n')
+    registry = data.DataRegistry(tmp_path, base_url='https://base/')
+    registry.load_registry(path)
+    assert registry.names == ['a/x.dat', 'b.dat']
+    assert registry['a/x.dat'].url == 'https://base/a/x.dat'
+    assert registry['b.dat'] == data.DataFile('b.dat', 'https://h/b.dat', 'md5', 'bb')
+    with pytest.raises(KeyError, match='missing'):
+        registry['missing']
+
+
+def test_default_cache_dir_from_environment(tmp_path, monkeypatch):
+    """Test the environment variable overrides the cache directory."""
+    monkeypatch.setenv(data.CACHE_DIR_ENV, str(tmp_path))
+    assert data.DataRegistry().cache_dir == tmp_path
+
+
+# ----------------------------------------------------------------------
+# Fetching
+# ----------------------------------------------------------------------
+
+
+def test_fetch_stores_file_under_its_hash(registry, file_server):
+    """Test a fetched file is verified and content-addressed."""
+    content = b'x' * 1000
+    digest = file_server.add('d/file.dat', content)
+    registry.register('d/file.dat', digest)
+    path = registry.fetch('d/file.dat')
+    hexdigest = digest.split(':')[1]
+    assert (
+        path == registry.cache_dir / 'objects' / 'sha256' / hexdigest[:2] / hexdigest / 'file.dat'
+    )
+    assert path.read_bytes() == content
+
+
+def test_fetch_uses_cache(registry, file_server):
+    """Test a cached file is not downloaded again."""
+    registry.register('a.dat', file_server.add('a.dat', b'abc'))
+    registry.fetch('a.dat')
+    registry.fetch('a.dat')
+    assert len(file_server.requests) == 1
+
+
+def test_fetch_rejects_hash_mismatch(registry, file_server):
+    """Test a corrupted download raises and leaves nothing cached."""
+    file_server.add('a.dat', b'abc')
+    registry.register('a.dat', 'sha256:' + '0' * 64)
+    with pytest.raises(data.HashMismatchError, match='a.dat'):
+        registry.fetch('a.dat')
+    assert not registry.is_cached('a.dat')
+    assert not list(registry.path('a.dat').parent.iterdir())
+
+
+def test_fetch_raises_http_errors_without_retry(registry, file_server):
+    """Test HTTP error statuses are not retried."""
+    registry.register('missing.dat', 'sha256:' + '0' * 64)
+    with pytest.raises(urllib.error.HTTPError):
+        registry.fetch('missing.dat')
+    assert len(file_server.requests) == 1
+
+
+def test_fetch_resumes_partial_file(registry, file_server):
+    """Test an existing partial file is resumed with a Range request."""
+    content = bytes(range(256)) * 40
+    registry.register('a.dat', file_server.add('a.dat', content))
+    part = registry.path('a.dat').with_name('a.dat.part')
+    part.parent.mkdir(parents=True)
+    part.write_bytes(content[:3000])
+    assert registry.fetch('a.dat').read_bytes() == content
+    assert [(r.path, r.range) for r in file_server.requests] == [('a.dat', 'bytes=3000-')]
+
+
+def test_fetch_resumes_after_broken_connection(registry, file_server, monkeypatch):
+    """Test a retry continues where the broken download stopped."""
+    monkeypatch.setattr(data, '_CHUNK_SIZE', 1024)
+    content = bytes(range(256)) * 40
+    registry.register('a.dat', file_server.add('a.dat', content))
+    file_server.cut_after['a.dat'] = 5000
+    assert registry.fetch('a.dat').read_bytes() == content
+    assert [r.range for r in file_server.requests] == [None, 'bytes=5000-']
+
+
+def test_fetch_restarts_if_range_is_ignored(registry, file_server):
+    """Test a full response to a Range request replaces the partial."""
+    file_server.ranges = False
+    content = b'abcdef' * 100
+    registry.register('a.dat', file_server.add('a.dat', content))
+    part = registry.path('a.dat').with_name('a.dat.part')
+    part.parent.mkdir(parents=True)
+    part.write_bytes(b'zzz')
+    assert registry.fetch('a.dat').read_bytes() == content
+
+
+def test_fetch_completes_finished_partial(registry, file_server):
+    """Test a complete partial file is accepted on a 416 response."""
+    content = b'abc'
+    registry.register('a.dat', file_server.add('a.dat', content))
+    part = registry.path('a.dat').with_name('a.dat.part')
+    part.parent.mkdir(parents=True)
+    part.write_bytes(content)
+    assert registry.fetch('a.dat').read_bytes() == content
+
+
+def test_fetch_many(registry, file_server):
+    """Test many files are fetched; shared content only once."""
+    for i in range(10):
+        registry.register(f'f{i}.dat', file_server.add(f'f{i}.dat', b'%d' % i * 100))
+    registry.register('copy.dat', registry['f3.dat'].known_hash, 'f3.dat')
+    paths = registry.fetch_many()
+    assert sorted(paths) == sorted(registry.names)
+    assert paths['copy.dat'].read_bytes() == paths['f3.dat'].read_bytes()
+    assert paths['copy.dat'].name == 'copy.dat'
+    assert len(file_server.requests) == 10
+
+
+def test_fetch_many_reports_all_failures(registry, file_server):
+    """Test failed downloads are collected; the others succeed."""
+    registry.register('ok.dat', file_server.add('ok.dat', b'ok'))
+    registry.register('bad1.dat', 'sha256:' + '0' * 64)
+    registry.register('bad2.dat', 'sha256:' + '1' * 64)
+    with pytest.raises(data.DownloadError) as info:
+        registry.fetch_many()
+    assert sorted(info.value.errors) == ['bad1.dat', 'bad2.dat']
+    assert registry.is_cached('ok.dat')
+
+
+def test_concurrent_processes_download_once(registry, file_server, tmp_path):
+    """Test processes sharing the cache download a file only once."""
+    registry.register('a.dat', file_server.add('a.dat', os.urandom(200_000)))
+    code = (
+        'import sys; from easyutilities.data import DataRegistry; '
+        'r = DataRegistry(sys.argv[1], base_url=sys.argv[2]); '
+        'r.register("a.dat", sys.argv[3]); print(r.fetch("a.dat"))'
+    )
+    args = [sys.executable, '-c', code, str(registry.cache_dir), file_server.url + '/']
+    args.append(registry['a.dat'].known_hash)
+    procs = [subprocess.Popen(args, stdout=subprocess.PIPE, text=True) for _ in range(3)]  # noqa: S603
+    outputs = {proc.communicate()[0].strip() for proc in procs}
+    assert outputs == {str(registry.path('a.dat'))}
+    assert len(file_server.requests) == 1
+
+
+# ----------------------------------------------------------------------
+# Pruning and locking
+# ----------------------------------------------------------------------
+
+
+def test_prune_removes_least_recently_used(registry, file_server):
+    """Test pruning keeps the most recently used files."""
+    for i in range(4):
+        registry.register(f'f{i}.dat', file_server.add(f'f{i}.dat', bytes([i]) * 100))
+        path = registry.fetch(f'f{i}.dat')
+        os.utime(path, (1000 + i, 1000 + i))
+    registry.fetch('f0.dat')  # now the most recently used
+    assert registry.cache_size() == 400
+
+    removed = registry.prune(250)
+    assert {path.name for path in removed} == {'f1.dat', 'f2.dat'}
+    assert registry.is_cached('f0.dat')
+    assert registry.is_cached('f3.dat')
+    assert registry.cache_size() == 200
+
+
+def test_hard_links_are_counted_and_pruned_together(registry, file_server):
+    """Test files stored under two names take space once."""
+    registry.register('a.dat', file_server.add('a.dat', b'a' * 100))
+    registry.register('copy.dat', registry['a.dat'].known_hash, 'a.dat')
+    registry.register('b.dat', file_server.add('b.dat', b'b' * 100))
+    original = registry.fetch('a.dat')
+    copy = registry.fetch('copy.dat')
+    if not os.path.samefile(original, copy):
+        pytest.skip('no hard links on this file system')
+    os.utime(original, (1000, 1000))
+    registry.fetch('b.dat')
+    assert registry.cache_size() == 200
+
+    removed = registry.prune(150)
+    assert sorted(path.name for path in removed) == ['a.dat', 'copy.dat']
+    assert not registry.is_cached('copy.dat')
+    assert registry.cache_size() == 100
+
+
+def test_max_cache_bytes_prunes_after_fetch(file_server, tmp_path):
+    """Test the size limit is enforced after each fetch."""
+    registry = data.DataRegistry(tmp_path, base_url=file_server.url + '/', max_cache_bytes=150)
+    for i in range(3):
+        registry.register(f'f{i}.dat', file_server.add(f'f{i}.dat', bytes([i]) * 100))
+        registry.fetch(f'f{i}.dat')
+    assert registry.cache_size() == 100
+    assert registry.is_cached('f2.dat')
+
+
+def test_max_cache_bytes_keeps_files_just_fetched(file_server, tmp_path):
+    """Test fetched files exceeding the size limit are not pruned."""
+    registry = data.DataRegistry(tmp_path, base_url=file_server.url + '/', max_cache_bytes=150)
+    for i in range(3):
+        registry.register(f'f{i}.dat', file_server.add(f'f{i}.dat', bytes([i]) * 100))
+    registry.fetch('f0.dat')
+
+    with pytest.warns(UserWarning, match='more than the cache limit'):
+        paths = registry.fetch_many(['f1.dat', 'f2.dat'])
+    assert all(path.is_file() for path in paths.values())
+    assert not registry.is_cached('f0.dat')
+    assert registry.cache_size() == 200
+
+
+def test_file_lock_excludes_other_holders(tmp_path):
+    """Test a held lock times out for a second holder."""
+    path = tmp_path / 'x.lock'
+    with FileLock(path) as lock:
+        assert lock.locked
+        with pytest.raises(TimeoutError):
+            FileLock(path, timeout=0.05).acquire()
+    with FileLock(path, timeout=0.05) as lock:
+        assert lock.locked
+    assert not lock.locked
+
+
+def test_file_lock_removed_while_waited_for(tmp_path):
+    """Test waiters lock a new file if the holder deletes it."""
+    path = tmp_path / 'x.lock'
+    holder = FileLock(path)
+    holder.acquire()
+    acquired = threading.Event()
+    waiter = FileLock(path)
+
+    def wait():
+        waiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    time.sleep(0.05)
+    holder.remove()
+    holder.release()
+    assert acquired.wait(5)
+    # The waiter holds the file now at the path, excluding others
+    with pytest.raises(TimeoutError):
+        FileLock(path, timeout=0.05).acquire()
+    waiter.release()
+    thread.join()
@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from easyutilities._filelock import FileLock
+from easyutilities.disk_cache import DiskCache
+from easyutilities.disk_cache import argument_hash
+from easyutilities.disk_cache import disk_memoize
+
+MIB = 1 << 20
+
+# ----------------------------------------------------------------------
+# Hashing
+# ----------------------------------------------------------------------
+
+
+def test_argument_hash_of_arrays():
+    """Test arrays are hashed by content, dtype and shape."""
+    x = np.arange(12.0)
+    assert argument_hash(x) == argument_hash(x.copy())
+    assert argument_hash(x) != argument_hash(x.astype(np.float32))
+    assert argument_hash(x) != argument_hash(x.reshape(3, 4))
+    changed = x.copy()
+    changed[5] += 1e-12
+    assert argument_hash(x) != argument_hash(changed)
+    # Equal arrays of any memory layout share keys
+    grid = x.reshape(3, 4)
+    assert argument_hash(grid[:, ::2]) == argument_hash(np.ascontiguousarray(grid[:, ::2]))
+    assert argument_hash(np.asfortranarray(grid)) == argument_hash(grid)
+    assert argument_hash(grid.T) != argument_hash(grid)
+    large = np.arange(3 * MIB // 8.0).reshape(3, -1)
+    assert argument_hash(np.asfortranarray(large)) == argument_hash(large)
+    assert argument_hash(large[:, ::-3]) == argument_hash(large[:, ::-3].copy())
+    assert argument_hash(np.datetime64('2026-01-01')) != argument_hash('2026-01-01')
+
+
+def test_argument_hash_of_containers_and_scalars():
+    """Test values are hashed by type and dicts by their items."""
+    assert argument_hash(1) != argument_hash(1.0) != argument_hash(True)
+    assert argument_hash((1, 2)) != argument_hash([1, 2])
+    assert argument_hash(('a', 'b')) != argument_hash(('ab',))
+    assert argument_hash(a=1, b=2) == argument_hash(b=2, a=1)
+    assert argument_hash({'a', 'b'}) == argument_hash({'b', 'a'})
+    assert argument_hash(Path('si.xye')) != argument_hash('si.xye')
+    with pytest.raises(TypeError, match='Cannot hash'):
+        argument_hash(threading.Lock())
+
+
+def test_argument_hash_does_not_copy_arrays():
+    """Test hashing a large contiguous array allocates no copy."""
+    x = np.ones(8 * MIB // 8)
+    tracemalloc.start()
+    try:
+        argument_hash(x)
+        argument_hash(np.asfortranarray(x.reshape(1024, -1)))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Only the Fortran-ordered input itself and a block are allocated
+    assert peak < 8 * MIB + MIB
+
+
+# ----------------------------------------------------------------------
+# Caches
+# ----------------------------------------------------------------------
+
+
+def test_array_results_are_memory_mapped(tmp_path):
+    """Test arrays are returned as read-only memory maps."""
+    calls = []
+
+    @disk_memoize(cache_dir=tmp_path)
+    def kernel(x, fwhm=0.1):
+        calls.append(fwhm)
+        return np.exp(-x * x / fwhm)
+
+    x = np.linspace(-1, 1, 1001)
+    first = kernel(x)
+    second = kernel(x, fwhm=0.1)
+    assert calls == [0.1]
+    assert isinstance(second, np.memmap)
+    assert not second.flags.writeable
+    np.testing.assert_array_equal(first, np.exp(-x * x / 0.1))
+    np.testing.assert_array_equal(second, first)
+    kernel(x, 0.2)
+    assert calls == [0.1, 0.2]
+    assert kernel.cache.directory.name.endswith('kernel')
+
+
+def test_entries_are_shared_between_caches(tmp_path):
+    """Test another process, modelled by a new cache, finds entries."""
+    DiskCache('reflections', cache_dir=tmp_path).set(('si', 1.54), {'hkl': [(1, 1, 1)]})
+    cache = DiskCache('reflections', cache_dir=tmp_path)
+    assert cache.get(('si', 1.54)) == {'hkl': [(1, 1, 1)]}
+    assert ('si', 1.54) in cache
+    assert cache.get(('si', 1.0), 'missing') == 'missing'
+    assert cache.get(np.zeros(0)) is None
+    cache.set('empty', np.zeros((0, 3)))
+    assert cache.get('empty').shape == (0, 3)
+    cache.clear()
+    assert cache.nbytes == 0
+    assert ('si', 1.54) not in cache
+    # Lock files go with their entries
+    assert list(tmp_path.glob('reflections/*/*')) == []
+
+
+def test_broken_entries_are_misses(tmp_path):
+    """Test truncated entries are recomputed."""
+    cache = DiskCache('fits', cache_dir=tmp_path)
+    cache.set('a', np.arange(1000.0))
+    cache.set('b', {'chi2': 1.0})
+    for path in tmp_path.glob('fits/*/*'):
+        if path.suffix != '.lock':
+            path.write_bytes(path.read_bytes()[:20])
+    assert cache.get('a') is None
+    assert cache.get_or_set('b', lambda: {'chi2': 2.0}) == {'chi2': 2.0}
+    assert cache.get('b') == {'chi2': 2.0}
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    """Test pruning keeps the recently loaded entries."""
+    cache = DiskCache('patterns', cache_dir=tmp_path, max_bytes=int(2.5 * MIB))
+    cache.set('a', np.zeros(MIB // 8))
+    cache.set('b', np.zeros(MIB // 8))
+    old = time.time() - 100
+    for path in tmp_path.glob('patterns/*/*.npy'):
+        os.utime(path, (old, old))
+    assert cache.get('a') is not None
+    cache.set('c', np.zeros(MIB // 8))
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.nbytes <= 2.5 * MIB
+    # Values larger than the cache are computed but not stored
+    assert cache.get_or_set('big', lambda: np.zeros(MIB)).nbytes == 8 * MIB
+    assert 'big' not in cache
+
+
+def test_prune_removes_lock_files(tmp_path):
+    """Test lock files do not outlive their entries."""
+    cache = DiskCache('kernels', cache_dir=tmp_path, max_bytes=int(1.5 * MIB))
+    for i in range(4):
+        cache.set(i, np.zeros(MIB // 16))
+    # A value too large to store, and an interrupted computation
+    assert cache.get_or_set('big', lambda: np.zeros(MIB)).nbytes == 8 * MIB
+    orphan = cache._base('interrupted').with_suffix('.lock')
+    orphan.parent.mkdir(exist_ok=True)
+    orphan.touch()
+    held = cache._base('computing').with_suffix('.lock')
+    with FileLock(held):
+        cache.prune()
+        locks = {path.name for path in tmp_path.glob('kernels/*/*.lock')}
+        entries = {path.stem for path in tmp_path.glob('kernels/*/*.npy')}
+        assert len(entries) == 2
+        assert locks == {f'{stem}.lock' for stem in entries} | {held.name}
+        cache.clear()
+        assert [path.name for path in tmp_path.glob('kernels/*/*')] == [held.name]
+    cache.clear()
+    assert list(tmp_path.glob('kernels/*/*')) == []
+
+
+def test_concurrent_misses_compute_once(tmp_path):
+    """Test threads missing the same key wait for one computation."""
+    calls = []
+
+    def background():
+        calls.append(1)
+        time.sleep(0.2)
+        return np.arange(10.0)
+
+    results = []
+
+    def load():
+        cache = DiskCache('backgrounds', cache_dir=tmp_path)
+        results.append(cache.get_or_set('si', background))
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(np.array_equal(result, np.arange(10.0)) for result in results)
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import easyutilities.environment as env
+from easyutilities.display import DisplayUpdater
+
+IPython_display = pytest.importorskip('IPython.display')
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def jupyter(set_environment):
+    """Pretend to run inside Jupyter."""
+    set_environment(jupyter=True)
+
+
+@pytest.fixture
+def handle():
+    """Mock IPython DisplayHandle that records updates."""
+    return MagicMock(spec=IPython_display.DisplayHandle)
+
+
+@pytest.fixture
+def clock():
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+def sent_html(handle):
+    """Return the HTML strings sent to a mock handle."""
+    return [call.args[0].data for call in handle.update.call_args_list]
+
+
+# ----------------------------------------------------------------------
+# Rate limiting
+# ----------------------------------------------------------------------
+
+
+def test_first_update_is_sent_immediately(jupyter, handle, clock):
+    """Test the first update is sent without waiting."""
+    updater = DisplayUpdater(handle, max_fps=10, clock=clock)
+    assert updater.enabled is True
+    assert updater.update('<b>0</b>') is True
+    assert sent_html(handle) == ['<b>0</b>']
+
+
+def test_updates_are_coalesced_to_max_fps(jupyter, handle, clock):
+    """Test updates within one frame interval are not sent."""
+    updater = DisplayUpdater(handle, max_fps=10, clock=clock)
+    updater.update('a')
+    clock.now = 0.05
+    assert updater.update('b') is False
+    assert updater.update('c') is False
+    clock.now = 0.1
+    assert updater.update('d') is True
+    assert sent_html(handle) == ['a', 'd']
+
+
+def test_zero_max_fps_disables_rate_limiting(jupyter, handle, clock):
+    """Test max_fps=0 sends every distinct frame."""
+    updater = DisplayUpdater(handle, max_fps=0, clock=clock)
+    for text in ('a', 'b', 'c'):
+        updater.update(text)
+    assert sent_html(handle) == ['a', 'b', 'c']
+
+
+def test_callable_content_is_rendered_only_when_sent(jupyter, handle, clock):
+    """Test callable content is not rendered between frames."""
+    renders = []
+
+    def render():
+        renders.append(1)
+        return f'frame {len(renders)}'
+
+    updater = DisplayUpdater(handle, max_fps=10, clock=clock)
+    for _ in range(1000):
+        updater.update(render)
+    assert len(renders) == 1
+    updater.flush()
+    assert len(renders) == 2
+    assert sent_html(handle) == ['frame 1', 'frame 2']
+
+
+# ----------------------------------------------------------------------
+# Diffing
+# ----------------------------------------------------------------------
+
+
+def test_identical_frames_are_skipped(jupyter, handle, clock):
+    """Test a frame equal to the last sent frame is not sent."""
+    updater = DisplayUpdater(handle, max_fps=0, clock=clock)
+    updater.update('same')
+    assert updater.update('same') is False
+    assert updater.update('other') is True
+    assert sent_html(handle) == ['same', 'other']
+    assert updater.frames_sent == 2
+    assert updater.frames_skipped == 1
+
+
+# ----------------------------------------------------------------------
+# Flushing
+# ----------------------------------------------------------------------
+
+
+def test_flush_sends_pending_final_state(jupyter, handle, clock):
+    """Test flush() sends the last coalesced update."""
+    updater = DisplayUpdater(handle, max_fps=1, clock=clock)
+    updater.update('start')
+    updater.update('middle')
+    updater.update('final')
+    assert updater.flush() is True
+    assert sent_html(handle) == ['start', 'final']
+    assert updater.flush() is False
+
+
+def test_context_manager_flushes_on_exit(jupyter, handle, clock):
+    """Test leaving the context flushes the final state."""
+    with DisplayUpdater(handle, max_fps=1, clock=clock) as updater:
+        updater.update('start')
+        updater.update('final')
+    assert sent_html(handle) == ['start', 'final']
+
+
+# ----------------------------------------------------------------------
+# Outside Jupyter
+# ----------------------------------------------------------------------
+
+
+def test_does_nothing_outside_jupyter(handle, clock):
+    """Test no updates are sent when not in Jupyter."""
+    env.refresh()
+    assert env.in_jupyter() is False
+    updater = DisplayUpdater(handle, max_fps=0, clock=clock)
+    assert updater.enabled is False
+    assert updater.update('a') is False
+    assert updater.flush() is False
+    handle.update.assert_not_called()
+
+
+def test_does_nothing_for_non_handle(jupyter, clock):
+    """Test an object that is not a display handle is ignored."""
+    updater = DisplayUpdater(object(), clock=clock)
+    assert updater.enabled is False
+    assert updater.update('a') is False
+
+
+def test_create_outside_jupyter_returns_disabled_updater():
+    """Test create() outside Jupyter creates no output area."""
+    env.refresh()
+    updater = DisplayUpdater.create()
+    assert updater.handle is None
+    assert updater.enabled is False
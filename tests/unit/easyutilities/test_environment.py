@@ -22,12 +22,104 @@ def reload_env_module():
     importlib.reload(env)
 
 
+@pytest.fixture(autouse=True)
+def fresh_snapshot():
+    """Ensure each test starts and ends with a fresh environment
+    snapshot.
+    """
+    env.refresh()
+    yield
+    env.refresh()
+
+
 @pytest.fixture
 def clean_pycharm_env(monkeypatch):
     """Fixture that ensures PYCHARM_HOSTED is unset."""
     monkeypatch.delenv('PYCHARM_HOSTED', raising=False)
 
 
+# ----------------------------------------------------------------------
+# EnvironmentInfo / environment_info() / refresh()
+# ----------------------------------------------------------------------
+
+
+def test_environment_info_is_cached():
+    """Test environment_info() returns the same snapshot each call."""
+    assert env.environment_info() is env.environment_info()
+
+
+def test_environment_info_does_not_detect_again(monkeypatch):
+    """Test cached lookups do not rerun the detectors."""
+    calls = []
+    original = env.EnvironmentInfo.detect
+
+    def counting_detect():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(env.EnvironmentInfo, 'detect', counting_detect)
+    env.refresh()
+    for _ in range(10):
+        env.in_jupyter()
+        env.in_pytest()
+        env.in_github_ci()
+    assert len(calls) == 1
+
+
+def test_environment_info_is_stale_until_refresh(monkeypatch):
+    """Test environment changes are picked up only after refresh()."""
+    monkeypatch.delenv('GITHUB_ACTIONS', raising=False)
+    env.refresh()
+    monkeypatch.setenv('GITHUB_ACTIONS', 'true')
+    assert env.in_github_ci() is False
+    new_info = env.refresh()
+    assert new_info.github_ci is True
+    assert env.in_github_ci() is True
+
+
+def test_environment_info_is_frozen():
+    """Test EnvironmentInfo attributes cannot be modified."""
+    info = env.environment_info()
+    with pytest.raises(AttributeError):
+        info.jupyter = True
+    with pytest.raises(AttributeError):
+        del info.jupyter
+    with pytest.raises(AttributeError):
+        info.extra = 1
+
+
+def test_environment_info_uses_slots():
+    """Test EnvironmentInfo has no per-instance __dict__."""
+    assert not hasattr(env.environment_info(), '__dict__')
+
+
+def test_environment_info_equality_and_repr():
+    """Test EnvironmentInfo value semantics."""
+    fields = dict(pytest=True, warp=False, pycharm=False, colab=False, jupyter=False)
+    a = env.EnvironmentInfo(**fields, github_ci=True)
+    b = env.EnvironmentInfo(**fields, github_ci=True)
+    c = env.EnvironmentInfo(**fields, github_ci=False)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a != c
+    assert a.as_dict()['github_ci'] is True
+    assert repr(a).startswith('EnvironmentInfo(pytest=True')
+
+
+def test_in_functions_read_snapshot(monkeypatch):
+    """Test the in_* functions return the snapshot values."""
+    info = env.EnvironmentInfo(
+        pytest=False, warp=True, pycharm=True, colab=True, jupyter=True, github_ci=True
+    )
+    monkeypatch.setattr(env, '_snapshot', info)
+    assert env.in_pytest() is False
+    assert env.in_warp() is True
+    assert env.in_pycharm() is True
+    assert env.in_colab() is True
+    assert env.in_jupyter() is True
+    assert env.in_github_ci() is True
+
+
 # ----------------------------------------------------------------------
 # in_pytest()
 # ----------------------------------------------------------------------
@@ -44,6 +136,7 @@ def test_in_pytest_returns_false_when_pytest_not_loaded(monkeypatch):
     monkeypatch.setattr(
         sys, 'modules', {k: v for k, v in original_modules.items() if k != 'pytest'}
     )
+    env.refresh()
     assert env.in_pytest() is False
 
 
@@ -55,18 +148,21 @@ def test_in_pytest_returns_false_when_pytest_not_loaded(monkeypatch):
 def test_in_warp_returns_true_when_warp_terminal(monkeypatch):
     """Test in_warp() returns True when TERM_PROGRAM is WarpTerminal."""
     monkeypatch.setenv('TERM_PROGRAM', 'WarpTerminal')
+    env.refresh()
     assert env.in_warp() is True
 
 
 def test_in_warp_returns_false_when_not_warp(monkeypatch):
     """Test in_warp() returns False for other terminals."""
     monkeypatch.setenv('TERM_PROGRAM', 'iTerm.app')
+    env.refresh()
     assert env.in_warp() is False
 
 
 def test_in_warp_returns_false_when_env_not_set(monkeypatch):
     """Test in_warp() returns False when TERM_PROGRAM is not set."""
     monkeypatch.delenv('TERM_PROGRAM', raising=False)
+    env.refresh()
     assert env.in_warp() is False
 
 
@@ -78,18 +174,21 @@ def test_in_warp_returns_false_when_env_not_set(monkeypatch):
 def test_in_pycharm_returns_true_when_pycharm_hosted(monkeypatch):
     """Test in_pycharm() returns True when PYCHARM_HOSTED is '1'."""
     monkeypatch.setenv('PYCHARM_HOSTED', '1')
+    env.refresh()
     assert env.in_pycharm() is True
 
 
 def test_in_pycharm_returns_false_when_not_hosted(monkeypatch):
     """Test in_pycharm() returns False when not '1'."""
     monkeypatch.setenv('PYCHARM_HOSTED', '0')
+    env.refresh()
     assert env.in_pycharm() is False
 
 
 def test_in_pycharm_returns_false_when_env_not_set(monkeypatch):
     """Test in_pycharm() returns False when env not set."""
     monkeypatch.delenv('PYCHARM_HOSTED', raising=False)
+    env.refresh()
     assert env.in_pycharm() is False
 
 
@@ -110,6 +209,7 @@ def test_in_colab_returns_true_when_module_exists(monkeypatch):
         'easyutilities.environment.find_spec',
         lambda x: mock_spec if x == 'google.colab' else None,
     )
+    env.refresh()
     assert env.in_colab() is True
 
 
@@ -126,6 +226,7 @@ def test_in_jupyter_returns_false_in_plain_env():
 def test_in_jupyter_returns_false_when_pycharm(monkeypatch):
     """Test in_jupyter() returns False in PyCharm."""
     monkeypatch.setenv('PYCHARM_HOSTED', '1')
+    env.refresh()
     assert env.in_jupyter() is False
 
 
@@ -142,6 +243,7 @@ def test_in_jupyter_returns_true_when_colab(monkeypatch, clean_pycharm_env, relo
             'easyutilities.environment.find_spec',
             lambda x: mock_spec if x == 'google.colab' else None,
         )
+        env.refresh()
         assert env.in_jupyter() is True
 
 
@@ -205,15 +307,61 @@ def test_in_jupyter_returns_false_when_ipython_returns_none(clean_pycharm_env, r
 def test_in_github_ci_returns_true_when_env_set(monkeypatch):
     """Test in_github_ci() returns True when GITHUB_ACTIONS is set."""
     monkeypatch.setenv('GITHUB_ACTIONS', 'true')
+    env.refresh()
     assert env.in_github_ci() is True
 
 
 def test_in_github_ci_returns_false_when_env_not_set(monkeypatch):
     """Test in_github_ci() returns False when env not set."""
     monkeypatch.delenv('GITHUB_ACTIONS', raising=False)
+    env.refresh()
     assert env.in_github_ci() is False
 
 
+# ----------------------------------------------------------------------
+# ipython_display_classes()
+# ----------------------------------------------------------------------
+
+
+def test_ipython_display_classes_returns_handle_and_html():
+    """Test ipython_display_classes() resolves the IPython classes."""
+    IPython_display = pytest.importorskip('IPython.display')
+    assert env.ipython_display_classes() == (
+        IPython_display.DisplayHandle,
+        IPython_display.HTML,
+    )
+
+
+def test_ipython_display_classes_imports_once():
+    """Test a successful resolution is not repeated."""
+    pytest.importorskip('IPython.display')
+    classes = env.ipython_display_classes()
+    with patch.dict(sys.modules, {'IPython': None, 'IPython.display': None}):
+        assert env.ipython_display_classes() == classes
+        assert env.can_update_ipython_display() is True
+
+
+def test_ipython_display_classes_caches_failure():
+    """Test a failed import is cached until refresh()."""
+    with patch.dict(sys.modules, {'IPython': None, 'IPython.display': None}):
+        env.refresh()
+        assert env.ipython_display_classes() is None
+    # IPython is importable again, but the failure is remembered
+    assert env.ipython_display_classes() is None
+    assert env.can_update_ipython_display() is False
+
+
+def test_display_helpers_without_ipython():
+    """Test the display helpers when IPython cannot be imported."""
+    mock_obj = MagicMock()
+    mock_obj.__class__.__module__ = 'IPython.display'
+    with patch.dict(sys.modules, {'IPython': None, 'IPython.display': None}):
+        env.refresh()
+        assert env.is_ipython_display_handle(mock_obj) is True
+        assert env.is_ipython_display_handle('string') is False
+        assert env.can_use_ipython_display(mock_obj) is False
+
+
 # ----------------------------------------------------------------------
 # is_ipython_display_handle()
 # ----------------------------------------------------------------------
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+
+import numpy as np
+import pytest
+
+from easyutilities.grid import Grid
+from easyutilities.grid import Sample
+from easyutilities.grid import evaluate_grid
+from easyutilities.grid import latin_hypercube
+from easyutilities.grid import sobol
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+def gaussian(x, amplitude, center, width):
+    """Vectorized Gaussian peak."""
+    return amplitude * np.exp(-0.5 * ((x - center) / width) ** 2)
+
+
+@pytest.fixture(scope='module')
+def peak():
+    """Noisy Gaussian peak with known parameters."""
+    rng = np.random.default_rng(1234)
+    x = np.linspace(-5, 5, 501)
+    sigma = np.full_like(x, 0.1)
+    y = gaussian(x, 10.0, 0.3, 0.8) + rng.normal(0.0, 0.1, x.size)
+    return x, y, sigma
+
+
+def brute_force(x, y, sigma, points):
+    """Chi-squared of each point, one model call per point."""
+    values = points.take(0, len(points))
+    return np.array([
+        np.sum(((y - gaussian(x, 10.0, c, w)) / sigma) ** 2)
+        for c, w in zip(values['center'], values['width'])
+    ])
+
+
+# ----------------------------------------------------------------------
+# Candidates
+# ----------------------------------------------------------------------
+
+
+def test_grid_points_follow_product_order():
+    """Test grid points are generated as by itertools.product."""
+    grid = Grid({'a': [1, 2, 3], 'b': [10, 20], 'c': [0.5]})
+    assert (len(grid), grid.shape, grid.names) == (6, (3, 2, 1), ('a', 'b', 'c'))
+    expected = list(itertools.product([1, 2, 3], [10, 20], [0.5]))
+    values = grid.take(1, 5)
+    assert list(zip(values['a'], values['b'], values['c'])) == expected[1:5]
+    with pytest.raises(ValueError, match='no empty axes'):
+        Grid({'a': [1], 'b': []})
+
+
+def test_sample_points():
+    """Test samples take slices and need points of equal length."""
+    sample = Sample({'a': [1, 2, 3], 'b': [4, 5, 6]})
+    assert len(sample) == 3
+    assert sample.take(1, 3)['b'].tolist() == [5, 6]
+    with pytest.raises(ValueError, match='same points'):
+        Sample({'a': [1, 2], 'b': [3]})
+    with pytest.raises(ValueError, match='at least one point'):
+        Sample({'a': [], 'b': []})
+
+
+def test_latin_hypercube_is_stratified():
+    """Test every stratum of every parameter holds one point."""
+    bounds = {'center': (-1.0, 1.0), 'width': (0.1, 2.0)}
+    sample = latin_hypercube(bounds, 50, seed=7)
+    assert len(sample) == 50
+    for name, (low, high) in bounds.items():
+        values = sample.values[name]
+        strata = np.floor((values - low) / (high - low) * 50).astype(int)
+        assert sorted(strata) == list(range(50))
+    again = latin_hypercube(bounds, 50, seed=7)
+    assert np.array_equal(sample.values['width'], again.values['width'])
+    with pytest.raises(ValueError, match='low < high'):
+        latin_hypercube({'width': (2.0, 0.1)}, 10)
+    with pytest.raises(ValueError, match='at least one point'):
+        latin_hypercube(bounds, 0)
+
+
+def test_sobol_sample():
+    """Test Sobol samples lie within the bounds."""
+    pytest.importorskip('scipy')
+    sample = sobol({'center': (-1.0, 1.0), 'width': (0.1, 2.0)}, 64, seed=3)
+    assert len(sample) == 64
+    assert np.all((sample.values['width'] >= 0.1) & (sample.values['width'] < 2.0))
+
+
+# ----------------------------------------------------------------------
+# Evaluation
+# ----------------------------------------------------------------------
+
+
+def test_surface_and_best_candidates(peak):
+    """Test chi-squared values match one model call per point."""
+    grid = Grid({'center': np.linspace(-1, 1, 21), 'width': np.linspace(0.5, 1.1, 7)})
+    result = evaluate_grid(gaussian, *peak[:2], grid, sigma=peak[2], fixed={'amplitude': 10.0})
+    expected = brute_force(*peak, grid)
+    assert result.surface.shape == (21, 7)
+    np.testing.assert_allclose(result.chi2, expected)
+    best = result.best()
+    assert len(best) == 10
+    assert [c.index for c in best] == np.argsort(expected, kind='stable')[:10].tolist()
+    assert best[0].params == pytest.approx({'center': 0.3, 'width': 0.8})
+    assert best[0].chi2 == pytest.approx(expected.min())
+
+
+def test_batches_fit_the_memory_budget(peak):
+    """Test small budgets split the points without changing results."""
+    sample = latin_hypercube({'center': (-1, 1), 'width': (0.5, 1.1)}, 300, seed=1)
+    args = (gaussian, *peak[:2], sample)
+    kwargs = {'sigma': peak[2], 'fixed': {'amplitude': 10.0}}
+    whole = evaluate_grid(*args, **kwargs)
+    assert (whole.batches, whole.batch_size) == (1, 300)
+    # Four arrays of 501 floats per point: 16 points per 256 KiB
+    split = evaluate_grid(*args, **kwargs, memory_budget=256 << 10, keep_chi2=False)
+    assert (split.batches, split.batch_size) == (19, 16)
+    assert split.chi2 is None
+    np.testing.assert_array_equal(split.best_index, whole.best_index)
+    np.testing.assert_allclose(split.best_chi2, whole.best_chi2)
+    with pytest.raises(ValueError, match='Surfaces need a grid'):
+        _ = whole.surface
+
+
+def test_batches_in_threads(peak):
+    """Test batches fanned out to threads give the serial results."""
+    grid = Grid({'center': np.linspace(-1, 1, 41), 'width': np.linspace(0.5, 1.1, 13)})
+    kwargs = {'sigma': peak[2], 'fixed': {'amplitude': 10.0}, 'memory_budget': 1 << 20}
+    serial = evaluate_grid(gaussian, *peak[:2], grid, **kwargs)
+    threaded = evaluate_grid(gaussian, *peak[:2], grid, **kwargs, max_workers=2, executor='thread')
+    assert threaded.batches > 2
+    np.testing.assert_array_equal(threaded.chi2, serial.chi2)
+
+
+def test_invalid_predictions_rank_last():
+    """Test NaN predictions count as infinite chi-squared."""
+
+    def model(x, scale):
+        return np.where(scale < 0, np.nan, scale * x)
+
+    x = np.arange(5.0)
+    result = evaluate_grid(model, x, 2 * x, Grid({'scale': [-1.0, 1.0, 2.0]}), top=2)
+    assert result.chi2.tolist() == [np.inf, 30.0, 0.0]
+    assert [c.params['scale'] for c in result.best()] == [2.0, 1.0]
+    with pytest.raises(ValueError, match='must be positive'):
+        evaluate_grid(model, x, x, Grid({'scale': [1.0]}), top=0)
+    with pytest.raises(ValueError, match='max_workers must be positive'):
+        evaluate_grid(model, x, x, Grid({'scale': [1.0]}), max_workers=0)
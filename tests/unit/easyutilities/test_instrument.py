@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+import easyutilities._instrument as instrument
+from easyutilities._instrument import NULL_CONTEXT
+from easyutilities._instrument import Recorder
+
+# ----------------------------------------------------------------------
+# Recorder
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ('value', 'enabled'), [(None, False), ('', False), ('0', False), ('1', True)]
+)
+def test_recorder_enabled_from_environment(monkeypatch, value, enabled):
+    """Test the environment variable enables the recorder unless 0."""
+    if value is None:
+        monkeypatch.delenv('EASYUTILITIES_TEST_ON', raising=False)
+    else:
+        monkeypatch.setenv('EASYUTILITIES_TEST_ON', value)
+    assert Recorder('EASYUTILITIES_TEST_ON').enabled is enabled
+
+
+def test_scope_clears_and_restores():
+    """Test scope() enables within the block and restores after."""
+    recorder = Recorder('EASYUTILITIES_TEST_ON')
+    recorder.records.append('old')
+    with recorder.scope(clear=True):
+        assert recorder.enabled
+        assert recorder.records == []
+        with recorder.scope(clear=False):
+            recorder.records.append('new')
+        assert recorder.enabled
+    assert not recorder.enabled
+    assert recorder.records == ['new']
+
+
+def test_wrap_enters_context_only_while_enabled():
+    """Test wrapped calls are instrumented by name when enabled."""
+    recorder = Recorder('EASYUTILITIES_TEST_ON')
+    names = []
+
+    @contextlib.contextmanager
+    def context(name):
+        names.append(name)
+        yield
+
+    def fit(x):
+        """Fit."""
+        if x < 0:
+            raise ValueError(x)
+        return 2 * x
+
+    wrapped = recorder.wrap(fit, None, context)
+    named = recorder.wrap(fit, 'chi2', context)
+    assert wrapped(1) == 2
+    assert names == []
+    with recorder.scope(clear=True):
+        assert wrapped(2) == 4
+        with pytest.raises(ValueError):
+            named(-1)
+    assert names == [fit.__qualname__, 'chi2']
+    assert wrapped.__doc__ == 'Fit.'
+
+
+def test_null_context_yields_none():
+    """Test the shared no-op context yields None and keeps errors."""
+    with NULL_CONTEXT as value:
+        assert value is None
+    with pytest.raises(KeyError), NULL_CONTEXT:
+        raise KeyError
+
+
+# ----------------------------------------------------------------------
+# show()
+# ----------------------------------------------------------------------
+
+
+def fail():
+    """Rendering that must not be computed."""
+    pytest.fail('wrong rendering')
+
+
+def test_show_prints_text_outside_jupyter(monkeypatch):
+    """Test text is printed in terminals and CI."""
+    monkeypatch.setattr(instrument, 'in_jupyter', lambda: False)
+    out = io.StringIO()
+    instrument.show(fail, lambda: 'text', out)
+    assert out.getvalue() == 'text\n'
+
+
+def test_show_displays_html_in_jupyter(monkeypatch):
+    """Test HTML is displayed once, without rate limit, in Jupyter."""
+    monkeypatch.setattr(instrument, 'in_jupyter', lambda: True)
+    monkeypatch.setattr(instrument, 'can_update_ipython_display', lambda: True)
+    updater = MagicMock()
+    monkeypatch.setattr(instrument, 'DisplayUpdater', updater)
+    instrument.show(lambda: '<table></table>', fail)
+    updater.create.assert_called_once_with(max_fps=0)
+    updater.create.return_value.update.assert_called_once_with('<table></table>')
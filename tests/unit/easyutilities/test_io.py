@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+import easyutilities.io as eio
+from easyutilities.sidecar import load_columns
+
+DATA = """\
+Instrument: HRPT
+# wavelength 1.494
+# n tth intensity
+1 10.0 105.5
+2 10.05 98.25  # trailing comment
+
+# comment in the data
+3 10.1 1e2
+4 10.15 nan
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Text data file with a header, comments and blank lines."""
+    path = tmp_path / 'data.dat'
+    path.write_text(DATA)
+    return path
+
+
+@pytest.fixture
+def large(tmp_path):
+    """Text data file of 1000 rows and its expected columns."""
+    n = np.arange(1000)
+    x = n * 0.25
+    path = tmp_path / 'large.xye'
+    lines = ['# n x']
+    for i, value in zip(n, x, strict=True):
+        lines.append(f'{i} {value}')
+        if i % 97 == 0:
+            lines.append('# marker')
+    path.write_text('\n'.join(lines) + '\n')
+    return path, n, x
+
+
+# ----------------------------------------------------------------------
+# sniff()
+# ----------------------------------------------------------------------
+
+
+def test_sniff_infers_names_dtypes_and_header(source):
+    """Test names come from the last comment and integers are found."""
+    layout = eio.sniff(source)
+    assert layout.names == ('n', 'tth', 'intensity')
+    assert layout.dtypes == {
+        'n': np.dtype(np.int64),
+        'tth': np.dtype(np.float64),
+        'intensity': np.dtype(np.float64),
+    }
+    assert layout.header == ('Instrument: HRPT', '# wavelength 1.494', '# n tth intensity')
+    assert layout.data_line == 4
+    assert source.read_bytes()[layout.data_offset :].startswith(b'1 10.0')
+
+
+def test_sniff_default_names(tmp_path):
+    """Test columns are numbered without a matching header line."""
+    path = tmp_path / 'data.xy'
+    path.write_text('# silicon at 300 K\n1.5 2\n')
+    assert eio.sniff(path).names == ('col0', 'col1')
+
+
+def test_sniff_overrides(source):
+    """Test names and dtypes can be given by name or in order."""
+    layout = eio.sniff(source, names=['a', 'b', 'c'], dtypes={'a': np.float32})
+    assert layout.column_dtypes == (np.float32, np.float64, np.float64)
+    layout = eio.sniff(source, dtypes=['f8', 'f8', 'f8'])
+    assert layout.dtypes['n'] == np.float64
+    with pytest.raises(ValueError, match='2 names given for 3 columns'):
+        eio.sniff(source, names=['a', 'b'])
+    with pytest.raises(ValueError, match='unknown columns'):
+        eio.sniff(source, dtypes={'z': int})
+
+
+def test_sniff_without_data(tmp_path):
+    """Test a file without numeric lines has no columns."""
+    path = tmp_path / 'empty.dat'
+    path.write_text('# nothing yet\n')
+    assert eio.sniff(path).ncols == 0
+    assert eio.read_columns(path) == {}
+    assert list(eio.iter_chunks(path)) == []
+    columns = eio.read_columns(path, names=['x'])
+    assert columns['x'].shape == (0,)
+
+
+# ----------------------------------------------------------------------
+# read_columns()
+# ----------------------------------------------------------------------
+
+
+def test_read_columns(source):
+    """Test comments and blank lines are skipped in the data."""
+    columns = eio.read_columns(source)
+    assert list(columns) == ['n', 'tth', 'intensity']
+    np.testing.assert_array_equal(columns['n'], [1, 2, 3, 4])
+    assert columns['n'].dtype == np.int64
+    np.testing.assert_array_equal(columns['intensity'], [105.5, 98.25, 100.0, np.nan])
+    assert all(values.flags.c_contiguous for values in columns.values())
+
+
+def test_read_columns_large(large):
+    """Test comment lines between data lines are skipped."""
+    path, n, x = large
+    columns = eio.read_columns(path)
+    np.testing.assert_array_equal(columns['n'], n)
+    np.testing.assert_array_equal(columns['x'], x)
+
+
+def test_read_columns_matches_loadtxt(large):
+    """Test the result equals that of numpy.loadtxt."""
+    path, _, _ = large
+    columns = eio.read_columns(path, dtypes=[float, float])
+    np.testing.assert_array_equal(np.column_stack(list(columns.values())), np.loadtxt(path))
+
+
+def test_read_columns_delimiter(tmp_path):
+    """Test comma-separated files with Windows line endings."""
+    path = tmp_path / 'data.csv'
+    path.write_bytes(b'x,y\r\n1.5, 2\r\n2.5, 3\r\n')
+    columns = eio.read_columns(path, delimiter=',')
+    np.testing.assert_array_equal(columns['x'], [1.5, 2.5])
+    np.testing.assert_array_equal(columns['y'], [2, 3])
+
+
+def test_read_columns_last_line_without_newline(tmp_path):
+    """Test the final line is read without a line ending."""
+    path = tmp_path / 'data.xy'
+    path.write_text('1 2\n3 4')
+    assert eio.read_columns(path)['col1'].tolist() == [2, 4]
+    chunks = eio.iter_chunks(path, block_size=3)
+    assert [chunk['col1'].tolist() for chunk in chunks] == [[2, 4]]
+
+
+def test_read_columns_with_layout(source):
+    """Test a sniffed layout is reused and not combined with options."""
+    layout = eio.sniff(source, names=['a', 'b', 'c'])
+    assert list(eio.read_columns(source, layout=layout)) == ['a', 'b', 'c']
+    with pytest.raises(TypeError, match='cannot be combined'):
+        eio.read_columns(source, layout=layout, delimiter=',')
+
+
+@pytest.mark.parametrize(
+    ('text', 'message'),
+    [
+        ('1 2\n3 4\n5\n', 'line 4: expected 2 values, found 1'),
+        ('1 2\n3 4\n5 x\n', "line 4: non-numeric value: '5 x'"),
+        ('1 2\n3 4.5\n', "line 3: non-integer value '4.5' in column 'col1'"),
+    ],
+)
+def test_read_columns_reports_malformed_line(tmp_path, text, message):
+    """Test errors name the file line of the malformed data."""
+    path = tmp_path / 'bad.dat'
+    path.write_text('# header\n' + text)
+    with pytest.raises(ValueError, match=message):
+        eio.read_columns(path, dtypes=[int, int])
+
+
+def test_read_columns_as_sidecar_parser(source, tmp_path):
+    """Test read_columns() plugs into sidecar.load_columns()."""
+    columns = load_columns(source, eio.read_columns, cache_dir=tmp_path / 'cache')
+    np.testing.assert_array_equal(columns['n'], [1, 2, 3, 4])
+
+
+# ----------------------------------------------------------------------
+# iter_chunks()
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('block_size', [7, 64, 1 << 20])
+def test_iter_chunks_fixed_rows(large, block_size):
+    """Test chunks have the requested rows for any block size."""
+    path, n, x = large
+    chunks = list(eio.iter_chunks(path, rows=300, block_size=block_size))
+    assert [len(chunk['n']) for chunk in chunks] == [300, 300, 300, 100]
+    np.testing.assert_array_equal(np.concatenate([chunk['n'] for chunk in chunks]), n)
+    np.testing.assert_array_equal(np.concatenate([chunk['x'] for chunk in chunks]), x)
+
+
+def test_iter_chunks_is_lazy(tmp_path):
+    """Test chunks before a malformed line are yielded first."""
+    path = tmp_path / 'bad.dat'
+    path.write_text('1\n2\n3\nx\n')
+    chunks = eio.iter_chunks(path, rows=1, block_size=2)
+    assert [next(chunks)['col0'][0] for _ in range(3)] == [1, 2, 3]
+    with pytest.raises(ValueError, match='line 4'):
+        next(chunks)
+
+
+def test_iter_chunks_rejects_non_positive_rows(source):
+    """Test at least one row per chunk is required."""
+    with pytest.raises(ValueError, match='rows must be positive'):
+        next(eio.iter_chunks(source, rows=0))
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+import easyutilities.lazy as lazy
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    """Start each test with no cached deferred imports."""
+    monkeypatch.setattr(lazy, '_registry', {})
+    monkeypatch.setattr(lazy, '_records', [])
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch, request):
+    """Create an importable package with a submodule."""
+    name = f'lazy_pkg_{request.node.name.replace("[", "_").replace("]", "")}'
+    root = tmp_path / name
+    root.mkdir()
+    (root / '__init__.py').write_text('VALUE = 42\n')
+    (root / 'sub.py').write_text('SUB_VALUE = 7\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module in [m for m in sys.modules if m.split('.')[0] == name]:
+        del sys.modules[module]
+
+
+# ----------------------------------------------------------------------
+# lazy_import()
+# ----------------------------------------------------------------------
+
+
+def test_lazy_import_defers_import(package):
+    """Test the module is imported on first attribute access only."""
+    proxy = lazy.lazy_import(package)
+    assert package not in sys.modules
+    assert lazy.is_imported(package) is False
+    assert proxy.VALUE == 42
+    assert package in sys.modules
+    assert lazy.is_imported(proxy) is True
+
+
+def test_lazy_import_returns_shared_proxy(package):
+    """Test repeated calls return the same proxy."""
+    assert lazy.lazy_import(package) is lazy.lazy_import(package)
+
+
+def test_lazy_import_is_a_module(package):
+    """Test the proxy can be used where a module is expected."""
+    proxy = lazy.lazy_import(package)
+    assert isinstance(proxy, types.ModuleType)
+    assert proxy.__name__ == package
+
+
+def test_lazy_import_caches_attributes(package):
+    """Test resolved attributes are stored on the proxy."""
+    proxy = lazy.lazy_import(package)
+    _ = proxy.VALUE
+    assert proxy.__dict__['VALUE'] == 42
+
+
+def test_lazy_import_resolves_submodules(package):
+    """Test submodules are imported on attribute access."""
+    proxy = lazy.lazy_import(package)
+    assert proxy.sub.SUB_VALUE == 7
+    assert f'{package}.sub' in sys.modules
+
+
+def test_lazy_import_of_dotted_name(package):
+    """Test a dotted name imports the submodule."""
+    assert lazy.lazy_import(f'{package}.sub').SUB_VALUE == 7
+
+
+def test_lazy_import_missing_attribute_raises(package):
+    """Test a missing attribute raises AttributeError."""
+    proxy = lazy.lazy_import(package)
+    with pytest.raises(AttributeError, match='no_such_name'):
+        _ = proxy.no_such_name
+
+
+def test_lazy_import_dunder_does_not_import(package):
+    """Test special attribute probes do not trigger the import."""
+    proxy = lazy.lazy_import(package)
+    assert not hasattr(proxy, '__wrapped__')
+    assert package not in sys.modules
+
+
+def test_lazy_import_repr_shows_state(package):
+    """Test repr() reports whether the module is imported."""
+    proxy = lazy.lazy_import(package)
+    assert repr(proxy) == f"<lazy module '{package}' (not imported)>"
+    _ = proxy.VALUE
+    assert repr(proxy) == f"<lazy module '{package}' (imported)>"
+    assert 'VALUE' in dir(proxy)
+
+
+# ----------------------------------------------------------------------
+# Missing modules
+# ----------------------------------------------------------------------
+
+
+def test_missing_module_raises_import_error():
+    """Test attribute access on a missing module raises ImportError."""
+    proxy = lazy.lazy_import('no_such_module_xyz')
+    with pytest.raises(ImportError, match='no_such_module_xyz'):
+        _ = proxy.anything
+    assert repr(proxy) == "<lazy module 'no_such_module_xyz' (unavailable)>"
+
+
+def test_missing_module_is_not_retried(monkeypatch):
+    """Test a failed import is cached."""
+    calls = []
+    original = importlib.import_module
+
+    def counting_import(name):
+        calls.append(name)
+        return original(name)
+
+    monkeypatch.setattr(lazy.importlib, 'import_module', counting_import)
+    for _ in range(5):
+        assert lazy.optional_import('no_such_module_xyz') is None
+        assert lazy.is_available('no_such_module_xyz') is False
+    assert calls == ['no_such_module_xyz']
+
+
+def test_optional_import_returns_module(package):
+    """Test optional_import() imports an available module."""
+    module = lazy.optional_import(package)
+    assert module is sys.modules[package]
+    assert lazy.is_available(package) is True
+
+
+def test_import_needing_a_proxy_does_not_deadlock(package, tmp_path):
+    """Test a thread importing a module can load other proxies."""
+    # Imported directly by one thread, and through a proxy by another
+    # while the first holds the import lock of the module
+    (tmp_path / package / 'slow.py').write_text(
+        'import time\n'
+        'import easyutilities.lazy as lazy\n'
+        'time.sleep(0.2)\n'
+        f'VALUE = lazy.lazy_import({package!r}).sub.SUB_VALUE\n'
+    )
+    name = f'{package}.slow'
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(importlib.import_module(name).VALUE)),
+        threading.Thread(target=lambda: results.append(lazy.lazy_import(name).VALUE)),
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join(5)
+    assert results == [7, 7]
+
+
+# ----------------------------------------------------------------------
+# import_records()
+# ----------------------------------------------------------------------
+
+
+def test_import_records_time_each_deferred_import(package):
+    """Test every deferred import is recorded once with its outcome."""
+    proxy = lazy.lazy_import(package)
+    _ = proxy.VALUE
+    _ = proxy.VALUE
+    lazy.optional_import('no_such_module_xyz')
+    records = lazy.import_records()
+    assert [record.name for record in records] == [package, 'no_such_module_xyz']
+    assert records[0].error is None
+    assert records[0].duration >= 0
+    assert records[0].started_at > 0
+    assert 'no_such_module_xyz' in records[1].error
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import io
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import easyutilities.bench as bench
+import easyutilities.memory as memory
+from easyutilities.memory import track
+
+pytestmark = pytest.mark.usefixtures('instrumentation_off')
+
+MIB = 1 << 20
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+def transient(mib):
+    """Allocate and free an array of about mib MiB."""
+    return float(np.ones(mib * MIB // 8).sum())
+
+
+# ----------------------------------------------------------------------
+# Tracking
+# ----------------------------------------------------------------------
+
+
+def test_disabled_tracking_is_free():
+    """Test disabled trackers are one shared no-op object."""
+    assert track('a') is track('b', top=0)
+    with track('a') as report:
+        assert report is None
+
+    @memory.tracked
+    def reduce():
+        return 1
+
+    assert reduce() == 1
+    assert memory.reports() == []
+    assert not tracemalloc.is_tracing()
+
+
+def test_track_reports_transient_peak():
+    """Test a freed temporary shows in the peak but not net."""
+    with memory.tracking(), track('reduce') as report:
+        transient(16)
+        kept = np.zeros(4 * MIB // 8) + 1
+    assert report.peak >= 16 * MIB
+    assert report.net == pytest.approx(4 * MIB, abs=64 * 1024)
+    assert report.sites[0].size_diff >= 4 * MIB
+    assert 'test_memory.py' in report.sites[0].location
+    assert kept.nbytes == 4 * MIB
+    assert memory.reports() == [report]
+    assert not tracemalloc.is_tracing()
+
+
+def test_nested_trackers_keep_their_peaks():
+    """Test an inner tracker does not hide the outer peak."""
+    with memory.tracking():
+        with track('outer', top=0) as outer:
+            transient(32)
+            with track('inner', top=0) as inner:
+                transient(8)
+    assert 8 * MIB <= inner.peak < 16 * MIB
+    assert outer.peak >= 32 * MIB
+    assert [report.name for report in memory.reports()] == ['inner', 'outer']
+
+
+def test_benchmarks_keep_tracker_peaks():
+    """Test peak measurements of benchmarks and trackers overlap."""
+    with memory.tracking(), track('outer', top=0) as outer:
+        transient(48)
+        measured = bench.measure_peak_memory(lambda: transient(4))
+
+        def inner():
+            transient(24)
+            with track('inner', top=0):
+                transient(1)
+
+        nested = bench.measure_peak_memory(inner)
+    assert outer.peak >= 48 * MIB
+    assert 4 * MIB <= measured < 8 * MIB
+    assert nested >= 24 * MIB
+    assert not tracemalloc.is_tracing()
+
+
+def test_thread_pool_memory_is_included():
+    """Test allocations in worker threads count for the block."""
+    with memory.tracking(), track('pool', top=0) as report:
+        with ThreadPoolExecutor(2) as pool:
+            list(pool.map(transient, [12, 12]))
+    assert report.peak >= 12 * MIB
+
+
+def test_tracked_decorator_and_rss():
+    """Test decorated calls are reported by name, with the RSS."""
+
+    @memory.tracked(name='fit', top=0)
+    def fit():
+        return transient(8)
+
+    with memory.tracking():
+        fit()
+    (report,) = memory.reports()
+    assert report.name == 'fit'
+    assert report.sites == []
+    if memory.current_rss() is not None:
+        assert report.rss_peak >= max(report.rss_start, report.rss_end)
+
+
+def test_tracing_started_elsewhere_is_kept():
+    """Test tracemalloc is left running if it already was."""
+    tracemalloc.start()
+    try:
+        with memory.tracking(), track('x'):
+            transient(1)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_snapshot_diff():
+    """Test sites are listed by decreasing growth."""
+    tracemalloc.start()
+    try:
+        before = memory.take_snapshot()
+        # Allocated at these lines, unlike np.ones() or np.zeros()
+        big = np.empty(MIB)
+        small = np.empty(MIB // 8)
+        sites = memory.snapshot_diff(before, memory.take_snapshot(), top=2)
+    finally:
+        tracemalloc.stop()
+    assert sites[0].size_diff >= big.nbytes
+    assert big.nbytes > sites[1].size_diff >= small.nbytes
+    assert all('test_memory.py' in site.location for site in sites)
+
+
+# ----------------------------------------------------------------------
+# Rendering
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def report():
+    """Report of a block that grew 2 MiB at one site."""
+    site = memory.AllocationSite('<model>.py:12', 2 * MIB, 3, 2 * MIB)
+    return memory.MemoryReport('fit', 10 * MIB, -MIB, 100 * MIB, 99 * MIB, 120 * MIB, 1.5, [site])
+
+
+def test_format_report(report):
+    """Test the text report has the totals and sites."""
+    text = memory.format_report(report)
+    assert text.splitlines()[0] == (
+        'fit: peak 10.0 MiB, net -1.0 MiB, RSS 100.0 MiB to 99.0 MiB (peak 120.0 MiB), 1.5 s'
+    )
+    assert text.splitlines()[2].split() == ['+2.0', 'MiB', '+3', '<model>.py:12']
+
+
+def test_report_html_escapes_sites(report):
+    """Test the HTML report has a row per site, escaped."""
+    html = memory.report_html(report)
+    assert html.startswith('<p><b>fit</b>: peak 10.0 MiB')
+    assert html.count('<td') == 3
+    assert '&lt;model&gt;.py:12' in html
+
+
+def test_report_html_without_sites_is_headline(report):
+    """Test reports without sites have no table."""
+    report.sites = []
+    assert '<table>' not in memory.report_html(report)
+
+
+def test_show_reports_separates_reports(report):
+    """Test reports are shown one after the other."""
+    out = io.StringIO()
+    memory.show_reports([report, report], file=out)
+    text = memory.format_report(report)
+    assert out.getvalue() == f'{text}\n\n{text}\n'
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import functools
+import itertools
+import math
+import os
+import threading
+import traceback
+
+import pytest
+
+import easyutilities.parallel as parallel
+from easyutilities.parallel import choose_executor
+from easyutilities.parallel import parallel_map
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def no_override(monkeypatch):
+    """Ignore EASYSCIENCE_PARALLEL set outside the tests."""
+    monkeypatch.delenv(parallel.PARALLEL_ENV, raising=False)
+
+
+def square(x):
+    """Module-level function, importable by worker processes."""
+    return x * x
+
+
+def fail_on_three(x):
+    """Function raising for one item."""
+    if x == 3:
+        raise ValueError('diverged')
+    return x
+
+
+# ----------------------------------------------------------------------
+# Executor choice
+# ----------------------------------------------------------------------
+
+
+def test_serial_under_pytest_unless_asked(set_environment, monkeypatch):
+    """Test tests run serially, but explicit choices are honoured."""
+    set_environment(pytest=True)
+    assert choose_executor(square, workload='io') == 'serial'
+    assert choose_executor(square, executor='thread') == 'thread'
+    monkeypatch.setenv(parallel.PARALLEL_ENV, 'process')
+    assert choose_executor(square) == 'process'
+    monkeypatch.setenv(parallel.PARALLEL_ENV, 'gpu')
+    with pytest.raises(ValueError, match='executor must be one of'):
+        choose_executor(square)
+
+
+def test_choice_follows_workload(set_environment):
+    """Test CPU work uses processes and waiting or NumPy threads."""
+    set_environment()
+    assert choose_executor(square) == 'process'
+    assert choose_executor(square, workload='io') == 'thread'
+    assert choose_executor(square, workload='nogil') == 'thread'
+    # Lambdas cannot be sent to worker processes
+    assert choose_executor(lambda x: x) == 'thread'
+    with pytest.raises(ValueError, match='cannot import'):
+        choose_executor(lambda x: x, executor='process')
+    with pytest.raises(ValueError, match='workload must be one of'):
+        choose_executor(square, workload='gpu')
+
+
+class Unpicklable:
+    """Argument that fails when pickled."""
+
+    def __reduce__(self):
+        raise AssertionError('pickled')
+
+
+def test_importability_is_checked_without_pickling(set_environment):
+    """Test functions are looked up by name, not pickled."""
+    set_environment()
+
+    def local(x):
+        return x
+
+    assert choose_executor(functools.partial(square, Unpicklable())) == 'process'
+    assert choose_executor(functools.partial(local, 1)) == 'thread'
+    assert choose_executor(math.sqrt) == 'process'
+    assert choose_executor(str.upper) == 'process'
+
+
+def test_notebook_functions_use_threads(set_environment, monkeypatch):
+    """Test notebook functions are not sent to worker processes."""
+    set_environment(jupyter=True)
+    monkeypatch.setattr(square, '__module__', '__main__')
+    assert choose_executor(square) == 'thread'
+    pool = parallel._create_executor('process', 1)
+    assert pool._mp_context.get_start_method() == 'spawn'
+    pool.shutdown()
+
+
+def test_cpu_count():
+    """Test the usable CPUs are counted."""
+    assert 1 <= parallel.cpu_count() <= (os.cpu_count() or 1)
+
+
+# ----------------------------------------------------------------------
+# Map
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('executor', ['serial', 'thread', 'process'])
+def test_results_keep_input_order(executor):
+    """Test results are in input order with every executor."""
+    results = parallel_map(square, range(50), executor=executor, max_workers=3, chunksize=4)
+    assert list(results) == [x * x for x in range(50)]
+
+
+def test_threads_run_chunks_in_parallel():
+    """Test items run in several worker threads, in chunks."""
+    names = []
+
+    def record(x):
+        names.append((x, threading.current_thread().name))
+        return x
+
+    results = parallel_map(record, range(40), executor='thread', max_workers=2)
+    assert list(results) == list(range(40))
+    by_item = dict(names)
+    # Default chunks: 40 items / (2 workers * 4) = 5 items per chunk
+    assert all(by_item[x] == by_item[x - x % 5] for x in range(40))
+    assert all(name.startswith('parallel_map') for name in by_item.values())
+
+
+def test_infinite_iterables_are_streamed():
+    """Test results stream before the input is exhausted."""
+    results = parallel_map(square, itertools.count(), executor='thread', max_workers=2)
+    assert list(itertools.islice(results, 5)) == [0, 1, 4, 9, 16]
+    results.close()
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_worker_exceptions_keep_traceback(executor):
+    """Test worker exceptions name the item and the raising line."""
+    results = parallel_map(fail_on_three, range(8), executor=executor, max_workers=2)
+    assert next(results) == 0
+    with pytest.raises(ValueError, match='diverged') as info:
+        list(results)
+    assert 'Raised by parallel_map() for item 3' in info.value.__notes__
+    text = ''.join(traceback.format_exception(info.value))
+    assert 'fail_on_three' in text
+
+
+def test_process_exceptions_of_library_functions():
+    """Test errors of built-in functions raised in processes."""
+    with pytest.raises(ValueError, match='math domain error'):
+        list(parallel_map(math.sqrt, [4, 1, -1, 9], executor='process', max_workers=2))
+
+
+def test_invalid_arguments():
+    """Test workers and chunk sizes must be positive."""
+    with pytest.raises(ValueError, match='at least 1'):
+        parallel_map(square, range(3), executor='thread', chunksize=0)
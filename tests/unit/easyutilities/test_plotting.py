@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+import easyutilities.plotting as plotting
+import easyutilities.theme as theme
+from easyutilities.plotting import FigureResampler
+
+go = pytest.importorskip('plotly.graph_objects')
+pio = pytest.importorskip('plotly.io')
+
+
+@pytest.fixture
+def pattern():
+    """Noisy pattern of 100 001 points with a sharp peak and dip."""
+    rng = np.random.default_rng(1)
+    x = np.linspace(0.0, 100.0, 100_001)
+    y = np.sin(x) + rng.random(x.size) * 0.1
+    y[54_321] = 50.0
+    y[77_777] = -50.0
+    return x, y
+
+
+# ----------------------------------------------------------------------
+# Downsampling
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('method', plotting.METHODS)
+def test_downsample_keeps_extremes_and_ends(pattern, method):
+    """Test the peak, the dip and both ends survive downsampling."""
+    x, y = pattern
+    x_out, y_out = plotting.downsample(x, y, 1000, method)
+    assert len(x_out) <= 1000
+    assert np.all(np.diff(x_out) > 0)
+    assert (x_out[0], x_out[-1]) == (x[0], x[-1])
+    assert y_out.max() == 50.0
+    assert y_out.min() == -50.0
+
+
+def test_minmax_indices_are_bucket_extremes():
+    """Test each bucket contributes its minimum and maximum."""
+    y = np.array([0, 5, 1, 2, -3, 4, 9, 8, 7, 6, 1, 0], dtype=float)
+    # Four buckets of three points
+    assert plotting.minmax_indices(y, 10).tolist() == [0, 1, 4, 5, 6, 8, 9, 11]
+
+
+@pytest.mark.parametrize('n_out', [2, 3, 4, 5, 100, 999])
+@pytest.mark.parametrize('n', [6, 1001, 10_007])
+def test_minmax_indices_bounds(n, n_out):
+    """Test at most n_out valid indices for any sizes."""
+    indices = plotting.minmax_indices(np.arange(n, dtype=float), n_out)
+    assert len(indices) <= max(n_out, 2) or len(indices) == n
+    assert indices.min() == 0
+    assert indices.max() == n - 1
+
+
+def test_minmax_indices_ignore_nan():
+    """Test NaNs are not selected as bucket extremes."""
+    y = np.array([0.0, np.nan, 3.0, 1.0, np.nan, -2.0, 0.0, 0.0])
+    assert plotting.minmax_indices(y, 6).tolist() == [0, 2, 5, 6, 7]
+
+
+def test_lttb_indices_count():
+    """Test LTTB selects exactly n_out points."""
+    x = np.arange(10_000.0)
+    indices = plotting.lttb_indices(x, np.cos(x / 100), 500)
+    assert len(indices) == 500
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsample_short_or_unknown():
+    """Test short lines are returned whole and methods are checked."""
+    x_out, y_out = plotting.downsample([1, 2, 3], [4, 5, 6], 10)
+    assert x_out.tolist() == [1, 2, 3]
+    with pytest.raises(ValueError, match='Unknown method'):
+        plotting.downsample([1, 2, 3], [4, 5, 6], 2, method='every_nth')
+
+
+# ----------------------------------------------------------------------
+# FigureResampler
+# ----------------------------------------------------------------------
+
+
+def test_resampler_downsamples_long_traces(pattern):
+    """Test long traces are sampled and short ones kept whole."""
+    x, y = pattern
+    fig = FigureResampler(n_out=1000)
+    fig.add_trace(x, y, name='measured')
+    fig.add_trace([1, 2], [3, 4], name='short')
+    measured, short = fig.figure.data
+    assert measured.name == 'measured'
+    assert len(measured.x) <= 1000
+    assert list(short.x) == [1, 2]
+
+
+def test_resampler_uses_webgl_for_many_points(pattern):
+    """Test Scattergl is used for traces of many raw points."""
+    x, y = pattern
+    fig = FigureResampler()
+    fig.add_trace(x, y)
+    fig.add_trace(x[:8000], y[:8000])
+    fig.add_trace(x[:1000], y[:1000])
+    # Downsampled to fewer points than the WebGL threshold
+    assert len(fig.figure.data[0].x) <= plotting.DEFAULT_POINTS
+    assert isinstance(fig.figure.data[0], go.Scattergl)
+    assert isinstance(fig.figure.data[1], go.Scatter)
+    assert isinstance(fig.figure.data[2], go.Scatter)
+    fig.resample([54.0, 55.0])
+    assert isinstance(fig.figure.data[0], go.Scattergl)
+    assert isinstance(fig.figure.data[1], go.Scatter)
+    fig = FigureResampler(threshold=len(x), webgl_threshold=200_000)
+    fig.add_trace(x, y)
+    assert isinstance(fig.figure.data[0], go.Scatter)
+
+
+def test_resampler_resamples_visible_range(pattern):
+    """Test zooming resamples from the full-resolution data."""
+    x, y = pattern
+    fig = FigureResampler(n_out=1000)
+    fig.add_trace(x, y)
+    fig.resample([54.0, 55.0])
+    trace = fig.figure.data[0]
+    # 1001 points at full resolution, plus one beyond each side
+    assert len(trace.x) == 1003
+    assert trace.x[0] < 54.0 < 55.0 < trace.x[-1]
+    assert 50.0 in trace.y
+    fig.resample(None)
+    assert len(fig.figure.data[0].x) <= 1000
+
+
+def test_resampler_unsorted_x():
+    """Test ranges of unsorted traces are selected by value."""
+    fig = FigureResampler()
+    fig.add_trace([3.0, 1.0, 2.0, 5.0], [1.0, 2.0, 3.0, 4.0])
+    fig.resample([1.5, 3.5])
+    assert list(fig.figure.data[0].x) == [3.0, 2.0]
+
+
+def test_resampler_follows_theme(monkeypatch):
+    """Test new figures use the template of the current theme."""
+    monkeypatch.setattr(theme, '_override', 'dark')
+    assert plotting.default_template() == 'plotly_dark'
+    layout = FigureResampler().figure.layout
+    assert (
+        layout.template.layout.paper_bgcolor == pio.templates['plotly_dark'].layout.paper_bgcolor
+    )
+
+
+def test_resampler_rejects_unknown_method():
+    """Test the downsampling method is checked up front."""
+    with pytest.raises(ValueError, match='Unknown method'):
+        FigureResampler(method='random')
+
+
+# ----------------------------------------------------------------------
+# Renderers
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ('flags', 'renderer'),
+    [
+        ({'colab': True, 'jupyter': True}, 'colab'),
+        ({'jupyter': True, 'github_ci': True}, 'plotly_mimetype+notebook_connected'),
+        ({'github_ci': True}, 'json'),
+        ({'pycharm': True}, 'browser'),
+        ({}, 'browser'),
+    ],
+)
+def test_default_renderer(set_environment, flags, renderer):
+    """Test the renderer follows the environment."""
+    set_environment(**flags)
+    assert plotting.default_renderer() == renderer
+
+
+def test_configure_renderer(set_environment, monkeypatch):
+    """Test the default is set unless PLOTLY_RENDERER is set."""
+    set_environment(github_ci=True)
+    monkeypatch.setattr(pio.renderers, 'default', 'svg')
+    monkeypatch.setenv('PLOTLY_RENDERER', 'svg')
+    assert plotting.configure_renderer() == 'svg'
+    monkeypatch.delenv('PLOTLY_RENDERER')
+    assert plotting.configure_renderer() == 'json'
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import io
+import json
+import threading
+
+import pytest
+
+import easyutilities.profiling as profiling
+from easyutilities.profiling import SpanRecord
+from easyutilities.profiling import span
+
+pytestmark = pytest.mark.usefixtures('instrumentation_off')
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+def record(path, wall, cpu=0.0, start=0):
+    """Return a span record with times in seconds."""
+    return SpanRecord(tuple(path.split('/')), 1, start, int(wall * 1e9), int(cpu * 1e9), None)
+
+
+@profiling.profiled
+def chi2(x):
+    """Function recorded as a span."""
+    return x * x
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+
+def test_disabled_spans_record_nothing():
+    """Test disabled spans are one shared no-op object."""
+    assert span('a') is span('b', size=3)
+    with span('a'):
+        assert chi2(3) == 9
+    assert profiling.records() == []
+
+
+def test_spans_nest_per_thread():
+    """Test spans record their enclosing spans of the same thread."""
+
+    def worker():
+        with span('worker'):
+            chi2(1)
+
+    with profiling.profile():
+        with span('fit', minimizer='lm'):
+            chi2(2)
+            thread = threading.Thread(target=worker, name='pool-1')
+            thread.start()
+            thread.join()
+    paths = {record.path for record in profiling.records()}
+    assert paths == {('fit',), ('fit', 'chi2'), ('worker',), ('worker', 'chi2')}
+    fit = next(record for record in profiling.records() if record.name == 'fit')
+    assert fit.args == {'minimizer': 'lm'}
+    assert fit.wall_ns > 0
+    assert not profiling.is_enabled()
+
+
+def test_profiled_name_and_exceptions():
+    """Test custom names and that raising spans are recorded."""
+
+    @profiling.profiled(name='model')
+    def fail():
+        raise RuntimeError('diverged')
+
+    with profiling.profile(), pytest.raises(RuntimeError):
+        fail()
+    assert [record.path for record in profiling.records()] == [('model',)]
+
+
+def test_profile_restores_state():
+    """Test profile() keeps profiling enabled if it already was."""
+    profiling.enable()
+    with profiling.profile():
+        pass
+    assert profiling.is_enabled()
+
+
+# ----------------------------------------------------------------------
+# Chrome trace
+# ----------------------------------------------------------------------
+
+
+def test_chrome_trace(tmp_path):
+    """Test spans are complete events inside their parents."""
+    with profiling.profile():
+        with span('fit', points=10):
+            chi2(1)
+    path = profiling.save_chrome_trace(tmp_path / 'trace.json')
+    events = json.loads(path.read_text())['traceEvents']
+    meta = [event for event in events if event['ph'] == 'M']
+    assert meta[0]['args']['name'] == threading.current_thread().name
+    fit, inner = (event for event in events if event['ph'] == 'X')
+    assert (fit['name'], inner['name']) == ('fit', 'chi2')
+    assert fit['args']['points'] == 10
+    assert 'cpu_ms' in inner['args']
+    assert fit['ts'] <= inner['ts']
+    assert inner['ts'] + inner['dur'] <= fit['ts'] + fit['dur']
+
+
+# ----------------------------------------------------------------------
+# Summary
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def spans():
+    """Spans of a fit: two minimizer calls of three model calls."""
+    return [
+        record('fit', 10.0, 9.0),
+        record('fit/setup', 1.0),
+        record('fit/minimize', 4.0),
+        record('fit/minimize', 4.5),
+        *[record('fit/minimize/model', 2.0) for _ in range(3)],
+    ]
+
+
+def test_summary_totals_and_self_time(spans):
+    """Test totals per path, self time and tree order."""
+    stats = profiling.summary(spans)
+    assert [entry.path[-1] for entry in stats] == ['fit', 'minimize', 'model', 'setup']
+    fit, minimize, model, _ = stats
+    assert (minimize.calls, minimize.wall) == (2, 8.5)
+    assert minimize.self_wall == pytest.approx(2.5)
+    assert fit.self_wall == pytest.approx(0.5)
+    assert fit.cpu == 9.0
+    assert model.depth == 2
+
+
+def test_format_summary_is_indented_tree(spans):
+    """Test the text summary indents children."""
+    lines = profiling.format_summary(profiling.summary(spans)).splitlines()
+    assert lines[0].split() == ['span', 'calls', 'wall', '(s)', 'cpu', '(s)', 'self', '(s)']
+    assert lines[3].startswith('    model ')
+    assert lines[3].split()[1:3] == ['3', '6.0000']
+
+
+def test_summary_html_indents_and_escapes(spans):
+    """Test HTML rows are indented by depth and names escaped."""
+    html = profiling.summary_html(profiling.summary([*spans, record('<io>', 1.0)]))
+    assert html.count('<tr>') == 6
+    assert 'padding-left: 3.5em' in html
+    assert '&lt;io&gt;' in html
+
+
+def test_show_summary_of_recorded_spans():
+    """Test the summary of the recorded spans is shown."""
+    with profiling.profile():
+        chi2(1)
+    out = io.StringIO()
+    profiling.show_summary(file=out)
+    assert out.getvalue() == profiling.format_summary() + '\n'
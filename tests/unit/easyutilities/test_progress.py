@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import io
+import os
+import threading
+
+import pytest
+
+import easyutilities.environment as env
+import easyutilities.progress as progress_mod
+from easyutilities.progress import AnsiBackend
+from easyutilities.progress import HtmlBackend
+from easyutilities.progress import LineBackend
+from easyutilities.progress import NullBackend
+from easyutilities.progress import Progress
+from easyutilities.progress import ProgressState
+from easyutilities.progress import format_progress
+from easyutilities.progress import select_backend
+from easyutilities.progress import track
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+class RecordingBackend:
+    """Backend recording rendered states."""
+
+    min_interval = 1.0
+
+    def __init__(self):
+        self.rendered = []
+        self.closed = []
+
+    def render(self, state):
+        self.rendered.append(state)
+
+    def close(self, state):
+        self.closed.append(state)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TtyStream(io.StringIO):
+    """In-memory stream that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def backend():
+    """Recording backend."""
+    return RecordingBackend()
+
+
+# ----------------------------------------------------------------------
+# format_progress()
+# ----------------------------------------------------------------------
+
+
+def test_format_progress_with_total():
+    """Test a line with known total contains bar, counts and rate."""
+    line = format_progress(ProgressState('fit', 50, 100, 5.0), width=10)
+    assert line == 'fit:  50% |#####     | 50/100 [00:05<00:05, 10.0 it/s]'
+
+
+def test_format_progress_without_total():
+    """Test a line with unknown total shows the count and rate."""
+    line = format_progress(ProgressState('', 7, None, 3700.0))
+    assert line == '7 [1:01:40, 0.0 it/s]'
+
+
+def test_format_progress_without_bar():
+    """Test width=0 omits the text bar."""
+    line = format_progress(ProgressState('', 1, 4, 1.0), width=0)
+    assert line.startswith(' 25% 1/4 ')
+
+
+# ----------------------------------------------------------------------
+# select_backend()
+# ----------------------------------------------------------------------
+
+
+def test_select_backend_silent_under_pytest(set_environment):
+    """Test pytest takes precedence over all other environments."""
+    set_environment(pytest=True, jupyter=True, github_ci=True)
+    assert isinstance(select_backend(), NullBackend)
+
+
+def test_select_backend_html_in_jupyter(set_environment):
+    """Test Jupyter selects the HTML backend."""
+    set_environment(jupyter=True)
+    assert isinstance(select_backend(), HtmlBackend)
+
+
+def test_select_backend_lines_in_github_ci(set_environment):
+    """Test GitHub Actions selects plain lines even on a terminal."""
+    set_environment(github_ci=True)
+    assert isinstance(select_backend(TtyStream()), LineBackend)
+
+
+def test_select_backend_ansi_on_terminal(set_environment):
+    """Test a terminal stream selects the ANSI backend."""
+    set_environment()
+    assert isinstance(select_backend(TtyStream()), AnsiBackend)
+
+
+def test_select_backend_lines_when_redirected(set_environment):
+    """Test a non-terminal stream selects plain lines."""
+    set_environment()
+    assert isinstance(select_backend(io.StringIO()), LineBackend)
+
+
+# ----------------------------------------------------------------------
+# Backends
+# ----------------------------------------------------------------------
+
+
+def test_ansi_backend_uses_escapes_in_regular_terminal(set_environment):
+    """Test the ANSI backend erases the line and hides the cursor."""
+    set_environment()
+    stream = TtyStream()
+    ansi = AnsiBackend(stream)
+    ansi.render(ProgressState('', 1, 2, 1.0))
+    ansi.close(ProgressState('', 2, 2, 1.0))
+    text = stream.getvalue()
+    assert text.startswith('\x1b[?25l\r')
+    assert '\x1b[K' in text
+    assert text.endswith('\x1b[?25h\n')
+
+
+@pytest.mark.parametrize('flag', ['warp', 'pycharm'])
+def test_ansi_backend_is_plain_in_warp_and_pycharm(set_environment, flag):
+    """Test Warp and PyCharm redraw with carriage return only."""
+    set_environment(**{flag: True})
+    stream = TtyStream()
+    ansi = AnsiBackend(stream)
+    ansi.render(ProgressState('long description', 1, 2, 1.0))
+    ansi.close(ProgressState('', 2, 2, 1.0))
+    text = stream.getvalue()
+    assert '\x1b' not in text
+    first, second = text.rstrip('\n').split('\r')[1:]
+    # The shorter final line is padded to erase the previous one
+    assert len(second) == len(first)
+
+
+def test_ansi_backend_fits_lines_to_the_stream_terminal(set_environment, monkeypatch):
+    """Test lines are cut to the width of the stream's terminal."""
+
+    class StderrTty(TtyStream):
+        def fileno(self):
+            return 2
+
+    sizes = {2: os.terminal_size((31, 24))}
+    monkeypatch.setattr(os, 'get_terminal_size', lambda fd: sizes[fd])
+    set_environment()
+    stream = StderrTty()
+    AnsiBackend(stream).render(ProgressState('x' * 100, 1, None, 1.0))
+    assert stream.getvalue().split('\r')[1] == 'x' * 30 + '\x1b[K'
+
+
+def test_ansi_backend_width_falls_back_without_descriptor(set_environment, monkeypatch):
+    """Test streams without a descriptor use the default width."""
+    monkeypatch.setenv('COLUMNS', '21')
+    set_environment()
+    stream = TtyStream()
+    AnsiBackend(stream).render(ProgressState('x' * 100, 1, None, 1.0))
+    assert stream.getvalue().split('\r')[1] == 'x' * 20 + '\x1b[K'
+
+
+def test_line_backend_writes_one_line_per_render():
+    """Test the line backend writes complete lines."""
+    stream = io.StringIO()
+    lines = LineBackend(stream)
+    lines.render(ProgressState('a', 1, 2, 1.0))
+    lines.close(ProgressState('a', 2, 2, 1.0))
+    assert stream.getvalue().count('\n') == 2
+
+
+def test_html_backend_renders_progress_element():
+    """Test the HTML contains a progress element with count and max."""
+    html = HtmlBackend.to_html(ProgressState('fit', 3, 10, 1.0))
+    assert '<progress value="3" max="10"></progress>' in html
+    assert 'fit:' in html
+
+
+# ----------------------------------------------------------------------
+# Progress
+# ----------------------------------------------------------------------
+
+
+def test_iter_sized_counts_items_and_sets_total(backend):
+    """Test iterating a sized iterable counts every item."""
+    progress = Progress(backend=backend)
+    assert list(progress.iter(range(12345))) == list(range(12345))
+    assert progress.count == 12345
+    assert progress.total == 12345
+
+
+def test_iter_unsized_counts_items(backend):
+    """Test iterating a generator counts every item."""
+    progress = Progress(backend=backend)
+    assert sum(progress.iter(i for i in range(12345))) == sum(range(12345))
+    assert progress.count == 12345
+    assert progress.total is None
+
+
+@pytest.mark.parametrize('make', [list, iter])
+def test_iter_counts_items_consumed_before_break(backend, make):
+    """Test an early break counts only the delivered items."""
+    progress = Progress(backend=backend)
+    iterator = progress.iter(make(range(1000)))
+    for i in iterator:
+        if i == 9:
+            break
+    del iterator  # closes the iterator
+    assert progress.count == 10
+
+
+def test_redraw_only_after_min_interval(backend):
+    """Test ticks within min_interval do not redraw."""
+    clock = FakeClock()
+    progress = Progress(backend=backend, clock=clock)
+    for _ in range(100):
+        progress.advance()
+    assert len(backend.rendered) == 1
+    clock.now = 2.0
+    for _ in range(100):
+        progress.advance()
+    assert len(backend.rendered) == 2
+    assert backend.rendered[-1].count > 100
+
+
+def test_advance_is_thread_safe(backend):
+    """Test concurrent single and bulk ticks are all counted."""
+    progress = Progress(backend=backend)
+
+    def work():
+        for _ in range(20000):
+            progress.advance()
+        progress.advance(5)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert progress.count == 160040
+
+
+def test_close_renders_final_state_once(backend):
+    """Test close() passes the final state to the backend once."""
+    with Progress(10, backend=backend) as progress:
+        progress.advance(10)
+    progress.close()
+    assert len(backend.closed) == 1
+    assert backend.closed[0].count == 10
+
+
+def test_track_closes_at_end(backend):
+    """Test track() closes the reporter when iteration ends."""
+    assert list(track('abc', 'letters', backend=backend)) == ['a', 'b', 'c']
+    assert backend.closed[0].count == 3
+    assert backend.closed[0].description == 'letters'
+
+
+def test_default_backend_is_silent_under_pytest():
+    """Test Progress is silent under pytest by default."""
+    env.refresh()
+    assert isinstance(Progress().backend, NullBackend)
+
+
+def test_stride_is_bounded(backend):
+    """Test the clock is read at least every _MAX_STRIDE ticks."""
+    progress = Progress(backend=backend)
+    for _ in progress.iter(range(3 * progress_mod._MAX_STRIDE)):
+        pass
+    assert 1 <= progress._stride <= progress_mod._MAX_STRIDE
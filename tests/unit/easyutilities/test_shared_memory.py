@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gc
+import multiprocessing
+import os
+import pickle  # noqa: S403
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+import easyutilities.shared_memory as shared_memory
+from easyutilities.shared_memory import share
+
+
+def total(handle):
+    """Sum a shared array in a worker."""
+    return float(handle.open().sum())
+
+
+def owned_references(handle):
+    """References held by a worker, which owns nothing."""
+    return shared_memory.references(handle)
+
+
+def crash(handle):
+    """Open a shared array and exit without any cleanup."""
+    handle.open()
+    os._exit(1)
+
+
+# ----------------------------------------------------------------------
+# Views
+# ----------------------------------------------------------------------
+
+
+def test_handles_are_small_and_views_zero_copy():
+    """Test handles pickle to bytes and views share memory."""
+    data = np.arange(100_000.0).reshape(1000, 100)
+    with share(data) as handle:
+        assert len(pickle.dumps(handle)) < 200
+        assert handle.nbytes == data.nbytes
+        view = handle.open()
+        np.testing.assert_array_equal(view, data)
+        assert not view.flags.writeable
+        with pytest.raises(ValueError, match='read-only'):
+            view[0, 0] = 1.0
+        handle.open(writeable=True)[0, 0] = -1.0
+        assert view[0, 0] == -1.0
+        assert data[0, 0] == 0.0
+
+
+def test_empty_arrays_and_objects():
+    """Test empty arrays are shared and object arrays refused."""
+    with share(np.zeros((0, 3), dtype=np.int32)) as handle:
+        assert handle.open().shape == (0, 3)
+        assert handle.open().dtype == np.int32
+    with pytest.raises(TypeError, match='Python objects'):
+        share(np.array([None, 1]))
+
+
+# ----------------------------------------------------------------------
+# Lifetimes
+# ----------------------------------------------------------------------
+
+
+def test_segment_unlinked_with_last_reference():
+    """Test the segment lives until every reference is released."""
+    handle = share(np.ones(10))
+    shared_memory.acquire(handle)
+    assert shared_memory.references(handle) == 2
+    shared_memory.release(handle)
+    assert handle.open().sum() == 10.0
+    shared_memory.release(handle)
+    assert shared_memory.references(handle) == 0
+    # Not mapped anew, with zeros, where named mappings are created
+    # on demand
+    with pytest.raises(FileNotFoundError):
+        handle.open()
+    with pytest.raises(KeyError):
+        shared_memory.release(handle)
+
+
+def test_views_outlive_the_segment():
+    """Test views opened before the last release remain valid."""
+    handle = share(np.arange(10.0))
+    view = handle.open()
+    part = view[::2]
+    shared_memory.release(handle)
+    del view
+    gc.collect()
+    assert part.sum() == 20.0
+
+
+def test_release_all_at_exit():
+    """Test segments still held at exit are unlinked."""
+    handle = share(np.ones(3))
+    shared_memory._release_all()
+    assert shared_memory.references(handle) == 0
+
+
+# ----------------------------------------------------------------------
+# Workers
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('method', multiprocessing.get_all_start_methods())
+def test_workers_open_handles(method):
+    """Test worker processes of any start method read the array."""
+    data = np.arange(1000.0)
+    with (
+        share(data) as handle,
+        ProcessPoolExecutor(2, mp_context=multiprocessing.get_context(method)) as pool,
+    ):
+        assert list(pool.map(total, [handle] * 4)) == [data.sum()] * 4
+        # Forked workers inherit the registry, not the ownership
+        assert list(pool.map(owned_references, [handle] * 2)) == [0, 0]
+        assert shared_memory.references(handle) == 1
+
+
+def test_worker_crash_leaves_segment_to_owner():
+    """Test a crashed worker neither unlinks nor leaks the segment."""
+    with share(np.ones(5)) as handle:
+        process = multiprocessing.Process(target=crash, args=(handle,))
+        process.start()
+        process.join()
+        assert process.exitcode == 1
+        assert handle.open().sum() == 5.0
+    assert shared_memory.references(handle) == 0
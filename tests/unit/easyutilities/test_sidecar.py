@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import stat
+import subprocess  # noqa: S404
+import sys
+
+import numpy as np
+import pytest
+
+import easyutilities.sidecar as sidecar
+
+DATA = """\
+# x y e
+1.0 10.0 0.5
+2.0 20.0 0.6
+3.0 30.0 0.7
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Whitespace-separated text data file."""
+    path = tmp_path / 'data.xye'
+    path.write_text(DATA)
+    return path
+
+
+@pytest.fixture
+def counting_parser():
+    """Parser recording the files it parses."""
+    calls = []
+
+    def parser(path):
+        calls.append(path)
+        return sidecar.parse_whitespace(path)
+
+    parser.calls = calls
+    return parser
+
+
+# ----------------------------------------------------------------------
+# load_columns()
+# ----------------------------------------------------------------------
+
+
+def test_load_columns_parses_once(source, tmp_path, counting_parser):
+    """Test the second load uses the sidecar without parsing."""
+    for _ in range(3):
+        columns = sidecar.load_columns(
+            source, counting_parser, names=['x', 'y', 'e'], cache_dir=tmp_path / 'cache'
+        )
+    assert len(counting_parser.calls) == 1
+    assert list(columns) == ['x', 'y', 'e']
+    np.testing.assert_array_equal(columns['y'], [10.0, 20.0, 30.0])
+
+
+def test_load_columns_returns_read_only_memmaps(source, tmp_path):
+    """Test columns are memory-mapped and cannot be modified."""
+    columns = sidecar.load_columns(source, cache_dir=tmp_path / 'cache')
+    assert list(columns) == ['col0', 'col1', 'col2']
+    assert all(isinstance(values, np.memmap) for values in columns.values())
+    with pytest.raises(ValueError, match='read-only'):
+        columns['col0'][0] = 5.0
+
+
+def test_sidecar_is_invalidated_when_source_changes(source, tmp_path, counting_parser):
+    """Test a modified source is parsed again."""
+    sidecar.load_columns(source, counting_parser, cache_dir=tmp_path / 'cache')
+    source.write_text(DATA + '4.0 40.0 0.8\n')
+    columns = sidecar.load_columns(source, counting_parser, cache_dir=tmp_path / 'cache')
+    assert len(counting_parser.calls) == 2
+    assert columns['col1'][-1] == 40.0
+
+
+def test_sidecar_with_missing_column_is_rebuilt(source, tmp_path, counting_parser):
+    """Test a sidecar missing a column file is parsed again."""
+    sidecar.load_columns(source, counting_parser, cache_dir=tmp_path / 'cache')
+    next((tmp_path / 'cache').rglob('1.npy')).unlink()
+    columns = sidecar.load_columns(source, counting_parser, cache_dir=tmp_path / 'cache')
+    assert len(counting_parser.calls) == 2
+    np.testing.assert_array_equal(columns['col1'], [10.0, 20.0, 30.0])
+
+
+def test_unchanged_source_is_not_hashed_again(source, tmp_path, monkeypatch):
+    """Test the remembered hash is used while size and mtime match."""
+    sidecar.load_columns(source, cache_dir=tmp_path / 'cache')
+    monkeypatch.setattr(sidecar, 'file_hash', lambda path: pytest.fail('hashed again'))
+    sidecar.load_columns(source, cache_dir=tmp_path / 'cache')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX permissions')
+def test_hash_index_has_default_permissions(source, tmp_path):
+    """Test index files get the mode of files created by open()."""
+    umask = os.umask(0)
+    os.umask(umask)
+    sidecar.load_columns(source, cache_dir=tmp_path / 'cache')
+    (index,) = (tmp_path / 'cache' / 'index').iterdir()
+    assert stat.S_IMODE(index.stat().st_mode) == 0o666 & ~umask
+
+
+def test_sidecar_is_keyed_on_parser(source, tmp_path, counting_parser):
+    """Test different parser keys get different sidecars."""
+    sidecar.load_columns(source, counting_parser, key='a', cache_dir=tmp_path / 'cache')
+    sidecar.load_columns(source, counting_parser, key='b', cache_dir=tmp_path / 'cache')
+    assert len(counting_parser.calls) == 2
+
+
+def test_load_columns_from_mapping_parser(source, tmp_path):
+    """Test parsers may return columns by name, with any dtype."""
+
+    def parser(path):
+        table = sidecar.parse_whitespace(path)
+        return {'index': table[:, 0].astype(np.int32), 'empty': np.zeros(0)}
+
+    columns = sidecar.load_columns(source, parser, cache_dir=tmp_path / 'cache')
+    assert columns['index'].dtype == np.int32
+    assert columns['empty'].shape == (0,)
+
+
+def test_load_columns_rejects_object_columns(source, tmp_path):
+    """Test columns that cannot be memory-mapped are rejected."""
+    with pytest.raises(TypeError, match='object dtype'):
+        sidecar.load_columns(
+            source, lambda path: {'a': np.array([None])}, cache_dir=tmp_path / 'cache'
+        )
+
+
+def test_load_columns_rejects_wrong_number_of_names(source, tmp_path):
+    """Test names must match the number of columns."""
+    with pytest.raises(ValueError, match='2 names given for 3 columns'):
+        sidecar.load_columns(source, names=['x', 'y'], cache_dir=tmp_path / 'cache')
+
+
+def test_other_process_loads_without_parsing(source, tmp_path):
+    """Test another process memory-maps the sidecar written here."""
+    sidecar.load_columns(source, cache_dir=tmp_path / 'cache')
+    code = (
+        'import sys, numpy as np\n'
+        'import easyutilities.sidecar as s\n'
+        's.parse_whitespace = None  # parsing would fail\n'
+        'c = s.load_columns(sys.argv[1], key=sys.argv[3], cache_dir=sys.argv[2])\n'
+        'print(type(c["col1"]).__name__, float(c["col1"].sum()))\n'
+    )
+    key = sidecar.parser_key(sidecar.parse_whitespace)
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', code, str(source), str(tmp_path / 'cache'), key],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert result.stdout.split() == ['memmap', '60.0']
+
+
+def test_registry_load_columns(tmp_path):
+    """Test registry files are loaded through sidecars by their hash."""
+    from easyutilities.data import DataRegistry
+
+    source = tmp_path / 'data.xye'
+    source.write_text(DATA)
+    registry = DataRegistry(tmp_path / 'cache')
+    registry.register('data.xye', sidecar.file_hash(source), source.as_uri())
+    columns = registry.load_columns('data.xye', names=['x', 'y', 'e'])
+    assert isinstance(columns['e'], np.memmap)
+    assert (tmp_path / 'cache' / 'sidecars').is_dir()
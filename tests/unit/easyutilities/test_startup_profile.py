@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+
+import pytest
+
+import easyutilities.startup_profile as sp
+
+# ----------------------------------------------------------------------
+# Import budget
+# ----------------------------------------------------------------------
+
+# Modules a cold import may pull in beyond interpreter startup, and the
+# maximum best-of-three cold import time. Extend these deliberately,
+# in review, when a new import is really needed. Standard-library
+# modules are listed as imported by our code; what they import in turn
+# depends on the Python version, so it is allowed as measured.
+IMPORT_BUDGET = {
+    'easyutilities': {
+        'modules': {'easyutilities'},
+        'max_ms': 50,
+    },
+    'easyutilities.environment': {
+        'modules': {
+            'easyutilities',
+            'easyutilities.environment',
+            '__future__',
+            'importlib.util',
+        },
+        'max_ms': 50,
+    },
+}
+
+# Heavy dependencies that must never be imported at startup
+HEAVY_MODULES = (
+    'darkdetect',
+    'IPython',
+    'jupyterlab',
+    'numpy',
+    'pandas',
+    'plotly',
+    'pooch',
+    'py3Dmol',
+    'requests',
+)
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   __future__
+import time:        20 |         20 |       _leaf
+import time:        30 |         50 |     inner
+import time:        40 |         40 |     sibling
+import time:        60 |        150 |   middle
+import time:       200 |        450 | top
+import time:        10 |         10 | other
+"""
+
+
+@pytest.fixture(scope='module')
+def profiles():
+    """Best-of-three cold import profiles of the budgeted modules."""
+    return {
+        module: min((sp.profile_import(module) for _ in range(3)), key=lambda p: p.total_us)
+        for module in IMPORT_BUDGET
+    }
+
+
+@pytest.fixture(scope='module')
+def allowed_modules():
+    """Budgeted modules with what the standard-library ones import."""
+    allowed = {}
+    for module, budget in IMPORT_BUDGET.items():
+        modules = set(budget['modules'])
+        for name in budget['modules']:
+            if name.split('.')[0] != 'easyutilities':
+                modules |= sp.profile_import(name).modules
+        allowed[module] = modules
+    return allowed
+
+
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGET))
+def test_import_pulls_in_no_heavy_dependencies(profiles, module):
+    """Test heavy dependencies are not imported at startup."""
+    imported = profiles[module].modules
+    heavy = {name for name in imported if name.split('.')[0] in HEAVY_MODULES}
+    assert not heavy
+
+
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGET))
+def test_import_module_set_within_budget(profiles, allowed_modules, module):
+    """Test no modules beyond the budget are imported."""
+    unexpected = profiles[module].modules - allowed_modules[module]
+    assert not unexpected, f'{module} now also imports {sorted(unexpected)}'
+
+
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGET))
+def test_import_time_within_budget(profiles, module):
+    """Test the cold import time is within budget."""
+    total_ms = profiles[module].total_us / 1000
+    assert total_ms <= IMPORT_BUDGET[module]['max_ms'], sp.format_tree(profiles[module])
+
+
+# ----------------------------------------------------------------------
+# parse_importtime()
+# ----------------------------------------------------------------------
+
+
+def test_parse_importtime_builds_tree():
+    """Test nested imports become children of their parent."""
+    roots = sp.parse_importtime(REPORT)
+    assert [root.name for root in roots] == ['top', 'other']
+    top = roots[0]
+    assert [child.name for child in top.children] == ['__future__', 'middle']
+    middle = top.children[1]
+    assert [child.name for child in middle.children] == ['inner', 'sibling']
+    assert middle.children[0].children[0].name == '_leaf'
+    assert top.self_us == 200
+    assert top.cumulative_us == 450
+
+
+def test_import_profile_totals():
+    """Test total time, module set and top list of a profile."""
+    profile = sp.ImportProfile('top', sp.parse_importtime(REPORT))
+    assert profile.total_us == 460
+    assert profile.modules == {'top', '__future__', 'middle', 'inner', '_leaf', 'sibling', 'other'}
+    assert [node.name for node in profile.top(2)] == ['top', '__future__']
+
+
+def test_format_tree_hides_fast_subtrees():
+    """Test min_us hides subtrees below the threshold."""
+    profile = sp.ImportProfile('top', sp.parse_importtime(REPORT))
+    text = sp.format_tree(profile, min_us=100)
+    assert '  middle' in text
+    assert 'inner' not in text
+    assert 'other' not in text
+    assert text.splitlines()[-1] == "Total: 0.46 ms, 7 modules imported by 'top'"
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+
+
+def test_main_prints_json(capsys):
+    """Test --json prints a machine-readable profile."""
+    assert sp.main(['easyutilities.environment', '--json']) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data['module'] == 'easyutilities.environment'
+    assert 'easyutilities.environment' in data['modules']
+
+
+def test_profile_import_raises_for_missing_module():
+    """Test a failing import raises RuntimeError."""
+    with pytest.raises(RuntimeError, match='no_such_module'):
+        sp.profile_import('no_such_module')
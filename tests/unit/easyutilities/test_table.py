@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+import easyutilities.table as table
+import easyutilities.theme as theme
+from easyutilities.table import TableView
+
+pd = pytest.importorskip('pandas')
+IPython_display = pytest.importorskip('IPython.display')
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def jupyter(set_environment):
+    """Pretend to run inside Jupyter."""
+    set_environment(jupyter=True)
+
+
+@pytest.fixture
+def handle():
+    """Mock IPython DisplayHandle that records updates."""
+    return MagicMock(spec=IPython_display.DisplayHandle)
+
+
+@pytest.fixture
+def frame():
+    """Table of 45 reflections."""
+    return pd.DataFrame({'h': range(45), 'intensity': [float(i * i) for i in range(45)]})
+
+
+def body_rows(html):
+    """Return the number of data rows in rendered HTML."""
+    return html.count('<tr>')
+
+
+def sent_html(handle):
+    """Return the HTML strings sent to a mock handle."""
+    return [call.args[0].data for call in handle.update.call_args_list]
+
+
+# ----------------------------------------------------------------------
+# TableView
+# ----------------------------------------------------------------------
+
+
+def test_view_renders_only_the_page(frame):
+    """Test only the rows of the current page are rendered."""
+    view = TableView(frame, rows=20, mode='pages')
+    html = view.to_html()
+    assert body_rows(html) == 20
+    assert 'Rows 1–20 of 45, page 1 of 3' in html
+
+
+def test_view_navigation(frame):
+    """Test pages are clipped and the last page may be short."""
+    view = TableView(frame, rows=20, mode='pages')
+    view.next()
+    assert (view.start, view.stop, view.page) == (20, 40, 1)
+    view.goto(-1)
+    assert (view.start, view.stop, view.pages) == (40, 45, 3)
+    view.next()
+    assert view.page == 2
+    assert body_rows(view.to_html()) == 5
+    view.goto(-10)
+    assert view.page == 0
+    view.prev()
+    assert view.start == 0
+    view.scroll_to(33)
+    assert view.start == 20
+
+
+def test_window_mode_scrolls_to_any_row(frame):
+    """Test windows start at any row but stay full at the end."""
+    view = TableView(frame, rows=10, mode='window')
+    view.scroll_to(7)
+    assert (view.start, view.stop) == (7, 17)
+    view.scroll_to(1000)
+    assert (view.start, view.stop) == (35, 45)
+    assert 'overflow: auto' in view.to_html()
+
+
+def test_window_follows_theme(monkeypatch, frame):
+    """Test windows use the scrollbars of the current theme."""
+    monkeypatch.setattr(theme, '_override', 'dark')
+    assert 'color-scheme: dark' in TableView(frame, mode='window').to_html()
+
+
+def test_view_updates_its_display_handle(jupyter, handle, frame):
+    """Test showing and navigating replace the same output."""
+    view = TableView(frame, rows=20, mode='pages', handle=handle)
+    view.show()
+    view.next()
+    view.next()
+    view.next()  # Already on the last page: no new frame
+    html = sent_html(handle)
+    assert len(html) == 3
+    assert [body_rows(page) for page in html] == [20, 20, 5]
+
+
+def test_view_of_large_table_slices_first():
+    """Test rendering a page does not touch the other rows."""
+    big = pd.DataFrame({'x': range(1_000_000)})
+    view = TableView(big, mode='pages')
+    view.goto(-1)
+    html = view.to_html()
+    assert body_rows(html) == table.PAGE_ROWS
+    assert 'page 50,000 of 50,000' in html
+
+
+def test_view_of_empty_table_and_series():
+    """Test empty tables and series are viewed as tables."""
+    view = TableView(pd.DataFrame({'x': []}), mode='pages')
+    view.next()
+    assert (view.start, view.stop, view.pages) == (0, 0, 1)
+    assert 'Rows 0–0 of 0' in view.to_html()
+    view = TableView(pd.Series([1, 2], name='y'), mode='pages')
+    assert list(view.frame.columns) == ['y']
+
+
+def test_view_rejects_bad_arguments(frame):
+    """Test unknown modes and empty pages are rejected."""
+    with pytest.raises(ValueError, match='Unknown mode'):
+        TableView(frame, mode='scroll')
+    with pytest.raises(ValueError, match='rows must be positive'):
+        TableView(frame, rows=0)
+
+
+def test_default_mode(set_environment):
+    """Test Colab gets windows and other notebooks pages."""
+    set_environment(jupyter=True, colab=True)
+    assert table.default_mode() == 'window'
+    assert TableView(pd.DataFrame()).rows == table.WINDOW_ROWS
+    set_environment(jupyter=True)
+    assert table.default_mode() == 'pages'
+
+
+# ----------------------------------------------------------------------
+# Text rendering
+# ----------------------------------------------------------------------
+
+
+def test_format_table_truncates(frame):
+    """Test only the first and last rows are formatted."""
+    text = table.format_table(frame, rows=3, width=80)
+    lines = text.splitlines()
+    assert lines[1].split()[0] == '0'
+    assert lines[4].split()[-1] == '...'
+    assert lines[7].split()[0] == '44'
+    assert lines[-1] == '[45 rows x 2 columns]'
+
+
+def test_show_table_prints_outside_notebooks(set_environment, frame):
+    """Test the text rendering is printed outside Jupyter."""
+    set_environment()
+    out = io.StringIO()
+    assert table.show_table(frame, rows=2, file=out) is None
+    assert '...' in out.getvalue()
+    assert '[45 rows x 2 columns]' in out.getvalue()
+
+
+def test_show_table_displays_view_in_jupyter(jupyter, monkeypatch, frame):
+    """Test a view is displayed in a new output area in Jupyter."""
+    displayed = []
+
+    def display(obj, display_id=None):
+        displayed.append(obj)
+        return MagicMock(spec=IPython_display.DisplayHandle)
+
+    monkeypatch.setattr(IPython_display, 'display', display)
+    view = table.show_table(frame)
+    assert isinstance(view, TableView)
+    assert len(displayed) == 1
@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import sys
+import threading
+
+import pytest
+
+import easyutilities.theme as theme
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def clean(set_environment, monkeypatch, tmp_path):
+    """Start from an empty cache, outside Jupyter, without overrides."""
+    monkeypatch.delenv(theme.THEME_ENV, raising=False)
+    monkeypatch.setenv('JUPYTERLAB_SETTINGS_DIR', str(tmp_path / 'settings'))
+    set_environment(jupyter=False)
+    theme.reset()
+    yield
+    worker = theme._worker
+    if worker is not None:
+        worker.join()
+    theme.reset()
+
+
+@pytest.fixture
+def gsettings(monkeypatch, tmp_path):
+    """Return a function installing a stub gsettings on the PATH."""
+    if sys.platform != 'linux':
+        pytest.skip('darkdetect runs gsettings only on Linux')
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    monkeypatch.setenv('PATH', f'{bin_dir}{os.pathsep}{os.environ["PATH"]}')
+
+    def install(value):
+        script = bin_dir / 'gsettings'
+        script.write_text(f'#!/bin/sh\necho "\'{value}\'"\n')
+        script.chmod(0o755)
+
+    return install
+
+
+def write_settings(tmp_path, text):
+    """Write a JupyterLab theme settings file."""
+    path = tmp_path / 'settings' / theme._JUPYTERLAB_THEME_SETTINGS
+    path.parent.mkdir(parents=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def system(monkeypatch):
+    """Stub system detection that counts calls and can be held."""
+    state = {'theme': 'dark', 'calls': 0, 'release': threading.Event()}
+    state['release'].set()
+
+    def detect():
+        state['calls'] += 1
+        state['release'].wait()
+        return state['theme']
+
+    monkeypatch.setattr(theme, '_system_theme', detect)
+    return state
+
+
+# ----------------------------------------------------------------------
+# Sources
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(('value', 'expected'), [('prefer-dark', 'dark'), ('default', 'light')])
+def test_system_theme_from_gsettings(gsettings, value, expected):
+    """Test the system theme is read through gsettings."""
+    gsettings(value)
+    assert theme.detect_theme() == expected
+
+
+def test_environment_variable_wins(monkeypatch, gsettings):
+    """Test the environment variable skips system detection."""
+    gsettings('prefer-dark')
+    monkeypatch.setenv(theme.THEME_ENV, 'Light')
+    assert theme.detect_theme() == 'light'
+    monkeypatch.setenv(theme.THEME_ENV, 'sepia')
+    assert theme.detect_theme() == 'dark'
+
+
+def test_jupyterlab_settings(set_environment, tmp_path, system):
+    """Test the JupyterLab setting is used inside Jupyter only."""
+    system['theme'] = 'light'
+    write_settings(tmp_path, '{\n  // Theme\n  "theme": "JupyterLab Dark"\n}')
+    assert theme.detect_theme() == 'light'
+    set_environment(jupyter=True)
+    assert theme.detect_theme() == 'dark'
+
+
+def test_jupyterlab_adaptive_theme_follows_system(set_environment, tmp_path, system):
+    """Test an adaptive JupyterLab theme defers to the system."""
+    set_environment(jupyter=True)
+    write_settings(tmp_path, '{"theme": "JupyterLab Light", "adaptive-theme": true}')
+    assert theme.detect_theme() == 'dark'
+
+
+def test_unreadable_settings_are_ignored(set_environment, tmp_path, system):
+    """Test broken settings files fall back to the system theme."""
+    set_environment(jupyter=True)
+    write_settings(tmp_path, '{"theme": ')
+    assert theme.detect_theme() == 'dark'
+
+
+# ----------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------
+
+
+def test_first_call_does_not_wait_for_the_system(system):
+    """Test the default is returned while the system is detected."""
+    system['release'].clear()
+    assert theme.current_theme() == theme.DEFAULT_THEME
+    system['release'].set()
+    theme._worker.join()
+    assert theme.current_theme() == 'dark'
+    assert system['calls'] == 1
+
+
+def test_cached_theme_is_reused(system):
+    """Test detection runs once within the time to live."""
+    assert theme.current_theme(wait=True) == 'dark'
+    system['theme'] = 'light'
+    for _ in range(100):
+        assert theme.current_theme() == 'dark'
+    assert system['calls'] == 1
+
+
+def test_expired_theme_refreshes_in_background(monkeypatch, system):
+    """Test an expired theme is returned while detected again."""
+    theme.current_theme(wait=True)
+    monkeypatch.setattr(theme, 'THEME_TTL', 0.0)
+    system['theme'] = 'light'
+    system['release'].clear()
+    assert theme.current_theme() == 'dark'
+    assert theme.current_theme() == 'dark'
+    system['release'].set()
+    theme._worker.join()
+    # One detection despite two expired lookups
+    assert system['calls'] == 2
+    monkeypatch.setattr(theme, 'THEME_TTL', 60.0)
+    assert theme.current_theme() == 'light'
+
+
+def test_cheap_sources_resolve_first_call(monkeypatch, system):
+    """Test the environment variable is used without a thread."""
+    monkeypatch.setenv(theme.THEME_ENV, 'dark')
+    assert theme.current_theme() == 'dark'
+    assert theme._worker is None or not theme._worker.is_alive()
+    assert system['calls'] == 0
+
+
+def test_set_theme(system):
+    """Test a set theme overrides detection until cleared."""
+    theme.set_theme('DARK')
+    assert theme.is_dark()
+    with pytest.raises(ValueError, match='Unknown theme'):
+        theme.set_theme('solarized')
+    system['theme'] = 'light'
+    theme.set_theme(None)
+    assert theme.current_theme(wait=True) == 'light'
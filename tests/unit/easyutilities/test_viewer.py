@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import itertools
+
+import numpy as np
+import pytest
+
+import easyutilities.theme as theme
+import easyutilities.viewer as viewer
+from easyutilities.viewer import StructureViewer
+from easyutilities.viewer import find_bonds
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty model cache."""
+    viewer.clear_model_cache()
+    yield
+    viewer.clear_model_cache()
+
+
+@pytest.fixture
+def water():
+    """Two water molecules 5 Å apart."""
+    symbols = ['O', 'H', 'H', 'O', 'H', 'H']
+    positions = [
+        [0.0, 0.0, 0.0],
+        [0.96, 0.0, 0.0],
+        [-0.24, 0.93, 0.0],
+        [5.0, 0.0, 0.0],
+        [5.96, 0.0, 0.0],
+        [4.76, 0.93, 0.0],
+    ]
+    return symbols, positions
+
+
+def brute_force_bonds(positions, cutoff, cell):
+    """Return bonds as (i, j, a, b, c) tuples by checking all pairs."""
+    positions = np.asarray(positions)
+    shifts = [(0, 0, 0)] if cell is None else itertools.product(range(-4, 5), repeat=3)
+    bonds = set()
+    for shift in shifts:
+        offset = np.zeros(3) if cell is None else np.array(shift) @ cell
+        distance = np.linalg.norm(positions[None, :] + offset - positions[:, None], axis=2)
+        for i, j in zip(*np.nonzero(distance <= cutoff)):
+            if i < j or (i == j and shift > (0, 0, 0)):
+                bonds.add((int(i), int(j), *shift))
+    return bonds
+
+
+def as_set(pairs, images):
+    """Return find_bonds() results as (i, j, a, b, c) tuples."""
+    return {(*pair, *image) for pair, image in zip(pairs.tolist(), images.tolist())}
+
+
+# ----------------------------------------------------------------------
+# Bonds
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'cell',
+    [
+        None,
+        np.diag([6.0, 6.0, 6.0]),
+        # Oblique, and narrower than the cutoff along x
+        np.array([[1.8, 0.0, 0.0], [1.5, 4.8, 0.0], [0.3, 0.7, 6.1]]),
+    ],
+)
+def test_find_bonds_matches_brute_force(cell):
+    """Test all bonds are found once, across periodic boundaries."""
+    rng = np.random.default_rng(3)
+    positions = rng.random((50, 3)) * 7 - 1
+    pairs, images = find_bonds(positions, cutoff=2.2, cell=cell)
+    assert len(pairs) == len(as_set(pairs, images))
+    assert as_set(pairs, images) == brute_force_bonds(positions, 2.2, cell)
+
+
+def test_find_bonds_with_radii(water):
+    """Test covalent radii bond O–H but not H–H or molecules."""
+    symbols, positions = water
+    radii = viewer.covalent_radii(symbols)
+    pairs, images = find_bonds(positions, radii=radii)
+    assert pairs.tolist() == [[0, 1], [0, 2], [3, 4], [3, 5]]
+    assert not images.any()
+
+
+def test_find_bonds_edge_cases():
+    """Test empty structures and the missing cutoff."""
+    pairs, images = find_bonds(np.empty((0, 3)), cutoff=1.0)
+    assert pairs.shape == (0, 2)
+    assert images.shape == (0, 3)
+    with pytest.raises(ValueError, match='cutoff or radii'):
+        find_bonds([[0.0, 0.0, 0.0]])
+
+
+def test_covalent_radii_ignore_charge_and_case():
+    """Test charges and case are ignored and unknowns defaulted."""
+    radii = viewer.covalent_radii(['Fe3+', 'o', 'Xx'])
+    assert radii.tolist() == [1.32, 0.66, viewer.DEFAULT_RADIUS]
+
+
+# ----------------------------------------------------------------------
+# Model payloads
+# ----------------------------------------------------------------------
+
+
+def test_model_payload_is_sdf(water):
+    """Test atoms and bonds are written as SDF V3000."""
+    payload = viewer.model_payload(*water)
+    assert 'M  V30 COUNTS 6 4 0 0 0' in payload
+    assert 'M  V30 4 O 5.0000 0.0000 0.0000 0' in payload
+    assert 'M  V30 3 1 4 5' in payload
+
+
+def test_model_payload_omits_bonds_across_boundaries():
+    """Test bonds to periodic images are not drawn."""
+    payload = viewer.model_payload(['Si', 'Si'], [[0.1, 0, 0], [2.9, 0, 0]], cell=np.eye(3) * 3)
+    assert 'M  V30 COUNTS 2 0 0 0 0' in payload
+
+
+def test_model_payload_is_cached(monkeypatch, water):
+    """Test bonds are found once per structure contents."""
+    calls = []
+    real = viewer.find_bonds
+    monkeypatch.setattr(viewer, 'find_bonds', lambda *a, **k: calls.append(1) or real(*a, **k))
+    first = viewer.model_payload(*water)
+    assert viewer.model_payload(water[0], np.array(water[1])) is first
+    assert len(calls) == 1
+    moved = np.array(water[1]) + 0.5
+    assert viewer.model_payload(water[0], moved) != first
+    assert len(calls) == 2
+
+
+# ----------------------------------------------------------------------
+# StructureViewer
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Record the commands py3Dmol sends on update instead."""
+    py3Dmol = pytest.importorskip('py3Dmol')
+    messages = []
+
+    def update(view):
+        messages.append(view.updatejs)
+        view.updatejs = ''
+
+    monkeypatch.setattr(py3Dmol.view, 'show', lambda view: setattr(view, 'updatejs', ''))
+    monkeypatch.setattr(py3Dmol.view, 'update', update)
+    return messages
+
+
+def test_viewer_sends_style_without_model(sent, water):
+    """Test style updates do not resend the model."""
+    structure = StructureViewer(*water)
+    structure.show()
+    assert 'V3000' in structure.view.startjs
+    structure.set_style({'line': {}})
+    structure.set_style({'sphere': {}}, {'elem': 'O'})
+    assert len(sent) == 2
+    assert all('V3000' not in message for message in sent)
+    assert 'setStyle' in sent[0]
+    assert structure.style == {'line': {}}
+
+
+def test_viewer_resends_only_changed_structures(sent, water):
+    """Test unchanged structures are not sent again."""
+    structure = StructureViewer(*water)
+    structure.show()
+    assert not structure.set_structure(*water)
+    assert sent == []
+    symbols, positions = water
+    assert structure.set_structure(symbols, np.array(positions) * 1.01)
+    assert len(sent) == 1
+    assert sent[0].count('V3000') == 1
+    assert 'removeAllModels' in sent[0]
+
+
+def test_viewer_replays_only_the_current_structure(sent, water):
+    """Test showing again draws the last structure, not all of them."""
+    structure = StructureViewer(*water)
+    structure.show()
+    symbols, positions = water
+    for scale in (1.01, 1.02, 1.03):
+        structure.set_structure(symbols, np.array(positions) * scale)
+    startjs = structure.view.startjs
+    assert startjs.count('addModel') == 1
+    assert 'removeAllModels' not in startjs
+    assert 'setBackgroundColor' in startjs
+    assert structure.view.updatejs == ''
+    assert len(sent) == 3
+
+
+def test_viewer_style_before_show(sent, water):
+    """Test styles set before showing apply to the new view."""
+    structure = StructureViewer(*water)
+    structure.set_style({'line': {}})
+    assert '"line"' in structure.view.startjs
+    assert sent == []
+
+
+def test_viewer_background_follows_theme(monkeypatch, sent, water):
+    """Test the background colour of the current theme is used."""
+    monkeypatch.setattr(theme, '_override', 'dark')
+    startjs = StructureViewer(*water).view.startjs
+    assert 'setBackgroundColor("black")' in startjs
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_TOOLS_DIR = Path(__file__).resolve().parents[3] / 'tools'
+
+
+@pytest.fixture(scope='module')
+def tool(request):
+    """The tool tested by the module, loaded from its file.
+
+    ``test_<name>.py`` tests ``tools/<name>.py``.
+    """
+    name = request.module.__name__.rpartition('.')[2].removeprefix('test_')
+    spec = importlib.util.spec_from_file_location(name, _TOOLS_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look up their module while the class is created
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[spec.name]
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+# ----------------------------------------------------------------------
+# Local stand-in for the branding repository
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def server(file_server):
+    """Local asset server with two files."""
+    file_server.files = {'logos/dark.svg': b'<svg>dark</svg>', 'icons/bw.svg': b'<svg>bw</svg>'}
+    return file_server
+
+
+@pytest.fixture
+def assets(tmp_path):
+    """Asset map into a temporary docs directory."""
+    return {
+        'logos/dark.svg': str(tmp_path / 'docs' / 'logo_dark.svg'),
+        'icons/bw.svg': str(tmp_path / 'docs' / 'icons' / 'bw.svg'),
+    }
+
+
+# ----------------------------------------------------------------------
+# sync_assets()
+# ----------------------------------------------------------------------
+
+
+def test_first_sync_downloads_and_copies(tool, server, assets, tmp_path):
+    """Test all assets are downloaded and copied on the first run."""
+    results = tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert [(r.downloaded, r.copied, r.error) for r in results] == [(True, True, None)] * 2
+    assert Path(assets['logos/dark.svg']).read_bytes() == b'<svg>dark</svg>'
+    manifest = tool.load_manifest(tmp_path / 'cache')
+    assert manifest['icons/bw.svg']['sha256'] == hashlib.sha256(b'<svg>bw</svg>').hexdigest()
+
+
+def test_unchanged_assets_are_not_downloaded_or_copied(tool, server, assets, tmp_path):
+    """Test a second run uses conditional requests and skips copies."""
+    tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    dest = Path(assets['logos/dark.svg'])
+    mtime = dest.stat().st_mtime_ns
+    server.requests.clear()
+
+    results = tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert [(r.downloaded, r.copied) for r in results] == [(False, False)] * 2
+    assert sorted(request.status for request in server.requests) == [304, 304]
+    assert dest.stat().st_mtime_ns == mtime
+
+
+def test_changed_remote_asset_is_downloaded(tool, server, assets, tmp_path):
+    """Test a changed remote file is downloaded and copied."""
+    tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    server.files['logos/dark.svg'] = b'<svg>new</svg>'
+
+    results = tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert [(r.downloaded, r.copied) for r in results] == [(True, True), (False, False)]
+    assert Path(assets['logos/dark.svg']).read_bytes() == b'<svg>new</svg>'
+
+
+def test_modified_destination_is_restored(tool, server, assets, tmp_path):
+    """Test a destination differing from the cache is rewritten."""
+    tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    Path(assets['icons/bw.svg']).write_bytes(b'edited')
+
+    results = tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert [(r.downloaded, r.copied) for r in results] == [(False, False), (False, True)]
+    assert Path(assets['icons/bw.svg']).read_bytes() == b'<svg>bw</svg>'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX permissions')
+def test_copies_keep_file_permissions(tool, server, assets, tmp_path):
+    """Test copies get default modes, or keep those they replace."""
+    umask = os.umask(0)
+    os.umask(umask)
+    tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    dest = Path(assets['icons/bw.svg'])
+    # As for files created by open(), not 0o600 as by mkstemp()
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o666 & ~umask
+    dest.write_bytes(b'edited')
+    dest.chmod(0o640)
+    tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert dest.read_bytes() == b'<svg>bw</svg>'
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o640
+
+
+def test_corrupt_cache_is_downloaded_again(tool, server, assets, tmp_path):
+    """Test a cached file not matching the manifest is not trusted."""
+    tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    (tmp_path / 'cache' / 'logos_dark.svg').write_bytes(b'corrupt')
+
+    results = tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert results[0].downloaded is True
+    assert (tmp_path / 'cache' / 'logos_dark.svg').read_bytes() == b'<svg>dark</svg>'
+
+
+def test_failed_asset_does_not_stop_others(tool, server, assets, tmp_path):
+    """Test a missing remote file is reported per asset."""
+    del server.files['logos/dark.svg']
+    results = tool.sync_assets(assets, tmp_path / 'cache', server.url)
+    assert '404' in results[0].error
+    assert results[1].copied is True
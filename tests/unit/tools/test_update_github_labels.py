@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import subprocess  # noqa: S404
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='fake gh is a shebang script')
+
+# Canned gh: answers list/view calls from labels.json and repos.json,
+# succeeds on create/edit unless the label is named 'broken', and logs
+# every call as a JSON line.
+FAKE_GH = """\
+#!{python}
+import json, os, sys
+from pathlib import Path
+
+state = Path(os.environ['FAKE_GH_DIR'])
+args = sys.argv[1:]
+with open(state / 'calls.log', 'a') as f:
+    f.write(json.dumps(args) + '\\n')
+if args[:2] == ['label', 'list']:
+    repo = args[args.index('--repo') + 1]
+    print(json.dumps(json.loads((state / 'labels.json').read_text())[repo]))
+elif args[:2] == ['repo', 'list']:
+    print((state / 'repos.json').read_text())
+elif args[:2] == ['repo', 'view']:
+    print(json.dumps({{'nameWithOwner': 'easyscience/current'}}))
+elif args[:2] in (['label', 'create'], ['label', 'edit']) and 'broken' in args:
+    sys.exit('HTTP 422: broken')
+"""
+
+
+@pytest.fixture
+def gh(tmp_path, monkeypatch):
+    """Directory with the fake gh state; the fake is first on PATH."""
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    script = bin_dir / 'gh'
+    script.write_text(FAKE_GH.format(python=sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f'{bin_dir}:{Path(sys.executable).parent}')
+    monkeypatch.setenv('FAKE_GH_DIR', str(tmp_path))
+    (tmp_path / 'calls.log').write_text('')
+    return tmp_path
+
+
+def labels_json(labels):
+    return [{'name': x.name, 'color': x.color, 'description': x.description} for x in labels]
+
+
+def calls(state):
+    return [json.loads(line) for line in (state / 'calls.log').read_text().splitlines()]
+
+
+# ----------------------------------------------------------------------
+# plan_changes()
+# ----------------------------------------------------------------------
+
+
+def test_plan_is_empty_when_labels_are_in_sync(tool):
+    """Test no changes are planned for an up-to-date repository."""
+    assert tool.plan_changes(tool.LABELS) == []
+
+
+def test_plan_for_default_labels(tool):
+    """Test default labels are renamed and the rest created."""
+    current = [tool.Label('bug', 'd73a4a', "Something isn't working")]
+    changes = tool.plan_changes(current)
+    renames = [c for c in changes if c.action == 'rename']
+    assert [(c.name, c.label.name) for c in renames] == [('bug', '[scope] bug')]
+    # The rename also applies the desired description
+    assert renames[0].label.description == 'Bug report or fix (major.minor.PATCH)'
+    creates = {c.label.name for c in changes if c.action == 'create'}
+    assert creates == {label.name for label in tool.LABELS} - {'[scope] bug'}
+
+
+def test_plan_updates_only_changed_labels(tool):
+    """Test only labels with a different color or description change."""
+    current = list(tool.LABELS)
+    current[0] = tool.Label(current[0].name, '000000', current[0].description)
+    current[1] = tool.Label(
+        current[1].name.upper(), current[1].color.upper(), current[1].description
+    )
+    changes = tool.plan_changes(current)
+    assert [(c.action, c.name) for c in changes] == [('update', tool.LABELS[0].name)]
+
+
+def test_plan_skips_rename_onto_existing_label(tool):
+    """Test a rename is skipped if the new name already exists."""
+    current = [*tool.LABELS, tool.Label('bug', 'ffffff')]
+    assert tool.plan_changes(current) == []
+
+
+def test_change_args(tool):
+    """Test the gh commands of each kind of change."""
+    label = tool.Label('[scope] bug', 'd73a4a', 'Bug')
+    assert tool.LabelChange('rename', 'bug', label).args('o/r') == [
+        'gh', 'label', 'edit', 'bug', '--name', '[scope] bug',
+        '--color', 'd73a4a', '--description', 'Bug', '--repo', 'o/r',
+    ]  # fmt: skip
+    assert tool.LabelChange('create', label.name, label).args('o/r')[:4] == [
+        'gh', 'label', 'create', '[scope] bug',
+    ]  # fmt: skip
+
+
+# ----------------------------------------------------------------------
+# main()
+# ----------------------------------------------------------------------
+
+
+def test_main_fetches_once_and_applies_plan(tool, gh):
+    """Test one list call per repository plus one call per change."""
+    current = [*tool.LABELS[1:], tool.Label('bug', 'd73a4a', 'Old')]
+    (gh / 'labels.json').write_text(json.dumps({'easyscience/a': labels_json(current)}))
+
+    assert tool.main(['--repo', 'easyscience/a']) == 0
+    made = calls(gh)
+    assert sum(call[:2] == ['label', 'list'] for call in made) == 1
+    edits = [call for call in made if call[:2] == ['label', 'edit']]
+    assert len(made) == 2
+    assert edits[0][2:5] == ['bug', '--name', '[scope] bug']
+
+
+def test_main_syncs_several_repos(tool, gh):
+    """Test repeated --repo syncs each repository."""
+    in_sync = labels_json(tool.LABELS)
+    (gh / 'labels.json').write_text(json.dumps({'easyscience/a': in_sync, 'easyscience/b': []}))
+
+    assert tool.main(['--repo', 'easyscience/a', '--repo', 'easyscience/b']) == 0
+    creates = [call for call in calls(gh) if call[:2] == ['label', 'create']]
+    assert len(creates) == len(tool.LABELS)
+    assert all(call[-1] == 'easyscience/b' for call in creates)
+
+
+def test_main_limits_gh_calls_across_repos(tool, gh, monkeypatch):
+    """Test concurrent gh calls of all repositories share one limit."""
+    repos = [f'easyscience/{name}' for name in 'abcd']
+    (gh / 'labels.json').write_text(json.dumps(dict.fromkeys(repos, [])))
+    monkeypatch.setattr(tool, '_gh_slots', threading.BoundedSemaphore(3))
+    lock = threading.Lock()
+    running = [0, 0]  # current, highest
+    run = subprocess.run
+
+    def counting_run(*args, **kwargs):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        try:
+            return run(*args, **kwargs)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(subprocess, 'run', counting_run)
+    assert tool.main([arg for repo in repos for arg in ('--repo', repo)]) == 0
+    assert len(calls(gh)) == 4 * (len(tool.LABELS) + 1)
+    assert running[1] <= 3
+
+
+def test_main_all_lists_org_repos(tool, gh):
+    """Test --all syncs every repository of the organization."""
+    repos = [{'nameWithOwner': 'easyscience/a'}, {'nameWithOwner': 'easyscience/b'}]
+    (gh / 'repos.json').write_text(json.dumps(repos))
+    labels = labels_json(tool.LABELS)
+    (gh / 'labels.json').write_text(json.dumps({'easyscience/a': labels, 'easyscience/b': labels}))
+
+    assert tool.main(['--all']) == 0
+    listed = sorted(call[3] for call in calls(gh) if call[:2] == ['label', 'list'])
+    assert listed == ['easyscience/a', 'easyscience/b']
+
+
+def test_main_dry_run_makes_no_changes(tool, gh, capsys):
+    """Test --dry-run only fetches labels and prints the plan."""
+    (gh / 'labels.json').write_text(json.dumps({'easyscience/current': []}))
+
+    assert tool.main(['--dry-run']) == 0
+    assert {tuple(call[:2]) for call in calls(gh)} == {('repo', 'view'), ('label', 'list')}
+    assert '[dry-run] gh label create' in capsys.readouterr().out
+
+
+def test_main_reports_failed_changes(tool, gh, capsys):
+    """Test a failing change is reported and sets the exit status."""
+    current = [*tool.LABELS, tool.Label('broken', 'ffffff')]
+    (gh / 'labels.json').write_text(json.dumps({'easyscience/a': labels_json(current)}))
+    tool.LABEL_RENAMES.append(tool.LabelRename('broken', 'fixed'))
+    try:
+        assert tool.main(['--repo', 'easyscience/a']) == 1
+    finally:
+        tool.LABEL_RENAMES.pop()
+    assert 'HTTP 422: broken' in capsys.readouterr().out
+
+
+def test_main_rejects_other_orgs(tool, gh):
+    """Test repositories outside the organization are refused."""
+    assert tool.main(['--repo', 'someone/else']) == 2
+    assert calls(gh) == []
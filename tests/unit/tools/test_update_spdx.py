@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 EasyUtilities contributors <https://github.com/easyscience>
+# SPDX-License-Identifier: BSD-3-Clause
+
+import subprocess  # noqa: S404
+
+import pytest
+
+
+@pytest.fixture
+def header(tool):
+    """The canonical SPDX header with its trailing blank line."""
+    return f'{tool.COPYRIGHT_TEXT}\n{tool.LICENSE_TEXT}\n\n'
+
+
+# ----------------------------------------------------------------------
+# update_spdx_header()
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ('before', 'after'),
+    [
+        ('x = 1\n', '{h}x = 1\n'),
+        ('\n\nx = 1\n', '{h}x = 1\n'),
+        ('', '{h}'),
+        ('{h}\n\nx = 1\n', '{h}x = 1\n'),
+        ('# SPDX-FileCopyrightText: 2020 old\n# SPDX-License-Identifier: MIT\nx\n', '{h}x\n'),
+        ('{h}# SPDX-License-Identifier: MIT\nx\n', '{h}x\n'),
+        ('{h}x\n\n\ny\n\n\n# SPDX-License-Identifier: MIT\nz\n', '{h}x\n\n\ny\n\n\nz\n'),
+        ('{h}x\n# SPDX-FileCopyrightText: 2020 old\n', '{h}x\n'),
+        ('#!/usr/bin/env python\n# -*- coding: utf-8 -*-\nx\n',
+         '#!/usr/bin/env python\n# -*- coding: utf-8 -*-\n{h}x\n'),
+    ],
+)  # fmt: skip
+def test_update_spdx_header(tool, header, tmp_path, before, after):
+    """Test the header is inserted or made canonical."""
+    path = tmp_path / 'module.py'
+    path.write_text(before.format(h=header))
+    assert tool.update_spdx_header(path) is True
+    assert path.read_text() == after.format(h=header)
+    assert tool.update_spdx_header(path) is False
+
+
+def test_canonical_file_is_not_rewritten(tool, header, tmp_path):
+    """Test a file with a canonical header keeps its mtime."""
+    path = tmp_path / 'module.py'
+    path.write_text(f'#!/usr/bin/env python\n{header}"""Doc."""\n')
+    mtime = path.stat().st_mtime_ns
+    assert tool.update_spdx_header(path) is False
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_has_canonical_header_reads_head_only(tool, header):
+    """Test the check needs only the first lines of a file."""
+    head = header.splitlines(keepends=True) + ['x = 1\n']
+    assert tool.has_canonical_header(head) is True
+    assert tool.has_canonical_header(head[:2] + ['\n', '\n']) is False
+
+
+# ----------------------------------------------------------------------
+# File selection and command line
+# ----------------------------------------------------------------------
+
+
+def git(cwd, *args):
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)  # noqa: S603, S607
+
+
+def test_main_since_revision(tool, header, tmp_path, monkeypatch, capsys):
+    """Test --since only processes files changed since a revision."""
+    git(tmp_path, 'init', '-q')
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'old.py').write_text('x = 1\n')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'init')
+    (tmp_path / 'src' / 'new.py').write_text('y = 2\n')
+    (tmp_path / 'src' / 'ok.py').write_text(f'{header}z = 3\n')
+    monkeypatch.chdir(tmp_path)
+
+    assert tool.main(['--since', 'HEAD']) == 0
+    assert capsys.readouterr().out.strip() == 'SPDX headers: 2 files checked, 1 modified'
+    assert (tmp_path / 'src' / 'new.py').read_text().startswith(header)
+    assert (tmp_path / 'src' / 'old.py').read_text() == 'x = 1\n'
+
+
+def test_main_given_files(tool, tmp_path, capsys):
+    """Test files passed as arguments are processed; others skipped."""
+    paths = [tmp_path / 'a.py', tmp_path / 'b.py', tmp_path / 'c.txt']
+    for path in paths:
+        path.write_text('x = 1\n')
+    assert tool.main([str(path) for path in paths]) == 0
+    assert capsys.readouterr().out.strip() == 'SPDX headers: 2 files checked, 2 modified'
+    assert paths[2].read_text() == 'x = 1\n'
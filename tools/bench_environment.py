@@ -0,0 +1,89 @@
+"""Micro-benchmark for the runtime environment detectors.
+
+Compares the per-call cost of running the environment detectors
+directly (what every ``in_*`` call used to do) with the cached
+``EnvironmentInfo`` lookups used by the public ``in_*`` functions.
+
+If IPython is installed, also compares ``can_use_ipython_display()``
+with a per-call ``from IPython.display import ...`` (what it used to
+do) and with a plain ``isinstance`` check.
+
+Usage:
+  python tools/bench_environment.py
+  python tools/bench_environment.py --number 200000
+"""
+
+import argparse
+import timeit
+
+from easyutilities import environment as env
+
+# Pairs of (name, uncached detector, cached public function)
+CASES = [
+    ('in_pytest', env._detect_pytest, env.in_pytest),
+    ('in_warp', env._detect_warp, env.in_warp),
+    ('in_pycharm', env._detect_pycharm, env.in_pycharm),
+    ('in_colab', env._detect_colab, env.in_colab),
+    ('in_jupyter', env._detect_jupyter, env.in_jupyter),
+    ('in_github_ci', env._detect_github_ci, env.in_github_ci),
+]
+
+
+def per_call_ns(func, number: int, repeat: int = 5) -> float:
+    """Return the best per-call time of ``func`` in nanoseconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def import_per_call(handle: object) -> bool:
+    """Check a display handle by importing IPython classes on each
+    call.
+    """
+    from IPython.display import HTML  # noqa: F401
+    from IPython.display import DisplayHandle
+
+    return isinstance(handle, DisplayHandle)
+
+
+def bench_display(number: int) -> None:
+    """Time the IPython display handle checks."""
+    try:
+        from IPython.display import DisplayHandle
+    except ImportError:
+        print('\nIPython not installed: skipping display checks')
+        return
+
+    handle = DisplayHandle()
+    cases = [
+        ('import per call', lambda: import_per_call(handle)),
+        ('can_use_ipython_display', lambda: env.can_use_ipython_display(handle)),
+        ('isinstance', lambda: isinstance(handle, DisplayHandle)),
+    ]
+    print(f'\n{"display check":<24} {"per call (ns)":>14}')
+    for name, func in cases:
+        print(f'{name:<24} {per_call_ns(func, number):>14.1f}')
+
+
+def main() -> int:
+    """Entry point: time each detector and print a comparison table."""
+    parser = argparse.ArgumentParser(description='Benchmark environment detectors')
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=100_000,
+        help='Calls per timing run',
+    )
+    args = parser.parse_args()
+
+    env.refresh()
+    print(f'{"function":<14} {"detect (ns)":>12} {"cached (ns)":>12} {"speedup":>9}')
+    for name, detect, cached in CASES:
+        before = per_call_ns(detect, args.number)
+        after = per_call_ns(cached, args.number)
+        print(f'{name:<14} {before:>12.1f} {after:>12.1f} {before / after:>8.1f}x')
+    bench_display(args.number)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
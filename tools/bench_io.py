@@ -0,0 +1,95 @@
+"""Benchmark of the numeric text readers against NumPy and pandas.
+
+Generates an ``xye``-style file (header, an integer column and three
+float columns) and times reading it with ``easyutilities.io``
+(``read_columns()`` and a streaming sum over ``iter_chunks()``),
+``numpy.loadtxt``, ``pandas.read_csv`` (if installed) and a plain
+line-by-line Python loop. Throughput is in MB of text per second.
+
+Usage:
+  python tools/bench_io.py
+  python tools/bench_io.py --rows 5000000 --repeat 5
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from easyutilities import io
+from easyutilities.lazy import optional_import
+
+pd = optional_import('pandas')
+
+
+def generate(path: Path, rows: int) -> None:
+    """Write a file of ``rows`` lines of counts and x, y, e values."""
+    rng = np.random.default_rng(0)
+    x = np.linspace(5.0, 150.0, rows)
+    y = rng.poisson(1000.0, rows).astype(float)
+    table = np.column_stack([np.arange(rows), x, y, np.sqrt(y)])
+    header = 'Generated by tools/bench_io.py\nn x y e'
+    np.savetxt(path, table, fmt=['%d', '%.5f', '%.1f', '%.4f'], header=header)
+
+
+def python_loop(path: Path) -> np.ndarray:
+    """Line-by-line parsing as commonly done in EasyScience packages."""
+    rows = []
+    with open(path) as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            rows.append([float(value) for value in line.split()])
+    return np.array(rows)
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of ``func`` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> int:
+    """Entry point: generate the file and time each reader."""
+    parser = argparse.ArgumentParser(description='Benchmark numeric text readers')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows in the file')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per case')
+    parser.add_argument('--no-loop', action='store_true', help='Skip the Python loop')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'data.xye'
+        generate(path, args.rows)
+        size = path.stat().st_size / 1e6
+
+        cases = [
+            ('io.read_columns', lambda: io.read_columns(path)),
+            ('io.iter_chunks sum', lambda: sum(c['y'].sum() for c in io.iter_chunks(path))),
+            ('numpy.loadtxt', lambda: np.loadtxt(path)),
+        ]
+        if pd is not None:
+            cases.append((
+                'pandas.read_csv',
+                lambda: pd.read_csv(path, sep=r'\s+', comment='#', header=None).to_numpy(),
+            ))
+        if not args.no_loop:
+            cases.append(('python loop', lambda: python_loop(path)))
+
+        print(f'{args.rows} rows, {size:.1f} MB')
+        print(f'{"case":<20} {"time (s)":>9} {"MB/s":>8} {"relative":>9}')
+        baseline = None
+        for name, func in cases:
+            elapsed = best_of(func, args.repeat)
+            baseline = baseline or elapsed
+            print(f'{name:<20} {elapsed:>9.3f} {size / elapsed:>8.1f} {elapsed / baseline:>9.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
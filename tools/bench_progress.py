@@ -0,0 +1,88 @@
+"""Overhead benchmark for the progress reporter.
+
+Times a loop of ``--number`` iterations with a small arithmetic body,
+plain and wrapped in ``Progress.iter()`` (sized and unsized) and with
+``Progress.advance()`` per iteration. Overheads are relative to the
+plain loop over ``range``. Output is rendered by the ANSI
+backend into ``os.devnull``, so redraw costs are included.
+
+Usage:
+  python tools/bench_progress.py
+  python tools/bench_progress.py --number 1000000
+"""
+
+import argparse
+import math
+import os
+import time
+
+from easyutilities.progress import AnsiBackend
+from easyutilities.progress import Progress
+
+
+def body(iterable) -> float:
+    """Loop body representative of cheap per-item work."""
+    total = 0.0
+    for i in iterable:
+        total += math.sqrt(i) * 0.5
+    return total
+
+
+def body_advance(iterable, progress: Progress) -> float:
+    """Same loop body, ticking with advance() on every iteration."""
+    total = 0.0
+    advance = progress.advance
+    for i in iterable:
+        total += math.sqrt(i) * 0.5
+        advance()
+    return total
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of ``func`` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> int:
+    """Entry point: time the loop variants and print the overhead."""
+    parser = argparse.ArgumentParser(description='Benchmark progress overhead')
+    parser.add_argument('--number', type=int, default=10_000_000, help='Loop iterations')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per case')
+    args = parser.parse_args()
+    n = args.number
+
+    with open(os.devnull, 'w') as devnull:
+
+        def wrapped(iterable):
+            progress = Progress(backend=AnsiBackend(devnull))
+            return body(progress.iter(iterable, close=True))
+
+        def advanced():
+            with Progress(n, backend=AnsiBackend(devnull)) as progress:
+                return body_advance(range(n), progress)
+
+        cases = [
+            ('plain loop', lambda: body(range(n))),
+            ('iter(range)', lambda: wrapped(range(n))),
+            ('plain generator', lambda: body(i for i in range(n))),
+            ('iter(generator)', lambda: wrapped(i for i in range(n))),
+            ('advance() per item', advanced),
+        ]
+        baseline = None
+        print(f'{"case":<20} {"time (s)":>9} {"overhead":>9} {"ns/item":>8}')
+        for name, func in cases:
+            elapsed = best_of(func, args.repeat)
+            baseline = baseline or elapsed
+            overhead = elapsed / baseline - 1
+            per_item = (elapsed - baseline) / n * 1e9
+            print(f'{name:<20} {elapsed:>9.3f} {overhead:>9.1%} {per_item:>8.1f}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
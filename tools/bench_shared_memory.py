@@ -0,0 +1,82 @@
+"""Benchmark of shared-memory array handles against pickling.
+
+Sends a large array to every task of a process pool, either pickled
+with the task or as an ``easyutilities.shared_memory`` handle opened
+by the worker, and times the whole fan-out. Each task reduces one
+row block of the array, as a bootstrap or ensemble fit would read
+its data.
+
+Usage:
+  python tools/bench_shared_memory.py
+  python tools/bench_shared_memory.py --sizes 100 400 --tasks 32
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from easyutilities.bench import format_bytes
+from easyutilities.parallel import cpu_count
+from easyutilities.shared_memory import release
+from easyutilities.shared_memory import share
+
+MIB = 1 << 20
+
+
+def reduce_pickled(data: np.ndarray, task: int, tasks: int) -> float:
+    """Reduce one block of an array received by pickle."""
+    return float(np.array_split(data, tasks)[task].sum())
+
+
+def reduce_shared(handle, task: int, tasks: int) -> float:
+    """Reduce one block of an array received as a handle."""
+    return float(np.array_split(handle.open(), tasks)[task].sum())
+
+
+def fan_out(pool: ProcessPoolExecutor, func, data, tasks: int) -> float:
+    """Return the wall time of running every task once."""
+    start = time.perf_counter()
+    futures = [pool.submit(func, data, task, tasks) for task in range(tasks)]
+    for future in futures:
+        future.result()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Entry point: time both transports for each array size."""
+    parser = argparse.ArgumentParser(description='Benchmark shared-memory arrays')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 400], help='Sizes in MiB')
+    parser.add_argument('--tasks', type=int, default=16, help='Tasks per fan-out')
+    parser.add_argument('--workers', type=int, default=min(4, cpu_count()), help='Pool size')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per case')
+    args = parser.parse_args()
+
+    print(f'{"size":>10} {"transport":<10} {"time (s)":>9} {"ms/task":>8}')
+    with ProcessPoolExecutor(args.workers) as pool:
+        # Start the workers before timing
+        list(pool.map(abs, range(args.workers)))
+        for size in args.sizes:
+            data = np.random.default_rng(0).random(size * MIB // 8)
+            cases = [
+                ('pickle', reduce_pickled, lambda: data),
+                ('shared', reduce_shared, lambda: share(data)),
+            ]
+            for name, func, publish in cases:
+                times = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    payload = publish()
+                    times.append(time.perf_counter() - start)
+                    times[-1] += fan_out(pool, func, payload, args.tasks)
+                    if name == 'shared':
+                        release(payload)
+                elapsed = min(times)
+                label = format_bytes(data.nbytes)
+                print(f'{label:>10} {name:<10} {elapsed:>9.3f} {elapsed / args.tasks * 1e3:>8.1f}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Benchmark of bond detection and model payloads against atom count.
+
+Builds periodic silicon supercells of increasing size and times
+``easyutilities.viewer.find_bonds()`` (cell list), an all-pairs
+distance search, building the model payload, and fetching it again
+from the cache. The all-pairs search needs memory quadratic in the
+number of atoms and is skipped above ``--max-pairs`` atoms.
+
+Usage:
+  python tools/bench_viewer.py
+  python tools/bench_viewer.py --sizes 1000 8000 64000 216000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from easyutilities import viewer
+
+SILICON_A = 5.431
+SILICON_BASIS = np.array([
+    [0.0, 0.0, 0.0],
+    [0.0, 0.5, 0.5],
+    [0.5, 0.0, 0.5],
+    [0.5, 0.5, 0.0],
+    [0.25, 0.25, 0.25],
+    [0.25, 0.75, 0.75],
+    [0.75, 0.25, 0.75],
+    [0.75, 0.75, 0.25],
+])
+
+
+def supercell(atoms: int) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Return a cubic silicon supercell of about ``atoms`` atoms."""
+    k = max(1, round((atoms / len(SILICON_BASIS)) ** (1 / 3)))
+    shifts = np.array(list(np.ndindex(k, k, k)), dtype=float)
+    fractional = (shifts[:, None, :] + SILICON_BASIS[None, :, :]).reshape(-1, 3) / k
+    cell = np.eye(3) * SILICON_A * k
+    return ['Si'] * len(fractional), fractional @ cell, cell
+
+
+def all_pairs(positions: np.ndarray, cell: np.ndarray, cutoff: float) -> int:
+    """Count bonds by minimum-image distances between all pairs."""
+    lengths = np.diag(cell)
+    delta = positions[None, :, :] - positions[:, None, :]
+    delta -= np.round(delta / lengths) * lengths
+    distance2 = np.einsum('ijk,ijk->ij', delta, delta)
+    return int((np.triu(distance2 <= cutoff * cutoff, k=1)).sum())
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of ``func`` in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> int:
+    """Entry point: time each case for each supercell size."""
+    parser = argparse.ArgumentParser(description='Benchmark bonds and model payloads')
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1000, 8000, 64000], help='Atom counts'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per case')
+    parser.add_argument('--max-pairs', type=int, default=5000, help='Largest size for all pairs')
+    args = parser.parse_args()
+    cutoff = 2.6
+
+    def uncached(symbols, positions, cell):
+        viewer.clear_model_cache()
+        viewer.model_payload(symbols, positions, cell=cell, cutoff=cutoff)
+
+    print(f'{"atoms":>8} {"case":<22} {"time (s)":>9} {"us/atom":>8}')
+    for size in args.sizes:
+        symbols, positions, cell = supercell(size)
+        n = len(symbols)
+        cases = [
+            ('find_bonds', lambda: viewer.find_bonds(positions, cutoff=cutoff, cell=cell)),
+            ('model_payload', lambda: uncached(symbols, positions, cell)),
+            (
+                'model_payload cached',
+                lambda: viewer.model_payload(symbols, positions, cell=cell, cutoff=cutoff),
+            ),
+        ]
+        if n <= args.max_pairs:
+            cases.append(('all pairs', lambda: all_pairs(positions, cell, cutoff)))
+        for name, func in cases:
+            elapsed = best_of(func, args.repeat)
+            print(f'{n:>8} {name:<22} {elapsed:>9.4f} {elapsed / n * 1e6:>8.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
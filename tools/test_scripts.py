@@ -7,11 +7,29 @@ Important: each script must be executed in a fresh Python process.
 Running many tutorials in-process (e.g. via runpy) leaks global state
 between scripts (notably cached calculator dictionaries keyed only by
 model/experiment names), which can cause false failures.
+
+To keep that isolation without paying interpreter startup and
+scientific-stack imports for every script, each script runs in its own
+process forked from a forkserver that has already imported
+easyutilities and its heavy dependencies. Scripts run concurrently,
+one per core, each with a timeout. All selected scripts are run once
+by a session fixture, so do not combine this file with pytest-xdist.
+
+The runner can also be used directly, printing the wall time of each
+script:
+
+  python tools/test_scripts.py
+  python tools/test_scripts.py docs/docs/tutorials/tutorial.py --jobs 2
 """
 
+import argparse
+import multiprocessing
 import os
-import subprocess  # noqa: S404
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -19,37 +37,217 @@ import pytest
 _repo_root = Path(__file__).resolve().parents[1]
 _src_root = _repo_root / 'src'
 
+# Make the local package importable by the forkserver and the scripts
+if _src_root.exists() and str(_src_root) not in sys.path:
+    sys.path.insert(0, str(_src_root))
+
 # Discover tutorial scripts, excluding temporary checkpoint files
 TUTORIALS = [
     p for p in Path('docs/docs/tutorials').rglob('*.py') if '.ipynb_checkpoints' not in p.parts
 ]
 
+# Modules imported once by the forkserver; missing ones are skipped
+PRELOAD = (
+    'easyutilities',
+    'easyutilities.environment',
+    'easyutilities.progress',
+    'numpy',
+    'pandas',
+    'plotly.graph_objects',
+    'pooch',
+)
+
+# Maximum run time of a single script in seconds
+TIMEOUT = 600
+
+# Executed in the forked child. The process target is the builtin
+# exec(), which can be pickled by reference wherever this file was
+# imported from; the script output goes to a log file via fds 1 and 2,
+# so output of extension modules is captured as well.
+_CHILD_CODE = """
+import os, runpy, sys
+sys.stdout.flush()
+sys.stderr.flush()
+fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+os.dup2(fd, 1)
+os.dup2(fd, 2)
+os.chdir(cwd)
+sys.argv = [script]
+sys.path.insert(0, os.path.dirname(script))
+runpy.run_path(script, run_name='__main__')
+"""
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of running one script.
+
+    Attributes:
+        path: Script path.
+        returncode: Exit code of the script process.
+        wall_time: Wall time in seconds.
+        output: Combined stdout and stderr.
+        timed_out: Whether the script was killed after the timeout.
+    """
+
+    path: Path
+    returncode: int
+    wall_time: float
+    output: str
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the script finished successfully."""
+        return self.returncode == 0 and not self.timed_out
+
+
+def _context(preload=PRELOAD):
+    # forkserver is not available on Windows, where spawn is used
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(list(preload))
+    return context
+
+
+def run_script(script_path: Path, context, timeout: float = TIMEOUT) -> ScriptResult:
+    """Run a script in a fresh process from ``context``.
+
+    Args:
+        script_path: Script to run, relative to the repository root or
+            absolute.
+        context: Multiprocessing context creating the process.
+        timeout: Kill the script after this many seconds.
+
+    Returns:
+        ScriptResult: Exit code, wall time and output of the script.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, 'output.log')
+        namespace = {
+            'script': str(_repo_root / script_path),
+            'cwd': str(_repo_root),
+            'log_path': log_path,
+        }
+        process = context.Process(target=exec, args=(_CHILD_CODE, namespace))
+        start = time.perf_counter()
+        process.start()
+        process.join(timeout)
+        timed_out = process.is_alive()
+        if timed_out:
+            process.kill()
+            process.join()
+        wall_time = time.perf_counter() - start
+        try:
+            with open(log_path, encoding='utf-8', errors='replace') as f:
+                output = f.read()
+        except FileNotFoundError:
+            output = ''
+    return ScriptResult(script_path, process.exitcode, wall_time, output, timed_out)
+
+
+def run_scripts(scripts, jobs: int | None = None, timeout: float = TIMEOUT) -> list[ScriptResult]:
+    """Run scripts concurrently, each in a fresh process.
+
+    Args:
+        scripts: Script paths.
+        jobs: Number of scripts run at the same time; defaults to the
+            number of CPUs.
+        timeout: Per-script timeout in seconds.
+
+    Returns:
+        list[ScriptResult]: Results in the order of ``scripts``.
+    """
+    context = _context()
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        return list(pool.map(lambda path: run_script(path, context, timeout), scripts))
+
+
+def format_report(results, elapsed: float) -> str:
+    """Format the wall time and status of each script, slowest first.
+
+    Args:
+        results: Script results.
+        elapsed: Wall time of the whole run in seconds.
+
+    Returns:
+        str: Report with one line per script and a total.
+    """
+    lines = []
+    for result in sorted(results, key=lambda r: r.wall_time, reverse=True):
+        status = 'ok' if result.ok else ('timeout' if result.timed_out else 'FAILED')
+        lines.append(f'{result.wall_time:>8.2f}s  {status:<7}  {result.path}')
+    total = sum(result.wall_time for result in results)
+    lines.append(f'{len(results)} scripts: {total:.2f}s of script time in {elapsed:.2f}s')
+    return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------
+# Pytest
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(scope='session')
+def script_results(request):
+    """Run all selected tutorial scripts concurrently."""
+    scripts = [
+        item.callspec.params['script_path']
+        for item in request.session.items
+        if 'script_path' in getattr(getattr(item, 'callspec', None), 'params', {})
+    ]
+    start = time.perf_counter()
+    results = run_scripts(scripts)
+    elapsed = time.perf_counter() - start
+    yield {result.path: result for result in results}
+
+    # Fixture teardown output is captured unless capturing is suspended
+    plugins = request.config.pluginmanager
+    reporter = plugins.get_plugin('terminalreporter')
+    capture = plugins.get_plugin('capturemanager')
+    if reporter is not None and capture is not None:
+        with capture.global_and_fixture_disabled():
+            reporter.write_line('')
+            reporter.write_sep('-', 'tutorial script wall times')
+            reporter.write_line(format_report(results, elapsed))
+
 
 @pytest.mark.parametrize('script_path', TUTORIALS)
-def test_script_runs(script_path: Path):
-    """Execute a tutorial script and fail if it raises an exception.
+def test_script_runs(script_path: Path, script_results, record_property):
+    """Check a tutorial script ran without raising an exception.
 
     Each script is run in the context of __main__ to mimic standalone
     execution.
     """
-    env = os.environ.copy()
-    if _src_root.exists():
-        existing = env.get('PYTHONPATH', '')
-        env['PYTHONPATH'] = (
-            str(_src_root) if not existing else str(_src_root) + os.pathsep + existing
-        )
-
-    # This is a test harness executing repo-local tutorial scripts.
-    # We intentionally use subprocess isolation to prevent cross-test
-    # global state leaks (e.g. calculator caches) that can cause false
-    # failures when running tutorials in a shared interpreter.
-    result = subprocess.run(  # noqa: S603
-        [sys.executable, str(script_path)],
-        cwd=str(_repo_root),
-        env=env,
-        capture_output=True,
-        text=True,
-    )
+    result = script_results[script_path]
+    record_property('wall_time', round(result.wall_time, 3))
+    if result.timed_out:
+        pytest.fail(f'{script_path} timed out after {TIMEOUT}s\n{result.output.strip()}')
     if result.returncode != 0:
-        details = (result.stdout or '') + (result.stderr or '')
-        pytest.fail(f'{script_path}\n{details.strip()}')
+        pytest.fail(f'{script_path}\n{result.output.strip()}')
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+
+
+def main(argv=None) -> int:
+    """Entry point: run scripts and print their wall times."""
+    parser = argparse.ArgumentParser(description='Run tutorial scripts in fresh processes')
+    parser.add_argument('scripts', nargs='*', type=Path, help='Scripts (default: all tutorials)')
+    parser.add_argument('--jobs', type=int, default=None, help='Concurrent scripts')
+    parser.add_argument('--timeout', type=float, default=TIMEOUT, help='Per-script timeout')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_scripts(args.scripts or TUTORIALS, jobs=args.jobs, timeout=args.timeout)
+    for result in results:
+        if not result.ok:
+            print(f'--- {result.path}\n{result.output.strip()}\n')
+    print(format_report(results, time.perf_counter() - start))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
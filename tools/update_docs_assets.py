@@ -4,13 +4,26 @@ Update documentation assets from the assets-branding repository.
 This script fetches branding assets (logos, icons, images) from the
 easyscience/assets-branding GitHub repository and copies them to the
 appropriate locations in the documentation directory.
+
+Assets are fetched concurrently with conditional requests: the ETag and
+Last-Modified headers of each download are kept in a manifest in the
+cache directory, so unchanged remote files are answered with
+``304 Not Modified`` instead of being downloaded again. A destination
+file is only rewritten when its content hash differs from the cached
+asset, which keeps docs build caches valid.
 """
 
-import shutil
+import argparse
+import hashlib
+import json
+import os
+import stat
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-import pooch
-
 # Configuration: Define what to fetch and where to copy
 GITHUB_REPO = 'easyscience/assets-branding'
 GITHUB_BRANCH = 'master'
@@ -30,62 +43,219 @@ ASSETS_MAP = {
     'easyscience-org/icons/eso-icon_bw.svg': 'docs/overrides/.icons/easyscience.svg',
 }
 
+# Maximum number of concurrent downloads
+MAX_WORKERS = 8
+
+# Timeout of a single request in seconds
+TIMEOUT = 30
+
+MANIFEST_NAME = 'manifest.json'
+
+
+@dataclass
+class AssetResult:
+    """Outcome of syncing one asset.
+
+    Attributes:
+        source_path: Path to the file in the GitHub repository.
+        dest_path: Destination path in the project.
+        downloaded: Whether the file was downloaded, rather than
+            confirmed unchanged by the server.
+        copied: Whether the destination was (re)written.
+        error: Error message if syncing failed, else None.
+    """
+
+    source_path: str
+    dest_path: str
+    downloaded: bool = False
+    copied: bool = False
+    error: str | None = None
+
+
+def sha256_of(path: Path) -> str | None:
+    """Return the SHA-256 hex digest of a file, or None if missing."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file with new content via a renamed temporary file.
+
+    The file keeps the permissions of the file it replaces; a new file
+    gets those of ``open()``, 0o666 under the umask.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.{os.urandom(4).hex()}')
+    fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if path.exists():
+                os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_manifest(cache_dir: Path) -> dict:
+    """Load the manifest of cached downloads, or an empty one."""
+    try:
+        return json.loads((cache_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(cache_dir: Path, manifest: dict) -> None:
+    """Write the manifest of cached downloads."""
+    text = json.dumps(manifest, indent=2, sort_keys=True) + '\n'
+    write_atomic(cache_dir / MANIFEST_NAME, text.encode('utf-8'))
+
+
+def fetch_asset(url: str, cache_file: Path, entry: dict) -> tuple[bool, dict]:
+    """Download ``url`` into ``cache_file`` unless it is unchanged.
 
-def fetch_and_copy_asset(
+    Args:
+        url: URL of the asset.
+        cache_file: Cached copy of the asset.
+        entry: Manifest entry of the previous download, possibly empty.
+
+    Returns:
+        tuple[bool, dict]: Whether the file was downloaded, and the new
+        manifest entry.
+    """
+    headers = {}
+    # Only ask for changes if the cached copy is intact
+    if entry.get('sha256') and sha256_of(cache_file) == entry['sha256']:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    request = urllib.request.Request(url, headers=headers)  # noqa: S310
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as response:  # noqa: S310
+            data = response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and headers:
+            return False, entry
+        raise
+    write_atomic(cache_file, data)
+    return True, {
+        'etag': etag,
+        'last_modified': last_modified,
+        'sha256': hashlib.sha256(data).hexdigest(),
+    }
+
+
+def sync_asset(
     source_path: str,
     dest_path: str,
     cache_dir: Path,
-) -> None:
+    manifest: dict,
+    base_url: str = BASE_URL,
+) -> AssetResult:
     """
-    Fetch an asset from GitHub and copy it to the destination.
+    Fetch an asset and copy it to the destination if it changed.
 
     Args:
         source_path: Path to the file in the GitHub repository
         dest_path: Destination path in the project
         cache_dir: Directory to cache downloaded files
+        manifest: Manifest entries by source path, updated in place
+        base_url: URL the source paths are relative to
+
+    Returns:
+        AssetResult: What was downloaded and copied.
     """
-    url = f'{BASE_URL}/{source_path}'
+    result = AssetResult(source_path, dest_path)
+    try:
+        # Create a unique cache filename based on source path
+        cache_file = cache_dir / source_path.replace('/', '_')
+        result.downloaded, entry = fetch_asset(
+            f'{base_url}/{source_path}', cache_file, manifest.get(source_path, {})
+        )
+        manifest[source_path] = entry
 
-    # Create a unique cache filename based on source path
-    cache_filename = source_path.replace('/', '_')
+        dest = Path(dest_path)
+        if sha256_of(dest) != entry['sha256']:
+            write_atomic(dest, cache_file.read_bytes())
+            result.copied = True
+    except Exception as e:
+        result.error = str(e)
+    return result
 
-    # Download file using pooch
-    file_path = pooch.retrieve(
-        url=url,
-        known_hash=None,  # Skip hash verification
-        path=cache_dir,
-        fname=cache_filename,
-    )
 
-    # Create destination directory if it doesn't exist
-    dest = Path(dest_path)
-    dest.parent.mkdir(parents=True, exist_ok=True)
+def sync_assets(
+    assets_map: dict[str, str],
+    cache_dir: Path,
+    base_url: str = BASE_URL,
+    max_workers: int = MAX_WORKERS,
+) -> list[AssetResult]:
+    """
+    Sync all assets concurrently and save the updated manifest.
+
+    Args:
+        assets_map: Destination paths by source path
+        cache_dir: Directory to cache downloaded files
+        base_url: URL the source paths are relative to
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        list[AssetResult]: Results in the order of ``assets_map``.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(cache_dir)
 
-    # Copy the file to destination
-    shutil.copy2(file_path, dest)
-    print(f'Copied {file_path} -> {dest_path}')
+    # Each task only sets the manifest entry of its own source path
+    def sync(item):
+        return sync_asset(*item, cache_dir, manifest, base_url)
 
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(sync, assets_map.items()))
+    save_manifest(cache_dir, manifest)
+    return results
 
-def main():
+
+def main(argv=None):
     """Main function to update all documentation assets."""
+    parser = argparse.ArgumentParser(description='Update documentation assets')
+    parser.add_argument('--base-url', default=BASE_URL, help='URL of the assets repository')
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=Path.home() / '.cache' / GITHUB_REPO,
+        help='Directory to cache downloaded files',
+    )
+    parser.add_argument('--jobs', type=int, default=MAX_WORKERS, help='Concurrent downloads')
+    args = parser.parse_args(argv)
+
     print('📥 Updating documentation assets...')
     print(f'   Repository: {GITHUB_REPO}')
     print(f'   Branch: {GITHUB_BRANCH}\n')
 
-    # Use a temporary cache directory
-    cache_dir = Path.home() / '.cache' / GITHUB_REPO
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
-    # Fetch and copy each asset
-    for source_path, dest_path in ASSETS_MAP.items():
-        try:
-            fetch_and_copy_asset(source_path, dest_path, cache_dir)
-            print()
-        except Exception as e:
-            print(f'❌ Failed to fetch {source_path}: {e}')
+    results = sync_assets(ASSETS_MAP, args.cache_dir, args.base_url, args.jobs)
+    for result in results:
+        if result.error is not None:
+            print(f'❌ Failed to fetch {result.source_path}: {result.error}')
+        elif result.copied:
+            print(f'Copied {result.source_path} -> {result.dest_path}')
+        else:
+            print(f'Unchanged {result.dest_path}')
 
+    failed = sum(result.error is not None for result in results)
+    downloaded = sum(result.downloaded for result in results)
+    copied = sum(result.copied for result in results)
+    print(f'\n{downloaded} downloaded, {copied} copied, {failed} failed')
+    if failed:
+        return 1
     print('\n✅ Documentation assets updated successfully!')
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())
@@ -5,11 +5,17 @@ Requires:
   - gh CLI installed
   - gh auth login completed
 
+The current labels of a repository are fetched once and compared with
+LABEL_RENAMES and LABELS; only the renames, creates and updates needed
+are applied, concurrently. ``--repo`` may be repeated to sync several
+repositories at once.
+
 Usage:
   python update_github_labels.py
   python update_github_labels.py --dry-run
   python update_github_labels.py --repo easyscience/my-repo
   python update_github_labels.py --repo easyscience/my-repo --dry-run
+  python update_github_labels.py --all --dry-run
 """
 
 from __future__ import annotations
@@ -19,10 +25,18 @@ import json
 import shlex
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 EASYSCIENCE_ORG = 'easyscience'
 
+# Maximum number of concurrent gh calls in total, shared by the
+# repositories synced at the same time
+MAX_WORKERS = 8
+
+_gh_slots = threading.BoundedSemaphore(MAX_WORKERS)
+
 
 # Data structures
 
@@ -201,11 +215,12 @@ def run_cmd(
         print(f'  [dry-run] {cmd_str}')
         return CmdResult(0, '', '')
 
-    proc = subprocess.run(
-        args=args,
-        text=True,
-        capture_output=True,
-    )
+    with _gh_slots:
+        proc = subprocess.run(
+            args=args,
+            text=True,
+            capture_output=True,
+        )
     result = CmdResult(
         proc.returncode,
         proc.stdout.strip(),
@@ -241,98 +256,234 @@ def get_current_repo() -> str:
     return name_with_owner
 
 
-def rename_label(
-    repo: str,
-    rename: LabelRename,
-    *,
-    dry_run: bool,
-) -> None:
-    """Rename a label, silently skipping if it doesn't exist."""
+def get_org_repos(org: str = EASYSCIENCE_ORG) -> list[str]:
+    """Get the non-archived repositories of an organization."""
+    result = run_cmd(
+        args=[
+            'gh',
+            'repo',
+            'list',
+            org,
+            '--no-archived',
+            '--limit',
+            '1000',
+            '--json',
+            'nameWithOwner',
+        ],
+        dry_run=False,
+    )
+    return sorted(item['nameWithOwner'] for item in json.loads(result.stdout))
+
+
+def fetch_labels(repo: str) -> list[Label]:
+    """Fetch all labels of a repository with a single gh call."""
     result = run_cmd(
         args=[
             'gh',
             'label',
-            'edit',
-            rename.old,
-            '--name',
-            rename.new,
+            'list',
             '--repo',
             repo,
+            '--limit',
+            '1000',
+            '--json',
+            'name,color,description',
         ],
-        dry_run=dry_run,
-        check=False,
+        dry_run=False,
     )
+    return [
+        Label(item['name'], item['color'], item.get('description') or '')
+        for item in json.loads(result.stdout)
+    ]
 
-    if dry_run or result.returncode == 0:
-        print(f'  Rename: {rename.old!r} → {rename.new!r}')
-    else:
-        print(f'  Skip (not found): {rename.old!r}')
 
+# Planning
 
-def upsert_label(
+
+@dataclass(frozen=True)
+class LabelChange:
+    """A single change to the labels of a repository.
+
+    ``name`` is the current label name; ``label`` is the desired state.
+    A rename may also update the color and description.
+    """
+
+    action: str  # 'rename', 'create' or 'update'
+    name: str
+    label: Label
+
+    def args(self, repo: str) -> list[str]:
+        """Return the gh command applying this change."""
+        if self.action == 'create':
+            return [
+                'gh',
+                'label',
+                'create',
+                self.label.name,
+                '--color',
+                self.label.color,
+                '--description',
+                self.label.description,
+                '--repo',
+                repo,
+            ]
+        args = ['gh', 'label', 'edit', self.name]
+        if self.action == 'rename':
+            args += ['--name', self.label.name]
+        args += ['--color', self.label.color, '--description', self.label.description]
+        return args + ['--repo', repo]
+
+    def describe(self) -> str:
+        """Return a one-line description of the change."""
+        if self.action == 'rename':
+            return f'Rename: {self.name!r} → {self.label.name!r}'
+        return f'{self.action.capitalize()}: {self.label.name!r}'
+
+
+def _same(a: Label, b: Label) -> bool:
+    return a.color.lower() == b.color.lower() and a.description == b.description
+
+
+def plan_changes(
+    current: list[Label],
+    renames: list[LabelRename] = LABEL_RENAMES,
+    labels: list[Label] = LABELS,
+) -> list[LabelChange]:
+    """Compute the minimal changes turning ``current`` into ``labels``.
+
+    Label names are compared case-insensitively, like GitHub does. A
+    rename is only planned if the old label exists and the new one does
+    not; it is combined with the update of the renamed label.
+    """
+    existing = {label.name.casefold(): label for label in current}
+    wanted = {label.name.casefold(): label for label in labels}
+    changes = []
+
+    for rename in renames:
+        old = existing.get(rename.old.casefold())
+        if old is None or rename.new.casefold() in existing:
+            continue
+        target = wanted.get(rename.new.casefold(), Label(rename.new, old.color, old.description))
+        changes.append(LabelChange('rename', old.name, target))
+        del existing[rename.old.casefold()]
+        existing[rename.new.casefold()] = target
+
+    for key, label in wanted.items():
+        have = existing.get(key)
+        if have is None:
+            changes.append(LabelChange('create', label.name, label))
+        elif not _same(have, label):
+            changes.append(LabelChange('update', have.name, label))
+
+    return changes
+
+
+# Execution
+
+
+def apply_changes(
     repo: str,
-    label: Label,
+    changes: list[LabelChange],
     *,
-    dry_run: bool,
-) -> None:
-    """Create or update a label."""
-    run_cmd(
-        [
-            'gh',
-            'label',
-            'create',
-            label.name,
-            '--color',
-            label.color,
-            '--description',
-            label.description,
-            '--force',
-            '--repo',
-            repo,
-        ],
-        dry_run=dry_run,
+    max_workers: int = MAX_WORKERS,
+) -> list[str]:
+    """Apply changes concurrently, renames first.
+
+    Returns:
+        Error messages of the changes that failed.
+    """
+    errors = []
+
+    def apply(change: LabelChange) -> None:
+        try:
+            run_cmd(change.args(repo), dry_run=False)
+        except RuntimeError as e:
+            errors.append(f'{change.describe()}: {e}')
+
+    # Renames must complete before creates and updates of other labels,
+    # which could otherwise take a name that is being renamed
+    phases = (
+        [c for c in changes if c.action == 'rename'],
+        [c for c in changes if c.action != 'rename'],
     )
-    print(f'  Upsert: {label.name!r}')
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for phase in phases:
+            list(pool.map(apply, phase))
+    return errors
+
+
+def sync_repo(repo: str, *, dry_run: bool) -> int:
+    """Sync the labels of one repository and report what was done.
+
+    Returns:
+        Number of failed changes.
+    """
+    current = fetch_labels(repo)
+    changes = plan_changes(current)
+
+    lines = [f'\nRepository: {repo}']
+    if dry_run:
+        errors = []
+        for change in changes:
+            cmd_str = ' '.join(shlex.quote(a) for a in change.args(repo))
+            lines += [f'  {change.describe()}', f'    [dry-run] {cmd_str}']
+    else:
+        errors = apply_changes(repo, changes)
+        lines += [f'  {change.describe()}' for change in changes]
+        lines += [f'  Failed: {error}' for error in errors]
+    lines.append(f'  {len(changes)} changes, {len(current)} labels before')
+    print('\n'.join(lines))
+    return len(errors)
 
 
 # Main
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Entry point: parse arguments and sync labels."""
     parser = argparse.ArgumentParser(description='Sync GitHub labels for easyscience repos')
     parser.add_argument(
         '--repo',
-        help='Target repository (owner/name)',
+        action='append',
+        help='Target repository (owner/name); may be repeated',
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help=f'Sync all non-archived {EASYSCIENCE_ORG} repositories',
     )
     parser.add_argument(
         '--dry-run',
         action='store_true',
         help='Print actions without applying changes',
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    repo = args.repo or get_current_repo()
-    org = repo.split('/')[0]
+    if args.all:
+        repos = get_org_repos()
+    else:
+        repos = args.repo or [get_current_repo()]
 
-    if org.lower() != EASYSCIENCE_ORG:
-        print(f"Error: repository '{repo}' is not under '{EASYSCIENCE_ORG}'", file=sys.stderr)
-        return 2
+    for repo in repos:
+        if repo.split('/')[0].lower() != EASYSCIENCE_ORG:
+            print(f"Error: repository '{repo}' is not under '{EASYSCIENCE_ORG}'", file=sys.stderr)
+            return 2
 
-    print(f'Repository: {repo}')
     if args.dry_run:
-        print('Mode: DRY-RUN (no changes will be made)\n')
+        print('Mode: DRY-RUN (no changes will be made)')
 
-    print('\nRenaming default labels...')
-    for rename in LABEL_RENAMES:
-        rename_label(repo, rename, dry_run=args.dry_run)
+    def sync(repo: str) -> int:
+        try:
+            return sync_repo(repo, dry_run=args.dry_run)
+        except RuntimeError as e:
+            print(f'\nRepository: {repo}\n  Failed: {e}', file=sys.stderr)
+            return 1
 
-    print('\nUpserting labels...')
-    for label in LABELS:
-        upsert_label(repo, label, dry_run=args.dry_run)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        failures = sum(pool.map(sync, repos))
 
-    print('\nDone.')
-    return 0
+    print('\nDone.' if not failures else f'\nDone with {failures} failures.')
+    return 1 if failures else 0
 
 
 if __name__ == '__main__':
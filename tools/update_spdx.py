@@ -2,10 +2,26 @@
 
 - Ensures SPDX-FileCopyrightText has the current year.
 - Ensures SPDX-License-Identifier is set to BSD-3-Clause.
+
+A file whose header is already canonical is only searched for stray
+SPDX lines further down, without splitting it into lines, and files
+are only rewritten when their content changes, so mtimes (and the
+caches keyed on them) stay untouched. Files are processed in
+parallel.
+
+Usage:
+  python tools/update_spdx.py                 # all of src and tests
+  python tools/update_spdx.py --since HEAD~1  # changed since HEAD~1
+  python tools/update_spdx.py src/a.py b.py   # the given files
 """
 
+import argparse
 import fnmatch
+import os
 import re
+import subprocess  # noqa: S404
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 COPYRIGHT_TEXT = (
@@ -18,6 +34,21 @@ EXCLUDE_PATTERNS = [
     '*/_vendored/jupyter_dark_detect/*',
 ]
 
+# Directories processed when no files or revision are given
+BASE_DIRS = ('src', 'tests')
+
+# Regexes for SPDX lines and PEP 263 coding cookies
+_COPY_RE = re.compile(r'^#\s*SPDX-FileCopyrightText:.*$')
+_LIC_RE = re.compile(r'^#\s*SPDX-License-Identifier:.*$')
+_CODING_RE = re.compile(r'^#.*coding[:=]\s*[-\w.]+')
+_ANY_SPDX_RE = re.compile(r'^#\s*SPDX-(?:FileCopyrightText|License-Identifier):', re.MULTILINE)
+
+# Canonical SPDX block: two lines + exactly one blank
+_SPDX_BLOCK = [COPYRIGHT_TEXT + '\n', LICENSE_TEXT + '\n', '\n']
+
+# Shebang + two coding cookies + SPDX block + first body line
+_HEAD_LINES = 3 + len(_SPDX_BLOCK) + 1
+
 
 def should_exclude(file_path: Path) -> bool:
     """Check if a file should be excluded from SPDX header updates."""
@@ -25,82 +56,151 @@ def should_exclude(file_path: Path) -> bool:
     return any(fnmatch.fnmatch(path_str, pattern) for pattern in EXCLUDE_PATTERNS)
 
 
-def update_spdx_header(file_path: Path):
-    # Use Path.open to satisfy lint rule PTH123.
-    with file_path.open('r', encoding='utf-8') as f:
-        original_lines = f.readlines()
+def _is_spdx(line: str) -> bool:
+    return bool(_COPY_RE.match(line) or _LIC_RE.match(line))
 
-    # Regexes for SPDX lines
-    copy_re = re.compile(r'^#\s*SPDX-FileCopyrightText:.*$')
-    lic_re = re.compile(r'^#\s*SPDX-License-Identifier:.*$')
 
-    # 1) Preserve any leading shebang / coding cookie lines
-    prefix = []
+def _prefix_length(lines: list[str]) -> int:
+    # Number of leading shebang / coding cookie lines to preserve
     body_start = 0
-    if original_lines:
-        # Shebang line like "#!/usr/bin/env python3"
-        if original_lines[0].startswith('#!'):
-            prefix.append(original_lines[0])
-            body_start = 1
-        # PEP 263 coding cookie on first or second line
-        # e.g. "# -*- coding: utf-8 -*-" or "# coding: utf-8"
-        for _ in range(2):  # at most one more line to inspect
-            if body_start < len(original_lines):
-                line = original_lines[body_start]
-                if re.match(r'^#.*coding[:=]\s*[-\w.]+', line):
-                    prefix.append(line)
-                    body_start += 1
-                else:
-                    break
-
-    # 2) Work on the remaining body
-    body = original_lines[body_start:]
-
-    # Remove any existing SPDX lines anywhere in the body
-    body = [ln for ln in body if not (copy_re.match(ln) or lic_re.match(ln))]
-
+    # Shebang line like "#!/usr/bin/env python3"
+    if lines and lines[0].startswith('#!'):
+        body_start = 1
+    # PEP 263 coding cookie on first or second line
+    # e.g. "# -*- coding: utf-8 -*-" or "# coding: utf-8"
+    for _ in range(2):
+        if body_start < len(lines) and _CODING_RE.match(lines[body_start]):
+            body_start += 1
+        else:
+            break
+    return body_start
+
+
+def has_canonical_header(head: list[str]) -> bool:
+    """Check whether the head of a file holds the canonical header.
+
+    Args:
+        head: At least the first ``_HEAD_LINES`` lines of the file, or
+            all of them if the file is shorter.
+
+    Returns:
+        True if the SPDX block follows the shebang / coding lines and
+        is followed by exactly one blank line and a non-SPDX line.
+    """
+    start = _prefix_length(head)
+    end = start + len(_SPDX_BLOCK)
+    if head[start:end] != _SPDX_BLOCK:
+        return False
+    following = head[end] if end < len(head) else ''
+    if not following:
+        return True  # Empty body
+    return bool(following.strip()) and not _is_spdx(following)
+
+
+def canonical_lines(lines: list[str]) -> list[str]:
+    """Return the lines of a file with the canonical SPDX header.
+
+    Shebang and coding cookie lines are preserved, SPDX lines anywhere
+    in the body are removed, and the header is followed by exactly one
+    blank line.
+    """
+    start = _prefix_length(lines)
+    body = [ln for ln in lines[start:] if not _is_spdx(ln)]
     # Strip leading blank lines in the body so header is tight
-    while body and not body[0].strip():
-        body.pop(0)
-
-    # 3) Build canonical SPDX block: two lines + exactly one blank
-    spdx_block = [
-        COPYRIGHT_TEXT + '\n',
-        LICENSE_TEXT + '\n',
-        '\n',
-    ]
-
-    # 4) New content: prefix + SPDX + body
-    new_lines = prefix + spdx_block + body
-
-    # 5) Normalize: collapse any extra blank lines immediately after
-    #    LICENSE to exactly one. This keeps the script idempotent.
-    # Find the index of LICENSE we just inserted (prefix may be 0, 1,
-    # or 2 lines)
-    lic_idx = len(prefix) + 1  # spdx_block[1] is the license line
-    # Ensure exactly one blank line after LICENSE
-    # Remove all blank lines after lic_idx, then insert a single blank.
-    j = lic_idx + 1
-    # Remove any number of blank lines following
-    while j < len(new_lines) and not new_lines[j].strip():
-        new_lines.pop(j)
-    # Insert exactly one blank line at this position
-    new_lines.insert(j, '\n')
+    first = next((i for i, ln in enumerate(body) if ln.strip()), len(body))
+    return lines[:start] + _SPDX_BLOCK + body[first:]
+
+
+def update_spdx_header(file_path: Path) -> bool:
+    """Make the SPDX header of a file canonical.
 
+    Returns:
+        True if the file was modified.
+    """
+    # Use Path.open to satisfy lint rule PTH123.
+    with file_path.open('r', encoding='utf-8') as f:
+        head = list(islice(f, _HEAD_LINES))
+        if has_canonical_header(head):
+            # Body lines in the head, then the rest of the file
+            end = _prefix_length(head) + len(_SPDX_BLOCK)
+            if not _ANY_SPDX_RE.search(''.join(head[end:]) + f.read()):
+                return False
+        f.seek(0)
+        original_lines = f.readlines()
+
+    new_lines = canonical_lines(original_lines)
+    if new_lines == original_lines:
+        return False
     with file_path.open('w', encoding='utf-8') as f:
         f.writelines(new_lines)
+    return True
+
+
+# ----------------------------------------------------------------------
+# File selection
+# ----------------------------------------------------------------------
+
+
+def _git_lines(*args: str) -> list[str]:
+    result = subprocess.run(  # noqa: S603
+        ['git', *args],  # noqa: S607
+        text=True,
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout.splitlines()
 
 
-def main():
-    """Recursively update or insert SPDX headers in all Python files
-    under the 'src' and 'tests' directories.
+def changed_files(since: str) -> list[Path]:
+    """Python files under BASE_DIRS changed since a git revision.
+
+    Includes uncommitted and untracked files; deleted files are left
+    out.
     """
-    for base_dir in ('src', 'tests'):
-        for py_file in Path(base_dir).rglob('*.py'):
-            if should_exclude(py_file):
-                continue
-            update_spdx_header(py_file)
+    changed = _git_lines('diff', '--name-only', '--diff-filter=d', since, '--', *BASE_DIRS)
+    untracked = _git_lines('ls-files', '--others', '--exclude-standard', '--', *BASE_DIRS)
+    return sorted({Path(name) for name in changed + untracked if name.endswith('.py')})
+
+
+def all_files() -> list[Path]:
+    """All Python files under BASE_DIRS."""
+    return sorted(path for base_dir in BASE_DIRS for path in Path(base_dir).rglob('*.py'))
+
+
+def update_files(files: list[Path], jobs: int | None = None) -> tuple[int, int]:
+    """Update SPDX headers of files in parallel.
+
+    Returns:
+        Number of files checked and number of files modified.
+    """
+    files = [path for path in files if not should_exclude(path)]
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        modified = sum(pool.map(update_spdx_header, files))
+    return len(files), modified
+
+
+def main(argv=None) -> int:
+    """Update or insert SPDX headers in Python files under the 'src'
+    and 'tests' directories, in files changed since a revision, or in
+    the given files.
+    """
+    parser = argparse.ArgumentParser(description='Update SPDX headers in Python files')
+    parser.add_argument('files', nargs='*', type=Path, help='Files to update')
+    parser.add_argument('--since', metavar='REV', help='Only files changed since a git revision')
+    parser.add_argument('--jobs', type=int, default=None, help='Number of parallel workers')
+    args = parser.parse_args(argv)
+
+    if args.files:
+        files = [path for path in args.files if path.suffix == '.py']
+    elif args.since:
+        files = changed_files(args.since)
+    else:
+        files = all_files()
+
+    checked, modified = update_files(files, args.jobs)
+    print(f'SPDX headers: {checked} files checked, {modified} modified')
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())